@@ -22,10 +22,19 @@ Byte stuffing: Insert 0x55 after every two consecutive 0xAA in payload.
 
 from dataclasses import dataclass
 from enum import IntEnum
+from pathlib import Path
 from typing import Optional, List, Tuple
 import struct
+import sys
 from binascii import crc32
 
+# Add shared library to path for config compression
+_shared_path = Path(__file__).parent.parent.parent.parent / "shared" / "python"
+if str(_shared_path) not in sys.path:
+    sys.path.insert(0, str(_shared_path))
+
+from config_compress import compress as compress_config  # noqa: E402
+
 
 class MessageType(IntEnum):
     """MIN Protocol Command IDs (0-63 range).
@@ -48,6 +57,7 @@ class MessageType(IntEnum):
     CLEAR_CONFIG_ACK = 0x17  # Clear config acknowledgment
     LOAD_BINARY_CONFIG = 0x18  # Load binary configuration (chunked)
     BINARY_CONFIG_ACK = 0x19   # Binary config acknowledgment
+    LOAD_BINARY_CONFIG_LZ = 0x1A  # Load LZ-compressed binary configuration (chunked)
 
     # Telemetry streaming
     SUBSCRIBE_TELEMETRY = 0x20    # START_STREAM in MIN
@@ -72,7 +82,7 @@ class MessageType(IntEnum):
     RESTART_ACK = 0x34        # Restart acknowledgment (future)
     BOOT_COMPLETE = 0x35      # Device boot complete notification (future)
 
-    # Atomic channel config (future)
+    # Atomic channel config
     SET_CHANNEL_CONFIG = 0x36     # Set single channel config
     CHANNEL_CONFIG_ACK = 0x37     # Channel config acknowledgment
 
@@ -376,7 +386,8 @@ class FrameBuilder:
         return ProtocolFrame(msg_type=MessageType.LOAD_BINARY_CONFIG, payload=header + binary_data)
 
     @staticmethod
-    def load_binary_config_chunked(binary_data: bytes, chunk_size: int = 200) -> list:
+    def load_binary_config_chunked(binary_data: bytes, chunk_size: int = 200,
+                                   compressed: bool = False) -> list:
         """
         Create LOAD_BINARY_CONFIG frames for a complete binary configuration.
 
@@ -386,10 +397,17 @@ class FrameBuilder:
         Args:
             binary_data: Complete binary configuration
             chunk_size: Maximum chunk size (default 200 bytes for MIN)
+            compressed: Send the LZ-compressed stream as LOAD_BINARY_CONFIG_LZ
+                (only for devices advertising SwCapsFlags.CONFIG_LZ)
 
         Returns:
             List of ProtocolFrame objects to send sequentially
         """
+        msg_type = MessageType.LOAD_BINARY_CONFIG
+        if compressed:
+            binary_data = compress_config(binary_data)
+            msg_type = MessageType.LOAD_BINARY_CONFIG_LZ
+
         frames = []
         total_chunks = (len(binary_data) + chunk_size - 1) // chunk_size
         if total_chunks == 0:
@@ -402,12 +420,28 @@ class FrameBuilder:
 
             header = struct.pack("<HH", i, total_chunks)
             frames.append(ProtocolFrame(
-                msg_type=MessageType.LOAD_BINARY_CONFIG,
+                msg_type=msg_type,
                 payload=header + chunk
             ))
 
         return frames
 
+    @staticmethod
+    def set_channel_config(channel_record: bytes) -> ProtocolFrame:
+        """
+        Create a SET_CHANNEL_CONFIG frame for an atomic single channel update.
+
+        Args:
+            channel_record: One serialized channel (14-byte header + name + config)
+        """
+        return ProtocolFrame(msg_type=MessageType.SET_CHANNEL_CONFIG, payload=channel_record)
+
+    @staticmethod
+    def remove_channel_config(channel_id: int) -> ProtocolFrame:
+        """Create a SET_CHANNEL_CONFIG frame that removes a channel."""
+        return ProtocolFrame(msg_type=MessageType.SET_CHANNEL_CONFIG,
+                             payload=struct.pack("<H", channel_id))
+
 
 class FrameParser:
     """Helper class to parse MIN protocol frame payloads."""
@@ -446,6 +480,26 @@ class FrameParser:
 
         return success, channels_loaded
 
+    @staticmethod
+    def parse_channel_config_ack(payload: bytes) -> tuple[int, bool, int, str]:
+        """
+        Parse CHANNEL_CONFIG_ACK payload.
+
+        Format: [channel_id:2B][success:1B][error_code:2B][error_msg:NB]
+
+        Returns:
+            Tuple of (channel_id, success, error_code, error_msg)
+        """
+        if len(payload) < 3:
+            raise ProtocolError("CHANNEL_CONFIG_ACK payload too short")
+
+        channel_id = struct.unpack("<H", payload[0:2])[0]
+        success = payload[2] == 1
+        error_code = struct.unpack("<H", payload[3:5])[0] if len(payload) >= 5 else 0
+        error_msg = payload[5:].decode("utf-8", errors="replace")
+
+        return channel_id, success, error_code, error_msg
+
     @staticmethod
     def parse_flash_ack(payload: bytes) -> bool:
         """
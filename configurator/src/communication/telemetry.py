@@ -16,10 +16,12 @@ Telemetry Packet Structure (154 bytes at configurable rate):
 - hbridge_positions: 8 bytes (4 x uint16) - H-Bridge positions
 """
 
+from array import array
 from dataclasses import dataclass, field
 from enum import IntFlag, IntEnum
 from typing import Optional
 import struct
+import sys
 import time
 
 
@@ -279,8 +281,57 @@ TELEMETRY_FORMAT = "<" + "".join([
 TELEMETRY_PACKET_SIZE = 174
 TELEMETRY_NUCLEO_MIN_SIZE = 80  # Minimum size for Nucleo F446RE format
 
-
-def parse_telemetry(data: bytes) -> TelemetryPacket:
+# Precompiled codecs
+_TELEMETRY_STRUCT = struct.Struct(TELEMETRY_FORMAT)
+_VIRTUAL_COUNT = struct.Struct("<H")
+_VIRTUAL_ENTRY = struct.Struct("<Hi")
+
+# Scalar fields only; array sections are skipped and copied separately
+# for flat results (offsets below)
+_TELEMETRY_SCALARS = struct.Struct("<IHhI142xhHHhIII")
+_ADC_OFFSET = 12
+_STATES_OFFSET = 52
+_DUTIES_OFFSET = 82
+_HBRIDGE_STATES_OFFSET = 142
+_HBRIDGE_POSITIONS_OFFSET = 146
+
+# Nucleo F446RE layout, fixed part up to the virtual channel count
+_NUCLEO_STRUCT = struct.Struct("<II30B20HB15xHHhhBB")
+_NUCLEO_SCALARS = struct.Struct("<II70xB15xHHhhBB")
+_NUCLEO_STATES_OFFSET = 8
+_NUCLEO_ADC_OFFSET = 38
+# Truncated Nucleo packets keep only whole fields: voltage/current,
+# temperatures, fault bytes
+_NUCLEO_FIELD_ENDS = (98, 102, 104)
+
+# Byte value -> ChannelState (out of range values map to DISABLED)
+_CHANNEL_STATES = [ChannelState(min(v, 7)) for v in range(256)]
+
+# array.array holds native byte order
+_BYTESWAP = sys.byteorder != "little"
+
+
+def _flat_array(typecode: str, data: bytes, offset: int, count: int) -> array:
+    """Copy count packed little-endian values from data into an array."""
+    values = array(typecode)
+    values.frombytes(data[offset:offset + count * values.itemsize])
+    if _BYTESWAP:
+        values.byteswap()
+    return values
+
+
+def _parse_virtuals(data: bytes, offset: int) -> dict[int, int]:
+    """Parse virtual channels: count (2 bytes) + [id (2 bytes) + value (4 bytes)] * count."""
+    if offset + 2 > len(data):
+        return {}
+    (count,) = _VIRTUAL_COUNT.unpack_from(data, offset)
+    offset += 2
+    count = min(count, (len(data) - offset) // _VIRTUAL_ENTRY.size)
+    with memoryview(data) as view:
+        return dict(_VIRTUAL_ENTRY.iter_unpack(view[offset:offset + count * _VIRTUAL_ENTRY.size]))
+
+
+def parse_telemetry(data: bytes, flat: bool = False) -> TelemetryPacket:
     """
     Parse telemetry data from raw bytes.
 
@@ -290,6 +341,9 @@ def parse_telemetry(data: bytes) -> TelemetryPacket:
 
     Args:
         data: Raw telemetry packet bytes
+        flat: Return array fields as array.array copied straight from
+            the packet, with channel states as raw bytes instead of
+            ChannelState lists (cheaper for high-rate streams)
 
     Returns:
         Parsed TelemetryPacket
@@ -299,82 +353,40 @@ def parse_telemetry(data: bytes) -> TelemetryPacket:
     """
     # Try Nucleo format first if packet is smaller than full format
     if len(data) < TELEMETRY_PACKET_SIZE and len(data) >= TELEMETRY_NUCLEO_MIN_SIZE:
-        return _parse_telemetry_nucleo(data)
+        return _parse_telemetry_nucleo(data, flat)
 
     if len(data) < TELEMETRY_PACKET_SIZE:
         raise ValueError(f"Telemetry packet too short: {len(data)} < {TELEMETRY_PACKET_SIZE}")
 
-    # Unpack all fields
-    values = struct.unpack(TELEMETRY_FORMAT, data[:TELEMETRY_PACKET_SIZE])
-
-    # Parse fields
-    idx = 0
-    timestamp_ms = values[idx]
-    idx += 1
-
-    voltage_mv = values[idx]
-    idx += 1
-
-    temperature_c = values[idx]
-    idx += 1
-
-    total_current_ma = values[idx]
-    idx += 1
-
-    adc_values = list(values[idx:idx + 20])
-    idx += 20
-
-    profet_states = [ChannelState(min(v, 7)) for v in values[idx:idx + 30]]
-    idx += 30
-
-    profet_duties = list(values[idx:idx + 30])
-    idx += 30
-
-    hbridge_states = list(values[idx:idx + 4])
-    idx += 4
-
-    hbridge_positions = list(values[idx:idx + 4])
-    idx += 4
-
-    # Extended system fields
-    board_temp_2 = values[idx]
-    idx += 1
-
-    output_5v_mv = values[idx]
-    idx += 1
-
-    output_3v3_mv = values[idx]
-    idx += 1
-
-    flash_temp = values[idx]
-    idx += 1
-
-    system_status = values[idx]
-    idx += 1
-
-    fault_flags_raw = values[idx]
-    idx += 1
+    if flat:
+        (
+            timestamp_ms, voltage_mv, temperature_c, total_current_ma,
+            board_temp_2, output_5v_mv, output_3v3_mv, flash_temp,
+            system_status, fault_flags_raw, digital_inputs_raw,
+        ) = _TELEMETRY_SCALARS.unpack_from(data)
+        adc_values = _flat_array("H", data, _ADC_OFFSET, 20)
+        profet_states = _flat_array("B", data, _STATES_OFFSET, 30)
+        profet_duties = _flat_array("H", data, _DUTIES_OFFSET, 30)
+        hbridge_states = _flat_array("B", data, _HBRIDGE_STATES_OFFSET, 4)
+        hbridge_positions = _flat_array("H", data, _HBRIDGE_POSITIONS_OFFSET, 4)
+    else:
+        values = _TELEMETRY_STRUCT.unpack_from(data)
+        timestamp_ms, voltage_mv, temperature_c, total_current_ma = values[:4]
+        adc_values = list(values[4:24])
+        profet_states = [_CHANNEL_STATES[v] for v in values[24:54]]
+        profet_duties = list(values[54:84])
+        hbridge_states = list(values[84:88])
+        hbridge_positions = list(values[88:92])
+        (
+            board_temp_2, output_5v_mv, output_3v3_mv, flash_temp,
+            system_status, fault_flags_raw, digital_inputs_raw,
+        ) = values[92:]
 
     # Digital inputs bitmask
-    digital_inputs_raw = values[idx]
     digital_inputs = [(digital_inputs_raw >> i) & 1 for i in range(20)]
 
     # Parse virtual channels if present (extended format)
-    virtual_channels = {}
-    remaining_data = data[TELEMETRY_PACKET_SIZE:]
-    if len(remaining_data) >= 2:
-        # Virtual channel count
-        virtual_count = struct.unpack("<H", remaining_data[:2])[0]
-        offset = 2
-
-        # Parse each virtual channel: id (2 bytes) + value (4 bytes) = 6 bytes each
-        for _ in range(virtual_count):
-            if offset + 6 <= len(remaining_data):
-                ch_id, ch_value = struct.unpack("<Hi", remaining_data[offset:offset + 6])
-                virtual_channels[ch_id] = ch_value
-                offset += 6
-            else:
-                break
+    virtual_channels = _parse_virtuals(data, TELEMETRY_PACKET_SIZE)
 
     return TelemetryPacket(
         timestamp_ms=timestamp_ms,
@@ -397,7 +409,7 @@ def parse_telemetry(data: bytes) -> TelemetryPacket:
     )
 
 
-def _parse_telemetry_nucleo(data: bytes) -> TelemetryPacket:
+def _parse_telemetry_nucleo(data: bytes, flat: bool = False) -> TelemetryPacket:
     """
     Parse Nucleo F446RE telemetry format.
 
@@ -417,87 +429,33 @@ def _parse_telemetry_nucleo(data: bytes) -> TelemetryPacket:
     - virtual_count: 2 bytes (offset 104)
     - virtual_channels: 6 bytes each (id:2 + value:4)
     """
-    idx = 0
-
-    # Stream counter (4 bytes)
-    stream_counter = struct.unpack_from("<I", data, idx)[0]
-    idx += 4
-
-    # Timestamp (4 bytes)
-    timestamp_ms = struct.unpack_from("<I", data, idx)[0]
-    idx += 4
-
-    # Output states (30 bytes)
-    profet_states = []
-    for i in range(30):
-        if idx < len(data):
-            state_val = data[idx]
-            profet_states.append(ChannelState(min(state_val, 7)))
-            idx += 1
-        else:
-            profet_states.append(ChannelState.OFF)
-
-    # ADC values (40 bytes = 20 x uint16)
-    adc_values = []
-    for i in range(20):
-        if idx + 1 < len(data):
-            val = struct.unpack_from("<H", data, idx)[0]
-            adc_values.append(val)
-            idx += 2
-        else:
-            adc_values.append(0)
+    fixed = data
+    if len(data) < _NUCLEO_STRUCT.size:
+        # Zero-fill fields that are missing or only partially present
+        whole = max([TELEMETRY_NUCLEO_MIN_SIZE] + [end for end in _NUCLEO_FIELD_ENDS if end <= len(data)])
+        fixed = bytes(data[:whole]).ljust(_NUCLEO_STRUCT.size, b"\0")
+
+    if flat:
+        (
+            stream_counter, timestamp_ms, din_byte,
+            voltage_mv, current_ma, mcu_temp, board_temp, fault_status, fault_flags,
+        ) = _NUCLEO_SCALARS.unpack_from(fixed)
+        profet_states = _flat_array("B", fixed, _NUCLEO_STATES_OFFSET, 30)
+        adc_values = _flat_array("H", fixed, _NUCLEO_ADC_OFFSET, 20)
+    else:
+        values = _NUCLEO_STRUCT.unpack_from(fixed)
+        stream_counter, timestamp_ms = values[:2]
+        profet_states = [_CHANNEL_STATES[v] for v in values[2:32]]
+        adc_values = list(values[32:52])
+        (
+            din_byte, voltage_mv, current_ma, mcu_temp, board_temp, fault_status, fault_flags,
+        ) = values[52:]
 
     # Digital inputs byte (packed bitmask)
-    din_byte = data[idx] if idx < len(data) else 0
-    idx += 1
     digital_inputs = [(din_byte >> i) & 1 for i in range(8)] + [0] * 12
 
-    # Reserved bytes (15 bytes) - skip
-    reserved_size = 15
-    idx += min(reserved_size, len(data) - idx)
-
-    # Voltage and current (4 bytes)
-    voltage_mv = 0
-    current_ma = 0
-    if idx + 3 < len(data):
-        voltage_mv = struct.unpack_from("<H", data, idx)[0]
-        idx += 2
-        current_ma = struct.unpack_from("<H", data, idx)[0]
-        idx += 2
-
-    # Temperature (4 bytes)
-    mcu_temp = 0
-    board_temp = 0
-    if idx + 3 < len(data):
-        mcu_temp = struct.unpack_from("<h", data, idx)[0]
-        idx += 2
-        board_temp = struct.unpack_from("<h", data, idx)[0]
-        idx += 2
-
-    # Fault status (2 bytes)
-    fault_status = 0
-    fault_flags = 0
-    if idx + 1 < len(data):
-        fault_status = data[idx]
-        idx += 1
-        fault_flags = data[idx] if idx < len(data) else 0
-        idx += 1
-
     # Parse virtual channels if present
-    # Format: count (2 bytes) + [channel_id (2 bytes) + value (4 bytes)] * count
-    virtual_channels = {}
-    if idx + 2 <= len(data):
-        virtual_count = struct.unpack_from("<H", data, idx)[0]
-        idx += 2
-
-        # Parse each virtual channel: id (2 bytes) + value (4 bytes) = 6 bytes each
-        for _ in range(virtual_count):
-            if idx + 6 <= len(data):
-                ch_id, ch_value = struct.unpack_from("<Hi", data, idx)
-                virtual_channels[ch_id] = ch_value
-                idx += 6
-            else:
-                break
+    virtual_channels = _parse_virtuals(data, _NUCLEO_STRUCT.size)
 
     return TelemetryPacket(
         timestamp_ms=timestamp_ms,
@@ -7,6 +7,10 @@ Contains device communication and protocol handling.
 from .device_controller import DeviceController
 from .transport import Transport, TransportFactory, SerialTransport, SocketTransport, MINSerialTransport
 from .protocol_handler import ProtocolHandler, ConfigAssembler, ParsedMessage
+from .async_client import AsyncDeviceClient
+from .connection_manager import ConnectionManager, DeviceSession, DeviceResult
+from .config_sync import ConfigSyncState, ConfigDelta
+from .telemetry_pipeline import TelemetryPipeline
 
 __all__ = [
     'DeviceController',
@@ -18,4 +22,11 @@ __all__ = [
     'ProtocolHandler',
     'ConfigAssembler',
     'ParsedMessage',
+    'AsyncDeviceClient',
+    'ConnectionManager',
+    'DeviceSession',
+    'DeviceResult',
+    'ConfigSyncState',
+    'ConfigDelta',
+    'TelemetryPipeline',
 ]
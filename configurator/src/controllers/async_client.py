@@ -0,0 +1,582 @@
+"""
+Asyncio Device Client for PMU-30
+
+Non-blocking device API for scripts and test rigs that drive several
+devices from one event loop:
+- TCP (Emulator, WiFi) via asyncio streams
+- USB Serial via event loop readiness callbacks on the port handle
+
+Framing and T-MIN reliability come from the shared MINTransport state
+machine. Each client runs one read task and one deadline task, no
+threads and no polling sleeps.
+
+Usage:
+    async with AsyncDeviceClient.tcp("localhost", 9876) as device:
+        if await device.ping():
+            ok, channels = await device.upload_config(binary_data)
+        async for packet in device.telemetry(rate_hz=50):
+            print(packet.timestamp_ms)
+"""
+
+import asyncio
+import logging
+import struct
+import sys
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import serial
+
+from communication.protocol import MessageType, FrameBuilder, FrameParser
+from communication.telemetry import parse_telemetry
+from .device_controller import DeviceCapabilities
+from .transport import TransportFactory
+
+# Add shared library to path for MIN protocol
+_shared_path = Path(__file__).parent.parent.parent.parent / "shared" / "python"
+if str(_shared_path) not in sys.path:
+    sys.path.insert(0, str(_shared_path))
+
+from min_protocol import MINTransport, MINFrame  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Telemetry packets buffered per client before the oldest are dropped
+TELEMETRY_QUEUE_SIZE = 256
+
+# Binary config chunk size (MIN payload limit minus 4-byte chunk header)
+CONFIG_CHUNK_SIZE = 200
+
+# Config chunks in flight on unreliable links (reliable T-MIN links queue
+# all chunks and let the T-MIN window pace them)
+CONFIG_UPLOAD_WINDOW = 4
+
+
+# =============================================================================
+# Byte streams
+# =============================================================================
+
+class AsyncByteStream(ABC):
+    """Abstract byte stream driven by the event loop."""
+
+    @abstractmethod
+    async def open(self):
+        """Open the stream. Raises ConnectionError on failure."""
+        pass
+
+    @abstractmethod
+    async def read(self) -> bytes:
+        """Wait for incoming bytes. Returns b'' when the stream is closed."""
+        pass
+
+    @abstractmethod
+    def write(self, data: bytes):
+        """Write bytes without waiting for them to be sent."""
+        pass
+
+    @abstractmethod
+    async def close(self):
+        """Close the stream."""
+        pass
+
+
+class AsyncSocketStream(AsyncByteStream):
+    """TCP stream for Emulator and WiFi connections."""
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def open(self):
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                timeout=self.connect_timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Cannot connect to {self.host}:{self.port}: {e}") from e
+
+    async def read(self) -> bytes:
+        try:
+            return await self._reader.read(4096)
+        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+            return b''
+
+    def write(self, data: bytes):
+        self._writer.write(data)
+
+    async def close(self):
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+
+
+class AsyncSerialStream(AsyncByteStream):
+    """
+    USB Serial stream.
+
+    On POSIX the port is read non-blocking when the event loop reports it
+    readable. Where the port has no file descriptor (Windows), reads block
+    in the loop's default executor instead.
+    """
+
+    def __init__(self, port: str, baudrate: int = 115200):
+        # Extract just the port name if format is "COMx - description"
+        self.port = port.split(" - ")[0] if " - " in port else port
+        self.baudrate = baudrate
+        self._serial: Optional[serial.Serial] = None
+        self._fd: Optional[int] = None
+
+    async def open(self):
+        try:
+            self._serial = serial.Serial(port=self.port, baudrate=self.baudrate,
+                                         timeout=0, write_timeout=1.0)
+            self._serial.reset_input_buffer()
+        except serial.SerialException as e:
+            raise ConnectionError(f"Cannot open {self.port}: {e}") from e
+        try:
+            self._fd = self._serial.fileno()
+        except (AttributeError, NotImplementedError):
+            self._fd = None
+            self._serial.timeout = 0.1
+
+    async def read(self) -> bytes:
+        ser = self._serial
+        if ser is None:
+            return b''
+        try:
+            if self._fd is None:
+                return await asyncio.get_running_loop().run_in_executor(None, self._blocking_read)
+
+            loop = asyncio.get_running_loop()
+            while True:
+                data = ser.read(ser.in_waiting or 1)
+                if data:
+                    return data
+                ready = loop.create_future()
+                loop.add_reader(self._fd, lambda fut=ready: fut.done() or fut.set_result(None))
+                try:
+                    await ready
+                finally:
+                    loop.remove_reader(self._fd)
+        except (serial.SerialException, OSError, TypeError):
+            # TypeError: port closed underneath a pending read
+            return b''
+
+    def _blocking_read(self) -> bytes:
+        ser = self._serial
+        while ser is self._serial and ser is not None:
+            data = ser.read(ser.in_waiting or 1)
+            if data:
+                return data
+        return b''
+
+    def write(self, data: bytes):
+        self._serial.write(data)
+
+    async def close(self):
+        if self._serial:
+            ser, self._serial = self._serial, None
+            ser.close()
+
+
+# =============================================================================
+# MIN state machine on a byte stream
+# =============================================================================
+
+class _StreamMINTransport(MINTransport):
+    """MINTransport writing to an AsyncByteStream; received bytes are passed to poll()."""
+
+    def __init__(self, stream: AsyncByteStream, loop: asyncio.AbstractEventLoop, **kwargs):
+        self._stream = stream
+        self._loop = loop
+        super().__init__(**kwargs)
+
+    def _now_ms(self) -> int:
+        return int(self._loop.time() * 1000)
+
+    def _serial_write(self, data: bytes):
+        self._stream.write(data)
+
+    def _serial_any(self) -> bool:
+        return False
+
+    def _serial_read_all(self) -> bytes:
+        return b''
+
+    def _serial_close(self):
+        pass
+
+
+# =============================================================================
+# Device client
+# =============================================================================
+
+class AsyncDeviceClient:
+    """
+    Asyncio client for one PMU-30.
+
+    Requests register a future for the expected response ID before the
+    command is sent; the read task resolves it when the response frame
+    arrives. Telemetry frames go to a bounded queue consumed by
+    telemetry(). Other frames are passed to on_message.
+
+    Args:
+        stream: Byte stream to the device
+        reliable: Send commands as T-MIN transport frames (retransmitted
+            until ACKed). Used for serial; the emulator takes plain frames.
+    """
+
+    def __init__(self, stream: AsyncByteStream, reliable: bool = False,
+                 telemetry_queue_size: int = TELEMETRY_QUEUE_SIZE):
+        self.stream = stream
+        self.reliable = reliable
+        self.on_message: Optional[Callable[[int, bytes], None]] = None
+        self._telemetry_queue_size = telemetry_queue_size
+        self._telemetry: Optional[asyncio.Queue] = None
+        self._min: Optional[_StreamMINTransport] = None
+        self._waiters: Dict[int, List[asyncio.Future]] = {}
+        self._listeners: Dict[int, Callable[[bytes], None]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._connected = False
+        self.telemetry_dropped = 0
+        self.capabilities: Optional[DeviceCapabilities] = None  # Last GET_CAPABILITIES answer
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def tcp(cls, host: str, port: int = 9876, **kwargs) -> "AsyncDeviceClient":
+        """Client for the emulator or a WiFi device."""
+        return cls(AsyncSocketStream(host, port), **kwargs)
+
+    @classmethod
+    def serial(cls, port: str, baudrate: int = 115200, **kwargs) -> "AsyncDeviceClient":
+        """Client for a USB Serial device (reliable T-MIN delivery)."""
+        kwargs.setdefault("reliable", True)
+        return cls(AsyncSerialStream(port, baudrate), **kwargs)
+
+    @classmethod
+    def from_config(cls, config: dict, **kwargs) -> "AsyncDeviceClient":
+        """Create a client from a DeviceController connection config dict."""
+        conn_type = config.get("type", "")
+        if conn_type == "USB Serial":
+            return cls.serial(config.get("port", ""), config.get("baudrate", 115200), **kwargs)
+        if conn_type == "Emulator":
+            host, port = TransportFactory._parse_address(config.get("address", "localhost:9876"), 9876)
+            return cls.tcp(host, port, **kwargs)
+        if conn_type == "WiFi":
+            host, port = TransportFactory._parse_address(config.get("address", ""), 80)
+            return cls.tcp(host, port, **kwargs)
+        raise ValueError(f"Unsupported connection type for async client: {conn_type}")
+
+    # -------------------------------------------------------------------------
+    # Connection
+    # -------------------------------------------------------------------------
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def connect(self):
+        """Open the stream and start the read and deadline tasks."""
+        if self._connected:
+            return
+        loop = asyncio.get_running_loop()
+        await self.stream.open()
+        self._min = _StreamMINTransport(self.stream, loop)
+        self._telemetry = asyncio.Queue(self._telemetry_queue_size)
+        self._wakeup = asyncio.Event()
+        self._connected = True
+        self.capabilities = None
+        if self.reliable:
+            self._min.transport_reset()
+        self._tasks = [
+            loop.create_task(self._read_loop()),
+            loop.create_task(self._deadline_loop()),
+        ]
+        logger.info(f"Async client connected ({self.stream.__class__.__name__})")
+
+    async def close(self):
+        """Stop background tasks, fail pending requests and close the stream."""
+        if not self._connected and not self._tasks:
+            return
+        self._connected = False
+        current = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current:
+                task.cancel()
+        for task in self._tasks:
+            if task is not current:
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._tasks = []
+        self._shutdown(ConnectionError("Connection closed"))
+        await self.stream.close()
+        logger.info("Async client disconnected")
+
+    async def __aenter__(self) -> "AsyncDeviceClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _shutdown(self, error: Exception):
+        """Fail pending requests and end telemetry iteration."""
+        for waiters in self._waiters.values():
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(error)
+        self._waiters.clear()
+        if self._telemetry is not None:
+            self._push_telemetry(None)
+
+    # -------------------------------------------------------------------------
+    # Background tasks
+    # -------------------------------------------------------------------------
+
+    async def _read_loop(self):
+        """Feed received bytes through MIN and dispatch frames."""
+        while True:
+            data = await self.stream.read()
+            if not data:
+                logger.warning("Connection closed by remote")
+                self._connected = False
+                self._shutdown(ConnectionError("Connection closed by remote"))
+                return
+            try:
+                frames = self._min.poll(data)
+            except Exception as e:
+                logger.error(f"MIN receive error: {e}")
+                continue
+            for frame in frames:
+                self._dispatch(frame)
+            # ACK/window state changed: recompute the deadline
+            self._wakeup.set()
+
+    async def _deadline_loop(self):
+        """Run MIN retransmits and ACKs when their deadlines are due."""
+        while True:
+            timeout_ms = self._min.next_timeout_ms()
+            if timeout_ms is None or timeout_ms > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(),
+                        None if timeout_ms is None else timeout_ms / 1000,
+                    )
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                for frame in self._min.poll(b''):
+                    self._dispatch(frame)
+            except Exception as e:
+                logger.error(f"MIN transmit error: {e}")
+
+    def _dispatch(self, frame: MINFrame):
+        """Route a received frame to a waiting request, telemetry or on_message."""
+        min_id = frame.min_id
+        listener = self._listeners.get(min_id)
+        if listener is not None:
+            listener(frame.payload)
+            return
+        waiters = self._waiters.get(min_id)
+        while waiters:
+            future = waiters.pop(0)
+            if not future.done():
+                future.set_result(frame.payload)
+                return
+
+        if min_id == MessageType.TELEMETRY_DATA:
+            self._push_telemetry(frame.payload)
+        elif self.on_message is not None:
+            self.on_message(min_id, frame.payload)
+        else:
+            logger.debug(f"Unhandled message 0x{min_id:02X}, {len(frame.payload)} bytes")
+
+    def _push_telemetry(self, payload: Optional[bytes]):
+        """Queue a telemetry payload (None = end), dropping the oldest when full."""
+        queue = self._telemetry
+        if queue.full():
+            queue.get_nowait()
+            self.telemetry_dropped += 1
+        queue.put_nowait(payload)
+
+    # -------------------------------------------------------------------------
+    # Commands
+    # -------------------------------------------------------------------------
+
+    def send(self, min_id: int, payload: bytes = b''):
+        """Send a command frame (T-MIN transport frame if reliable)."""
+        if not self._connected:
+            raise ConnectionError("Not connected")
+        if self.reliable:
+            self._min.queue_frame(min_id, payload)
+            self._wakeup.set()
+        else:
+            self._min.send_frame(min_id, payload)
+
+    async def request(self, min_id: int, payload: bytes, response_id: int,
+                      timeout: float = 1.0) -> bytes:
+        """
+        Send a command and wait for its response frame.
+
+        Raises:
+            asyncio.TimeoutError: No response within timeout
+            ConnectionError: Not connected or connection lost
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(response_id, []).append(future)
+        try:
+            self.send(min_id, payload)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            waiters = self._waiters.get(response_id)
+            if waiters and future in waiters:
+                waiters.remove(future)
+
+    async def ping(self, timeout: float = 1.0) -> bool:
+        """Send PING and wait for PONG."""
+        try:
+            await self.request(MessageType.PING, b'', MessageType.PONG, timeout)
+            return True
+        except (asyncio.TimeoutError, ConnectionError):
+            return False
+
+    async def wait_ready(self, max_wait: float = 5.0, poll_interval: float = 0.5) -> bool:
+        """PING until the device responds (e.g. after STOP_STREAM or restart)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        while loop.time() < deadline:
+            if await self.ping(timeout=min(poll_interval, max(deadline - loop.time(), 0.01))):
+                return True
+        return False
+
+    async def get_capabilities(self, timeout: float = 1.0) -> Optional[DeviceCapabilities]:
+        """Request device capabilities (cached in self.capabilities)."""
+        try:
+            payload = await self.request(MessageType.GET_CAPABILITIES, b'',
+                                         MessageType.CAPABILITIES, timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            return None
+        self.capabilities = DeviceCapabilities.from_payload(payload)
+        return self.capabilities
+
+    async def upload_config(self, binary_data: bytes, timeout: float = 2.0,
+                            progress: Optional[Callable[[int, int], None]] = None,
+                            compressed: Optional[bool] = None) -> Tuple[bool, int]:
+        """
+        Upload a binary configuration with pipelined LOAD_BINARY_CONFIG chunks.
+
+        Reliable links queue every chunk at once. Otherwise up to
+        CONFIG_UPLOAD_WINDOW chunks are in flight, each freed by an
+        intermediate BINARY_CONFIG_ACK. The upload ends with the final
+        ACK (6 bytes, carrying the number of channels loaded) or the
+        first error ACK.
+
+        Args:
+            binary_data: Binary config data (serialized channels)
+            timeout: Maximum time without an ACK, in seconds
+            progress: Called with (chunks_done, total_chunks)
+            compressed: Send LOAD_BINARY_CONFIG_LZ chunks; None uses them when
+                the cached capabilities advertise SwCapsFlags.CONFIG_LZ
+
+        Returns:
+            (success, channels_loaded)
+        """
+        if compressed is None:
+            compressed = self.capabilities is not None and self.capabilities.supports_config_lz
+        frames = FrameBuilder.load_binary_config_chunked(binary_data, CONFIG_CHUNK_SIZE, compressed)
+        total = len(frames)
+        window = total if self.reliable else CONFIG_UPLOAD_WINDOW
+        acks: asyncio.Queue = asyncio.Queue()
+        self._listeners[MessageType.BINARY_CONFIG_ACK] = acks.put_nowait
+        sent = acked = 0
+        try:
+            while True:
+                while sent < total and sent - acked < window:
+                    self.send(frames[sent].msg_type, frames[sent].payload)
+                    sent += 1
+                try:
+                    payload = await asyncio.wait_for(acks.get(), timeout)
+                except asyncio.TimeoutError:
+                    logger.error(f"Config upload: no ACK after chunk {sent}/{total}")
+                    return False, 0
+                success, channels = FrameParser.parse_config_ack(payload)
+                if not success:
+                    error = payload[1] if len(payload) >= 2 else 0
+                    logger.error(f"Config upload rejected after chunk {sent}/{total}: error {error}")
+                    return False, 0
+                if len(payload) >= 6 or total == 1:
+                    break
+                acked += 1
+                if progress is not None:
+                    progress(acked, total)
+        finally:
+            self._listeners.pop(MessageType.BINARY_CONFIG_ACK, None)
+
+        if progress is not None:
+            progress(total, total)
+        logger.info(f"Binary config uploaded: {channels} channels loaded")
+        return True, channels
+
+    async def save_to_flash(self, timeout: float = 5.0) -> bool:
+        """Save the current configuration to flash."""
+        try:
+            payload = await self.request(MessageType.SAVE_TO_FLASH, b'',
+                                         MessageType.FLASH_ACK, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout waiting for flash ACK ({timeout}s)")
+            return False
+        return FrameParser.parse_flash_ack(payload)
+
+    def set_output(self, output_index: int, state: bool):
+        """Set output state (on/off)."""
+        self.send(MessageType.SET_OUTPUT, struct.pack('<BB', output_index, 1 if state else 0))
+
+    # -------------------------------------------------------------------------
+    # Telemetry
+    # -------------------------------------------------------------------------
+
+    def subscribe_telemetry(self, rate_hz: int = 10):
+        """Start telemetry streaming."""
+        frame = FrameBuilder.subscribe_telemetry(rate_hz)
+        self.send(frame.msg_type, frame.payload)
+
+    def unsubscribe_telemetry(self):
+        """Stop telemetry streaming."""
+        self.send(MessageType.UNSUBSCRIBE_TELEMETRY)
+
+    async def telemetry(self, rate_hz: Optional[int] = None, raw: bool = False) -> AsyncIterator:
+        """
+        Iterate over received telemetry until the connection closes.
+
+        Args:
+            rate_hz: Subscribe at this rate first (and unsubscribe when done)
+            raw: Yield payload bytes instead of TelemetryPacket objects
+        """
+        if rate_hz is not None:
+            self.subscribe_telemetry(rate_hz)
+        try:
+            while True:
+                payload = await self._telemetry.get()
+                if payload is None:
+                    return
+                yield payload if raw else parse_telemetry(payload)
+        finally:
+            if rate_hz is not None and self._connected:
+                self.unsubscribe_telemetry()
@@ -0,0 +1,166 @@
+"""
+Delta Config Sync
+
+Tracks which serialized channels the device already holds so that a config
+push can send only the changed, added and removed channels as atomic
+SET_CHANNEL_CONFIG updates instead of re-uploading the whole binary.
+
+The binary format is the one produced by serialize_ui_channels_for_executor():
+[count:2B LE] followed by one record per channel:
+[CfgChannelHeader_t:14B][name:name_len][config:config_size]
+"""
+
+import hashlib
+import logging
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_HEADER_SIZE = 14
+
+# A single SET_CHANNEL_CONFIG record must fit in one MIN frame
+MAX_RECORD_SIZE = 255
+
+
+def split_channel_records(binary_data: bytes) -> Dict[int, bytes]:
+    """Split a binary config into per-channel records keyed by channel ID.
+
+    Records are returned in config order.
+
+    Raises:
+        ValueError: If the binary is truncated or a channel ID is duplicated
+    """
+    if len(binary_data) < 2:
+        raise ValueError("Binary config too short")
+
+    count = struct.unpack_from('<H', binary_data, 0)[0]
+    offset = 2
+    records: Dict[int, bytes] = {}
+
+    for _ in range(count):
+        if offset + CHANNEL_HEADER_SIZE > len(binary_data):
+            raise ValueError(f"Truncated channel header at offset {offset}")
+        channel_id = struct.unpack_from('<H', binary_data, offset)[0]
+        name_len = binary_data[offset + 12]
+        config_size = binary_data[offset + 13]
+        end = offset + CHANNEL_HEADER_SIZE + name_len + config_size
+        if end > len(binary_data):
+            raise ValueError(f"Truncated record for channel {channel_id}")
+        if channel_id in records:
+            raise ValueError(f"Duplicate channel ID {channel_id}")
+        records[channel_id] = binary_data[offset:end]
+        offset = end
+
+    return records
+
+
+def _record_hash(record: bytes) -> bytes:
+    return hashlib.blake2b(record, digest_size=8).digest()
+
+
+@dataclass
+class ConfigDelta:
+    """Channels that differ between the synced config and a new one."""
+
+    changed: List[int] = field(default_factory=list)
+    added: List[int] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+    records: Dict[int, bytes] = field(default_factory=dict)  # New records for changed + added
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the device already holds the new config."""
+        return not (self.changed or self.added or self.removed)
+
+    @property
+    def update_count(self) -> int:
+        """Number of atomic updates needed to apply the delta."""
+        return len(self.changed) + len(self.added) + len(self.removed)
+
+    @property
+    def wire_size(self) -> int:
+        """Payload bytes needed to apply the delta."""
+        return sum(len(r) for r in self.records.values()) + 2 * len(self.removed)
+
+
+class ConfigSyncState:
+    """Content hashes of the channels from the last successful sync.
+
+    Usage:
+        delta = sync.diff(binary_data)
+        if delta is None:
+            ...full upload...
+        else:
+            ...send delta.records / delta.removed...
+        sync.commit(binary_data)   # after the device acknowledged
+    """
+
+    def __init__(self, max_delta_ratio: float = 0.5, max_delta_channels: int = 16):
+        """
+        Args:
+            max_delta_ratio: Fall back to a full upload when the delta payload
+                exceeds this fraction of the full binary
+            max_delta_channels: Fall back to a full upload when more channels
+                than this changed
+        """
+        self.max_delta_ratio = max_delta_ratio
+        self.max_delta_channels = max_delta_channels
+        self._hashes: Optional[Dict[int, bytes]] = None
+
+    @property
+    def has_baseline(self) -> bool:
+        """True if a previous sync is known."""
+        return self._hashes is not None
+
+    def reset(self):
+        """Forget the synced state; the next sync is a full upload."""
+        self._hashes = None
+
+    def commit(self, binary_data: bytes):
+        """Record binary_data as the config now held by the device."""
+        try:
+            records = split_channel_records(binary_data)
+        except ValueError as e:
+            logger.warning(f"Cannot track synced config: {e}")
+            self._hashes = None
+            return
+        self._hashes = {ch_id: _record_hash(r) for ch_id, r in records.items()}
+
+    def diff(self, binary_data: bytes) -> Optional[ConfigDelta]:
+        """Compute the delta from the synced config to binary_data.
+
+        Returns:
+            The delta, or None if a full upload should be used instead
+            (no baseline, unparsable binary, or a large diff)
+        """
+        if self._hashes is None:
+            return None
+
+        try:
+            records = split_channel_records(binary_data)
+        except ValueError as e:
+            logger.warning(f"Cannot diff config, using full upload: {e}")
+            return None
+
+        delta = ConfigDelta()
+        for ch_id, record in records.items():
+            old_hash = self._hashes.get(ch_id)
+            if old_hash is None:
+                delta.added.append(ch_id)
+            elif old_hash != _record_hash(record):
+                delta.changed.append(ch_id)
+            else:
+                continue
+            if len(record) > MAX_RECORD_SIZE:
+                return None
+            delta.records[ch_id] = record
+        delta.removed = [ch_id for ch_id in self._hashes if ch_id not in records]
+
+        if delta.update_count > self.max_delta_channels:
+            return None
+        if delta.wire_size > len(binary_data) * self.max_delta_ratio:
+            return None
+
+        return delta
@@ -0,0 +1,255 @@
+"""
+Multi-Device Connection Manager for PMU-30
+
+Holds one session per device for bench rigs and end-of-line stations:
+- Sessions keyed by serial number or address, each with its own
+  AsyncDeviceClient (transport, MIN parser, telemetry queue)
+- Sessions stay connected between operations (pooled)
+- Fan-out operations run concurrently on all or selected devices,
+  with per-device progress, timing and error reporting
+
+Usage:
+    manager = ConnectionManager()
+    for port in ("/dev/ttyACM0", "/dev/ttyACM1"):
+        manager.add(port, {"type": "USB Serial", "port": port})
+    results = await manager.upload_and_flash_all(binary_data)
+    for key, result in results.items():
+        print(key, result.success, f"{result.elapsed_s:.2f}s", result.error)
+    await manager.close_all()
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .async_client import AsyncDeviceClient
+
+logger = logging.getLogger(__name__)
+
+# Devices worked on at the same time by fan-out operations (0 = no limit)
+DEFAULT_MAX_CONCURRENCY = 0
+
+
+@dataclass
+class DeviceSession:
+    """One managed device connection."""
+    key: str
+    config: Dict[str, Any]
+    client: AsyncDeviceClient
+    connected_at: Optional[float] = None
+    last_error: str = ""
+    operations: int = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return self.client.is_connected
+
+
+@dataclass
+class DeviceResult:
+    """Outcome of a fan-out operation on one device."""
+    key: str
+    success: bool = False
+    result: Any = None
+    error: str = ""
+    elapsed_s: float = 0.0
+    steps: Dict[str, float] = field(default_factory=dict)  # step name -> seconds
+
+
+# Progress callback: (device key, step name, fraction 0.0-1.0)
+ProgressCallback = Callable[[str, str, float], None]
+
+
+class ConnectionManager:
+    """
+    Connection pool for several PMU-30 devices on one event loop.
+
+    Operations are coroutines taking (session, report) where report(step,
+    fraction) forwards per-device progress. A failing device never stops
+    the others; its exception is recorded in its DeviceResult.
+
+    Example usage:
+        async def check(session, report):
+            return await session.client.get_capabilities()
+
+        results = await manager.run_all(check)
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 client_factory: Callable[[Dict[str, Any]], AsyncDeviceClient] = AsyncDeviceClient.from_config):
+        self.max_concurrency = max_concurrency
+        self._client_factory = client_factory
+        self._sessions: Dict[str, DeviceSession] = {}
+
+    # -------------------------------------------------------------------------
+    # Session pool
+    # -------------------------------------------------------------------------
+
+    def add(self, key: str, config: Dict[str, Any]) -> DeviceSession:
+        """Register a device. Raises ValueError if the key is already in use."""
+        if key in self._sessions:
+            raise ValueError(f"Device '{key}' is already registered")
+        session = DeviceSession(key=key, config=dict(config), client=self._client_factory(config))
+        self._sessions[key] = session
+        return session
+
+    async def remove(self, key: str):
+        """Close and forget a device."""
+        session = self._sessions.pop(key, None)
+        if session is not None:
+            await session.client.close()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._sessions)
+
+    def session(self, key: str) -> DeviceSession:
+        """Get a registered session. Raises KeyError for unknown devices."""
+        return self._sessions[key]
+
+    async def ensure_connected(self, key: str) -> DeviceSession:
+        """Get a session, connecting (or reconnecting) it if needed."""
+        session = self._sessions[key]
+        if not session.client.is_connected:
+            await session.client.close()
+            await session.client.connect()
+            session.connected_at = time.monotonic()
+            logger.info(f"Device '{key}' connected")
+        return session
+
+    async def connect_all(self, keys: Optional[Iterable[str]] = None) -> Dict[str, DeviceResult]:
+        """Connect all (or the given) devices concurrently."""
+        async def connect(session, report):
+            return True
+        return await self.run_all(connect, keys)
+
+    async def close_all(self):
+        """Disconnect every device (sessions stay registered)."""
+        await asyncio.gather(*(s.client.close() for s in self._sessions.values()),
+                             return_exceptions=True)
+
+    # -------------------------------------------------------------------------
+    # Fan-out
+    # -------------------------------------------------------------------------
+
+    async def run_all(self,
+                      operation: Callable[[DeviceSession, Callable[[str, float], None]], Awaitable[Any]],
+                      keys: Optional[Iterable[str]] = None,
+                      progress: Optional[ProgressCallback] = None,
+                      timeout: Optional[float] = None) -> Dict[str, DeviceResult]:
+        """
+        Run an operation on several devices concurrently.
+
+        Args:
+            operation: Coroutine function (session, report) -> result
+            keys: Devices to run on (default: all)
+            progress: Called with (key, step, fraction) as devices report
+            timeout: Per-device time limit in seconds, including connecting
+
+        Returns:
+            Dict of device key -> DeviceResult, in the order of keys
+            (registration order by default)
+        """
+        keys = list(self._sessions) if keys is None else list(keys)
+        limit = self.max_concurrency
+        semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+
+        async def run_one(key: str) -> DeviceResult:
+            result = DeviceResult(key=key)
+            if semaphore is not None:
+                await semaphore.acquire()
+            start = time.monotonic()
+            step_name, step_time = "", start
+
+            def report(step: str, fraction: float):
+                nonlocal step_name, step_time
+                if step != step_name:
+                    now = time.monotonic()
+                    if step_name:
+                        result.steps[step_name] = now - step_time
+                    step_name, step_time = step, now
+                if progress is not None:
+                    progress(key, step, fraction)
+
+            async def connect_and_run():
+                report("connect", 0.0)
+                session = await self.ensure_connected(key)
+                value = await operation(session, report)
+                session.operations += 1
+                return value
+
+            try:
+                # The timeout covers connecting too, so a hung connect frees its slot
+                coro = connect_and_run()
+                value = await (asyncio.wait_for(coro, timeout) if timeout else coro)
+                result.result = value
+                result.success = value is not False
+                if not result.success:
+                    result.error = "Operation failed"
+            except asyncio.TimeoutError:
+                result.error = f"Timed out after {timeout}s"
+            except Exception as e:
+                result.error = str(e) or e.__class__.__name__
+            finally:
+                end = time.monotonic()
+                if step_name:
+                    result.steps[step_name] = end - step_time
+                result.elapsed_s = end - start
+                if semaphore is not None:
+                    semaphore.release()
+
+            if key in self._sessions:
+                self._sessions[key].last_error = result.error
+            if result.error:
+                logger.warning(f"Device '{key}': {result.error}")
+            return result
+
+        results = await asyncio.gather(*(run_one(key) for key in keys))
+        return {r.key: r for r in results}
+
+    async def ping_all(self, keys: Optional[Iterable[str]] = None,
+                       timeout: float = 1.0) -> Dict[str, DeviceResult]:
+        """PING every device concurrently."""
+        async def ping(session, report):
+            report("ping", 0.0)
+            return await session.client.ping(timeout)
+        return await self.run_all(ping, keys)
+
+    async def upload_and_flash_all(self, binary_data: bytes,
+                                   keys: Optional[Iterable[str]] = None,
+                                   save_to_flash: bool = True,
+                                   progress: Optional[ProgressCallback] = None,
+                                   chunk_timeout: float = 2.0,
+                                   flash_timeout: float = 5.0) -> Dict[str, DeviceResult]:
+        """
+        Upload one binary config to many devices and save it to flash.
+
+        Each DeviceResult.result holds the number of channels loaded;
+        steps holds upload and flash durations.
+        """
+        async def upload(session, report):
+            client = session.client
+            report("upload", 0.0)
+            if client.capabilities is None:
+                await client.get_capabilities()  # Negotiates compressed upload
+            ok, channels = await client.upload_config(
+                binary_data, chunk_timeout,
+                progress=lambda done, total: report("upload", done / total))
+            if not ok:
+                raise RuntimeError("Config upload failed")
+            if save_to_flash:
+                report("flash", 0.0)
+                if not await client.save_to_flash(flash_timeout):
+                    raise RuntimeError("Flash save failed")
+                report("flash", 1.0)
+            return channels
+
+        return await self.run_all(upload, keys, progress)
@@ -24,20 +24,31 @@ _shared_path = Path(__file__).parent.parent.parent.parent / "shared" / "python"
 if str(_shared_path) not in sys.path:
     sys.path.insert(0, str(_shared_path))
 
-from communication.protocol import MessageType, build_min_frame, MINFrameParser
+from communication.protocol import MessageType, FrameBuilder, build_min_frame, MINFrameParser
 from communication.telemetry import parse_telemetry
+from device_caps import SwCapsFlags  # noqa: E402
 from binascii import crc32
 from dataclasses import dataclass
 
 # New modular components
 from .transport import TransportFactory, MINSerialTransport
 from .telemetry_manager import TelemetryManager, TelemetryState
+from .telemetry_pipeline import TelemetryPipeline  # noqa: E402
 from .protocol_handler import ConfigAssembler, ProtocolHandler
+from .config_sync import ConfigSyncState, ConfigDelta  # noqa: E402
 from .connection_recovery import ConnectionRecoveryMachine, ConnectionConfig, ConnectionState
 
 
 logger = logging.getLogger(__name__)
 
+# Fallback interval of the serial telemetry timer (ms). Frames are normally
+# delivered as soon as the T-MIN reader thread queues them.
+SERIAL_POLL_FALLBACK_MS = 250
+
+# Wait for a CAPABILITIES answer before choosing the config upload path (s).
+# Firmware that does not answer gets the SerialTransfer upload right away.
+CAPABILITIES_PROBE_TIMEOUT = 0.3
+
 
 @dataclass
 class DeviceCapabilities:
@@ -53,6 +64,17 @@ class DeviceCapabilities:
     digital_input_count: int = 8  # Digital input channels
     hbridge_count: int = 2      # H-Bridge channels
     can_bus_count: int = 2      # CAN bus interfaces
+    sw_flags: SwCapsFlags = SwCapsFlags.NONE  # Protocol/software features
+
+    @property
+    def supports_config_lz(self) -> bool:
+        """Device accepts LOAD_BINARY_CONFIG_LZ (compressed config upload)."""
+        return bool(self.sw_flags & SwCapsFlags.CONFIG_LZ)
+
+    @property
+    def supports_config_in_band(self) -> bool:
+        """Device reassembles chunked LOAD_BINARY_CONFIG sent over T-MIN."""
+        return bool(self.sw_flags & SwCapsFlags.CONFIG_IN_BAND)
 
     @property
     def device_type_name(self) -> str:
@@ -64,10 +86,11 @@ class DeviceCapabilities:
     def from_payload(cls, payload: bytes) -> "DeviceCapabilities":
         """Parse capabilities from firmware response payload.
 
-        Payload format (10 bytes):
+        Payload format (10 bytes, newer firmware appends 4):
         [0] device_type, [1] fw_major, [2] fw_minor, [3] fw_patch,
         [4] output_count, [5] analog_input_count, [6] digital_input_count,
-        [7] hbridge_count, [8] can_bus_count, [9] reserved
+        [7] hbridge_count, [8] can_bus_count, [9] reserved,
+        [10-13] sw_flags (SwCapsFlags, LE)
         """
         if len(payload) < 10:
             logger.warning(f"Capabilities payload too short: {len(payload)} bytes")
@@ -81,6 +104,8 @@ class DeviceCapabilities:
             digital_input_count=payload[6],
             hbridge_count=payload[7],
             can_bus_count=payload[8],
+            sw_flags=SwCapsFlags(struct.unpack_from('<I', payload, 10)[0]) if len(payload) >= 14
+            else SwCapsFlags.NONE,
         )
 
 
@@ -103,6 +128,9 @@ class DeviceController(QObject):
     reconnecting = pyqtSignal(int, int)  # attempt, max_attempts
     reconnect_failed = pyqtSignal()  # all attempts exhausted
 
+    # Internal: T-MIN reader thread queued frames (delivered to the GUI thread)
+    _frames_ready = pyqtSignal()
+
     def __init__(self):
         super().__init__()
 
@@ -119,9 +147,15 @@ class DeviceController(QObject):
         # Telemetry manager for centralized control
         self._telemetry_manager = TelemetryManager(self)
 
-        # Serial telemetry polling timer
+        # Telemetry decode runs on the pipeline's worker, not the receive thread
+        self._telemetry_pipeline = TelemetryPipeline(parent=self)
+
+        # Serial telemetry polling: frames are pushed by the T-MIN reader
+        # thread, the timer only enables delivery and acts as a fallback
         self._serial_poll_timer = QTimer()
         self._serial_poll_timer.timeout.connect(self._poll_serial_telemetry)
+        self._frames_pending = threading.Event()
+        self._frames_ready.connect(self._on_frames_ready)
 
         # Config receive state
         self._config_event = threading.Event()
@@ -139,12 +173,20 @@ class DeviceController(QObject):
         self._channel_config_ack_event = threading.Event()
         self._channel_config_ack_success = False
         self._channel_config_ack_error_msg = ""
+        self._channel_config_pending: set = set()  # Channel IDs awaiting CHANNEL_CONFIG_ACK
+        self._channel_config_failed: List[int] = []
+
+        # Delta config sync: channels the device holds since the last upload
+        self._config_sync = ConfigSyncState()
+        self._atomic_update_supported = True  # Cleared when firmware ignores SET_CHANNEL_CONFIG
 
         # Binary config upload state
         self._binary_config_ack_event = threading.Event()
         self._binary_config_ack_success = False
         self._binary_config_ack_error = 0
         self._binary_config_channels_loaded = 0
+        self._binary_config_chunks = 0  # Chunks in the in-band upload in progress
+        self._in_band_upload_supported: Optional[bool] = None  # From capabilities on first upload
 
         # PING/PONG health check state
         self._pong_event = threading.Event()
@@ -179,6 +221,15 @@ class DeviceController(QObject):
         """Check if device is connected."""
         return self._is_connected
 
+    @property
+    def telemetry_pipeline(self) -> TelemetryPipeline:
+        """Background telemetry decode with coalesced widget updates.
+
+        Example:
+            controller.telemetry_pipeline.subscribe(update, ['voltage_v'])
+        """
+        return self._telemetry_pipeline
+
     @property
     def telemetry(self) -> TelemetryManager:
         """Get telemetry manager for stream control.
@@ -277,10 +328,17 @@ class DeviceController(QObject):
 
             # Reset config assembler
             self._config_assembler.reset()
+            self._in_band_upload_supported = None
+            self._device_capabilities = None
+            self._atomic_update_supported = True
+            self._config_sync.reset()  # Device config unknown until the first upload
+            self._telemetry_pipeline.reset_subscribers()
 
             # Start receive thread for async transports
             if connection_type in ("Emulator", "WiFi"):
                 self._start_receive_thread()
+            elif isinstance(self._transport, MINSerialTransport):
+                self._transport.on_frames = self._notify_frames
 
             # Subscribe to telemetry after connection is established
             # Note: For Serial, telemetry starts after config is loaded (see _post_connection_setup)
@@ -316,6 +374,7 @@ class DeviceController(QObject):
 
         self._is_connected = False
         self._telemetry_enabled = False
+        self._telemetry_pipeline.reset_subscribers()
 
     def _on_recovery_state_changed(self, old_state: ConnectionState, new_state: ConnectionState):
         """Handle state changes from the recovery machine."""
@@ -356,6 +415,7 @@ class DeviceController(QObject):
         while time.time() - start_time < timeout:
             try:
                 if isinstance(self._transport, MINSerialTransport):
+                    self._transport.wait_frames(0.1)
                     frames = self._transport.poll()
                     for frame in frames:
                         if frame.min_id == MessageType.PONG:
@@ -367,8 +427,7 @@ class DeviceController(QObject):
                     if self._pong_event.wait(0.1):
                         return True
             except Exception:
-                pass
-            time.sleep(0.01)
+                time.sleep(0.01)
 
         return False
 
@@ -396,6 +455,7 @@ class DeviceController(QObject):
         while time.time() - start_time < timeout:
             try:
                 if isinstance(self._transport, MINSerialTransport):
+                    self._transport.wait_frames(0.1)
                     frames = self._transport.poll()
                     for frame in frames:
                         if frame.min_id == MessageType.CAPABILITIES:
@@ -409,7 +469,7 @@ class DeviceController(QObject):
                         return self._device_capabilities
             except Exception as e:
                 logger.warning(f"Error polling for capabilities: {e}")
-            time.sleep(0.01)
+                time.sleep(0.01)
 
         return None
 
@@ -658,8 +718,8 @@ class DeviceController(QObject):
                     self._handle_connection_lost()
                     break
 
-                # Try to receive data (non-blocking with short timeout)
-                data = self._transport.receive(4096, timeout=0.01)
+                # Block until data arrives (timeout only to check the stop flag)
+                data = self._transport.receive(4096, timeout=0.1)
 
                 if data:
                     logger.debug(f"Received {len(data)} bytes: {data[:50].hex()}...")
@@ -673,8 +733,6 @@ class DeviceController(QObject):
                     self._handle_connection_lost()
                     break
 
-                time.sleep(0.01)  # 10ms polling interval
-
             except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError) as e:
                 if not self._stop_thread.is_set():
                     logger.warning(f"Connection error: {e}")
@@ -724,8 +782,10 @@ class DeviceController(QObject):
                 logger.debug("PONG received")
 
             elif msg_type == MessageType.TELEMETRY_DATA:
-                telemetry = parse_telemetry(payload)
-                self.telemetry_received.emit(telemetry)
+                self._telemetry_pipeline.submit(payload)
+                # Full packets only for direct listeners of the legacy signal
+                if self.receivers(self.telemetry_received):
+                    self.telemetry_received.emit(parse_telemetry(payload))
 
             elif msg_type == MessageType.LOG_MESSAGE:
                 # Use protocol handler to parse log message
@@ -759,6 +819,7 @@ class DeviceController(QObject):
             elif msg_type == MessageType.BOOT_COMPLETE:
                 # Device finished boot/restart - emit signal to reload config
                 logger.info("BOOT_COMPLETE received - device finished initialization")
+                self._config_sync.reset()  # Device reloaded its config from flash
                 self.boot_complete.emit()
 
             elif msg_type == MessageType.OUTPUT_ACK:
@@ -780,12 +841,19 @@ class DeviceController(QObject):
                     channel_id, success, error_code, error_msg = FrameParser.parse_channel_config_ack(payload)
                     self._channel_config_ack_success = success
                     self._channel_config_ack_error_msg = error_msg
-                    logger.info(f"Channel config ACK: channel={channel_id}, success={success}, error={error_msg}")
+                    self._channel_config_pending.discard(channel_id)
+                    if not success:
+                        self._channel_config_failed.append(channel_id)
+                    logger.info(f"Channel config ACK: channel={channel_id}, success={success}, "
+                                f"error={error_code} {error_msg}")
                 except Exception as e:
                     logger.error(f"Failed to parse channel config ACK: {e}")
                     self._channel_config_ack_success = False
                     self._channel_config_ack_error_msg = str(e)
-                self._channel_config_ack_event.set()
+                    self._channel_config_pending.clear()
+                    self._channel_config_failed.append(0)
+                if not self._channel_config_pending:
+                    self._channel_config_ack_event.set()
 
             elif msg_type == MessageType.BINARY_CONFIG_ACK:
                 # Parse binary config ACK: success (1B) + error_code (1B) + channels_loaded (2B) + ...
@@ -797,7 +865,10 @@ class DeviceController(QObject):
                     self._binary_config_ack_success = len(payload) >= 1 and payload[0] == 1
                     self._binary_config_ack_error = payload[1] if len(payload) >= 2 else 0
                     self._binary_config_channels_loaded = 0
-                self._binary_config_ack_event.set()
+                # Multi-chunk uploads finish with the 6-byte final ACK (or an error)
+                if (len(payload) >= 6 or not self._binary_config_ack_success
+                        or self._binary_config_chunks <= 1):
+                    self._binary_config_ack_event.set()
                 logger.info(f"Binary config ACK: success={self._binary_config_ack_success}, "
                            f"error={self._binary_config_ack_error}, channels={self._binary_config_channels_loaded}")
 
@@ -923,11 +994,10 @@ class DeviceController(QObject):
             self._telemetry_manager._rate_hz = rate_hz
             logger.info(f"Subscribed to telemetry at {rate_hz}Hz")
 
-            # For T-MIN Serial, start polling timer to process incoming frames
+            # For T-MIN Serial, enable frame delivery (reader thread pushes frames)
             if self._connection_type == "USB Serial":
-                poll_interval = max(20, 1000 // rate_hz // 2)  # Poll faster than telemetry rate
-                self._serial_poll_timer.start(poll_interval)
-                logger.info(f"Started T-MIN polling at {poll_interval}ms interval")
+                self._serial_poll_timer.start(SERIAL_POLL_FALLBACK_MS)
+                logger.info("Started T-MIN telemetry delivery")
 
     def unsubscribe_telemetry(self):
         """Unsubscribe from telemetry streaming.
@@ -948,8 +1018,20 @@ class DeviceController(QObject):
                 self._telemetry_manager._state = TelemetryState.STOPPED
             logger.info("Unsubscribed from telemetry")
 
+    def _notify_frames(self):
+        """Called from the T-MIN reader thread when frames are queued."""
+        if not self._frames_pending.is_set():
+            self._frames_pending.set()
+            self._frames_ready.emit()
+
+    def _on_frames_ready(self):
+        """Deliver queued T-MIN frames in the GUI thread."""
+        self._frames_pending.clear()
+        if self._serial_poll_timer.isActive():
+            self._poll_serial_telemetry()
+
     def _poll_serial_telemetry(self):
-        """Poll T-MIN transport for incoming frames (called by timer)."""
+        """Process queued T-MIN frames (on reader notification or fallback timer)."""
         if not self._is_connected or not self._transport:
             return
 
@@ -992,8 +1074,9 @@ class DeviceController(QObject):
     def upload_binary_config(self, binary_data: bytes, timeout: float = 5.0) -> bool:
         """Upload binary configuration to device and wait for ACK.
 
-        Uses PMUSerialTransfer (COBS + CRC8) protocol - same as firmware.
-        The existing transport is disconnected during upload to avoid conflicts.
+        Sends LOAD_BINARY_CONFIG chunks in-band over the open T-MIN transport
+        when the device advertises SwCapsFlags.CONFIG_IN_BAND. Other firmware
+        gets the legacy PMUSerialTransfer upload without waiting for an ACK.
 
         Args:
             binary_data: Binary config data (serialized channels)
@@ -1010,6 +1093,177 @@ class DeviceController(QObject):
             logger.error("Cannot upload config - not USB Serial connection")
             return False
 
+        if self._in_band_upload_supported is None:
+            self._in_band_upload_supported = self._config_in_band_supported()
+
+        result = None
+        if self._in_band_upload_supported:
+            result = self._upload_binary_config_in_band(binary_data, timeout)
+            if result is None:
+                logger.warning("No in-band config ACK - using SerialTransfer upload for this connection")
+                self._in_band_upload_supported = False
+
+        if result is None:
+            result = self._upload_binary_config_serial_transfer(binary_data, timeout)
+
+        if result:
+            self._config_sync.commit(binary_data)
+        else:
+            self._config_sync.reset()
+        return result
+
+    def sync_binary_config(self, binary_data: bytes, timeout: float = 5.0) -> bool:
+        """Bring the device config in line with binary_data, sending only changes.
+
+        Channels whose serialized record changed since the last successful
+        upload are sent as atomic SET_CHANNEL_CONFIG updates. Falls back to
+        upload_binary_config() when there is no previous sync, the diff is
+        large, or the firmware does not support atomic updates.
+
+        Args:
+            binary_data: Binary config data (serialize_ui_channels_for_executor)
+            timeout: Timeout in seconds to wait for ACKs
+
+        Returns:
+            True if the device now holds binary_data
+        """
+        if not self._is_connected:
+            logger.warning("Cannot sync config: not connected")
+            return False
+
+        delta = None
+        if self._atomic_update_supported and isinstance(self._transport, MINSerialTransport):
+            delta = self._config_sync.diff(binary_data)
+        if delta is None:
+            return self.upload_binary_config(binary_data, timeout)
+
+        if delta.is_empty:
+            logger.debug("Config sync: device already up to date")
+            return True
+
+        result = self._upload_config_delta(delta, timeout)
+        if result is None:
+            logger.warning("No channel config ACK - using full uploads for this connection")
+            self._atomic_update_supported = False
+        if not result:
+            # Partially applied delta leaves the device state unknown
+            self._config_sync.reset()
+            return self.upload_binary_config(binary_data, timeout)
+
+        self._config_sync.commit(binary_data)
+        return True
+
+    def _upload_config_delta(self, delta: ConfigDelta, timeout: float) -> Optional[bool]:
+        """Send a config delta as pipelined SET_CHANNEL_CONFIG frames.
+
+        Removals go first so a re-added channel ID never collides.
+
+        Returns:
+            True if every update was acknowledged, False on an error ACK,
+            or None if no ACK arrived within timeout
+        """
+        frames = [FrameBuilder.remove_channel_config(ch_id) for ch_id in delta.removed]
+        frames += [FrameBuilder.set_channel_config(delta.records[ch_id])
+                   for ch_id in delta.changed + delta.added]
+
+        polling_was_active = self._serial_poll_timer.isActive()
+        if polling_was_active:
+            self._serial_poll_timer.stop()
+
+        self._channel_config_ack_event.clear()
+        self._channel_config_pending = set(delta.removed + delta.changed + delta.added)
+        self._channel_config_failed = []
+        start_time = time.time()
+        try:
+            for frame in frames:
+                if not self._transport.queue_frame(frame.msg_type, frame.payload):
+                    logger.error("Failed to queue SET_CHANNEL_CONFIG frame")
+                    return False
+
+            while time.time() - start_time < timeout:
+                self._transport.wait_frames(0.05)
+                for frame in self._transport.poll():
+                    self._handle_message(frame.min_id, frame.payload)
+                if self._channel_config_ack_event.is_set():
+                    break
+
+            if not self._channel_config_ack_event.is_set():
+                # Some ACKs but not all: firmware supports updates, the link is bad
+                return False if len(self._channel_config_pending) < len(frames) else None
+            if self._channel_config_failed:
+                logger.error(f"Channel config update failed for channels {self._channel_config_failed}")
+                return False
+
+            logger.info(f"Config delta synced: {len(delta.changed)} changed, {len(delta.added)} added, "
+                        f"{len(delta.removed)} removed, {delta.wire_size} bytes, "
+                        f"{time.time() - start_time:.3f}s")
+            return True
+        finally:
+            self._channel_config_pending = set()
+            if polling_was_active:
+                self._serial_poll_timer.start()
+
+    def _upload_binary_config_in_band(self, binary_data: bytes, timeout: float) -> Optional[bool]:
+        """Pipelined config upload over T-MIN.
+
+        All chunks are queued at once; T-MIN keeps its send window full and
+        retransmits lost frames, and the firmware sends a single ACK after
+        reassembling the last chunk. Devices advertising SwCapsFlags.CONFIG_LZ
+        get the compressed stream.
+
+        Returns:
+            ACK success, or None if no final ACK arrived within timeout
+        """
+        frames = FrameBuilder.load_binary_config_chunked(binary_data, compressed=self._config_lz_supported())
+
+        polling_was_active = self._serial_poll_timer.isActive()
+        if polling_was_active:
+            self._serial_poll_timer.stop()
+
+        self._binary_config_ack_event.clear()
+        self._binary_config_ack_success = False
+        self._binary_config_chunks = len(frames)
+        start_time = time.time()
+        try:
+            for frame in frames:
+                if not self._transport.queue_frame(frame.msg_type, frame.payload):
+                    logger.error("Failed to queue LOAD_BINARY_CONFIG chunk")
+                    return False
+
+            while time.time() - start_time < timeout:
+                self._transport.wait_frames(0.05)
+                for frame in self._transport.poll():
+                    self._handle_message(frame.min_id, frame.payload)
+                if self._binary_config_ack_event.is_set():
+                    break
+
+            if not self._binary_config_ack_event.is_set():
+                return None
+
+            logger.info(f"Binary config uploaded in-band: {len(binary_data)} bytes, "
+                        f"{len(frames)} chunks ({frames[0].msg_type.name}), "
+                        f"{time.time() - start_time:.3f}s")
+            return self._binary_config_ack_success
+        finally:
+            self._binary_config_chunks = 0
+            if polling_was_active:
+                self._serial_poll_timer.start()
+
+    def _config_in_band_supported(self) -> bool:
+        """True if the device advertises in-band upload, querying capabilities if needed."""
+        caps = self._device_capabilities or self.get_capabilities(timeout=CAPABILITIES_PROBE_TIMEOUT)
+        return caps is not None and caps.supports_config_in_band
+
+    def _config_lz_supported(self) -> bool:
+        """True if the connected device advertised compressed config upload."""
+        caps = self._device_capabilities
+        return caps is not None and caps.supports_config_lz
+
+    def _upload_binary_config_serial_transfer(self, binary_data: bytes, timeout: float) -> bool:
+        """Legacy upload over a separate PMUSerialTransfer (COBS + CRC8) connection.
+
+        The T-MIN transport is disconnected during upload to avoid conflicts.
+        """
         # Get port info before disconnecting
         port_name = self._transport.port.split(" - ")[0] if " - " in self._transport.port else self._transport.port
         baudrate = self._transport.baudrate
@@ -1070,7 +1324,9 @@ class DeviceController(QObject):
                 # STEP 5: Upload config
                 logger.info(f"Uploading binary config: {len(binary_data)} bytes")
                 pmu._port.reset_input_buffer()  # Clear any stale data before upload
-                upload_success, channels = pmu.upload_config(binary_data)
+                caps = pmu.get_capabilities()
+                compressed = bool(caps and caps.get('sw_flags', 0) & SwCapsFlags.CONFIG_LZ)
+                upload_success, channels = pmu.upload_config(binary_data, compressed=compressed)
 
                 if upload_success:
                     logger.info(f"Binary config uploaded: {channels} channels loaded")
@@ -1133,15 +1389,16 @@ class DeviceController(QObject):
             start_time = time.time()
             while time.time() - start_time < timeout:
                 if isinstance(self._transport, MINSerialTransport):
+                    self._transport.wait_frames(0.05)
                     frames = self._transport.poll()
                     for frame in frames:
                         self._handle_message(frame.min_id, frame.payload)
 
-                if self._flash_ack_event.is_set():
+                    if self._flash_ack_event.is_set():
+                        break
+                elif self._flash_ack_event.wait(0.05):
                     break
 
-                time.sleep(0.05)
-
             if self._flash_ack_success:
                 logger.info("Configuration saved to flash successfully")
                 return True
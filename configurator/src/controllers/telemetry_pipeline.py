@@ -0,0 +1,292 @@
+"""
+Telemetry Pipeline - background decode and coalesced fan-out to widgets.
+
+Raw TELEMETRY_DATA payloads are queued by the receiving thread and
+decoded on a worker thread, which also computes the derived display
+fields (volts, amps, plain state lists, ...). The GUI thread never
+parses packets: a refresh timer hands the latest frame to subscribers
+at the display rate (latest-wins). Each subscriber gets only the fields
+it asked for, and only when one of them changed since its last delivery.
+
+Subscribers that must see every sample (the data logger) subscribe with
+every_frame=True and receive all frames decoded since the previous
+refresh, in order.
+
+Usage:
+    pipeline = TelemetryPipeline()
+    pipeline.subscribe(monitor.update_voltage, ['voltage_v', 'current_a'])
+    pipeline.subscribe(logger.add_frames, ['voltage_v'], every_frame=True)
+    pipeline.submit(payload)   # Any thread
+"""
+
+import logging
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QObject, QTimer
+
+from communication.telemetry import TelemetryPacket, parse_telemetry
+
+logger = logging.getLogger(__name__)
+
+
+# Widget refresh rate; faster telemetry is coalesced to this rate
+DEFAULT_REFRESH_HZ = 30
+
+# Undecoded payloads kept while the worker is busy (oldest dropped)
+MAX_PENDING_PAYLOADS = 1000
+
+# Frames kept for every_frame subscribers between refreshes
+MAX_FRAME_HISTORY = 5000
+
+
+def _fault_flags(packet: TelemetryPacket) -> int:
+    return int(packet.fault_flags)
+
+
+# Field name -> value computed from a flat-parsed packet. Lists are plain
+# ints so widgets need no enum handling and change checks are cheap.
+TELEMETRY_FIELDS: Dict[str, Callable[[TelemetryPacket], Any]] = {
+    'uptime_ms': lambda p: p.timestamp_ms,
+    'voltage_v': lambda p: p.input_voltage_mv / 1000.0,
+    'temperature_c': lambda p: p.temperature_c,
+    'current_a': lambda p: p.total_current_ma / 1000.0,
+    'channel_states': lambda p: list(p.profet_states),
+    'channel_currents': lambda p: list(p.profet_duties),
+    'output_currents': lambda p: list(p.profet_duties),
+    'adc_values': lambda p: list(p.adc_values),
+    'analog_values': lambda p: list(p.adc_values[:8]),
+    'digital_inputs': lambda p: list(p.digital_inputs),
+    'hbridge_states': lambda p: list(p.hbridge_states),
+    'hbridge_positions': lambda p: list(p.hbridge_positions),
+    'virtual_channels': lambda p: p.virtual_channels,
+    'fault_flags': _fault_flags,
+    'board_temp_2': lambda p: p.board_temp_2,
+    'output_5v_mv': lambda p: p.output_5v_mv,
+    'output_3v3_mv': lambda p: p.output_3v3_mv,
+    'flash_temp': lambda p: p.flash_temp,
+    'system_status': lambda p: p.system_status,
+}
+
+# Host receive time (time.time()) of the frame, always present
+FIELD_RECEIVED = 'received_s'
+
+
+@dataclass(eq=False)
+class TelemetrySubscription:
+    """A subscriber and the fields it receives."""
+    callback: Callable[[Any], None]
+    fields: Tuple[str, ...]
+    every_frame: bool = False
+    last: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+
+class TelemetryPipeline(QObject):
+    """Decodes telemetry on a worker thread and fans frames out on the GUI thread."""
+
+    def __init__(self, refresh_hz: int = DEFAULT_REFRESH_HZ, parent: Optional[QObject] = None):
+        super().__init__(parent)
+
+        self._subscriptions: List[TelemetrySubscription] = []
+        self._fields: Tuple[str, ...] = ()
+        self._keep_history = False
+
+        # Receiving thread -> worker
+        self._pending: Deque[Tuple[bytes, float]] = deque(maxlen=MAX_PENDING_PAYLOADS)
+        self._pending_cond = threading.Condition()
+        self._busy = False
+        self._worker: Optional[threading.Thread] = None
+        self._running = False
+
+        # Worker -> GUI thread
+        self._frame_lock = threading.Lock()
+        self._latest: Optional[Dict[str, Any]] = None
+        self._latest_seq = 0
+        self._delivered_seq = 0
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=MAX_FRAME_HISTORY)
+
+        # Statistics
+        self.frames_received = 0
+        self.frames_decoded = 0
+        self.frames_dropped = 0
+        self.decode_errors = 0
+        self.refreshes = 0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(max(1, 1000 // refresh_hz))
+        self._timer.timeout.connect(self.flush)
+
+    # -------------------------------------------------------------------------
+    # Subscriptions (GUI thread)
+    # -------------------------------------------------------------------------
+
+    def subscribe(self, callback: Callable[[Any], None], fields: Sequence[str],
+                  every_frame: bool = False) -> TelemetrySubscription:
+        """
+        Deliver fields to callback on the GUI thread.
+
+        Args:
+            callback: Called with {field: value} for the latest frame, or with
+                a list of such dicts (oldest first) when every_frame is set
+            fields: Names from TELEMETRY_FIELDS; FIELD_RECEIVED is always added
+            every_frame: Receive every decoded frame instead of the latest one
+                whenever a subscribed field changed
+
+        Returns:
+            Handle for unsubscribe()
+        """
+        unknown = [name for name in fields if name not in TELEMETRY_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown telemetry fields: {unknown}")
+
+        subscription = TelemetrySubscription(callback, tuple(fields) + (FIELD_RECEIVED,), every_frame)
+        self._subscriptions.append(subscription)
+        self._update_fields()
+        return subscription
+
+    def unsubscribe(self, subscription: TelemetrySubscription):
+        """Stop deliveries to a subscriber."""
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            self._update_fields()
+
+    def _update_fields(self):
+        """Only fields someone subscribed to are computed by the worker."""
+        names = {name for sub in self._subscriptions for name in sub.fields}
+        names.discard(FIELD_RECEIVED)
+        self._fields = tuple(sorted(names))
+        self._keep_history = any(sub.every_frame for sub in self._subscriptions)
+
+    # -------------------------------------------------------------------------
+    # Input (any thread)
+    # -------------------------------------------------------------------------
+
+    def submit(self, payload: bytes):
+        """Queue a raw TELEMETRY_DATA payload for decoding. Never blocks."""
+        with self._pending_cond:
+            if len(self._pending) == self._pending.maxlen:
+                self.frames_dropped += 1
+            self._pending.append((payload, time.time()))
+            self.frames_received += 1
+            if not self._running:
+                self._start_worker()
+            self._pending_cond.notify()
+
+    def _start_worker(self):
+        self._running = True
+        self._worker = threading.Thread(target=self._worker_loop, name="telemetry-decode", daemon=True)
+        self._worker.start()
+
+    def _worker_loop(self):
+        while True:
+            with self._pending_cond:
+                while self._running and not self._pending:
+                    self._busy = False
+                    self._pending_cond.notify_all()
+                    self._pending_cond.wait()
+                if not self._running:
+                    self._busy = False
+                    self._pending_cond.notify_all()
+                    return
+                batch = list(self._pending)
+                self._pending.clear()
+                self._busy = True
+
+            frames = [frame for frame in map(self._decode, batch) if frame is not None]
+            if frames:
+                with self._frame_lock:
+                    self._latest = frames[-1]
+                    self._latest_seq += len(frames)
+                    if self._keep_history:
+                        self._history.extend(frames)
+
+    def _decode(self, item: Tuple[bytes, float]) -> Optional[Dict[str, Any]]:
+        payload, received = item
+        try:
+            packet = parse_telemetry(payload, flat=True)
+        except (ValueError, IndexError, struct.error) as e:
+            self.decode_errors += 1
+            logger.debug(f"Dropping malformed telemetry ({len(payload)} bytes): {e}")
+            return None
+
+        frame = {name: TELEMETRY_FIELDS[name](packet) for name in self._fields}
+        frame[FIELD_RECEIVED] = received
+        self.frames_decoded += 1
+        return frame
+
+    def wait_idle(self, timeout: float = 1.0) -> bool:
+        """Wait until all submitted payloads are decoded (for tests and shutdown)."""
+        deadline = time.monotonic() + timeout
+        with self._pending_cond:
+            while self._pending or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._pending_cond.wait(remaining)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Output (GUI thread)
+    # -------------------------------------------------------------------------
+
+    def start(self):
+        """Start periodic delivery to subscribers."""
+        self._timer.start()
+
+    def stop(self):
+        """Stop delivery and the worker; undelivered frames are dropped."""
+        self._timer.stop()
+        with self._pending_cond:
+            self._running = False
+            self._pending.clear()
+            self._pending_cond.notify_all()
+        if self._worker is not None:
+            self._worker.join(1.0)
+            self._worker = None
+        with self._frame_lock:
+            self._latest = None
+            self._history.clear()
+            self._delivered_seq = self._latest_seq
+
+    @property
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+
+    def flush(self):
+        """Deliver the latest frame (and frame history) to subscribers."""
+        with self._frame_lock:
+            if self._latest_seq == self._delivered_seq:
+                return
+            latest = self._latest
+            history = list(self._history)
+            self._history.clear()
+            self._delivered_seq = self._latest_seq
+
+        self.refreshes += 1
+        for subscription in list(self._subscriptions):
+            try:
+                if subscription.every_frame:
+                    if history:
+                        subscription.callback(
+                            [{name: frame[name] for name in subscription.fields if name in frame}
+                             for frame in history])
+                    continue
+
+                values = {name: latest[name] for name in subscription.fields if name in latest}
+                changed = subscription.last is None or any(
+                    values[name] != subscription.last.get(name)
+                    for name in values if name != FIELD_RECEIVED)
+                if changed:
+                    subscription.last = values
+                    subscription.callback(values)
+            except Exception as e:
+                logger.error(f"Telemetry subscriber {subscription.callback!r} failed: {e}", exc_info=True)
+
+    def reset_subscribers(self):
+        """Force the next frame out to every subscriber (e.g. after reconnect)."""
+        for subscription in self._subscriptions:
+            subscription.last = None
@@ -28,6 +28,10 @@ from min_protocol import MINTransportSerial, MINFrame, MINConnectionError
 
 logger = logging.getLogger(__name__)
 
+# Longest blocking read in the T-MIN reader thread (seconds). Reads return
+# as soon as bytes arrive; this only bounds how long a missed wakeup can last.
+MIN_READER_MAX_WAIT = 0.5
+
 
 class Transport(ABC):
     """Abstract base class for transport implementations."""
@@ -151,6 +155,11 @@ class MINSerialTransport(Transport):
         frames = transport.poll()
         for frame in frames:
             handle_message(frame.min_id, frame.payload)
+
+    A reader thread blocks on the serial port and only wakes when bytes
+    arrive or a T-MIN retransmit/ACK deadline is due. Set on_frames to be
+    notified (from the reader thread) when new frames are queued, or block
+    in wait_frames().
     """
 
     def __init__(
@@ -179,6 +188,8 @@ class MINSerialTransport(Transport):
         self._stop_poll = threading.Event()
         self._rx_queue: List[MINFrame] = []
         self._rx_lock = threading.Lock()
+        self._rx_event = threading.Event()
+        self.on_frames: Optional[Callable[[], None]] = None
 
     def connect(self) -> bool:
         """Establish T-MIN connection over serial."""
@@ -215,6 +226,9 @@ class MINSerialTransport(Transport):
         """Close T-MIN connection."""
         # Stop poll thread
         self._stop_poll.set()
+        transport = self._min_transport
+        if transport:
+            transport.cancel_wait()
         if self._poll_thread:
             self._poll_thread.join(timeout=2.0)
             self._poll_thread = None
@@ -231,6 +245,7 @@ class MINSerialTransport(Transport):
         # Clear receive queue
         with self._rx_lock:
             self._rx_queue.clear()
+            self._rx_event.clear()
 
         logger.info("T-MIN Serial disconnected")
 
@@ -283,14 +298,18 @@ class MINSerialTransport(Transport):
                 return False
             try:
                 self._min_transport.queue_frame(min_id, payload)
+                # Transmit now rather than on the reader's next wakeup
+                self._min_transport.poll(b'')
                 logger.debug(f"T-MIN queued: id=0x{min_id:02X}, len={len(payload)}")
-                return True
             except MINConnectionError as e:
                 logger.error(f"T-MIN queue error: {e}")
                 return False
             except ValueError as e:
                 logger.error(f"T-MIN queue value error: {e}")
                 return False
+            # Reader recomputes its retransmit deadline
+            self._min_transport.cancel_wait()
+            return True
 
     def send_frame(self, min_id: int, payload: bytes = b'') -> bool:
         """
@@ -331,8 +350,21 @@ class MINSerialTransport(Transport):
         with self._rx_lock:
             frames = self._rx_queue.copy()
             self._rx_queue.clear()
+            self._rx_event.clear()
         return frames
 
+    def wait_frames(self, timeout: float) -> bool:
+        """
+        Block until received frames are queued for poll().
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if frames are available
+        """
+        return self._rx_event.wait(timeout)
+
     def get_transport_stats(self) -> Tuple:
         """
         Get T-MIN transport statistics.
@@ -359,15 +391,32 @@ class MINSerialTransport(Transport):
                 logger.info("T-MIN transport reset")
 
     def _poll_loop(self):
-        """Background loop for T-MIN state machine."""
+        """
+        Background reader for the T-MIN state machine.
+
+        Blocks on the serial port without holding the lock and wakes when
+        bytes arrive, when the next retransmit/ACK deadline is due, or when
+        queue_frame()/disconnect() cancel the wait.
+        """
         logger.debug("T-MIN poll loop started")
         while not self._stop_poll.is_set():
             try:
                 with self._lock:
-                    if not self._min_transport:
+                    transport = self._min_transport
+                    if not transport:
                         break
-                    # Poll T-MIN - processes RX data, handles ACKs, retransmits
-                    frames = self._min_transport.poll()
+                    timeout_ms = transport.next_timeout_ms()
+
+                wait = MIN_READER_MAX_WAIT
+                if timeout_ms is not None:
+                    wait = min(wait, timeout_ms / 1000)
+                data = transport.wait_for_data(wait) if wait > 0 else b''
+
+                with self._lock:
+                    if self._min_transport is not transport:
+                        break
+                    # Process RX data, send ACKs and due retransmits
+                    frames = transport.poll(data)
 
                 # Add received frames to queue
                 if frames:
@@ -376,9 +425,10 @@ class MINSerialTransport(Transport):
                             self._rx_queue.append(frame)
                             logger.debug(f"T-MIN RX: id=0x{frame.min_id:02X}, "
                                        f"len={len(frame.payload)}, transport={frame.is_transport}")
-
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.001)  # 1ms poll interval
+                        self._rx_event.set()
+                    callback = self.on_frames
+                    if callback:
+                        callback()
 
             except Exception as e:
                 if not self._stop_poll.is_set():
@@ -10,6 +10,7 @@ from .config_manager import ConfigManager
 from .binary_config import BinaryConfigManager
 from .config_migration import ConfigMigration
 from .config_can import CANMessageManager
+from .channel_dependencies import ChannelDependencyGraph
 from .undo_manager import (
     Command,
     AddChannelCommand,
@@ -29,6 +30,7 @@ __all__ = [
     'BinaryConfigManager',
     'ConfigMigration',
     'CANMessageManager',
+    'ChannelDependencyGraph',
     'Command',
     'AddChannelCommand',
     'RemoveChannelCommand',
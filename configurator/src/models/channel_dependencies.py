@@ -0,0 +1,275 @@
+"""
+Channel Dependency Graph
+
+Tracks which channels read which others, for "Show dependents", reference
+validation, circular dependency detection and the channel graph view.
+
+Each channel's references (by name, or by numeric channel_id in configs
+read back from the device) are kept as forward adjacency, and every
+reference is also filed under the name or ID it points at (reverse
+adjacency). Adding, editing or removing one channel only touches that
+channel's own edges; a reference to a channel that does not exist yet
+resolves as soon as it is added.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# A channel reference: channel name, or numeric channel_id
+ChannelRef = Union[str, int]
+
+# Channels that always exist (firmware constants)
+SYSTEM_CHANNEL_NAMES = frozenset({"zero", "one"})
+
+# Fields holding a single channel reference, per channel type
+CHANNEL_REFERENCE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "power_output": ("source_channel", "duty_channel"),
+    "hbridge": ("source_channel", "duty_channel", "direction_channel", "pid_setpoint_channel",
+                "pwm_source_channel", "direction_source_channel",
+                "position_source_channel", "target_source_channel"),
+    "logic": ("channel", "channel_2", "set_channel", "reset_channel", "toggle_channel"),
+    "timer": ("start_channel", "stop_channel", "trigger_channel"),
+    "filter": ("input_channel",),
+    "table_2d": ("x_axis_channel",),
+    "table_3d": ("x_axis_channel", "y_axis_channel"),
+    "switch": ("input_up_channel", "input_down_channel",
+               "input_channel_up", "input_channel_down"),
+    "enum": ("input_up_channel", "input_down_channel"),
+    "pid": ("setpoint_channel", "process_channel"),
+    "can_tx": ("trigger_channel",),
+    "lua_script": ("trigger_channel",),
+    "handler": ("source_channel", "condition_channel"),
+    "wiper": ("control_channel", "wash_channel", "rain_sensor_channel",
+              "park_channel", "intermittent_delay_channel"),
+    "blinker": ("left_channel", "right_channel", "hazard_channel"),
+}
+
+# Channel types with an "inputs" list (names, channel_ids or {"channel": ...})
+CHANNEL_INPUT_LIST_TYPES = frozenset({"logic", "number"})
+
+
+def _channel_name(channel: Dict[str, Any]) -> str:
+    return channel.get("channel_name", "") or channel.get("name", "") or channel.get("id", "")
+
+
+def _add_reference(refs: List[ChannelRef], ref: Any) -> None:
+    if isinstance(ref, dict):
+        ref = ref.get("channel")
+    if ref and isinstance(ref, (str, int)) and not isinstance(ref, bool) and ref not in refs:
+        refs.append(ref)
+
+
+def extract_channel_references(channel: Dict[str, Any]) -> List[ChannelRef]:
+    """
+    Get the channels a channel config reads from.
+
+    Args:
+        channel: Channel configuration dict
+
+    Returns:
+        Unique references in field order (names or numeric channel_ids)
+    """
+    refs: List[ChannelRef] = []
+    channel_type = channel.get("channel_type", "")
+
+    for field in CHANNEL_REFERENCE_FIELDS.get(channel_type, ()):
+        _add_reference(refs, channel.get(field))
+
+    if channel_type in CHANNEL_INPUT_LIST_TYPES:
+        for inp in channel.get("inputs", None) or []:
+            _add_reference(refs, inp)
+
+    if channel_type == "can_tx":
+        for sig in channel.get("signals", None) or []:
+            if isinstance(sig, dict):
+                _add_reference(refs, sig.get("source_channel"))
+                _add_reference(refs, sig.get("channel"))
+
+    return refs
+
+
+class ChannelDependencyGraph:
+    """Forward and reverse channel references, updated one channel at a time."""
+
+    def __init__(self):
+        # Forward: channel name -> references it reads
+        self._references: Dict[str, List[ChannelRef]] = {}
+        # Reverse: reference (name or channel_id) -> names of channels using it
+        self._referenced_by: Dict[ChannelRef, Dict[str, None]] = {}
+        self._channel_ids: Dict[str, Any] = {}
+        self._names_by_id: Dict[Any, str] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._references
+
+    def __len__(self) -> int:
+        return len(self._references)
+
+    def clear(self) -> None:
+        """Remove all channels"""
+        self._references.clear()
+        self._referenced_by.clear()
+        self._channel_ids.clear()
+        self._names_by_id.clear()
+
+    def build(self, channels: Iterable[Dict[str, Any]]) -> None:
+        """Replace the graph with channel configs (first wins on duplicate names)"""
+        self.clear()
+        for ch in channels:
+            name = _channel_name(ch)
+            if name and name not in self._references:
+                self.set_channel(name, extract_channel_references(ch), ch.get("channel_id"))
+
+    def set_channel(self, name: str, references: Iterable[ChannelRef],
+                    channel_id: Optional[Any] = None) -> None:
+        """
+        Add a channel or replace its references.
+
+        Args:
+            name: Channel name
+            references: Names or numeric channel_ids it reads
+            channel_id: Numeric channel_id, so references by ID resolve to it
+        """
+        if name in self._references:
+            self.remove_channel(name)
+
+        refs: List[ChannelRef] = []
+        for ref in references:
+            _add_reference(refs, ref)
+        self._references[name] = refs
+        for ref in refs:
+            self._referenced_by.setdefault(ref, {})[name] = None
+
+        if channel_id is not None:
+            self._channel_ids[name] = channel_id
+            self._names_by_id.setdefault(channel_id, name)
+
+    def remove_channel(self, name: str) -> None:
+        """Remove a channel's own references; references to it stay (now undefined)"""
+        refs = self._references.pop(name, None)
+        if refs is None:
+            return
+        for ref in refs:
+            users = self._referenced_by[ref]
+            del users[name]
+            if not users:
+                del self._referenced_by[ref]
+
+        channel_id = self._channel_ids.pop(name, None)
+        if channel_id is not None and self._names_by_id.get(channel_id) == name:
+            del self._names_by_id[channel_id]
+
+    def resolve(self, ref: ChannelRef) -> Optional[str]:
+        """Name of the channel a reference points at, None if undefined"""
+        if isinstance(ref, int):
+            return self._names_by_id.get(ref)
+        return ref if ref in self._references else None
+
+    def references(self, name: str) -> List[ChannelRef]:
+        """References a channel reads, as configured"""
+        return list(self._references.get(name, []))
+
+    def dependencies(self, name: str) -> List[str]:
+        """Names of the existing channels a channel reads"""
+        result = []
+        for ref in self._references.get(name, []):
+            target = self.resolve(ref)
+            if target is not None and target not in result:
+                result.append(target)
+        return result
+
+    def dependents(self, name: str) -> List[str]:
+        """Names of the channels reading a channel, by name or by channel_id"""
+        users = dict(self._referenced_by.get(name, {}))
+        channel_id = self._channel_ids.get(name)
+        if channel_id is not None and self._names_by_id.get(channel_id) == name:
+            users.update(self._referenced_by.get(channel_id, {}))
+        return list(users)
+
+    def impact(self, name: str) -> List[str]:
+        """
+        Channels affected by a change to a channel, directly or through others.
+
+        Returns:
+            Dependents in breadth-first order (nearest first), without name itself
+        """
+        seen = {name: None}
+        queue = [name]
+        for current in queue:
+            for user in self.dependents(current):
+                if user not in seen:
+                    seen[user] = None
+                    queue.append(user)
+        return queue[1:]
+
+    def undefined_references(self, known_names: Iterable[str] = SYSTEM_CHANNEL_NAMES
+                             ) -> List[Tuple[str, str]]:
+        """
+        References by name to channels that do not exist.
+
+        References by numeric channel_id are runtime IDs and not checked.
+
+        Returns:
+            (channel name, referenced name) pairs
+        """
+        known = set(known_names)
+        return [
+            (name, ref)
+            for name, refs in self._references.items()
+            for ref in refs
+            if isinstance(ref, str) and ref not in self._references and ref not in known
+        ]
+
+    def find_cycles(self) -> List[List[str]]:
+        """
+        Find groups of channels that depend on each other (Tarjan's algorithm).
+
+        Returns:
+            One list of channel names per cycle (strongly connected group,
+            or a channel reading itself)
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Dict[str, None] = {}
+        stack: List[str] = []
+        cycles: List[List[str]] = []
+
+        for root in self._references:
+            if root in index:
+                continue
+            # Iterative DFS: (node, its dependencies, next dependency to visit)
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack[root] = None
+            work = [(root, self.dependencies(root), 0)]
+
+            while work:
+                node, deps, i = work[-1]
+                if i < len(deps):
+                    work[-1] = (node, deps, i + 1)
+                    dep = deps[i]
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = len(index)
+                        stack.append(dep)
+                        on_stack[dep] = None
+                        work.append((dep, self.dependencies(dep), 0))
+                    elif dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep])
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    group = []
+                    while True:
+                        member = stack.pop()
+                        del on_stack[member]
+                        group.append(member)
+                        if member == node:
+                            break
+                    if len(group) > 1 or node in deps:
+                        group.reverse()
+                        cycles.append(group)
+
+        return cycles
@@ -6,11 +6,15 @@ Owner: R2 m-sport
 """
 
 import logging
+from bisect import bisect_left, insort
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
 
 from .channel import ChannelType, LogicOperation
+from .channel_dependencies import (
+    ChannelDependencyGraph, SYSTEM_CHANNEL_NAMES, extract_channel_references,
+)
 from .config_can import CANMessageManager
 from .config_migration import ConfigMigration
 from .channel_display_service import ChannelIdGenerator
@@ -42,13 +46,31 @@ def create_default_config() -> Dict[str, Any]:
 
 
 class ConfigManager:
-    """Manages PMU-30 configuration files (binary .pmu30 format only)"""
+    """Manages PMU-30 configuration files (binary .pmu30 format only)
+
+    Channel lookups go through indexes (name -> position, numeric
+    channel_id -> channel, channel_type -> channels) and a dependency graph
+    that add/update/remove keep up to date incrementally. The indexes remember which channels list
+    they describe and its length, so a replaced config or a list appended to
+    directly (e.g. CAN import) triggers one rebuild on the next lookup.
+    Callers that edit channel names, IDs or types in place should call
+    invalidate_channel_index().
+    """
 
     def __init__(self):
         self.config: Dict[str, Any] = create_default_config()
         self.current_file: Optional[Path] = None
         self.modified: bool = False
 
+        # Channel indexes, built lazily for self._indexed_channels
+        self._indexed_channels: Optional[List[Dict[str, Any]]] = None
+        self._indexed_keys: List[Tuple[str, Any, Any]] = []
+        self._name_index: Dict[str, int] = {}
+        self._id_index: Dict[Any, Dict[str, Any]] = {}
+        self._type_index: Dict[Any, List[int]] = {}  # Sorted positions
+        self._index_unique: bool = True
+        self._dependency_graph = ChannelDependencyGraph()
+
     def get_config(self) -> Dict[str, Any]:
         """Get current configuration"""
         return self.config
@@ -58,6 +80,7 @@ class ConfigManager:
         self.config = create_default_config()
         self.current_file = None
         self.modified = False
+        self.invalidate_channel_index()
         logger.info("Created new empty configuration")
 
     def load_from_file(self, filepath: str) -> Tuple[bool, Optional[str]]:
@@ -150,6 +173,7 @@ class ConfigManager:
             self.config["channels"] = channels
             self.current_file = path
             self.modified = False
+            self.invalidate_channel_index()
 
             logger.info(f"Loaded binary configuration: {len(channels)} channels")
             return True, None
@@ -278,6 +302,7 @@ class ConfigManager:
             self.config = config_dict
             self.current_file = None
             self.modified = False
+            self.invalidate_channel_index()
 
             logger.info("Loaded configuration from device")
             return True, None
@@ -338,6 +363,114 @@ class ConfigManager:
             logger.error(f"Failed to save configuration: {e}")
             return False
 
+    # ========== Channel Index ==========
+
+    @staticmethod
+    def _channel_name(channel: Dict[str, Any]) -> str:
+        """Channel name: 'channel_name', then 'name', then 'id' (backwards compatibility)"""
+        return channel.get("channel_name", "") or channel.get("name", "") or channel.get("id", "")
+
+    @classmethod
+    def _channel_keys(cls, channel: Dict[str, Any]) -> Tuple[str, Any, Any]:
+        """(name, numeric channel_id, channel_type) a channel is indexed under"""
+        return cls._channel_name(channel), channel.get("channel_id"), channel.get("channel_type")
+
+    def invalidate_channel_index(self) -> None:
+        """Drop the channel indexes; they are rebuilt on the next lookup."""
+        self._indexed_channels = None
+
+    def _rebuild_channel_index(self, channels: List[Dict[str, Any]]) -> None:
+        """Index every channel; on duplicate names or IDs the first one wins."""
+        self._indexed_channels = channels
+        self._indexed_keys = []
+        self._name_index = {}
+        self._id_index = {}
+        self._type_index = {}
+        self._index_unique = True
+        self._dependency_graph.clear()
+        for ch in channels:
+            self._index_channel_added(ch)
+
+    def _channels_indexed(self) -> List[Dict[str, Any]]:
+        """Get the channels list, rebuilding the indexes if it was replaced or resized"""
+        channels = self.config.get("channels", [])
+        if channels is not self._indexed_channels or len(channels) != len(self._indexed_keys):
+            self._rebuild_channel_index(channels)
+        return channels
+
+    def _index_channel_added(self, channel: Dict[str, Any]) -> None:
+        """Index a channel just appended to the indexed list"""
+        index = len(self._indexed_keys)
+        keys = self._channel_keys(channel)
+        name, ch_id, ch_type = keys
+        self._indexed_keys.append(keys)
+        if name in self._name_index:
+            self._index_unique = False
+        else:
+            self._name_index[name] = index
+            self._dependency_graph.set_channel(name, extract_channel_references(channel), ch_id)
+        if ch_id is not None:
+            if ch_id in self._id_index:
+                self._index_unique = False
+            else:
+                self._id_index[ch_id] = channel
+        self._type_index.setdefault(ch_type, []).append(index)
+
+    def _index_channel_replaced(self, index: int, channel: Dict[str, Any]) -> None:
+        """Re-index position index after its channel was replaced"""
+        old_name, old_id, old_type = self._indexed_keys[index]
+        keys = self._channel_keys(channel)
+        name, ch_id, ch_type = keys
+
+        # Renamed onto another channel's name or ID: first-wins needs a rescan
+        if (not self._index_unique
+                or (name != old_name and name in self._name_index)
+                or (ch_id != old_id and ch_id in self._id_index)):
+            self._rebuild_channel_index(self._indexed_channels)
+            return
+
+        self._indexed_keys[index] = keys
+        del self._name_index[old_name]
+        self._name_index[name] = index
+        if name != old_name:
+            self._dependency_graph.remove_channel(old_name)
+        self._dependency_graph.set_channel(name, extract_channel_references(channel), ch_id)
+        if old_id is not None:
+            del self._id_index[old_id]
+        if ch_id is not None:
+            self._id_index[ch_id] = channel
+
+        if ch_type != old_type:
+            self._remove_type_position(old_type, index)
+            insort(self._type_index.setdefault(ch_type, []), index)
+
+    def _index_channel_removed(self, index: int) -> None:
+        """Re-index after the channel at position index was popped"""
+        if not self._index_unique:
+            self._rebuild_channel_index(self._indexed_channels)
+            return
+
+        old_name, old_id, old_type = self._indexed_keys.pop(index)
+        del self._name_index[old_name]
+        self._dependency_graph.remove_channel(old_name)
+        if old_id is not None:
+            del self._id_index[old_id]
+        self._remove_type_position(old_type, index)
+
+        # Later channels moved up by one
+        for i in range(index, len(self._indexed_keys)):
+            self._name_index[self._indexed_keys[i][0]] = i
+        for positions in self._type_index.values():
+            start = bisect_left(positions, index)
+            positions[start:] = [p - 1 for p in positions[start:]]
+
+    def _remove_type_position(self, channel_type: Any, index: int) -> None:
+        """Drop position index from a type's sorted positions"""
+        positions = self._type_index[channel_type]
+        del positions[bisect_left(positions, index)]
+        if not positions:
+            del self._type_index[channel_type]
+
     # ========== Channel Methods ==========
 
     def get_all_channels(self) -> List[Dict[str, Any]]:
@@ -346,31 +479,45 @@ class ConfigManager:
 
     def get_channels_by_type(self, channel_type: ChannelType) -> List[Dict[str, Any]]:
         """Get channels of specific type"""
-        channels = self.config.get("channels", [])
-        return [ch for ch in channels if ch.get("channel_type") == channel_type.value]
+        channels = self._channels_indexed()
+        return [channels[i] for i in self._type_index.get(channel_type.value, [])]
 
     def get_channel_by_name(self, channel_name: str) -> Optional[Dict[str, Any]]:
         """Get channel by name (with backwards compatibility for 'name' and 'id' fields)"""
-        for ch in self.config.get("channels", []):
-            # Try 'channel_name' first, then 'name', then 'id' for backwards compatibility
-            name = ch.get("channel_name", "") or ch.get("name", "") or ch.get("id", "")
-            if name == channel_name:
-                return ch
-        return None
+        index = self.get_channel_index(channel_name)
+        if index < 0:
+            return None
+        return self.config["channels"][index]
 
     # Backwards compatibility alias
     def get_channel_by_id(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """Deprecated: Use get_channel_by_name instead"""
         return self.get_channel_by_name(channel_id)
 
+    def get_channel_by_channel_id(self, channel_id: int) -> Optional[Dict[str, Any]]:
+        """Get channel by numeric channel_id, None if not found"""
+        self._channels_indexed()
+        channel = self._id_index.get(channel_id)
+        if channel is not None and channel.get("channel_id") != channel_id:
+            # Edited in place since indexing
+            self._rebuild_channel_index(self._indexed_channels)
+            channel = self._id_index.get(channel_id)
+        return channel
+
+    def get_dependency_graph(self) -> ChannelDependencyGraph:
+        """Get the channel dependency graph (dependents, impact, cycles)"""
+        self._channels_indexed()
+        return self._dependency_graph
+
     def get_channel_index(self, channel_name: str) -> int:
         """Get channel index by name, returns -1 if not found"""
-        for i, ch in enumerate(self.config.get("channels", [])):
-            # Try 'channel_name' first, then 'name', then 'id' for backwards compatibility
-            name = ch.get("channel_name", "") or ch.get("name", "") or ch.get("id", "")
-            if name == channel_name:
-                return i
-        return -1
+        channels = self._channels_indexed()
+        index = self._name_index.get(channel_name, -1)
+        if index >= 0 and self._channel_name(channels[index]) != channel_name:
+            # Edited in place since indexing
+            self._rebuild_channel_index(channels)
+            index = self._name_index.get(channel_name, -1)
+        return index
 
     def add_channel(self, channel_config: Dict[str, Any]) -> bool:
         """
@@ -386,12 +533,13 @@ class ConfigManager:
             self.config["channels"] = []
 
         # Check for duplicate name (try 'channel_name' first, then 'name', then 'id')
-        channel_name = channel_config.get("channel_name", "") or channel_config.get("name", "") or channel_config.get("id", "")
-        if self.get_channel_by_name(channel_name):
+        channel_name = self._channel_name(channel_config)
+        if self.get_channel_index(channel_name) >= 0:
             logger.error(f"Channel with name '{channel_name}' already exists")
             return False
 
         self.config["channels"].append(channel_config)
+        self._index_channel_added(channel_config)
         self.modified = True
         logger.info(f"Added channel: {channel_name}")
         return True
@@ -414,6 +562,7 @@ class ConfigManager:
 
         # Update the channel
         self.config["channels"][index] = channel_config
+        self._index_channel_replaced(index, channel_config)
         self.modified = True
         logger.info(f"Updated channel: {channel_id}")
         return True
@@ -434,6 +583,7 @@ class ConfigManager:
             return False
 
         self.config["channels"].pop(index)
+        self._index_channel_removed(index)
         self.modified = True
         logger.info(f"Removed channel: {channel_id}")
         return True
@@ -497,14 +647,9 @@ class ConfigManager:
 
     def get_channel_names_of_type(self, channel_type: ChannelType) -> List[str]:
         """Get list of channel names of specific type"""
-        result = []
-        for ch in self.config.get("channels", []):
-            if ch.get("channel_type") == channel_type.value:
-                # Try 'channel_name' first, then 'name', then 'id' for backwards compatibility
-                name = ch.get("channel_name", "") or ch.get("name", "") or ch.get("id", "")
-                if name:
-                    result.append(name)
-        return result
+        channels = self._channels_indexed()
+        names = (self._channel_name(channels[i]) for i in self._type_index.get(channel_type.value, []))
+        return [name for name in names if name]
 
     # Backwards compatibility alias
     def get_channel_ids_of_type(self, channel_type: ChannelType) -> List[str]:
@@ -513,13 +658,13 @@ class ConfigManager:
 
     def channel_exists(self, channel_name: str) -> bool:
         """Check if channel with given name exists"""
-        return self.get_channel_by_name(channel_name) is not None
+        return self.get_channel_index(channel_name) >= 0
 
     def get_channel_count(self, channel_type: Optional[ChannelType] = None) -> int:
         """Get count of channels, optionally filtered by type"""
-        channels = self.config.get("channels", [])
+        channels = self._channels_indexed()
         if channel_type:
-            return sum(1 for ch in channels if ch.get("channel_type") == channel_type.value)
+            return len(self._type_index.get(channel_type.value, []))
         return len(channels)
 
     def get_next_channel_id(self) -> int:
@@ -632,73 +777,20 @@ class ConfigManager:
         Returns:
             List of error messages
         """
-        errors = []
-        # Include system channels that are always available
-        all_channel_names = {'zero', 'one'}  # System constant channels
-        for ch in self.config.get("channels", []):
-            # Try 'channel_name' first, then 'name', then 'id' for backwards compatibility
-            ch_name = ch.get("channel_name", "") or ch.get("name", "") or ch.get("id", "")
-            if ch_name:
-                all_channel_names.add(ch_name)
-
-        for ch in self.config.get("channels", []):
-            # Try 'channel_name' first, then 'name', then 'id' for backwards compatibility
-            ch_name = ch.get("channel_name", "") or ch.get("name", "") or ch.get("id", "unknown")
-            channel_type = ch.get("channel_type", "")
-
-            # Check references based on type
-            refs_to_check = []
-
-            if channel_type == "logic":
-                refs_to_check = ch.get("inputs", [])
-            elif channel_type == "number":
-                refs_to_check = ch.get("inputs", [])
-            elif channel_type == "timer":
-                if ch.get("start_channel"):
-                    refs_to_check.append(ch["start_channel"])
-                if ch.get("stop_channel"):
-                    refs_to_check.append(ch["stop_channel"])
-            elif channel_type == "filter":
-                if ch.get("input_channel"):
-                    refs_to_check.append(ch["input_channel"])
-            elif channel_type == "power_output":
-                if ch.get("source_channel"):
-                    refs_to_check.append(ch["source_channel"])
-                if ch.get("duty_channel"):
-                    refs_to_check.append(ch["duty_channel"])
-            elif channel_type in ["table_2d", "table_3d"]:
-                if ch.get("x_axis_channel"):
-                    refs_to_check.append(ch["x_axis_channel"])
-                if ch.get("y_axis_channel"):
-                    refs_to_check.append(ch["y_axis_channel"])
-            elif channel_type == "switch":
-                if ch.get("input_up_channel"):
-                    refs_to_check.append(ch["input_up_channel"])
-                if ch.get("input_down_channel"):
-                    refs_to_check.append(ch["input_down_channel"])
-            elif channel_type == "can_tx":
-                for sig in ch.get("signals", []):
-                    if sig.get("source_channel"):
-                        refs_to_check.append(sig["source_channel"])
-
-            for ref in refs_to_check:
-                # Skip empty, None, and integer references (runtime channel IDs)
-                if not ref or isinstance(ref, int):
-                    continue
-                if ref not in all_channel_names:
-                    errors.append(f"Channel '{ch_name}' references undefined channel '{ref}'")
-
-        return errors
+        graph = self.get_dependency_graph()
+        return [
+            f"Channel '{ch_name}' references undefined channel '{ref}'"
+            for ch_name, ref in graph.undefined_references(SYSTEM_CHANNEL_NAMES)
+        ]
 
     def detect_circular_dependencies(self) -> List[List[str]]:
         """
         Detect circular dependencies
 
         Returns:
-            List of cycles (each cycle is a list of channel IDs)
+            List of cycles (each cycle is a list of channel names)
         """
-        # ConfigValidator was removed - return empty (no cycles detected)
-        return []
+        return self.get_dependency_graph().find_cycles()
 
     # ========== Export ==========
 
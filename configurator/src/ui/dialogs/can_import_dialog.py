@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
 from utils.canx_parser import CanxParser, CanxData, CanxChannel, CanxMob, CanxFrame
@@ -447,19 +447,19 @@ class CANImportDialog(QDialog):
         else:
             self.stats_label.setText("No channels found")
 
-    def _get_existing_ids(self) -> Tuple[List[str], List[str]]:
+    def _get_existing_ids(self) -> Tuple[Set[str], Set[str]]:
         """Get existing message and channel IDs from config manager."""
-        msg_ids = []
-        channel_ids = []
+        msg_ids = set()
+        channel_ids = set()
 
         if self.config_manager:
             config = self.config_manager.get_config()
-            msg_ids = [m.get("id", "") for m in config.get("can_messages", [])]
-            channel_ids = [c.get("id", "") for c in config.get("channels", [])]
+            msg_ids = {m.get("id", "") for m in config.get("can_messages", [])}
+            channel_ids = {c.get("id", "") for c in config.get("channels", [])}
 
         return msg_ids, channel_ids
 
-    def _generate_unique_id(self, base_id: str, existing_ids: List[str]) -> str:
+    def _generate_unique_id(self, base_id: str, existing_ids: Set[str]) -> str:
         """Generate a unique ID by appending _N suffix if needed."""
         if base_id not in existing_ids:
             return base_id
@@ -520,8 +520,8 @@ class CANImportDialog(QDialog):
         self,
         selected_channels: List[Tuple[str, CanxChannel]],
         can_bus: int,
-        existing_msg_ids: List[str],
-        existing_channel_ids: List[str]
+        existing_msg_ids: Set[str],
+        existing_channel_ids: Set[str]
     ) -> Tuple[List[Dict], List[Dict]]:
         """Import CANX channels and create corresponding messages."""
         messages = []
@@ -547,7 +547,7 @@ class CANImportDialog(QDialog):
         name = self.name_edit.text() or self.parsed_data.filename
         base_msg_id = f"msg_{name.replace(' ', '_').replace('-', '_').lower()}"
         msg_id = self._generate_unique_id(base_msg_id, existing_msg_ids)
-        existing_msg_ids.append(msg_id)
+        existing_msg_ids.add(msg_id)
 
         # Get base frame ID
         base_frame = mob.frames[0] if mob.frames else None
@@ -576,7 +576,7 @@ class CANImportDialog(QDialog):
             channel_config["id"] = self._generate_unique_id(
                 channel_config["id"], existing_channel_ids
             )
-            existing_channel_ids.append(channel_config["id"])
+            existing_channel_ids.add(channel_config["id"])
             channels.append(channel_config)
 
         return messages, channels
@@ -585,8 +585,8 @@ class CANImportDialog(QDialog):
         self,
         selected_channels: List[Tuple[str, DbcSignal]],
         can_bus: int,
-        existing_msg_ids: List[str],
-        existing_channel_ids: List[str]
+        existing_msg_ids: Set[str],
+        existing_channel_ids: Set[str]
     ) -> Tuple[List[Dict], List[Dict]]:
         """Import DBC signals and create corresponding messages."""
         messages = []
@@ -609,7 +609,7 @@ class CANImportDialog(QDialog):
             # Create message config
             base_msg_id = f"msg_{msg.name.replace(' ', '_').replace('-', '_').lower()}"
             msg_id = self._generate_unique_id(base_msg_id, existing_msg_ids)
-            existing_msg_ids.append(msg_id)
+            existing_msg_ids.add(msg_id)
 
             msg_config = msg.to_can_message_config(msg_id)
             msg_config["can_bus"] = can_bus
@@ -621,7 +621,7 @@ class CANImportDialog(QDialog):
                 channel_config["id"] = self._generate_unique_id(
                     channel_config["id"], existing_channel_ids
                 )
-                existing_channel_ids.append(channel_config["id"])
+                existing_channel_ids.add(channel_config["id"])
                 channels.append(channel_config)
 
         return messages, channels
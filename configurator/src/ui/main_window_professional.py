@@ -483,8 +483,7 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
 
         # Device controller signals - use QueuedConnection for thread safety
         # (signals may be emitted from background receive thread)
-        self.device_controller.telemetry_received.connect(
-            self._on_telemetry_received, Qt.ConnectionType.QueuedConnection)
+        self._setup_telemetry_subscriptions()
         self.device_controller.log_received.connect(
             self._on_log_received, Qt.ConnectionType.QueuedConnection)
         self.device_controller.disconnected.connect(
@@ -594,6 +593,7 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
                 logger.debug(f"New digital input config: input_pin={config.get('input_pin')}, name={config.get('name')}")
                 self.project_tree.add_channel(channel_type, config)
                 self.digital_monitor.set_inputs(self.project_tree.get_all_inputs())
+                self._resend_telemetry()
                 self.configuration_changed.emit()
 
         elif channel_type == ChannelType.ANALOG_INPUT:
@@ -605,6 +605,7 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
                 logger.debug(f"New analog input config: input_pin={config.get('input_pin')}, name={config.get('name')}")
                 self.project_tree.add_channel(channel_type, config)
                 self.analog_monitor.set_inputs(self.project_tree.get_all_inputs())
+                self._resend_telemetry()
                 self.configuration_changed.emit()
 
         elif channel_type == ChannelType.POWER_OUTPUT:
@@ -617,6 +618,7 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
                 config = dialog.get_config()
                 self.project_tree.add_channel(channel_type, config)
                 self.output_monitor.set_outputs(self.project_tree.get_all_outputs())
+                self._resend_telemetry()
                 self.configuration_changed.emit()
                 # Apply channel state immediately to device
                 self._apply_output_to_device(config)
@@ -808,6 +810,7 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
                     self.project_tree.update_current_item(updated_config)
                     # Update digital monitor to reflect changes
                     self.digital_monitor.set_inputs(self.project_tree.get_all_inputs())
+                    self._resend_telemetry()
                     # Send updated config to device
                     self._send_config_to_device_silent()
                     logger.info(f"Digital input updated: {updated_config.get('name')}")
@@ -824,6 +827,7 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
                     updated_config = dialog.get_config()
                     self.project_tree.update_current_item(updated_config)
                     self.analog_monitor.set_inputs(self.project_tree.get_all_inputs())
+                    self._resend_telemetry()
                     # Send updated config to device
                     self._send_config_to_device_silent()
                     logger.info(f"Analog input updated: {updated_config.get('name')}")
@@ -843,6 +847,7 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
                     updated_config = dialog.get_config()
                     self.project_tree.update_current_item(updated_config)
                     self.output_monitor.set_outputs(self.project_tree.get_all_outputs())
+                    self._resend_telemetry()
                     # Apply channel state immediately to device (without flash save)
                     self._apply_output_to_device(updated_config)
                     logger.info(f"Output updated and applied: {updated_config.get('name')}")
@@ -1187,38 +1192,27 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
         """Show channels that depend on the selected channel."""
         from PyQt6.QtWidgets import QMessageBox
 
-        # Get all channels
-        all_channels = self.project_tree.get_all_channels()
-
-        # Find the channel_id of the target channel
-        target_channel_id = None
-        for ch in all_channels:
-            ch_name = ch.get('channel_name', '') or ch.get('name', '') or ch.get('id', '')
-            if ch_name == channel_name:
-                target_channel_id = ch.get('channel_id')
-                break
-
-        if target_channel_id is None:
+        graph = self.config_manager.get_dependency_graph()
+        if channel_name not in graph:
             QMessageBox.warning(self, "Error", f"Channel '{channel_name}' not found.")
             return
 
-        # Find channels that reference this channel
-        dependents = []
-        for ch in all_channels:
-            ch_name = ch.get('channel_name', '') or ch.get('name', '') or ch.get('id', '')
-            if ch_name == channel_name:
-                continue  # Skip self
+        def describe(name):
+            ch = self.config_manager.get_channel_by_name(name) or {}
+            return f"{name} ({ch.get('channel_type', 'unknown')})"
 
-            # Check if this channel references the target channel by ID or name
-            referenced = self._extract_input_channels(ch)
-            if target_channel_id in referenced or channel_name in referenced:
-                ch_type = ch.get('channel_type', 'unknown')
-                dependents.append(f"{ch_name} ({ch_type})")
+        direct = [name for name in graph.dependents(channel_name) if name != channel_name]
+        dependents = [describe(name) for name in direct]
+        direct_names = set(direct)
+        indirect = [describe(name) for name in graph.impact(channel_name) if name not in direct_names]
 
         # Show results in message box
         if dependents:
             msg = f"<b>{channel_name}</b> is used by:<br><br>"
             msg += "<br>".join(f"• {dep}" for dep in dependents)
+            if indirect:
+                msg += "<br><br>Indirectly affected:<br><br>"
+                msg += "<br>".join(f"• {dep}" for dep in indirect)
         else:
             msg = f"<b>{channel_name}</b> is not used by any other channel."
 
@@ -1524,7 +1518,7 @@ class MainWindowProfessional(MainWindowConfigMixin, MainWindowDeviceMixin, MainW
         else:
             self.status_message.setText(f"Failed to inject CAN message")
 
-    # Telemetry methods (_on_telemetry_received, _update_led_indicator, _on_log_received)
+    # Telemetry methods (_setup_telemetry_subscriptions, _update_led_indicator, _on_log_received)
     # are provided by MainWindowTelemetryMixin
 
     def show_can_messages_manager(self):
@@ -150,6 +150,7 @@ class MainWindowChannelsMixin:
             self.hbridge_monitor.set_hbridges(self.project_tree.get_all_hbridges())
         elif channel_type == ChannelType.BLINKMARINE_KEYPAD:
             self._sync_keypad_button_channels(config)
+        self._resend_telemetry()
 
         # Push atomic config update to device if connected
         self._push_channel_config_to_device(channel_type, config)
@@ -158,6 +158,7 @@ class MainWindowConfigMixin:
 
         self.variables_inspector.populate_from_config(self.config_manager)
         self.data_logger.populate_from_config(self.config_manager)
+        self._resend_telemetry()
 
     def _on_config_changed(self):
         """Handle configuration change."""
@@ -167,86 +168,9 @@ class MainWindowConfigMixin:
 
         self.variables_inspector.populate_from_config(self.config_manager)
         self.data_logger.populate_from_config(self.config_manager)
+        self._resend_telemetry()
         self._send_config_to_device_silent()
 
-    def _extract_input_channels(self, ch: dict) -> list:
-        """Extract input channel references from a channel config."""
-        inputs = []
-        ch_type = ch.get('channel_type', '')
-
-        if ch_type == 'power_output':
-            if ch.get('source_channel'):
-                inputs.append(ch['source_channel'])
-            if ch.get('duty_channel'):
-                inputs.append(ch['duty_channel'])
-
-        elif ch_type == 'logic':
-            for inp in ch.get('inputs', []):
-                if isinstance(inp, dict) and inp.get('channel'):
-                    inputs.append(inp['channel'])
-                elif isinstance(inp, str):
-                    inputs.append(inp)
-            if ch.get('set_channel'):
-                inputs.append(ch['set_channel'])
-            if ch.get('reset_channel'):
-                inputs.append(ch['reset_channel'])
-            if ch.get('toggle_channel'):
-                inputs.append(ch['toggle_channel'])
-
-        elif ch_type == 'timer':
-            if ch.get('start_channel'):
-                inputs.append(ch['start_channel'])
-            if ch.get('stop_channel'):
-                inputs.append(ch['stop_channel'])
-
-        elif ch_type == 'filter':
-            if ch.get('input_channel'):
-                inputs.append(ch['input_channel'])
-
-        elif ch_type == 'table_2d':
-            if ch.get('x_axis_channel'):
-                inputs.append(ch['x_axis_channel'])
-
-        elif ch_type == 'table_3d':
-            if ch.get('x_axis_channel'):
-                inputs.append(ch['x_axis_channel'])
-            if ch.get('y_axis_channel'):
-                inputs.append(ch['y_axis_channel'])
-
-        elif ch_type == 'number':
-            for inp in ch.get('inputs', []):
-                if isinstance(inp, dict) and inp.get('channel'):
-                    inputs.append(inp['channel'])
-
-        elif ch_type == 'pid':
-            if ch.get('setpoint_channel'):
-                inputs.append(ch['setpoint_channel'])
-            if ch.get('process_channel'):
-                inputs.append(ch['process_channel'])
-
-        elif ch_type == 'hbridge':
-            if ch.get('source_channel'):
-                inputs.append(ch['source_channel'])
-            if ch.get('duty_channel'):
-                inputs.append(ch['duty_channel'])
-            if ch.get('direction_channel'):
-                inputs.append(ch['direction_channel'])
-            if ch.get('pid_setpoint_channel'):
-                inputs.append(ch['pid_setpoint_channel'])
-
-        elif ch_type == 'enum':
-            if ch.get('input_up_channel'):
-                inputs.append(ch['input_up_channel'])
-            if ch.get('input_down_channel'):
-                inputs.append(ch['input_down_channel'])
-
-        elif ch_type == 'can_tx':
-            for sig in ch.get('signals', []):
-                if sig.get('source_channel'):
-                    inputs.append(sig['source_channel'])
-
-        return inputs
-
     def compare_configurations(self):
         """Compare current configuration with device configuration."""
         from ui.dialogs.config_diff_dialog import ConfigDiffDialog
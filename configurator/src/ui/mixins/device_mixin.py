@@ -87,6 +87,7 @@ class MainWindowDeviceMixin:
         ]
         for widget in widgets:
             widget.set_connected(connected)
+        self._resend_telemetry()
 
         # Update status labels
         if connected:
@@ -233,6 +234,7 @@ class MainWindowDeviceMixin:
             self.config_manager.load_from_dict(config)
             self.variables_inspector.populate_from_config(self.config_manager)
             self.data_logger.populate_from_config(self.config_manager)
+            self._resend_telemetry()
 
             self.status_message.setText(f"Configuration loaded: {len(channels)} channels")
             logger.info(f"Loaded configuration with {len(channels)} channels")
@@ -505,8 +507,8 @@ class MainWindowDeviceMixin:
             if len(binary_data) > 2:  # More than just channel count
                 channel_count = struct.unpack('<H', binary_data[:2])[0]
 
-                # Use upload_binary_config which waits for ACK
-                success = self.device_controller.upload_binary_config(binary_data, timeout=5.0)
+                # Sends only the channels changed since the last sync (full upload if needed)
+                success = self.device_controller.sync_binary_config(binary_data, timeout=5.0)
 
                 if success:
                     self.status_message.setText(f"Config synced ({channel_count} channels, {len(binary_data)} bytes)")
@@ -8,86 +8,82 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class MainWindowTelemetryMixin:
-    """Mixin for telemetry handling."""
+# Fields each display subscribes to (see controllers.telemetry_pipeline)
+PMU_MONITOR_FIELDS = [
+    'voltage_v', 'temperature_c', 'current_a', 'channel_states', 'channel_currents',
+    'analog_values', 'fault_flags', 'board_temp_2', 'output_5v_mv', 'output_3v3_mv',
+    'flash_temp', 'system_status', 'uptime_ms',
+]
+OUTPUT_MONITOR_FIELDS = ['channel_states', 'channel_currents', 'output_currents', 'voltage_v']
+ANALOG_MONITOR_FIELDS = ['adc_values']
+DIGITAL_MONITOR_FIELDS = ['digital_inputs']
+VARIABLES_FIELDS = ['virtual_channels']
+DATA_LOGGER_FIELDS = [
+    'voltage_v', 'temperature_c', 'current_a', 'channel_states', 'channel_currents',
+    'analog_values', 'uptime_ms', 'virtual_channels',
+]
+LED_FIELDS = ['channel_states', 'fault_flags', 'system_status', 'uptime_ms']
 
-    def _on_telemetry_received(self, telemetry):
-        """Handle telemetry data from device."""
-        try:
-            # Log telemetry summary
-            active_outputs = sum(1 for s in telemetry.profet_states if s and int(s) > 0)
-            virtual_count = len(telemetry.virtual_channels) if telemetry.virtual_channels else 0
-            logger.info(f"Telemetry: V={telemetry.input_voltage_mv}mV, outputs={active_outputs}/30, virtuals={virtual_count}")
-
-            self._update_pmu_monitor(telemetry)
-            states = self._update_output_monitor(telemetry)
-            self._update_input_monitors(telemetry)
-            self._update_variables_inspector(telemetry)
-            self._update_data_logger(telemetry)
-            self._update_led_indicator(telemetry, states)
-        except Exception as e:
-            logger.error(f"Error processing telemetry: {e}", exc_info=True)
 
-    def _update_pmu_monitor(self, telemetry):
+class MainWindowTelemetryMixin:
+    """Mixin for telemetry handling.
+
+    Telemetry is decoded off the GUI thread by the device controller's
+    TelemetryPipeline; each display subscribes to the fields it shows and
+    is refreshed at the display rate, only when those fields change. The
+    data logger receives every frame.
+    """
+
+    def _setup_telemetry_subscriptions(self):
+        """Subscribe displays to the telemetry pipeline and start delivery."""
+        pipeline = self.device_controller.telemetry_pipeline
+        pipeline.subscribe(self._update_pmu_monitor, PMU_MONITOR_FIELDS)
+        pipeline.subscribe(self._update_output_monitor, OUTPUT_MONITOR_FIELDS)
+        pipeline.subscribe(self._update_analog_monitor, ANALOG_MONITOR_FIELDS)
+        pipeline.subscribe(self._update_digital_monitor, DIGITAL_MONITOR_FIELDS)
+        pipeline.subscribe(self._update_variables_inspector, VARIABLES_FIELDS)
+        pipeline.subscribe(self._update_data_logger, DATA_LOGGER_FIELDS, every_frame=True)
+        pipeline.subscribe(self._update_led_indicator, LED_FIELDS)
+        pipeline.start()
+
+    def _resend_telemetry(self):
+        """Redeliver the next frame to every display.
+
+        Displays only receive changed fields, so call this after a widget
+        clears or rebuilds its table (connect/disconnect, config reload).
+        """
+        self.device_controller.telemetry_pipeline.reset_subscribers()
+
+    def _update_pmu_monitor(self, data: dict):
         """Update PMU monitor widget."""
-        data = {
-            'voltage_v': telemetry.input_voltage_mv / 1000.0,
-            'temperature_c': telemetry.temperature_c,
-            'current_a': telemetry.total_current_ma / 1000.0,
-            'channel_states': [s.value if hasattr(s, 'value') else s for s in telemetry.profet_states],
-            'channel_currents': telemetry.profet_duties,
-            'analog_values': telemetry.adc_values[:8],
-            'fault_flags': telemetry.fault_flags.value if hasattr(telemetry.fault_flags, 'value') else 0,
-            'board_temp_2': telemetry.board_temp_2,
-            'output_5v_mv': telemetry.output_5v_mv,
-            'output_3v3_mv': telemetry.output_3v3_mv,
-            'flash_temp': telemetry.flash_temp,
-            'system_status': telemetry.system_status,
-            'uptime_ms': telemetry.timestamp_ms,
-        }
         self.pmu_monitor.update_from_telemetry(data)
 
-    def _update_output_monitor(self, telemetry) -> list:
-        """Update output monitor widget. Returns states list for LED update."""
-        states = [int(s) if hasattr(s, 'value') else s for s in telemetry.profet_states]
-        duties = list(telemetry.profet_duties)
-        currents = list(telemetry.output_currents)
-        battery_v = telemetry.input_voltage
-        self.output_monitor.update_from_telemetry(states, duties, currents, battery_v)
-        return states
-
-    def _update_input_monitors(self, telemetry):
-        """Update analog and digital monitors."""
-        self.analog_monitor.update_from_telemetry(telemetry.adc_values)
-        self.digital_monitor.update_from_telemetry(telemetry.digital_inputs)
-
-    def _update_variables_inspector(self, telemetry):
+    def _update_output_monitor(self, data: dict):
+        """Update output monitor widget."""
+        self.output_monitor.update_from_telemetry(
+            data['channel_states'], data['channel_currents'],
+            data['output_currents'], data['voltage_v'])
+
+    def _update_analog_monitor(self, data: dict):
+        """Update analog monitor."""
+        self.analog_monitor.update_from_telemetry(data['adc_values'])
+
+    def _update_digital_monitor(self, data: dict):
+        """Update digital monitor."""
+        self.digital_monitor.update_from_telemetry(data['digital_inputs'])
+
+    def _update_variables_inspector(self, data: dict):
         """Update variables inspector with virtual channel data only.
 
-        Variables Inspector now only displays virtual channels (logic, number, timer, etc.),
-        so we only pass the virtual_channels data from telemetry.
+        Variables Inspector now only displays virtual channels (logic, number, timer, etc.).
         """
-        # Variables inspector only shows virtual channels now
-        if hasattr(telemetry, 'virtual_channels') and telemetry.virtual_channels:
-            variables_data = {'virtual_channels': telemetry.virtual_channels}
-            self.variables_inspector.update_from_telemetry(variables_data)
-
-    def _update_data_logger(self, telemetry):
-        """Update data logger with telemetry data."""
-        data = {
-            'voltage_v': telemetry.input_voltage_mv / 1000.0,
-            'temperature_c': telemetry.temperature_c,
-            'current_a': telemetry.total_current_ma / 1000.0,
-            'channel_states': [s.value if hasattr(s, 'value') else s for s in telemetry.profet_states],
-            'channel_currents': telemetry.profet_duties,
-            'analog_values': telemetry.adc_values[:8],
-            'uptime_ms': telemetry.timestamp_ms,
-        }
-
-        if hasattr(telemetry, 'virtual_channels') and telemetry.virtual_channels:
-            data['virtual_channels'] = telemetry.virtual_channels
-
-        self.data_logger.update_from_telemetry(data)
+        if data['virtual_channels']:
+            self.variables_inspector.update_from_telemetry(data)
+
+    def _update_data_logger(self, frames: list):
+        """Feed every telemetry frame to the data logger."""
+        for data in frames:
+            self.data_logger.update_from_telemetry(data)
 
     def _on_log_received(self, level: int, source: str, message: str):
         """Handle log message from device."""
@@ -102,18 +98,18 @@ class MainWindowTelemetryMixin:
         log_funcs = {0: logger.debug, 1: logger.info, 2: logger.warning, 3: logger.error}
         log_funcs.get(level, logger.error)(f"Device: {log_text}")
 
-    def _update_led_indicator(self, telemetry, output_states: list):
+    def _update_led_indicator(self, data: dict):
         """Update LED indicator bar from telemetry data."""
         from ..widgets.led_indicator import SystemStatus
 
         try:
+            output_states = data['channel_states']
+            fault_flags = data['fault_flags']
+
             # Count active outputs and faults
             active_count = sum(1 for s in output_states if s in (1, 2))  # ON or PWM
             fault_count = 0
 
-            # Check fault flags from telemetry - per-channel faults
-            fault_flags = telemetry.fault_flags.value if hasattr(telemetry.fault_flags, 'value') else telemetry.fault_flags
-
             # Create per-channel fault list (convert bitmask to list)
             channel_faults = []
             for i in range(min(len(output_states), 40)):
@@ -129,7 +125,7 @@ class MainWindowTelemetryMixin:
             self.led_indicator.set_output_status(active_count, fault_count)
 
             # Update system status based on protection
-            system_status = telemetry.system_status if hasattr(telemetry, 'system_status') else 0
+            system_status = data['system_status']
             if system_status >= 4:  # Critical
                 self.led_indicator.set_system_status(SystemStatus.CRITICAL)
             elif system_status >= 3:  # Fault
@@ -2,6 +2,7 @@
 
 from .project_tree import ProjectTree
 from .tree_model import TreeModel
+from .monitor_table_model import MonitorTableModel
 from .output_monitor import OutputMonitor
 from .analog_monitor import AnalogMonitor
 from .digital_monitor import DigitalMonitor
@@ -34,6 +35,7 @@ from .constant_spinbox import (
 __all__ = [
     'ProjectTree',
     'TreeModel',
+    'MonitorTableModel',
     'OutputMonitor',
     'AnalogMonitor',
     'DigitalMonitor',
@@ -10,13 +10,15 @@ ECUMaster channel naming convention:
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QTableView,
     QHeaderView, QPushButton, QHBoxLayout, QLabel, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QBrush
+from PyQt6.QtCore import Qt, QTimer, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor
 from typing import Dict, List
 
+from .monitor_table_model import MonitorTableModel, ALIGN_CENTER, ALIGN_LEFT, ALIGN_RIGHT
+
 
 class AnalogMonitor(QWidget):
     """Analog input channels monitor widget with real-time telemetry display."""
@@ -42,6 +44,7 @@ class AnalogMonitor(QWidget):
         super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.inputs_data = []  # Only user-created channels
+        self._row_calibration: List[List[Dict]] = []  # Sorted calibration points per row
         self._connected = False
         self._init_ui()
 
@@ -72,9 +75,13 @@ class AnalogMonitor(QWidget):
 
         # Table with ECUMaster-compatible columns
         # Pin | Name | Value | Vltg | Pu/pd
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Pin", "Name", "Value", "Vltg", "Pu/pd"])
+        # Cells only repaint when their text changes (see MonitorTableModel)
+        self.model = MonitorTableModel(
+            ["Pin", "Name", "Value", "Vltg", "Pu/pd"],
+            [ALIGN_CENTER, ALIGN_LEFT, ALIGN_RIGHT, ALIGN_RIGHT, ALIGN_CENTER],
+            background=self.COLOR_NORMAL, foreground=self.COLOR_TEXT, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Set column widths
         header = self.table.horizontalHeader()
@@ -92,24 +99,24 @@ class AnalogMonitor(QWidget):
 
         self.table.setAlternatingRowColors(False)
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)  # Read-only
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)  # Select full rows
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)  # Read-only
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)  # Select full rows
 
         # Double-click to edit channel
-        self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        self.table.doubleClicked.connect(self._on_cell_double_clicked)
 
         # Dark theme styling (matching Variables Inspector - pure black)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #000000;
                 color: #ffffff;
                 gridline-color: #333333;
             }
-            QTableWidget::item {
+            QTableView::item {
                 background-color: #000000;
                 color: #ffffff;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4;
                 color: #ffffff;
             }
@@ -123,8 +130,9 @@ class AnalogMonitor(QWidget):
 
         layout.addWidget(self.table)
 
-    def _on_cell_double_clicked(self, row: int, column: int):
+    def _on_cell_double_clicked(self, index: QModelIndex):
         """Handle double-click on a cell to open edit dialog."""
+        row = index.row()
         if row < 0 or row >= len(self.inputs_data):
             return
 
@@ -179,40 +187,18 @@ class AnalogMonitor(QWidget):
 
     def _reset_values(self):
         """Reset all telemetry values to '?'."""
-        for row in range(self.table.rowCount()):
-            for col in [self.COL_VALUE, self.COL_VLTG]:
-                item = self.table.item(row, col)
-                if item:
-                    item.setText("?")
-                    item.setBackground(QBrush(self.COLOR_DISABLED))
+        for row in range(self.model.rowCount()):
+            self.model.update_row(row, ("?", "?"), self.COL_VALUE)
+            self.model.set_row_color(row, self.COLOR_DISABLED)
 
     def _populate_table(self):
         """Populate table with user-created inputs only."""
-        self.table.setRowCount(len(self.inputs_data))
+        rows = []
+        self._row_calibration = []
 
         for row, input_data in enumerate(self.inputs_data):
             channel = input_data.get('channel', row)
 
-            # Pin (A1, A2, etc.)
-            pin_item = QTableWidgetItem(f"A{channel + 1}")
-            pin_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, self.COL_PIN, pin_item)
-
-            # Name
-            name = input_data.get('name', '')
-            name_item = QTableWidgetItem(name)
-            self.table.setItem(row, self.COL_NAME, name_item)
-
-            # Value (? when offline)
-            value_item = QTableWidgetItem("?")
-            value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, self.COL_VALUE, value_item)
-
-            # Voltage
-            vltg_item = QTableWidgetItem("?")
-            vltg_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, self.COL_VLTG, vltg_item)
-
             # Pull-up/Pull-down configuration
             pupd = input_data.get('pull_mode', 'none')
             pupd_str = ""
@@ -220,22 +206,15 @@ class AnalogMonitor(QWidget):
                 pupd_str = "Pu"
             elif pupd == 'pull_down':
                 pupd_str = "Pd"
-            pupd_item = QTableWidgetItem(pupd_str)
-            pupd_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, self.COL_PUPD, pupd_item)
-
-            # Set row color
-            self._set_row_color(row, self.COLOR_NORMAL)
-
-    def _set_row_color(self, row: int, color: QColor):
-        """Set background color for entire row."""
-        bg_brush = QBrush(color)
-        fg_brush = QBrush(QColor(255, 255, 255))  # White text
-        for col in range(5):
-            item = self.table.item(row, col)
-            if item:
-                item.setBackground(bg_brush)
-                item.setForeground(fg_brush)
+
+            # Pin (A1, A2, etc.) | Name | Value, Voltage (? when offline) | Pu/pd
+            rows.append([f"A{channel + 1}", input_data.get('name', ''), "?", "?", pupd_str])
+
+            # Sort calibration once here instead of on every packet
+            self._row_calibration.append(sorted(
+                input_data.get('calibration_points', []), key=lambda p: p.get('voltage', 0)))
+
+        self.model.set_rows(rows, self.COLOR_NORMAL)
 
     def _update_values(self):
         """Update real-time values (when connected to device)."""
@@ -247,8 +226,7 @@ class AnalogMonitor(QWidget):
         for row, input_data in enumerate(self.inputs_data):
             if input_data.get('channel') == channel:
                 # Update values
-                self.table.item(row, self.COL_VALUE).setText(f"{value:.2f}")
-                self.table.item(row, self.COL_VLTG).setText(f"{voltage:.2f}")
+                self.model.update_row(row, (f"{value:.2f}", f"{voltage:.2f}"), self.COL_VALUE)
 
                 # Set row color based on logical output state (only for switch types)
                 subtype = input_data.get('subtype', 'linear')
@@ -275,17 +253,19 @@ class AnalogMonitor(QWidget):
                     input_data['_digital_state'] = digital_state
 
                     if digital_state == 1:
-                        self._set_row_color(row, self.COLOR_ACTIVE)
+                        self.model.set_row_color(row, self.COLOR_ACTIVE)
                     else:
-                        self._set_row_color(row, self.COLOR_NORMAL)
+                        self.model.set_row_color(row, self.COLOR_NORMAL)
                 else:
-                    self._set_row_color(row, self.COLOR_NORMAL)
+                    self.model.set_row_color(row, self.COLOR_NORMAL)
                 break
 
     def update_from_telemetry(self, adc_values: List[int], reference_voltage: float = 3.3):
         """
         Update all analog inputs from telemetry data.
 
+        Only cells whose displayed text changes are repainted.
+
         Args:
             adc_values: List of raw ADC values (0-4095 for 12-bit)
             reference_voltage: ADC reference voltage (default 3.3V)
@@ -351,12 +331,10 @@ class AnalogMonitor(QWidget):
                 digital_state = 1 if voltage > 0.1 else 0
             elif subtype == 'calibrated':
                 # For calibrated inputs, use interpolation from calibration table
-                calibration_points = input_data.get('calibration_points', [])
+                sorted_points = self._row_calibration[row]
                 decimal_places = input_data.get('decimal_places', 0)
 
-                if len(calibration_points) >= 2:
-                    # Sort by voltage
-                    sorted_points = sorted(calibration_points, key=lambda p: p.get('voltage', 0))
+                if len(sorted_points) >= 2:
 
                     # Find interpolation range
                     scaled_value = 0.0
@@ -393,26 +371,19 @@ class AnalogMonitor(QWidget):
                 display_value = f"{value_percent:.2f}"
                 digital_state = 1 if voltage > 0.1 else 0
 
-            # Update Value column (only for configured inputs)
-            value_item = self.table.item(row, self.COL_VALUE)
-            if value_item:
-                value_item.setText(display_value)
-
-            # Update Voltage column (only for configured inputs)
-            vltg_item = self.table.item(row, self.COL_VLTG)
-            if vltg_item:
-                vltg_item.setText(f"{voltage:.2f}")
+            # Update Value and Voltage columns
+            self.model.update_row(row, (display_value, f"{voltage:.2f}"), self.COL_VALUE)
 
             # Set row color based on logical output state
             # Only switch types have binary (0/1) output - highlight green when ON
             if subtype in ('switch_active_low', 'switch_active_high'):
                 if digital_state == 1:
-                    self._set_row_color(row, self.COLOR_ACTIVE)
+                    self.model.set_row_color(row, self.COLOR_ACTIVE)
                 else:
-                    self._set_row_color(row, self.COLOR_NORMAL)
+                    self.model.set_row_color(row, self.COLOR_NORMAL)
             else:
                 # Linear/calibrated inputs don't have binary output - no green highlight
-                self._set_row_color(row, self.COLOR_NORMAL)
+                self.model.set_row_color(row, self.COLOR_NORMAL)
 
     def get_channel_count(self) -> int:
         """Get number of configured analog inputs."""
@@ -20,10 +20,11 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor, QBrush, QFont
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from collections import deque
 from datetime import datetime
-import struct
+
+from utils.can_extract import CanExtractPlan, compile_can_input
 
 
 class CANMonitor(QWidget):
@@ -42,6 +43,7 @@ class CANMonitor(QWidget):
         super().__init__(parent)
         self.can_messages_config = []  # CAN message definitions
         self.can_inputs_config = []    # CAN input/signal definitions
+        self._signal_plans: Dict[int, List[Tuple[str, CanExtractPlan]]] = {}  # {base_id: [(signal_id, plan)]}
         self._connected = False
         self._paused = False
 
@@ -359,9 +361,26 @@ class CANMonitor(QWidget):
         """Set CAN configuration for decoding."""
         self.can_messages_config = messages or []
         self.can_inputs_config = inputs or []
+        self._compile_signal_plans()
         self._populate_decoded_table()
         self._update_quick_send_buttons()
 
+    def _compile_signal_plans(self):
+        """Compile each CAN input into an extraction plan, grouped by message CAN ID."""
+        base_ids = {}
+        for msg in self.can_messages_config:
+            msg_id = msg.get("id") or msg.get("name")
+            if msg_id and msg_id not in base_ids:
+                base_ids[msg_id] = msg.get("base_id")
+
+        self._signal_plans = {}
+        for inp in self.can_inputs_config:
+            base_id = base_ids.get(inp.get("message_ref", ""))
+            if base_id is None:
+                continue
+            self._signal_plans.setdefault(base_id, []).append(
+                (inp.get("id", ""), compile_can_input(inp)))
+
     def _populate_decoded_table(self):
         """Populate decoded values table with configured signals."""
         self.decoded_table.setRowCount(0)
@@ -575,67 +594,18 @@ class CANMonitor(QWidget):
         self._decode_signals(arb_id, data)
 
     def _decode_signals(self, arb_id: int, data: bytes):
-        """Decode signals from received message."""
-        for inp in self.can_inputs_config:
-            # Find message reference
-            msg_ref = inp.get("message_ref", "")
-            matching_msg = None
-            for msg in self.can_messages_config:
-                if msg.get("id") == msg_ref and msg.get("base_id") == arb_id:
-                    matching_msg = msg
-                    break
-
-            if not matching_msg:
-                continue
-
-            # Decode value based on configuration
-            try:
-                start_byte = inp.get("start_byte", 0)
-                data_format = inp.get("data_format", "16bit")
-                data_type = inp.get("data_type", "unsigned")
-                byte_order = inp.get("byte_order", "little_endian")
-
-                # Extract bytes
-                if data_format == "8bit":
-                    if start_byte < len(data):
-                        raw_value = data[start_byte]
-                        if data_type == "signed" and raw_value > 127:
-                            raw_value -= 256
-                elif data_format == "16bit":
-                    if start_byte + 1 < len(data):
-                        fmt = "<H" if byte_order == "little_endian" else ">H"
-                        if data_type == "signed":
-                            fmt = "<h" if byte_order == "little_endian" else ">h"
-                        raw_value = struct.unpack(fmt, data[start_byte:start_byte+2])[0]
-                    else:
-                        continue
-                elif data_format == "32bit":
-                    if start_byte + 3 < len(data):
-                        fmt = "<I" if byte_order == "little_endian" else ">I"
-                        if data_type == "signed":
-                            fmt = "<i" if byte_order == "little_endian" else ">i"
-                        raw_value = struct.unpack(fmt, data[start_byte:start_byte+4])[0]
-                    else:
-                        continue
-                else:
-                    continue
-
-                # Apply scaling
-                multiplier = inp.get("multiplier", 1.0)
-                divider = inp.get("divider", 1.0)
-                offset = inp.get("offset", 0.0)
-
-                value = (raw_value * multiplier / divider) + offset
-
-                # Store value
-                signal_id = inp.get("id", "")
-                self.signal_values[signal_id] = {
-                    "value": value,
-                    "timestamp": datetime.now()
-                }
+        """Decode signals from received message (same plans as the firmware)."""
+        plans = self._signal_plans.get(arb_id)
+        if not plans:
+            return
 
-            except (struct.error, IndexError):
-                pass
+        now = datetime.now()
+        for signal_id, plan in plans:
+            value, _ = plan.decode(data)
+            self.signal_values[signal_id] = {
+                "value": value,
+                "timestamp": now
+            }
 
     def _update_display(self):
         """Update decoded values display."""
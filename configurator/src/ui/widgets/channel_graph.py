@@ -25,6 +25,8 @@ from PyQt6.QtGui import (
     QRadialGradient, QLinearGradient, QAction, QWheelEvent
 )
 
+from models.channel_dependencies import ChannelDependencyGraph
+
 logger = logging.getLogger(__name__)
 
 
@@ -253,8 +255,8 @@ class ChannelGraphScene(QGraphicsScene):
         self.node_items.clear()
         self.edges.clear()
 
-        # Build channel_id -> node_id mapping for resolving numeric references
-        channel_id_to_node_id = {}
+        # References are resolved by name or numeric channel_id
+        graph = ChannelDependencyGraph()
 
         # Create nodes
         for ch in channels:
@@ -266,33 +268,13 @@ class ChannelGraphScene(QGraphicsScene):
                 id=ch_id,
                 name=ch.get('name', ch_id),
                 channel_type=ch.get('type', 'logic'),
-                inputs=ch.get('input_channels', [])
             )
             self.nodes[ch_id] = node
+            graph.set_channel(ch_id, ch.get('input_channels', []), ch.get('channel_id'))
 
-            # Map numeric channel_id to node id
-            numeric_id = ch.get('channel_id')
-            if numeric_id is not None:
-                channel_id_to_node_id[numeric_id] = ch_id
-
-        # Resolve numeric input references to node IDs
         for node in self.nodes.values():
-            resolved_inputs = []
-            for input_ref in node.inputs:
-                if isinstance(input_ref, int):
-                    # Numeric reference - look up in mapping
-                    if input_ref in channel_id_to_node_id:
-                        resolved_inputs.append(channel_id_to_node_id[input_ref])
-                elif isinstance(input_ref, str):
-                    # String reference - use as-is
-                    resolved_inputs.append(input_ref)
-            node.inputs = resolved_inputs
-
-        # Calculate outputs (reverse of inputs)
-        for node in self.nodes.values():
-            for input_id in node.inputs:
-                if input_id in self.nodes:
-                    self.nodes[input_id].outputs.append(node.id)
+            node.inputs = graph.dependencies(node.id)
+            node.outputs = graph.dependents(node.id)
 
         # Layout nodes
         self._layout_nodes()
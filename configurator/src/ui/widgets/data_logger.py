@@ -3,16 +3,22 @@ Data Logger Widget - Professional ECU-style data logging and analysis.
 
 Features:
 - Real-time streaming telemetry at 50-500 Hz
+- Bounded per-channel sample storage (NumPy ring buffers)
+- Min/max level-of-detail decimation for drawing
 - Multi-channel graph display with zoom/pan/scroll
 - Channel selector with categories
 - Time cursor and selection tools
 - Recording to file
-- CSV export
+- CSV and columnar (.npz) export in a background thread
 """
 
 import logging
+import os
+import sys
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
 from collections import deque
 import csv
 import json
@@ -22,10 +28,22 @@ from PyQt6.QtWidgets import (
     QPushButton, QComboBox, QSpinBox, QLabel, QCheckBox,
     QTreeWidget, QTreeWidgetItem, QSlider, QToolBar, QFileDialog,
     QMessageBox, QStatusBar, QMenu, QFrame, QScrollArea, QDoubleSpinBox,
-    QLineEdit
+    QLineEdit, QProgressDialog
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPointF
 from PyQt6.QtGui import QAction, QColor, QPen
+import numpy as np
+
+from utils.sample_buffer import SampleRingBuffer, DEFAULT_RETENTION_SAMPLES
+from utils.decimation import MinMaxPyramid, minmax_envelope, DEFAULT_PLOT_WIDTH
+from utils.log_export import ExportColumn, ExportCancelled, export_log, write_csv, read_columnar
+
+# Shared library (PLOG files)
+_shared_path = Path(__file__).parent.parent.parent.parent.parent / "shared" / "python"
+if str(_shared_path) not in sys.path:
+    sys.path.insert(0, str(_shared_path))
+
+from datalog import MappedPlogReader  # noqa: E402
 
 # Use pyqtgraph for fast plotting
 try:
@@ -51,6 +69,9 @@ CATEGORY_COLORS = {
 }
 
 # Default channel definitions
+# Channels at least this long get a decimation pyramid once they stop changing
+PYRAMID_MIN_SAMPLES = 10000
+
 DEFAULT_CHANNELS = [
     {'id': 0x0001, 'name': 'Battery Voltage', 'unit': 'V', 'category': 'System', 'min': 0, 'max': 30},
     {'id': 0x0002, 'name': 'Board Temp L', 'unit': 'C', 'category': 'System', 'min': -40, 'max': 125},
@@ -61,12 +82,50 @@ DEFAULT_CHANNELS = [
 ]
 
 
+class PlogSeries:
+    """
+    One column of an open PLOG file, read from the memory map.
+
+    Plots reduce the raw stored values of the visible window to a min/max
+    envelope and scale only that, so a loaded log keeps no per-channel
+    copies. load() builds the full float64 series for statistics and export.
+    """
+
+    def __init__(self, log: MappedPlogReader, column_id: int):
+        self.log = log
+        self.column_id = column_id
+
+    def __len__(self) -> int:
+        return len(self.log)
+
+    @property
+    def end_time(self) -> float:
+        """Timestamp of the last sample in seconds."""
+        return self.log.timestamps[-1] / 1000.0 if len(self.log) else 0.0
+
+    def last_value(self) -> float:
+        count = len(self.log)
+        return float(self.log.values(self.column_id, count - 1, count)[0]) if count else 0.0
+
+    def plot_data(self, t0: Optional[float], t1: Optional[float],
+                  width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Decimated (x, y) arrays in seconds and real values for the t0..t1 window."""
+        x, y = minmax_envelope(self.log.timestamps, self.log.raw(self.column_id),
+                               None if t0 is None else t0 * 1000.0,
+                               None if t1 is None else t1 * 1000.0, width)
+        return x / 1000.0, self.log.to_real(self.column_id, y)
+
+    def load(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Full (timestamps, values) series as float64 arrays."""
+        return self.log.timestamps / 1000.0, self.log.values(self.column_id)
+
+
 class DataChannel:
     """Represents a data channel for logging."""
 
     def __init__(self, channel_id: int, name: str, unit: str = '',
                  category: str = 'User', min_val: float = 0, max_val: float = 100,
-                 color: Optional[str] = None):
+                 color: Optional[str] = None, retention: int = DEFAULT_RETENTION_SAMPLES):
         self.id = channel_id
         self.name = name
         self.unit = unit
@@ -77,40 +136,124 @@ class DataChannel:
         self.visible = True
         self.color = color or CATEGORY_COLORS.get(category, '#FFFFFF')
 
-        # Data storage
-        self.timestamps: List[float] = []
-        self.values: List[float] = []
-
-        # Statistics
+        # Data storage (bounded NumPy ring buffer, statistics kept incrementally)
+        self.buffer = SampleRingBuffer(retention)
         self.current_value = 0.0
-        self.min_recorded = float('inf')
-        self.max_recorded = float('-inf')
-        self.avg_value = 0.0
+
+        # Decimation pyramid for data that stopped changing (e.g. loaded logs)
+        self._pyramid: Optional[MinMaxPyramid] = None
+        self._pyramid_count = -1
+        self._plotted_count = -1
+
+        # Loaded PLOG column, copied into the buffer only when the samples are needed
+        self._plog: Optional[PlogSeries] = None
+
+    def _load_plog(self):
+        if self._plog is not None:
+            plog, self._plog = self._plog, None
+            self.buffer.assign(*plog.load())
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Retained timestamps (read-only view)."""
+        self._load_plog()
+        return self.buffer.times
+
+    @property
+    def values(self) -> np.ndarray:
+        """Retained values (read-only view)."""
+        self._load_plog()
+        return self.buffer.values
+
+    @property
+    def sample_count(self) -> int:
+        """Number of retained samples."""
+        if self._plog is not None:
+            return len(self._plog)
+        return len(self.buffer)
+
+    @property
+    def end_time(self) -> float:
+        """Timestamp of the newest sample (0 when empty)."""
+        if self._plog is not None:
+            return self._plog.end_time
+        return self.buffer.last()[0] if self.buffer else 0.0
+
+    @property
+    def min_recorded(self) -> float:
+        self._load_plog()
+        return self.buffer.min_value
+
+    @property
+    def max_recorded(self) -> float:
+        self._load_plog()
+        return self.buffer.max_value
+
+    @property
+    def avg_value(self) -> float:
+        self._load_plog()
+        return self.buffer.avg_value
 
     def add_sample(self, timestamp: float, value: float):
         """Add a data sample."""
-        self.timestamps.append(timestamp)
-        self.values.append(value)
+        self._load_plog()
+        self.buffer.append(timestamp, value)
         self.current_value = value
 
-        # Update statistics
-        if value < self.min_recorded:
-            self.min_recorded = value
-        if value > self.max_recorded:
-            self.max_recorded = value
+    def add_samples(self, timestamps, values):
+        """Add many samples at once (array-likes of equal length)."""
+        self._load_plog()
+        self.buffer.extend(timestamps, values)
+        if self.buffer:
+            self.current_value = self.buffer.last()[1]
+
+    def load_series(self, timestamps, values):
+        """Replace the data with a complete recorded series (no retention limit)."""
+        self.clear()
+        self.buffer.assign(timestamps, values)
+        if self.buffer:
+            self.current_value = self.buffer.last()[1]
+
+    def load_plog(self, plog: PlogSeries):
+        """Replace the data with a memory-mapped PLOG column (no retention limit)."""
+        self.clear()
+        self._plog = plog
+        self.current_value = plog.last_value()
+
+    def plot_data(self, t0: Optional[float] = None, t1: Optional[float] = None,
+                  width: int = DEFAULT_PLOT_WIDTH):
+        """
+        Decimated (x, y) arrays for the t0..t1 window at a plot width in pixels.
+
+        Changing data gets a direct min/max envelope of the visible samples.
+        Once the data stops changing between calls, a pyramid is built so
+        zooming and panning only touch about one block per pixel.
+        A loaded PLOG column is reduced straight from the file.
+        """
+        if self._plog is not None:
+            return self._plog.plot_data(t0, t1, width)
+
+        count = self.buffer.total_count
+        if self._pyramid is not None and self._pyramid_count == count:
+            return self._pyramid.query(t0, t1, width)
 
-        # Running average
-        n = len(self.values)
-        self.avg_value = ((self.avg_value * (n - 1)) + value) / n
+        if count == self._plotted_count and self.sample_count >= PYRAMID_MIN_SAMPLES:
+            self._pyramid = MinMaxPyramid(self.timestamps, self.values)
+            self._pyramid_count = count
+            return self._pyramid.query(t0, t1, width)
+
+        self._pyramid = None
+        self._plotted_count = count
+        return minmax_envelope(self.timestamps, self.values, t0, t1, width)
 
     def clear(self):
         """Clear all data."""
-        self.timestamps.clear()
-        self.values.clear()
+        self.buffer.clear()
         self.current_value = 0.0
-        self.min_recorded = float('inf')
-        self.max_recorded = float('-inf')
-        self.avg_value = 0.0
+        self._plog = None
+        self._pyramid = None
+        self._pyramid_count = -1
+        self._plotted_count = -1
 
 
 class DataLoggerWidget(QWidget):
@@ -120,6 +263,8 @@ class DataLoggerWidget(QWidget):
     recording_started = pyqtSignal()
     recording_stopped = pyqtSignal()
     channel_toggled = pyqtSignal(int, bool)  # channel_id, enabled
+    export_progress = pyqtSignal(int, int)  # rows_done, rows_total
+    export_finished = pyqtSignal(str, str)  # filename, error ('' = success)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -130,10 +275,20 @@ class DataLoggerWidget(QWidget):
         self.start_time = 0.0
         self.sample_rate = 100  # Hz
         self.time_window = 10.0  # Seconds visible
+        self.retention_samples = DEFAULT_RETENTION_SAMPLES  # Samples kept per channel
         self.cursor_time = 0.0
+        self._plog: Optional[MappedPlogReader] = None  # Open log the loaded channels read from
 
         # Graph references
         self.plot_items: Dict[int, Any] = {}
+        self._plot_keys: Dict[int, tuple] = {}  # Last drawn (samples, window, width)
+
+        # Background export
+        self._export_thread: Optional[threading.Thread] = None
+        self._export_cancel = threading.Event()
+        self._export_dialog: Optional[QProgressDialog] = None
+        self.export_progress.connect(self._on_export_progress)
+        self.export_finished.connect(self._on_export_finished)
 
         self._init_ui()
         self._init_channels()
@@ -241,7 +396,7 @@ class DataLoggerWidget(QWidget):
         self.toolbar.addSeparator()
 
         # Export
-        export_btn = QPushButton("Export CSV")
+        export_btn = QPushButton("Export...")
         export_btn.clicked.connect(self._on_export)
         self.toolbar.addWidget(export_btn)
 
@@ -472,9 +627,16 @@ class DataLoggerWidget(QWidget):
         if channel_id in self.channels:
             return
 
-        channel = DataChannel(channel_id, name, unit, category, min_val, max_val)
+        channel = DataChannel(channel_id, name, unit, category, min_val, max_val,
+                              retention=self.retention_samples)
         self.channels[channel_id] = channel
 
+    def set_retention(self, samples: int):
+        """Set the number of samples kept per channel (oldest are dropped)."""
+        self.retention_samples = samples
+        for channel in self.channels.values():
+            channel.buffer.set_retention(samples)
+
     def remove_channel(self, channel_id: int):
         """Remove a data channel."""
         if channel_id in self.channels:
@@ -589,6 +751,7 @@ class DataLoggerWidget(QWidget):
                 self.plot_items[channel_id] = self.plot_widget.plot(
                     [], [], pen=pen, name=channel.name
                 )
+                self._plot_keys.pop(channel_id, None)
         else:
             if channel_id in self.plot_items:
                 self.plot_widget.removeItem(self.plot_items[channel_id])
@@ -698,11 +861,11 @@ class DataLoggerWidget(QWidget):
             ch_a = self.channels.get(cfg['ch_a'])
             ch_b = self.channels.get(cfg['ch_b']) if cfg['ch_b'] else None
 
-            if not ch_a or not ch_a.values:
+            if not ch_a or not ch_a.sample_count:
                 continue
 
             val_a = ch_a.current_value
-            val_b = ch_b.current_value if ch_b and ch_b.values else cfg['const']
+            val_b = ch_b.current_value if ch_b and ch_b.sample_count else cfg['const']
 
             result = 0
             op = cfg['op']
@@ -777,10 +940,11 @@ class DataLoggerWidget(QWidget):
             return
 
         import time
+        received = telemetry_data.get('received_s') or time.time()
         if self.start_time == 0:
-            self.start_time = time.time()
+            self.start_time = received
 
-        timestamp = time.time() - self.start_time
+        timestamp = received - self.start_time
 
         samples = {}
 
@@ -833,11 +997,27 @@ class DataLoggerWidget(QWidget):
         if not self.plot_widget or not HAS_PYQTGRAPH:
             return
 
-        # Update plots
+        # Visible window: whole series while x auto-range is on
+        view_box = self.plot_widget.getViewBox()
+        if view_box.autoRangeEnabled()[0]:
+            t0 = t1 = None
+        else:
+            t0, t1 = view_box.viewRange()[0]
+        width = int(view_box.width()) or DEFAULT_PLOT_WIDTH
+
+        # Update plots (only curves whose data or view changed)
         for channel_id, plot_item in self.plot_items.items():
             channel = self.channels.get(channel_id)
-            if channel and channel.timestamps:
-                plot_item.setData(channel.timestamps, channel.values)
+            if not channel:
+                continue
+            key = (channel.buffer.total_count, t0, t1, width)
+            if self._plot_keys.get(channel_id) == key:
+                continue
+            self._plot_keys[channel_id] = key
+            if channel.sample_count:
+                plot_item.setData(*channel.plot_data(t0, t1, width))
+            else:
+                plot_item.setData([], [])
 
         # Update channel values in tree
         self._update_channel_values()
@@ -858,7 +1038,7 @@ class DataLoggerWidget(QWidget):
 
     def _update_status(self):
         """Update status bar."""
-        total_samples = sum(len(ch.timestamps) for ch in self.channels.values())
+        total_samples = sum(ch.sample_count for ch in self.channels.values())
         enabled_count = sum(1 for ch in self.channels.values() if ch.enabled)
 
         status = f"Channels: {enabled_count}/{len(self.channels)} | "
@@ -960,6 +1140,9 @@ class DataLoggerWidget(QWidget):
         """Clear all data."""
         for channel in self.channels.values():
             channel.clear()
+        if self._plog is not None:
+            self._plog.close()
+            self._plog = None
         self._update_status()
 
     def _on_rate_changed(self, value: int):
@@ -998,8 +1181,7 @@ class DataLoggerWidget(QWidget):
         # Find max timestamp across all channels
         max_time = 0
         for channel in self.channels.values():
-            if channel.timestamps:
-                max_time = max(max_time, channel.timestamps[-1])
+            max_time = max(max_time, channel.end_time)
 
         if max_time > 0:
             self.cursor_time = (value / 1000.0) * max_time
@@ -1009,69 +1191,106 @@ class DataLoggerWidget(QWidget):
                 self.cursor_line.setPos(self.cursor_time)
 
     def _on_export(self):
-        """Export data to CSV."""
-        filename, _ = QFileDialog.getSaveFileName(
+        """Export data to CSV or columnar file in the background."""
+        if self.is_exporting:
+            return
+
+        filename, selected = QFileDialog.getSaveFileName(
             self, "Export Data", "",
-            "CSV Files (*.csv);;All Files (*)"
+            "CSV Files (*.csv);;Columnar NumPy (*.npz);;All Files (*)"
         )
 
         if not filename:
             return
 
-        if not filename.endswith('.csv'):
-            filename += '.csv'
+        if not filename.lower().endswith(('.csv', '.npz')):
+            filename += '.npz' if 'npz' in selected else '.csv'
 
         try:
-            self.export_to_csv(filename)
-            QMessageBox.information(self, "Export Complete",
-                                   f"Data exported to {filename}")
+            self.start_export(filename)
         except Exception as e:
             QMessageBox.critical(self, "Export Error", str(e))
+            return
 
-    def export_to_csv(self, filename: str):
-        """Export all enabled channel data to CSV."""
-        enabled_channels = [ch for ch in self.channels.values() if ch.enabled]
+        self._export_dialog = QProgressDialog("Exporting data...", "Cancel", 0, 1000, self)
+        self._export_dialog.setWindowTitle("Export")
+        self._export_dialog.setMinimumDuration(500)
+        self._export_dialog.canceled.connect(self._export_cancel.set)
 
+    @property
+    def is_exporting(self) -> bool:
+        return self._export_thread is not None and self._export_thread.is_alive()
+
+    def _export_columns(self) -> List[ExportColumn]:
+        """Snapshot of enabled channels (views stay valid while recording continues)."""
+        enabled_channels = [ch for ch in self.channels.values() if ch.enabled]
         if not enabled_channels:
             raise ValueError("No channels enabled for export")
 
-        # Find all unique timestamps
-        all_timestamps = set()
-        for channel in enabled_channels:
-            all_timestamps.update(channel.timestamps)
-        all_timestamps = sorted(all_timestamps)
-
-        if not all_timestamps:
+        columns = [ExportColumn(ch.name, ch.unit, ch.timestamps, ch.values)
+                   for ch in enabled_channels]
+        if not any(len(column.times) for column in columns):
             raise ValueError("No data to export")
+        return columns
+
+    def start_export(self, filename: str):
+        """
+        Export enabled channels in a worker thread (format by extension).
+
+        Progress is reported through export_progress and completion
+        through export_finished.
+        """
+        columns = self._export_columns()
+        self._export_cancel.clear()
+
+        def worker():
+            try:
+                rows = export_log(filename, columns, self.export_progress.emit, self._export_cancel)
+                logger.info(f"Exported {rows} samples to {filename}")
+                self.export_finished.emit(filename, '')
+            except ExportCancelled:
+                self._remove_partial_export(filename)
+                self.export_finished.emit(filename, 'Export cancelled')
+            except Exception as e:
+                logger.error(f"Export to {filename} failed: {e}")
+                self._remove_partial_export(filename)
+                self.export_finished.emit(filename, str(e) or type(e).__name__)
+
+        self._export_thread = threading.Thread(target=worker, daemon=True)
+        self._export_thread.start()
+
+    @staticmethod
+    def _remove_partial_export(filename: str):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+    def _on_export_progress(self, done: int, total: int):
+        if self._export_dialog is not None and total:
+            self._export_dialog.setValue(done * 1000 // total)
 
-        with open(filename, 'w', newline='') as f:
-            writer = csv.writer(f)
-
-            # Header
-            header = ['Time (s)']
-            for ch in enabled_channels:
-                header.append(f'{ch.name} ({ch.unit})' if ch.unit else ch.name)
-            writer.writerow(header)
-
-            # Data rows
-            for ts in all_timestamps:
-                row = [f'{ts:.4f}']
-                for ch in enabled_channels:
-                    # Find closest value for this timestamp
-                    if ts in ch.timestamps:
-                        idx = ch.timestamps.index(ts)
-                        row.append(f'{ch.values[idx]:.4f}')
-                    else:
-                        row.append('')
-                writer.writerow(row)
-
-        logger.info(f"Exported {len(all_timestamps)} samples to {filename}")
+    def _on_export_finished(self, filename: str, error: str):
+        if self._export_dialog is None:
+            return
+        self._export_dialog.close()
+        self._export_dialog = None
+        if not error:
+            QMessageBox.information(self, "Export Complete",
+                                   f"Data exported to {filename}")
+        elif not self._export_cancel.is_set():
+            QMessageBox.critical(self, "Export Error", error)
+
+    def export_to_csv(self, filename: str):
+        """Export all enabled channel data to CSV (blocking)."""
+        rows = write_csv(filename, self._export_columns())
+        logger.info(f"Exported {rows} samples to {filename}")
 
     def _on_load_log(self):
         """Load log file."""
         filename, _ = QFileDialog.getOpenFileName(
             self, "Load Log File", "",
-            "Log Files (*.plog *.csv);;All Files (*)"
+            "Log Files (*.plog *.csv *.npz);;All Files (*)"
         )
 
         if not filename:
@@ -1080,6 +1299,8 @@ class DataLoggerWidget(QWidget):
         try:
             if filename.endswith('.csv'):
                 self.load_from_csv(filename)
+            elif filename.endswith('.npz'):
+                self.load_from_columnar(filename)
             else:
                 self.load_from_plog(filename)
             QMessageBox.information(self, "Load Complete",
@@ -1126,7 +1347,58 @@ class DataLoggerWidget(QWidget):
         for ch_id in channel_ids:
             self._update_plot_visibility(ch_id)
 
+    def load_from_columnar(self, filename: str):
+        """Load data from a columnar (.npz) export."""
+        self._on_clear()
+        names, timestamps, columns = read_columnar(filename)
+
+        channel_ids = []
+        for i, ((name, unit), values) in enumerate(zip(names, columns), start=1):
+            ch_id = 0x1000 + i
+            self.add_channel(ch_id, name, unit, 'User')
+            channel = self.channels[ch_id]
+            channel.enabled = True
+            present = ~np.isnan(values)
+            channel.load_series(timestamps[present], values[present])
+            channel_ids.append(ch_id)
+
+        self._update_channel_tree()
+        for ch_id in channel_ids:
+            self._update_plot_visibility(ch_id)
+
     def load_from_plog(self, filename: str):
-        """Load data from binary PLOG file."""
-        # TODO: Implement binary log file loading
-        raise NotImplementedError("PLOG file loading not yet implemented")
+        """
+        Load data from binary PLOG file (memory-mapped, no CSV conversion).
+
+        The file stays open and channels plot from the map; a channel's
+        samples are copied only when statistics or export need them.
+        """
+        self._on_clear()
+
+        log = MappedPlogReader(filename)
+        timestamps = None if log.is_mapped else log.timestamps / 1000.0
+        channel_ids = []
+        for i, column in enumerate(log.columns, start=1):
+            ch_id = 0x1000 + i
+            if column.max_value > column.min_value:
+                self.add_channel(ch_id, column.name, column.unit, 'User',
+                                 column.min_value, column.max_value)
+            else:
+                self.add_channel(ch_id, column.name, column.unit, 'User')
+            channel = self.channels[ch_id]
+            channel.enabled = True
+            if log.is_mapped:
+                channel.load_plog(PlogSeries(log, column.id))
+            else:
+                # Variable-length records: the reader already copied them, NaN marks gaps
+                channel.load_series(timestamps, log.values(column.id))
+            channel_ids.append(ch_id)
+
+        if log.is_mapped:
+            self._plog = log
+        else:
+            log.close()
+
+        self._update_channel_tree()
+        for ch_id in channel_ids:
+            self._update_plot_visibility(ch_id)
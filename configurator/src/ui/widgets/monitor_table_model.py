@@ -0,0 +1,148 @@
+"""
+Monitor Table Model
+Text table model shared by the Output Monitor, Analog Monitor and
+Variables Inspector.
+
+Cells are display strings in one row-major list with one background
+color per row. Widgets format telemetry and push whole rows through
+update_row(); only cells whose text actually changed are stored and
+reported to the view, so a packet that moves one current reading
+repaints one cell instead of every item in the table.
+"""
+
+from typing import List, Optional, Sequence
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QBrush, QColor
+
+
+ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+class MonitorTableModel(QAbstractTableModel):
+    """Read-only table of display strings with a background color per row."""
+
+    def __init__(self, headers: Sequence[str], alignments: Optional[Sequence] = None,
+                 background: QColor = QColor(0, 0, 0),
+                 foreground: QColor = QColor(255, 255, 255), parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._columns = len(self._headers)
+        self._alignments = list(alignments) if alignments else [ALIGN_LEFT] * self._columns
+        self._background = QBrush(background)
+        self._foreground = QBrush(foreground)
+
+        self._cells: List[str] = []          # rows * columns, row-major
+        self._backgrounds: List[QBrush] = []  # One per row
+
+        # Statistics: cells reported to the view through dataChanged
+        self.cells_changed = 0
+
+    # -------------------------------------------------------------------------
+    # QAbstractTableModel interface
+    # -------------------------------------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._backgrounds)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._columns
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < self._columns):
+            return self._headers[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._cells[row * self._columns + index.column()]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._backgrounds[row]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foreground
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._alignments[index.column()]
+        return None
+
+    # -------------------------------------------------------------------------
+    # Contents
+    # -------------------------------------------------------------------------
+
+    def set_rows(self, rows: Sequence[Sequence[str]], color: Optional[QColor] = None):
+        """Replace all rows (resets attached views; use for structure changes)."""
+        brush = QBrush(color) if color is not None else self._background
+        cells = []
+        for row in rows:
+            if len(row) != self._columns:
+                raise ValueError(f"Expected {self._columns} cells, got {len(row)}")
+            cells.extend(row)
+
+        self.beginResetModel()
+        self._cells = cells
+        self._backgrounds = [brush] * len(rows)
+        self.endResetModel()
+
+    def text(self, row: int, column: int) -> str:
+        """Displayed text of a cell."""
+        return self._cells[row * self._columns + column]
+
+    def update_row(self, row: int, texts: Sequence[Optional[str]], first_column: int = 0) -> int:
+        """
+        Set consecutive cells of a row, starting at first_column.
+
+        None leaves a cell as it is. One dataChanged covering the changed
+        cells is emitted, and nothing when all texts are unchanged.
+
+        Returns:
+            Number of cells that changed
+        """
+        base = row * self._columns + first_column
+        first = last = -1
+        changed = 0
+        for offset, text in enumerate(texts):
+            if text is None or self._cells[base + offset] == text:
+                continue
+            self._cells[base + offset] = text
+            if first < 0:
+                first = offset
+            last = offset
+            changed += 1
+
+        if changed:
+            self.cells_changed += changed
+            self.dataChanged.emit(self.index(row, first_column + first),
+                                  self.index(row, first_column + last),
+                                  [Qt.ItemDataRole.DisplayRole])
+        return changed
+
+    def set_text(self, row: int, column: int, text: str) -> bool:
+        """Set one cell. Returns True if its text changed."""
+        return self.update_row(row, (text,), column) > 0
+
+    def set_column(self, column: int, text: str):
+        """Set a column in every row (e.g. '?' when offline)."""
+        for row in range(len(self._backgrounds)):
+            self.set_text(row, column, text)
+
+    def row_color(self, row: int) -> QColor:
+        return self._backgrounds[row].color()
+
+    def set_row_color(self, row: int, color: QColor) -> bool:
+        """Set a row's background. Returns True if it changed."""
+        if self._backgrounds[row].color() == color:
+            return False
+        self._backgrounds[row] = QBrush(color)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self._columns - 1),
+                              [Qt.ItemDataRole.BackgroundRole])
+        return True
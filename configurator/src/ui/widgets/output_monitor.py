@@ -13,13 +13,15 @@ ECUMaster channel naming convention:
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QTableView,
     QHeaderView, QPushButton, QHBoxLayout, QLabel, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QBrush
+from PyQt6.QtCore import Qt, QTimer, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor
 from typing import Dict, List
 
+from .monitor_table_model import MonitorTableModel, ALIGN_CENTER, ALIGN_LEFT, ALIGN_RIGHT
+
 
 class OutputMonitor(QWidget):
     """Output channels monitor widget with real-time telemetry display."""
@@ -45,13 +47,21 @@ class OutputMonitor(QWidget):
     COL_VLTG = 7     # Output voltage
     COL_TRIP = 8     # Trip/Fault indicator
 
+    STATE_NAMES = ["OFF", "ON", "OC", "OT", "SC", "OL", "PWM"]
+    FAULT_STATES = (2, 3, 4, 5)  # OC, OT, SC, OL
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.outputs_data = []  # Only user-created channels
         self._connected = False
-        self._peak_currents = {}  # Track peak currents per channel
+        self._peak_currents: List[int] = []  # Peak current (mA) per row
         self._row_to_index = {}   # Mapping from table row to outputs_data index
+
+        # Per-row telemetry plan, rebuilt by _populate_table()
+        self._row_pins: List[List[int]] = []
+        self._row_default: List[bool] = []
+        self._row_pwm_configured: List[bool] = []
         self._init_ui()
 
         # Start with empty table - only show user-created channels
@@ -87,11 +97,14 @@ class OutputMonitor(QWidget):
 
         # Table with ECUMaster-compatible columns
         # Pin | Name | Status | V | Load | Curr | Peak | Vltg | Trip
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "Pin", "Name", "Status", "V", "Load", "Curr", "Peak", "Vltg", "Trip"
-        ])
+        # Cells only repaint when their text changes (see MonitorTableModel)
+        self.model = MonitorTableModel(
+            ["Pin", "Name", "Status", "V", "Load", "Curr", "Peak", "Vltg", "Trip"],
+            [ALIGN_CENTER, ALIGN_LEFT, ALIGN_CENTER, ALIGN_RIGHT, ALIGN_RIGHT,
+             ALIGN_RIGHT, ALIGN_RIGHT, ALIGN_RIGHT, ALIGN_CENTER],
+            background=self.COLOR_NORMAL, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Set column widths
         header = self.table.horizontalHeader()
@@ -117,24 +130,24 @@ class OutputMonitor(QWidget):
 
         self.table.setAlternatingRowColors(False)  # We'll use custom row colors
         self.table.verticalHeader().setVisible(False)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)  # Read-only
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)  # Select full rows
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)  # Read-only
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)  # Select full rows
 
         # Double-click to edit channel
-        self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        self.table.doubleClicked.connect(self._on_cell_double_clicked)
 
         # Dark theme styling (matching Variables Inspector - pure black)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #000000;
                 color: #ffffff;
                 gridline-color: #333333;
             }
-            QTableWidget::item {
+            QTableView::item {
                 background-color: #000000;
                 color: #ffffff;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4;
                 color: #ffffff;
             }
@@ -148,9 +161,10 @@ class OutputMonitor(QWidget):
 
         layout.addWidget(self.table)
 
-    def _on_cell_double_clicked(self, row: int, column: int):
+    def _on_cell_double_clicked(self, index: QModelIndex):
         """Handle double-click on a cell to open edit dialog."""
         # Get the output data for this row
+        row = index.row()
         if row not in self._row_to_index:
             return
 
@@ -209,128 +223,86 @@ class OutputMonitor(QWidget):
 
     def _reset_values(self):
         """Reset all telemetry values to '?'."""
-        for row in range(self.table.rowCount()):
-            for col in [self.COL_STATUS, self.COL_V, self.COL_LOAD, self.COL_CURR,
-                       self.COL_PEAK, self.COL_VLTG, self.COL_TRIP]:
-                item = self.table.item(row, col)
-                if item:
-                    item.setText("?")
-                    item.setBackground(QBrush(self.COLOR_DISABLED))
+        unknown = ("?",) * (self.COL_TRIP - self.COL_STATUS + 1)
+        for row in range(self.model.rowCount()):
+            self.model.update_row(row, unknown, self.COL_STATUS)
+            self.model.set_row_color(row, self.COLOR_DISABLED)
 
     def _reset_peaks(self):
         """Reset peak current values."""
-        self._peak_currents.clear()
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, self.COL_PEAK)
-            if item:
-                item.setText("0")
+        self._peak_currents = [0] * len(self._peak_currents)
+        self.model.set_column(self.COL_PEAK, "0")
 
     def _populate_table(self):
-        """Populate table with user-created outputs only."""
-        self.table.setRowCount(len(self.outputs_data))
-
+        """Populate table with user-created outputs and build the row->pin plan."""
         # Store mapping from table row to original index
         self._row_to_index = {}
+        self._row_pins = []
+        self._row_default = []
+        self._row_pwm_configured = []
+        rows = []
 
         for row, output in enumerate(self.outputs_data):
             self._row_to_index[row] = row
 
             # Get pins - can be single pin or multiple pins
-            pins = output.get('pins', [])
-            if not pins:
-                # Fallback to legacy 'channel' field
-                channel = output.get('channel', row)
-                pins = [channel]
+            # Support multiple field names: output_pins, pins, channel
+            pins = output.get('output_pins') or output.get('pins') or [output.get('channel', row)]
+            self._row_pins.append(list(pins))
+
+            # Consider unconfigured if _is_default flag is True OR if name is empty
+            name = output.get('name', '')
+            self._row_default.append(output.get('_is_default', True) or not name)
 
-            # Pin (O1, O2, etc. or O1, O2, O3 for multiple)
+            # Check if PWM is configured for this output
+            self._row_pwm_configured.append(
+                output.get("pwm_enabled", False) or output.get("pwm", {}).get("enabled", False))
+
+            # Pin (O1, O2, etc. or O1, O2, O3 for multiple) | Name | telemetry "?" | Trip
             pin_str = ", ".join([f"O{p + 1}" for p in pins])
-            pin_item = QTableWidgetItem(pin_str)
-            pin_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, self.COL_PIN, pin_item)
+            rows.append([pin_str, name, "?", "?", "?", "?", "?", "?", ""])
 
-            # Name - always shown for user-created channels
-            name = output.get('name', '')
-            name_item = QTableWidgetItem(name)
-            self.table.setItem(row, self.COL_NAME, name_item)
-
-            # Status
-            status_item = QTableWidgetItem("?")
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, self.COL_STATUS, status_item)
-
-            # V (battery voltage - same for all)
-            v_item = QTableWidgetItem("?")
-            v_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, self.COL_V, v_item)
-
-            # Load (duty %)
-            load_item = QTableWidgetItem("?")
-            load_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, self.COL_LOAD, load_item)
-
-            # Curr (current mA)
-            curr_item = QTableWidgetItem("?")
-            curr_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, self.COL_CURR, curr_item)
-
-            # Peak (peak current)
-            peak_item = QTableWidgetItem("?")
-            peak_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, self.COL_PEAK, peak_item)
-
-            # Vltg (output voltage)
-            vltg_item = QTableWidgetItem("?")
-            vltg_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, self.COL_VLTG, vltg_item)
-
-            # Trip (fault indicator)
-            trip_item = QTableWidgetItem("")
-            trip_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, self.COL_TRIP, trip_item)
-
-            # All rows are user-created, set normal styling
-            self._set_row_color(row, self.COLOR_NORMAL)
-
-    def _set_row_color(self, row: int, color: QColor):
-        """Set background color for entire row."""
-        bg_brush = QBrush(color)
-        fg_brush = QBrush(QColor(255, 255, 255))  # White text
-        for col in range(9):
-            item = self.table.item(row, col)
-            if item:
-                item.setBackground(bg_brush)
-                item.setForeground(fg_brush)
+        self._peak_currents = [0] * len(rows)
+
+        # All rows are user-created, set normal styling
+        self.model.set_rows(rows, self.COLOR_NORMAL)
 
     def _update_values(self):
         """Update real-time values (when connected to device)."""
         # Values are updated via update_from_telemetry() called from main window
         pass
 
+    @staticmethod
+    def _format_current(current_ma: int) -> str:
+        if current_ma >= 1000:
+            return f"{current_ma/1000:.2f}A"
+        return f"{current_ma}"
+
     def update_output_status(self, channel: int, status: str, voltage: float, load: float):
         """Update specific output status (legacy method for backwards compatibility)."""
         # Find the row for this channel
-        for row in range(self.table.rowCount()):
-            pin_item = self.table.item(row, self.COL_PIN)
-            if pin_item and pin_item.text() == f"O{channel + 1}":
+        pin_str = f"O{channel + 1}"
+        for row in range(self.model.rowCount()):
+            if self.model.text(row, self.COL_PIN) == pin_str:
                 # Update status
-                self.table.item(row, self.COL_STATUS).setText(status)
+                self.model.set_text(row, self.COL_STATUS, status)
 
                 # Update voltage
                 if voltage > 0:
-                    self.table.item(row, self.COL_VLTG).setText(f"{voltage:.2f}")
+                    self.model.set_text(row, self.COL_VLTG, f"{voltage:.2f}")
 
                 # Update load (duty)
-                self.table.item(row, self.COL_LOAD).setText(f"{load:.2f}%")
+                self.model.set_text(row, self.COL_LOAD, f"{load:.2f}%")
 
                 # Set row color based on status
                 if status in ["OC", "OT", "SC", "OL"]:
-                    self._set_row_color(row, self.COLOR_FAULT)
+                    self.model.set_row_color(row, self.COLOR_FAULT)
                 elif status == "PWM":
-                    self._set_row_color(row, self.COLOR_PWM)
+                    self.model.set_row_color(row, self.COLOR_PWM)
                 elif status == "ON":
-                    self._set_row_color(row, self.COLOR_ACTIVE)
+                    self.model.set_row_color(row, self.COLOR_ACTIVE)
                 else:
-                    self._set_row_color(row, self.COLOR_NORMAL)
+                    self.model.set_row_color(row, self.COLOR_NORMAL)
                 break
 
     def update_from_telemetry(self, profet_states: List[int], profet_duties: List[int],
@@ -338,131 +310,67 @@ class OutputMonitor(QWidget):
         """
         Update all outputs from telemetry data.
 
+        Only cells whose displayed text changes are repainted.
+
         Args:
             profet_states: List of channel states (0=OFF, 1=ON, 2=OC, 3=OT, 4=SC, 5=OL, 6=PWM)
             profet_duties: List of duty cycles (0-1000 = 0-100.0%)
             profet_currents: List of channel currents in mA
             battery_voltage: System battery voltage for output voltage estimation
         """
-        state_names = ["OFF", "ON", "OC", "OT", "SC", "OL", "PWM"]
-        fault_states = [2, 3, 4, 5]  # OC, OT, SC, OL
-
-        for row in range(self.table.rowCount()):
-            # Get original output index from row mapping
-            orig_idx = self._row_to_index.get(row, row)
-            if orig_idx >= len(self.outputs_data):
-                continue
-
-            output_config = self.outputs_data[orig_idx]
-            # Consider unconfigured if _is_default flag is True OR if name is empty
-            name = output_config.get('name', '')
-            is_default = output_config.get('_is_default', True) or not name
-
-            # Get list of physical pins for this output
-            # Support multiple field names: output_pins, pins, channel
-            pins = output_config.get('output_pins') or output_config.get('pins') or [output_config.get('channel', orig_idx)]
-            if not pins:
-                pins = [orig_idx]
-
+        state_names = self.STATE_NAMES
+        num_states = len(profet_states)
+        num_duties = len(profet_duties)
+        num_currents = len(profet_currents)
+        battery_str = f"{battery_voltage:.2f}"
+        unconfigured = ("-", "-", "-", "-", "-", "-", "")
+
+        for row, pins in enumerate(self._row_pins):
             # Use first pin as primary channel index for telemetry
-            channel_idx = pins[0] if pins else orig_idx
+            channel_idx = pins[0]
+            if channel_idx >= num_states:
+                continue
 
-            if channel_idx >= len(profet_states):
+            # Show dash for unconfigured outputs, which stay gray
+            if self._row_default[row]:
+                self.model.update_row(row, unconfigured, self.COL_STATUS)
+                self.model.set_row_color(row, self.COLOR_DISABLED)
                 continue
 
             # Aggregate state/duty/current from all pins in this output
             state = profet_states[channel_idx]
-            duty = profet_duties[channel_idx] if channel_idx < len(profet_duties) else 0
+            duty = profet_duties[channel_idx] if channel_idx < num_duties else 0
 
             # Sum current from all pins in this output channel
             current_ma = 0
             for pin in pins:
-                if pin < len(profet_currents):
+                if pin < num_currents:
                     current_ma += profet_currents[pin]
 
-            # Show status based on configuration
-            if is_default:
-                status_str = "-"  # Show dash for unconfigured
-            else:
-                # Show actual state from telemetry
-                # No more DIS status - outputs are controlled only by Control Function
-                status_str = state_names[state] if state < len(state_names) else "?"
-
-            status_item = self.table.item(row, self.COL_STATUS)
-            if status_item:
-                status_item.setText(status_str)
-
-            # V (battery voltage - same for all outputs)
-            v_item = self.table.item(row, self.COL_V)
-            if v_item:
-                if is_default:
-                    v_item.setText("-")
-                else:
-                    v_item.setText(f"{battery_voltage:.2f}")
-
-            # Load (duty cycle 0-1000 -> 0-100.0%)
-            load_item = self.table.item(row, self.COL_LOAD)
-            if load_item:
-                if is_default:
-                    load_item.setText("-")
-                else:
-                    duty_percent = duty / 10.0
-                    load_item.setText(f"{duty_percent:.2f}%")
-
-            # Current in mA (show - for unconfigured)
-            curr_item = self.table.item(row, self.COL_CURR)
-            if curr_item:
-                if is_default:
-                    curr_item.setText("-")
-                elif current_ma >= 1000:
-                    curr_item.setText(f"{current_ma/1000:.2f}A")
-                else:
-                    curr_item.setText(f"{current_ma}")
-
-            # Peak current tracking (only when configured)
-            if not is_default:
-                if row not in self._peak_currents:
-                    self._peak_currents[row] = 0
-                if current_ma > self._peak_currents[row]:
-                    self._peak_currents[row] = current_ma
-
-            peak_item = self.table.item(row, self.COL_PEAK)
-            if peak_item:
-                if is_default:
-                    peak_item.setText("-")
-                else:
-                    peak = self._peak_currents.get(row, 0)
-                    if peak >= 1000:
-                        peak_item.setText(f"{peak/1000:.2f}A")
-                    else:
-                        peak_item.setText(f"{peak}")
+            # Peak current tracking
+            if current_ma > self._peak_currents[row]:
+                self._peak_currents[row] = current_ma
 
             # Output voltage estimation
-            vltg_item = self.table.item(row, self.COL_VLTG)
-            if vltg_item:
-                if is_default:
-                    vltg_item.setText("-")
-                elif state == 1:  # ON
-                    vltg_item.setText(f"{battery_voltage:.2f}")
-                elif state == 6:  # PWM
-                    output_voltage = battery_voltage * (duty / 1000.0)
-                    vltg_item.setText(f"{output_voltage:.2f}")
-                else:
-                    vltg_item.setText("0.00")
+            if state == 1:  # ON
+                vltg_str = battery_str
+            elif state == 6:  # PWM
+                vltg_str = f"{battery_voltage * (duty / 1000.0):.2f}"
+            else:
+                vltg_str = "0.00"
 
-            # Trip indicator (fault flag) - show error icon for faults
-            trip_item = self.table.item(row, self.COL_TRIP)
-            if trip_item:
-                if not is_default and state in fault_states:
-                    trip_item.setText("\u26a0")  # Warning sign ⚠
-                else:
-                    trip_item.setText("")
+            is_fault = state in self.FAULT_STATES
 
-            # Check if PWM is configured for this output
-            is_pwm_configured = output_config.get("pwm_enabled", False)
-            if not is_pwm_configured:
-                pwm_cfg = output_config.get("pwm", {})
-                is_pwm_configured = pwm_cfg.get("enabled", False)
+            # Status | V | Load (duty 0-1000 -> 0-100.0%) | Curr | Peak | Vltg | Trip
+            self.model.update_row(row, (
+                state_names[state] if state < len(state_names) else "?",
+                battery_str,
+                f"{duty / 10.0:.2f}%",
+                self._format_current(current_ma),
+                self._format_current(self._peak_currents[row]),
+                vltg_str,
+                "\u26a0" if is_fault else "",  # Warning sign ⚠
+            ), self.COL_STATUS)
 
             # Determine if output is in PWM mode:
             # - state == 6 (firmware reports PWM)
@@ -470,21 +378,17 @@ class OutputMonitor(QWidget):
             # - OR PWM is configured and output is active with non-100% duty
             is_pwm_active = (state == 6 or
                             (duty > 0 and duty < 1000) or
-                            (is_pwm_configured and state == 1 and duty < 1000))
-
-            # Set row color based on state:
-            # - Unconfigured (default) outputs stay gray
-            # - Configured outputs: colored based on state
-            if is_default:
-                self._set_row_color(row, self.COLOR_DISABLED)
-            elif state in fault_states:
-                self._set_row_color(row, self.COLOR_FAULT)
+                            (self._row_pwm_configured[row] and state == 1 and duty < 1000))
+
+            # Set row color based on state
+            if is_fault:
+                self.model.set_row_color(row, self.COLOR_FAULT)
             elif is_pwm_active:  # PWM mode (state=6 or partial duty)
-                self._set_row_color(row, self.COLOR_PWM)
+                self.model.set_row_color(row, self.COLOR_PWM)
             elif state == 1:  # ON (100% duty)
-                self._set_row_color(row, self.COLOR_ACTIVE)
+                self.model.set_row_color(row, self.COLOR_ACTIVE)
             else:  # OFF
-                self._set_row_color(row, self.COLOR_NORMAL)
+                self.model.set_row_color(row, self.COLOR_NORMAL)
 
     def get_channel_count(self) -> int:
         """Get number of configured outputs."""
@@ -19,9 +19,11 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon
 from typing import Dict, Any, List, Optional
-from collections import deque
 import time
 
+from utils.sample_buffer import SampleRingBuffer
+from utils.decimation import minmax_envelope, DEFAULT_PLOT_WIDTH
+
 try:
     import pyqtgraph as pg
     HAS_PYQTGRAPH = True
@@ -52,12 +54,12 @@ class PIDTuner(QWidget):
 
         # Data buffers for plotting (circular buffers)
         self.history_length = 600  # 60 seconds at 10Hz
-        self.time_data = deque(maxlen=self.history_length)
-        self.setpoint_data = deque(maxlen=self.history_length)
-        self.process_data = deque(maxlen=self.history_length)
-        self.output_data = deque(maxlen=self.history_length)
-        self.error_data = deque(maxlen=self.history_length)
+        self.setpoint_data = SampleRingBuffer(self.history_length)
+        self.process_data = SampleRingBuffer(self.history_length)
+        self.output_data = SampleRingBuffer(self.history_length)
+        self.error_data = SampleRingBuffer(self.history_length)
         self._start_time = time.time()
+        self._plot_key = None  # Last drawn (samples, width, error shown)
 
         # Recording state
         self._recording = False
@@ -469,12 +471,9 @@ class PIDTuner(QWidget):
     def _on_history_changed(self, seconds: int):
         """Handle history length change."""
         self.history_length = seconds * 10  # 10 Hz
-        # Recreate buffers with new size
-        self.time_data = deque(list(self.time_data)[-self.history_length:], maxlen=self.history_length)
-        self.setpoint_data = deque(list(self.setpoint_data)[-self.history_length:], maxlen=self.history_length)
-        self.process_data = deque(list(self.process_data)[-self.history_length:], maxlen=self.history_length)
-        self.output_data = deque(list(self.output_data)[-self.history_length:], maxlen=self.history_length)
-        self.error_data = deque(list(self.error_data)[-self.history_length:], maxlen=self.history_length)
+        for buffer in (self.setpoint_data, self.process_data, self.output_data, self.error_data):
+            buffer.set_retention(self.history_length)
+        self._plot_key = None
 
     def _toggle_error_curve(self, show: bool):
         """Toggle error curve visibility."""
@@ -492,12 +491,12 @@ class PIDTuner(QWidget):
 
     def _clear_graph(self):
         """Clear all graph data."""
-        self.time_data.clear()
         self.setpoint_data.clear()
         self.process_data.clear()
         self.output_data.clear()
         self.error_data.clear()
         self._start_time = time.time()
+        self._plot_key = None
 
         if HAS_PYQTGRAPH and self.plot_widget:
             self.setpoint_curve.setData([], [])
@@ -515,11 +514,10 @@ class PIDTuner(QWidget):
         current_time = time.time() - self._start_time
 
         # Add data points
-        self.time_data.append(current_time)
-        self.setpoint_data.append(setpoint)
-        self.process_data.append(process)
-        self.output_data.append(output)
-        self.error_data.append(setpoint - process)
+        self.setpoint_data.append(current_time, setpoint)
+        self.process_data.append(current_time, process)
+        self.output_data.append(current_time, output)
+        self.error_data.append(current_time, setpoint - process)
 
         # Update value labels
         self.current_setpoint_label.setText(f"{setpoint:.2f}")
@@ -542,16 +540,25 @@ class PIDTuner(QWidget):
         if not HAS_PYQTGRAPH or not self.plot_widget:
             return
 
-        if len(self.time_data) < 2:
+        if len(self.setpoint_data) < 2:
             return
 
-        time_list = list(self.time_data)
-        self.setpoint_curve.setData(time_list, list(self.setpoint_data))
-        self.process_curve.setData(time_list, list(self.process_data))
-        self.output_curve.setData(time_list, list(self.output_data))
-
-        if hasattr(self, 'error_curve') and self.error_curve and self.show_error_check.isChecked():
-            self.error_curve.setData(time_list, list(self.error_data))
+        show_error = bool(getattr(self, 'error_curve', None)) and self.show_error_check.isChecked()
+        width = int(self.plot_widget.getViewBox().width()) or DEFAULT_PLOT_WIDTH
+        key = (self.setpoint_data.total_count, width, show_error)
+        if key == self._plot_key:
+            return
+        self._plot_key = key
+
+        curves = [
+            (self.setpoint_curve, self.setpoint_data),
+            (self.process_curve, self.process_data),
+            (self.output_curve, self.output_data),
+        ]
+        if show_error:
+            curves.append((self.error_curve, self.error_data))
+        for curve, buffer in curves:
+            curve.setData(*minmax_envelope(buffer.times, buffer.values, width=width))
 
     def set_connected(self, connected: bool):
         """Update connection state."""
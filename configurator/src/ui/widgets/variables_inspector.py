@@ -17,14 +17,16 @@ Channel naming conventions:
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QTableView,
     QHeaderView, QHBoxLayout, QLabel, QLineEdit, QPushButton, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QBrush
+from PyQt6.QtCore import Qt, QTimer, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor
 from typing import Dict, List, Any, Optional
 import logging
 
+from .monitor_table_model import MonitorTableModel, ALIGN_LEFT, ALIGN_RIGHT
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,6 +58,7 @@ class VariablesInspector(QWidget):
         self._channels: Dict[str, Dict[str, Any]] = {}  # name -> {value, unit, type, active}
         self._channel_id_map: Dict[int, str] = {}  # channel_id -> stored_id for fast lookup
         self._row_index_map: Dict[str, int] = {}  # channel_id -> row index for O(1) lookup
+        self._row_ids: List[str] = []  # row index -> channel_id
         self._changed_rows: set = set()  # Track rows that need color reset
         self._pending_updates: bool = False  # Flag for batched viewport updates
         self._init_ui()
@@ -95,9 +98,12 @@ class VariablesInspector(QWidget):
 
         # Table with ECUMaster-compatible columns
         # Name | Value | Unit
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Name", "Value", "Unit"])
+        # Cells only repaint when their text changes (see MonitorTableModel)
+        self.model = MonitorTableModel(
+            ["Name", "Value", "Unit"], [ALIGN_LEFT, ALIGN_RIGHT, ALIGN_LEFT],
+            background=self.COLOR_NORMAL, foreground=self.COLOR_TEXT, parent=self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Set column widths
         header = self.table.horizontalHeader()
@@ -111,20 +117,21 @@ class VariablesInspector(QWidget):
 
         self.table.setAlternatingRowColors(False)  # We use custom row colors
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)  # Read-only
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
 
         # Dark theme styling
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #000000;
                 color: #ffffff;
                 gridline-color: #333333;
             }
-            QTableWidget::item {
+            QTableView::item {
                 background-color: #000000;
                 color: #ffffff;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4;
                 color: #ffffff;
             }
@@ -177,7 +184,7 @@ class VariablesInspector(QWidget):
         """)
 
         # Double-click to edit channel
-        self.table.cellDoubleClicked.connect(self._on_cell_double_clicked)
+        self.table.doubleClicked.connect(self._on_cell_double_clicked)
 
         layout.addWidget(self.table)
 
@@ -194,10 +201,8 @@ class VariablesInspector(QWidget):
 
     def _reset_values(self):
         """Reset all telemetry values to '?'."""
-        for row in range(self.table.rowCount()):
-            value_item = self.table.item(row, self.COL_VALUE)
-            if value_item:
-                value_item.setText("?")
+        self.model.set_column(self.COL_VALUE, "?")
+        for row in range(self.model.rowCount()):
             self._set_row_color(row, self.COLOR_DISABLED)
 
     def set_channels(self, channels: List[Dict[str, Any]]):
@@ -271,53 +276,24 @@ class VariablesInspector(QWidget):
         # Sort channels by name
         sorted_ids = sorted(self._channels.keys())
 
-        # Disable updates during bulk population for performance
-        self.table.setUpdatesEnabled(False)
-
-        self.table.setRowCount(len(sorted_ids))
+        # Build row index maps for O(1) lookup in both directions
+        self._row_ids = sorted_ids
+        self._row_index_map = {ch_id: row for row, ch_id in enumerate(sorted_ids)}
 
-        # Build row index map for O(1) lookup
-        self._row_index_map.clear()
-
-        for row, ch_id in enumerate(sorted_ids):
+        rows = []
+        for ch_id in sorted_ids:
             ch = self._channels[ch_id]
+            rows.append([ch['name'], str(ch['value']), ch['unit']])
 
-            # Build reverse lookup map
-            self._row_index_map[ch_id] = row
-
-            # Name (not editable)
-            name_item = QTableWidgetItem(ch['name'])
-            name_item.setData(Qt.ItemDataRole.UserRole, ch_id)  # Store ID in item
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, self.COL_NAME, name_item)
-
-            # Value (read-only)
-            value_item = QTableWidgetItem(str(ch['value']))
-            value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            value_item.setFlags(value_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, self.COL_VALUE, value_item)
-
-            # Unit (not editable)
-            unit_item = QTableWidgetItem(ch['unit'])
-            unit_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            unit_item.setFlags(unit_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, self.COL_UNIT, unit_item)
-
-            # Initial color
-            self._set_row_color(row, self.COLOR_DISABLED if not self._connected else self.COLOR_NORMAL)
-
-        # Re-enable updates and repaint once
-        self.table.setUpdatesEnabled(True)
+        # Single model reset instead of per-item inserts
+        self.model.set_rows(rows, self.COLOR_DISABLED if not self._connected else self.COLOR_NORMAL)
 
         self.count_label.setText(f"{len(sorted_ids)} channels")
         self._apply_filter()
 
     def _set_row_color(self, row: int, color: QColor):
         """Set background color for entire row."""
-        for col in range(3):
-            item = self.table.item(row, col)
-            if item:
-                item.setBackground(QBrush(color))
+        self.model.set_row_color(row, color)
 
     def _get_row_by_id(self, channel_id: str) -> int:
         """Find row index by channel ID using O(1) lookup."""
@@ -350,13 +326,11 @@ class VariablesInspector(QWidget):
         if row < 0:
             return
 
-        # Update value text
-        value_item = self.table.item(row, self.COL_VALUE)
-        if value_item:
-            if isinstance(value, float):
-                value_item.setText(f"{value:.2f}")
-            else:
-                value_item.setText(str(value))
+        # Update value text (repaints only if the text changed)
+        if isinstance(value, float):
+            self.model.set_text(row, self.COL_VALUE, f"{value:.2f}")
+        else:
+            self.model.set_text(row, self.COL_VALUE, str(value))
 
         # Update row color based on state
         if error:
@@ -462,11 +436,10 @@ class VariablesInspector(QWidget):
         self._changed_rows.clear()
 
         for row in rows_to_process:
-            name_item = self.table.item(row, self.COL_NAME)
-            if not name_item:
+            if row >= len(self._row_ids):
                 continue
 
-            ch_id = name_item.data(Qt.ItemDataRole.UserRole)
+            ch_id = self._row_ids[row]
             if ch_id not in self._channels:
                 continue
 
@@ -485,35 +458,23 @@ class VariablesInspector(QWidget):
         filter_text = self.filter_edit.text().lower()
 
         visible_count = 0
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, self.COL_NAME)
-            if not name_item:
-                continue
-
-            name = name_item.text().lower()
+        for row in range(self.model.rowCount()):
+            name = self.model.text(row, self.COL_NAME).lower()
             visible = filter_text in name if filter_text else True
             self.table.setRowHidden(row, not visible)
             if visible:
                 visible_count += 1
 
-        self.count_label.setText(f"{visible_count} of {self.table.rowCount()} channels")
+        self.count_label.setText(f"{visible_count} of {self.model.rowCount()} channels")
 
-    def _on_cell_double_clicked(self, row: int, column: int):
+    def _on_cell_double_clicked(self, index: QModelIndex):
         """Handle double-click on table cell - emit signal to edit the channel."""
-        if row < 0 or row >= self.table.rowCount():
+        row = index.row()
+        if row < 0 or row >= len(self._row_ids):
             return
 
         # Get channel ID from the row
-        name_item = self.table.item(row, self.COL_NAME)
-        if not name_item:
-            return
-
-        # Find the channel by row in our index
-        ch_id = None
-        for stored_id, stored_row in self._row_index_map.items():
-            if stored_row == row:
-                ch_id = stored_id
-                break
+        ch_id = self._row_ids[row]
 
         if not ch_id or ch_id not in self._channels:
             logger.debug(f"Double-click: channel not found for row {row}")
@@ -0,0 +1,297 @@
+"""
+CAN Signal Extraction Plans - desktop twin of the firmware decoder.
+
+The firmware compiles every CAN Input into an extraction plan when it is
+added (PMU_CAN_ExtractPlan_t in firmware/include/pmu_can.h): byte offset,
+byte count, shift, mask, sign extension and, where the scaling is exact,
+integer multiplier/divider/offset. Byte-aligned 8/16/32-bit fields get a
+direct load.
+
+This module builds the same plan from a configurator CAN Input dict and
+decodes with the same steps, so the CAN monitor shows what the firmware
+computes:
+
+- raw bits and the virtual channel value match exactly
+- the float path uses float32 operations in the firmware's order
+
+compile_plan() mirrors CAN_CompilePlan(), CanExtractPlan.decode() mirrors
+CAN_DecodePlan().
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+# Load strategies (CAN_PLAN_* kinds in pmu_can.c)
+PLAN_U8 = 0
+PLAN_LE16 = 1
+PLAN_BE16 = 2
+PLAN_LE32 = 3
+PLAN_BE32 = 4
+PLAN_LE = 5
+PLAN_BE = 6
+PLAN_BITS = 7
+
+# Flags
+PLAN_SIGNED = 0x01
+PLAN_FLOAT = 0x02
+PLAN_INT_SCALE = 0x04
+PLAN_MOTOROLA = 0x08
+
+# Largest |multiplier|, |divider|, |offset| for integer scaling
+INT_SCALE_MAX = 65536
+
+# Receive buffer of a CAN Input's message object (CAN FD)
+CAN_FD_MAX_BYTES = 64
+
+_MASK64 = (1 << 64) - 1
+
+# Firmware data format -> bit length for byte-aligned formats
+_FORMAT_BITS = {"8bit": 8, "16bit": 16, "32bit": 32}
+
+
+def _mask(bits: int) -> int:
+    return _MASK64 if bits >= 64 else (1 << bits) - 1
+
+
+def _to_int32(value: int) -> int:
+    """Two's complement wrap, as the firmware's (int32_t) cast of an int64."""
+    value &= 0xFFFFFFFF
+    return value - (1 << 32) if value & 0x80000000 else value
+
+
+def _float_to_int32(value: np.float32) -> int:
+    """(int32_t) of a float on the Cortex-M7: truncate, saturate, NaN -> 0."""
+    if np.isnan(value):
+        return 0
+    if value >= 2147483647.0:
+        return 2147483647
+    if value <= -2147483648.0:
+        return -2147483648
+    return int(value)
+
+
+def extract_raw_bits(data: bytes, start_bit: int, bit_length: int,
+                     byte_order: int, max_bytes: int) -> int:
+    """Bit-by-bit extraction (CAN_ExtractRawBits), used for fields over 8 bytes."""
+    start_byte = start_bit // 8
+    start_bit_in_byte = start_bit % 8
+    raw = 0
+
+    if byte_order == 0:
+        bytes_needed = (bit_length + start_bit_in_byte + 7) // 8
+        for i in range(min(bytes_needed, 8)):
+            if start_byte + i >= max_bytes:
+                break
+            raw |= data[start_byte + i] << (i * 8)
+        raw >>= start_bit_in_byte
+    else:
+        bits_remaining = bit_length
+        current_byte = start_byte
+        bits_from_msb = start_bit_in_byte + 1
+
+        bits_to_take = min(bits_remaining, bits_from_msb)
+        raw = (data[current_byte] >> (bits_from_msb - bits_to_take)) & ((1 << bits_to_take) - 1)
+        bits_remaining -= bits_to_take
+        current_byte += 1
+
+        while bits_remaining >= 8 and current_byte < max_bytes:
+            raw = ((raw << 8) | data[current_byte]) & _MASK64
+            bits_remaining -= 8
+            current_byte += 1
+
+        if bits_remaining > 0 and current_byte < max_bytes:
+            raw = ((raw << bits_remaining) | (data[current_byte] >> (8 - bits_remaining))) & _MASK64
+
+    return raw & _mask(bit_length)
+
+
+@dataclass
+class CanExtractPlan:
+    """Compiled extraction of one signal (PMU_CAN_ExtractPlan_t)."""
+    kind: int
+    byte_offset: int        # First byte (start bit for PLAN_BITS)
+    byte_count: int         # Bytes loaded (buffer size for PLAN_BITS)
+    shift: int
+    mask: int
+    bit_length: int
+    flags: int
+    multiplier: int = 0     # Integer scaling (PLAN_INT_SCALE)
+    divider: int = 1
+    offset: int = 0
+    # Float scaling, as float32 like the firmware config fields
+    f_multiplier: np.float32 = np.float32(1.0)
+    f_divider: np.float32 = np.float32(0.0)
+    f_offset: np.float32 = np.float32(0.0)
+    max_bytes: int = CAN_FD_MAX_BYTES
+
+    def load(self, data: bytes) -> int:
+        """Raw bits (CAN_PlanLoad); data must cover the plan's buffer."""
+        p = self.byte_offset
+        kind = self.kind
+        if kind == PLAN_U8:
+            return data[p]
+        if kind == PLAN_LE16:
+            return data[p] | (data[p + 1] << 8)
+        if kind == PLAN_BE16:
+            return (data[p] << 8) | data[p + 1]
+        if kind == PLAN_LE32:
+            return int.from_bytes(data[p:p + 4], 'little')
+        if kind == PLAN_BE32:
+            return int.from_bytes(data[p:p + 4], 'big')
+        if kind == PLAN_LE:
+            return (int.from_bytes(data[p:p + self.byte_count], 'little') >> self.shift) & self.mask
+        if kind == PLAN_BE:
+            return (int.from_bytes(data[p:p + self.byte_count], 'big') >> self.shift) & self.mask
+        return extract_raw_bits(data, self.byte_offset, self.bit_length,
+                                1 if self.flags & PLAN_MOTOROLA else 0, self.byte_count)
+
+    def decode(self, data: bytes) -> Tuple[float, int]:
+        """
+        Decode a frame.
+
+        Bytes past the end of data read as zero, like the firmware's
+        zero-initialised receive buffer.
+
+        Returns:
+            (scaled value, virtual channel value)
+        """
+        if len(data) < self.max_bytes:
+            data = bytes(data) + bytes(self.max_bytes - len(data))
+        raw = self.load(data)
+
+        if self.flags & PLAN_SIGNED:
+            sign = 1 << (self.bit_length - 1)
+            raw = ((raw ^ sign) - sign) & _MASK64
+            if raw >> 63:
+                raw -= 1 << 64
+
+        if self.flags & PLAN_INT_SCALE:
+            scaled = raw * self.multiplier + self.offset * self.divider
+            quotient = abs(scaled) // abs(self.divider)
+            if (scaled < 0) != (self.divider < 0):
+                quotient = -quotient
+            value = np.float32(np.int64(scaled)) / np.float32(self.divider)
+            return float(value), _to_int32(quotient)
+
+        with np.errstate(all='ignore'):
+            if self.flags & PLAN_FLOAT:
+                v = np.array([raw], dtype=np.uint32).view(np.float32)[0]
+            elif self.flags & PLAN_SIGNED:
+                v = np.float32(np.int64(raw))
+            else:
+                v = np.float32(np.uint64(raw))
+
+            if self.f_divider != 0:
+                v = np.float32(np.float32(v * self.f_multiplier) / self.f_divider) + self.f_offset
+            else:
+                v = np.float32(v * self.f_multiplier) + self.f_offset
+            v = np.float32(v)
+
+        return float(v), _float_to_int32(v)
+
+
+def _is_int_scale(value: np.float32) -> bool:
+    return bool(np.isfinite(value)) and float(value).is_integer() and abs(value) <= INT_SCALE_MAX
+
+
+def compile_plan(start_bit: int, bit_length: int, byte_order: int, signed: bool = False,
+                 is_float: bool = False, max_bytes: int = CAN_FD_MAX_BYTES,
+                 multiplier: float = 1.0, divider: float = 0.0,
+                 offset: float = 0.0) -> CanExtractPlan:
+    """
+    Compile a signal layout and scaling (CAN_CompilePlan).
+
+    Args:
+        start_bit: Start bit (Intel: LSB, Motorola: MSB, DBC numbering)
+        bit_length: Length in bits
+        byte_order: 0 = Intel, 1 = Motorola
+        signed: Sign-extend from bit_length
+        is_float: 32-bit IEEE float field (ignored for other lengths)
+        max_bytes: Receive buffer size
+        multiplier, divider, offset: value = raw * multiplier / divider + offset
+            (divider 0 = no division)
+    """
+    start_byte, start_bit_in_byte = divmod(start_bit, 8)
+    available = max_bytes - start_byte if start_byte < max_bytes else 0
+
+    flags = 0
+    if is_float and bit_length == 32:
+        flags = PLAN_FLOAT
+    elif signed and 0 < bit_length <= 64:
+        flags = PLAN_SIGNED
+
+    mask = _mask(bit_length)
+    if byte_order == 0:
+        needed = (bit_length + start_bit_in_byte + 7) // 8
+        kind = PLAN_LE
+        byte_count = min(needed, available)
+        shift = start_bit_in_byte
+        if start_bit_in_byte == 0 and byte_count == needed:
+            kind = {8: PLAN_U8, 16: PLAN_LE16, 32: PLAN_LE32}.get(bit_length, kind)
+    else:
+        first_bits = start_bit_in_byte + 1
+        needed = 1 if bit_length <= first_bits else 1 + (bit_length - first_bits + 7) // 8
+        available = max(available, 1)
+        flags |= PLAN_MOTOROLA
+        kind = PLAN_BE
+        if needed <= available:
+            byte_count = needed
+            shift = 8 * needed - 7 + start_bit_in_byte - bit_length
+        else:
+            present = first_bits + 8 * (available - 1)
+            byte_count = available
+            shift = 0
+            if present < bit_length:
+                mask = _mask(present)
+        if start_bit_in_byte == 7 and byte_count == needed:
+            kind = {8: PLAN_U8, 16: PLAN_BE16, 32: PLAN_BE32}.get(bit_length, kind)
+
+    byte_offset = start_byte
+    if needed > 8:
+        kind = PLAN_BITS
+        byte_offset = start_bit
+        byte_count = max_bytes
+        shift = 0
+
+    plan = CanExtractPlan(kind=kind, byte_offset=byte_offset, byte_count=byte_count,
+                          shift=shift, mask=mask, bit_length=bit_length, flags=flags,
+                          f_multiplier=np.float32(multiplier), f_divider=np.float32(divider),
+                          f_offset=np.float32(offset), max_bytes=max_bytes)
+
+    divisor = plan.f_divider if plan.f_divider != 0 else np.float32(1.0)
+    if (not flags & PLAN_FLOAT and bit_length <= 32 and _is_int_scale(plan.f_multiplier)
+            and _is_int_scale(divisor) and _is_int_scale(plan.f_offset)):
+        plan.flags |= PLAN_INT_SCALE
+        plan.multiplier = int(plan.f_multiplier)
+        plan.divider = int(divisor)
+        plan.offset = int(plan.f_offset)
+
+    return plan
+
+
+def compile_can_input(inp: Dict[str, Any]) -> CanExtractPlan:
+    """Compile a CAN Input channel dict (CAN_CompileInputPlan)."""
+    byte_order = inp.get("byte_order", "little_endian")
+    if isinstance(byte_order, str):
+        byte_order = 1 if byte_order in ("big_endian", "motorola") else 0
+
+    data_format = inp.get("data_format", "16bit")
+    if data_format == "custom":
+        start_bit = inp.get("start_bit", 0)
+        bit_length = inp.get("bit_length", 16)
+    else:
+        bit_length = _FORMAT_BITS.get(data_format, 16)
+        # Byte-aligned field: Motorola start bit is the MSB of the first byte
+        start_bit = inp.get("byte_offset", inp.get("start_byte", 0)) * 8
+        if byte_order:
+            start_bit += 7
+
+    data_type = inp.get("data_type", "unsigned")
+    return compile_plan(start_bit, bit_length, byte_order,
+                        signed=data_type == "signed", is_float=data_type == "float",
+                        multiplier=inp.get("multiplier", 1.0),
+                        divider=inp.get("divider", 1.0),
+                        offset=inp.get("offset", 0.0))
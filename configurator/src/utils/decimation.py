@@ -0,0 +1,151 @@
+"""
+Plot Decimation - min/max level-of-detail reduction for time series.
+
+Plots never need more than about two points per horizontal pixel. These
+helpers reduce a (times, values) series to a per-pixel min/max envelope
+for the visible time window, so spikes stay visible at any zoom level
+and drawing cost depends on the plot width, not on the series length.
+
+- minmax_envelope(): one pass over the visible samples (live data)
+- MinMaxPyramid: precomputed min/max levels for static data (loaded
+  logs), so a query only touches about factor x width entries
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+# Plot width assumed when the real width is not known yet
+DEFAULT_PLOT_WIDTH = 1000
+
+# Block size ratio between pyramid levels
+PYRAMID_FACTOR = 8
+
+
+def visible_range(times: np.ndarray, t0: float, t1: float) -> Tuple[int, int]:
+    """
+    Index range [start, stop) covering t0..t1 in sorted times.
+
+    One sample on each side is included so lines continue to the edges.
+    """
+    start = max(int(np.searchsorted(times, t0, side='left')) - 1, 0)
+    stop = min(int(np.searchsorted(times, t1, side='right')) + 1, len(times))
+    return start, stop
+
+
+def _envelope(times: np.ndarray, mins: np.ndarray, maxs: np.ndarray,
+              t0: float, t1: float, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-pixel envelope of (times, mins, maxs), two points per non-empty bucket."""
+    edges = np.linspace(t0, t1, width + 1)
+    starts = np.searchsorted(times, edges[:-1], side='left')
+    starts = np.unique(starts[starts < len(times)])
+    if starts.size == 0 or starts[0] != 0:
+        starts = np.concatenate(([0], starts))
+
+    bucket_min = np.minimum.reduceat(mins, starts)
+    bucket_max = np.maximum.reduceat(maxs, starts)
+
+    x = np.repeat(times[starts], 2)
+    y = np.empty(2 * len(starts), dtype=np.float64)
+    y[0::2] = bucket_min
+    y[1::2] = bucket_max
+    return x, y
+
+
+def minmax_envelope(times: np.ndarray, values: np.ndarray,
+                    t0: Optional[float] = None, t1: Optional[float] = None,
+                    width: int = DEFAULT_PLOT_WIDTH) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a sorted series to at most ~2 points per pixel over t0..t1.
+
+    Series that already fit are returned as views of the input without
+    copying. Otherwise every pixel-wide time bucket becomes a vertical
+    min -> max segment at the bucket's first timestamp.
+
+    Args:
+        times: Sorted timestamps
+        values: Values, same length as times
+        t0, t1: Visible time window (default: whole series)
+        width: Plot width in pixels
+
+    Returns:
+        (x, y) arrays to hand to the plot
+    """
+    if len(times) == 0:
+        return times, values
+    if t0 is None:
+        t0 = float(times[0])
+    if t1 is None:
+        t1 = float(times[-1])
+
+    start, stop = visible_range(times, t0, t1)
+    times = times[start:stop]
+    values = values[start:stop]
+    width = max(int(width), 1)
+    if len(times) <= 2 * width or t1 <= t0:
+        return times, values
+    return _envelope(times, values, values, t0, t1, width)
+
+
+class MinMaxPyramid:
+    """
+    Precomputed min/max levels for a static series.
+
+    Level 0 is the raw series; each further level stores the min and max
+    of PYRAMID_FACTOR consecutive entries of the level below, stamped with
+    the block's first timestamp. A query picks the coarsest level that
+    still has at least one block per pixel in the window and builds the
+    per-pixel envelope from it.
+
+    Example usage:
+        pyramid = MinMaxPyramid(times, values)
+        x, y = pyramid.query(view_t0, view_t1, plot_width)
+        curve.setData(x, y)
+    """
+
+    def __init__(self, times: np.ndarray, values: np.ndarray, factor: int = PYRAMID_FACTOR):
+        if factor < 2:
+            raise ValueError(f"Pyramid factor must be at least 2, got {factor}")
+        times = np.asarray(times, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        self.factor = factor
+        self.levels: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = [(times, values, values)]
+
+        level_times, mins, maxs = times, values, values
+        while len(level_times) > factor:
+            blocks = np.arange(0, len(level_times), factor)
+            level_times = level_times[blocks]
+            mins = np.minimum.reduceat(mins, blocks)
+            maxs = np.maximum.reduceat(maxs, blocks)
+            self.levels.append((level_times, mins, maxs))
+
+    def __len__(self) -> int:
+        return len(self.levels[0][0])
+
+    def query(self, t0: Optional[float] = None, t1: Optional[float] = None,
+              width: int = DEFAULT_PLOT_WIDTH) -> Tuple[np.ndarray, np.ndarray]:
+        """Envelope for the t0..t1 window at the given plot width."""
+        times, values, _ = self.levels[0]
+        if len(times) == 0:
+            return times, values
+        if t0 is None:
+            t0 = float(times[0])
+        if t1 is None:
+            t1 = float(times[-1])
+        width = max(int(width), 1)
+
+        start, stop = visible_range(times, t0, t1)
+        if stop - start <= 2 * width or t1 <= t0:
+            return times[start:stop], values[start:stop]
+
+        level_times, mins, maxs = self.levels[0]
+        for candidate in reversed(self.levels[1:]):
+            c_times = candidate[0]
+            c_start, c_stop = visible_range(c_times, t0, t1)
+            if c_stop - c_start >= width:
+                level_times, mins, maxs = candidate
+                break
+
+        start, stop = visible_range(level_times, t0, t1)
+        return _envelope(level_times[start:stop], mins[start:stop], maxs[start:stop], t0, t1, width)
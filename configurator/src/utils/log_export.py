@@ -0,0 +1,227 @@
+"""
+Log Export - columnar export of data logger channels.
+
+Each channel is a sorted (timestamps, values) series with its own sample
+times. merge_columns() outer-joins them on a common time axis in one
+vectorized pass (no per-row lookups); iter_merged() does the same join
+one block of rows at a time. The writers work in row chunks so progress
+can be reported and a worker thread can be cancelled between chunks.
+
+Formats:
+- CSV: 'Time (s)' + one 'Name (unit)' column per channel, empty cells
+  where a channel has no sample at that time; merged chunk by chunk, so
+  memory use does not grow with the log length
+- Columnar (.npz): one NumPy array per column in a zip archive plus a
+  JSON header with names and units; several times smaller than CSV and
+  loaded back without parsing. Each array is written whole (its length
+  goes in the header), so the merge is done in memory first
+"""
+
+import csv
+import json
+import threading
+import zipfile
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Rows formatted and written per chunk (progress granularity)
+EXPORT_CHUNK_ROWS = 20_000
+
+COLUMNAR_FORMAT_VERSION = 1
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class ExportCancelled(Exception):
+    """Export stopped through the cancel event."""
+    pass
+
+
+@dataclass
+class ExportColumn:
+    """One channel series to export."""
+    name: str
+    unit: str
+    times: np.ndarray
+    values: np.ndarray
+
+    @property
+    def title(self) -> str:
+        return f"{self.name} ({self.unit})" if self.unit else self.name
+
+
+def merge_columns(columns: Sequence[ExportColumn]) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Outer-join sorted series on their timestamps.
+
+    Returns:
+        (times, values): the sorted union of all timestamps and one float64
+        array per column aligned to it, NaN where the column has no sample.
+        A timestamp repeated within a column keeps its last value.
+    """
+    if not columns:
+        return np.empty(0), []
+
+    times = np.unique(np.concatenate([np.asarray(c.times, dtype=np.float64) for c in columns]))
+    merged = []
+    for column in columns:
+        aligned = np.full(len(times), np.nan)
+        aligned[np.searchsorted(times, column.times)] = column.values
+        merged.append(aligned)
+    return times, merged
+
+
+def iter_merged(columns: Sequence[ExportColumn], chunk_rows: int = EXPORT_CHUNK_ROWS,
+                values: bool = True) -> Iterator[Tuple[np.ndarray, List[np.ndarray]]]:
+    """
+    Outer-join sorted series like merge_columns(), one block of rows at a time.
+
+    Each block holds at most chunk_rows timestamps; blocks are consecutive
+    and together give exactly the rows of merge_columns().
+
+    Args:
+        columns: Series to join
+        chunk_rows: Maximum rows per block
+        values: False yields only the times (row counting)
+
+    Yields:
+        (times, values) per block, values empty when not requested
+    """
+    all_times = [np.asarray(c.times, dtype=np.float64) for c in columns]
+    positions = [0] * len(columns)
+    chunk_rows = max(int(chunk_rows), 1)
+
+    while columns:
+        windows = [times[pos:pos + chunk_rows] for times, pos in zip(all_times, positions)]
+        candidates = np.unique(np.concatenate(windows))
+        if len(candidates) == 0:
+            return
+
+        # Last row of the block: never past a window whose column continues
+        cutoff = candidates[min(chunk_rows, len(candidates)) - 1]
+        for times, pos, window in zip(all_times, positions, windows):
+            if pos + len(window) < len(times):
+                cutoff = min(cutoff, window[-1])
+
+        stops = [int(np.searchsorted(times, cutoff, side='right')) for times in all_times]
+        block = np.unique(np.concatenate([times[pos:stop] for times, pos, stop
+                                          in zip(all_times, positions, stops)]))
+        merged = []
+        if values:
+            for column, times, pos, stop in zip(columns, all_times, positions, stops):
+                aligned = np.full(len(block), np.nan)
+                aligned[np.searchsorted(block, times[pos:stop])] = column.values[pos:stop]
+                merged.append(aligned)
+        positions = stops
+        yield block, merged
+
+
+def _check_cancel(cancel: Optional[threading.Event]):
+    if cancel is not None and cancel.is_set():
+        raise ExportCancelled("Export cancelled")
+
+
+def write_csv(filename: str, columns: Sequence[ExportColumn],
+              progress: Optional[ProgressCallback] = None,
+              cancel: Optional[threading.Event] = None,
+              chunk_rows: int = EXPORT_CHUNK_ROWS) -> int:
+    """
+    Export columns as CSV, merged on time.
+
+    Returns:
+        Number of data rows written
+    """
+    total = sum(len(times) for times, _ in iter_merged(columns, chunk_rows, values=False))
+    row_format = ','.join(['%.4f'] * (len(columns) + 1))
+    done = 0
+
+    with open(filename, 'w', newline='') as f:
+        csv.writer(f).writerow(['Time (s)'] + [c.title for c in columns])
+
+        for times, merged in iter_merged(columns, chunk_rows):
+            _check_cancel(cancel)
+            rows = np.column_stack([times] + merged).tolist()
+            # Missing samples format as 'nan'; no number contains it
+            text = '\r\n'.join([row_format % tuple(row) for row in rows]).replace('nan', '')
+            f.write(text + '\r\n')
+            done += len(times)
+            if progress:
+                progress(done, total)
+
+    return total
+
+
+def write_columnar(filename: str, columns: Sequence[ExportColumn],
+                   progress: Optional[ProgressCallback] = None,
+                   cancel: Optional[threading.Event] = None,
+                   chunk_rows: int = EXPORT_CHUNK_ROWS) -> int:
+    """
+    Export columns as a compressed NumPy archive (.npz), merged on time.
+
+    Arrays: 'time' (float64 seconds), 'c0'...'cN' (float64, NaN = no
+    sample) and 'header' (JSON with names and units). np.load() reads
+    the file directly.
+
+    Returns:
+        Number of rows written
+    """
+    times, merged = merge_columns(columns)
+    total = len(times)
+    header = {
+        'version': COLUMNAR_FORMAT_VERSION,
+        'rows': total,
+        'columns': [{'name': c.name, 'unit': c.unit} for c in columns],
+    }
+    arrays = [('time', times)] + [(f'c{i}', values) for i, values in enumerate(merged)]
+    work = max(len(arrays) * total, 1)
+    done = 0
+
+    with zipfile.ZipFile(filename, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        with archive.open('header.npy', 'w') as f:
+            np.lib.format.write_array(f, np.array(json.dumps(header)))
+
+        for name, array in arrays:
+            with archive.open(f'{name}.npy', 'w', force_zip64=True) as f:
+                np.lib.format.write_array_header_1_0(
+                    f, {'descr': array.dtype.str, 'fortran_order': False, 'shape': array.shape})
+                for start in range(0, total, chunk_rows):
+                    _check_cancel(cancel)
+                    f.write(array[start:start + chunk_rows].tobytes())
+                    done += min(chunk_rows, total - start)
+                    if progress:
+                        progress(done * total // work, total)
+
+    if progress and total == 0:
+        progress(0, 0)
+    return total
+
+
+def read_columnar(filename: str) -> Tuple[List[Tuple[str, str]], np.ndarray, List[np.ndarray]]:
+    """
+    Load a columnar export.
+
+    Returns:
+        ([(name, unit), ...], times, [values, ...])
+    """
+    with np.load(filename, allow_pickle=False) as archive:
+        try:
+            header = json.loads(str(archive['header']))
+        except KeyError:
+            raise ValueError(f"Not a data logger export: {filename}")
+        if header.get('version', 0) > COLUMNAR_FORMAT_VERSION:
+            raise ValueError(f"Unsupported export version {header['version']}")
+
+        names = [(c['name'], c.get('unit', '')) for c in header['columns']]
+        return names, archive['time'], [archive[f'c{i}'] for i in range(len(names))]
+
+
+def export_log(filename: str, columns: Sequence[ExportColumn],
+               progress: Optional[ProgressCallback] = None,
+               cancel: Optional[threading.Event] = None) -> int:
+    """Export by file extension (.npz = columnar, otherwise CSV)."""
+    if filename.lower().endswith('.npz'):
+        return write_columnar(filename, columns, progress, cancel)
+    return write_csv(filename, columns, progress, cancel)
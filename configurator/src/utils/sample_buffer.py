@@ -0,0 +1,202 @@
+"""
+Sample Ring Buffer - bounded columnar time series storage.
+
+Stores (timestamp, value) samples in preallocated NumPy arrays with a
+fixed retention limit, keeps min/max/avg statistics incrementally and
+hands out contiguous views for plotting without copying.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+# Default number of samples kept per channel (1 hour at 100 Hz)
+DEFAULT_RETENTION_SAMPLES = 360_000
+
+# Storage allocated for a new buffer; grows geometrically up to the retention
+INITIAL_CAPACITY = 1024
+
+
+class SampleRingBuffer:
+    """
+    Bounded storage for one channel's samples.
+
+    Samples are appended into arrays with room for up to twice the
+    retention. When the end is reached, the newest samples are copied
+    into freshly allocated arrays, so views handed out earlier stay valid
+    and unchanged (amortized one copy per sample). Storage starts small
+    and grows with the session, so memory stays proportional to the
+    retained samples.
+
+    Statistics cover every sample appended since the last clear(),
+    including samples already dropped by the retention limit.
+
+    Example usage:
+        buffer = SampleRingBuffer(retention=100_000)
+        buffer.append(0.01, 12.5)
+        plot_item.setData(buffer.times, buffer.values)  # No copies
+    """
+
+    def __init__(self, retention: int = DEFAULT_RETENTION_SAMPLES):
+        if retention < 1:
+            raise ValueError(f"Retention must be at least 1 sample, got {retention}")
+        self.retention = retention
+        self.clear()
+
+    def clear(self):
+        """Drop all samples and reset statistics."""
+        capacity = min(INITIAL_CAPACITY, 2 * self.retention)
+        self._times = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+        self.total_count = 0
+        self.min_value = float('inf')
+        self.max_value = float('-inf')
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        """Currently allocated storage, in samples."""
+        return len(self._times)
+
+    @property
+    def times(self) -> np.ndarray:
+        """Read-only view of retained timestamps."""
+        view = self._times[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def values(self) -> np.ndarray:
+        """Read-only view of retained values."""
+        view = self._values[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def avg_value(self) -> float:
+        """Mean of all samples appended since clear()."""
+        return self._sum / self.total_count if self.total_count else 0.0
+
+    def last(self) -> Tuple[float, float]:
+        """Newest (timestamp, value). Raises IndexError when empty."""
+        if self._end == self._start:
+            raise IndexError("Sample buffer is empty")
+        return float(self._times[self._end - 1]), float(self._values[self._end - 1])
+
+    def _reserve(self, count: int):
+        """Make room for count (<= retention) more samples at the end."""
+        if self._end + count <= len(self._times):
+            return
+
+        keep = min(self._end - self._start, self.retention - count)
+        needed = keep + count
+        capacity = min(max(2 * len(self._times), 2 * needed), 2 * self.retention)
+
+        times = np.empty(capacity, dtype=np.float64)
+        values = np.empty(capacity, dtype=np.float64)
+        times[:keep] = self._times[self._end - keep:self._end]
+        values[:keep] = self._values[self._end - keep:self._end]
+
+        self._times = times
+        self._values = values
+        self._start = 0
+        self._end = keep
+
+    def append(self, timestamp: float, value: float):
+        """Append one sample."""
+        end = self._end
+        if end == len(self._times):
+            self._reserve(1)
+            end = self._end
+
+        self._times[end] = timestamp
+        self._values[end] = value
+        self._end = end + 1
+        if self._end - self._start > self.retention:
+            self._start += 1
+
+        self.total_count += 1
+        self._sum += value
+        if value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+
+    def extend(self, timestamps, values):
+        """Append many samples (array-likes of equal length)."""
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if timestamps.shape != values.shape or timestamps.ndim != 1:
+            raise ValueError("timestamps and values must be 1-D arrays of equal length")
+        count = len(values)
+        if count == 0:
+            return
+
+        self.total_count += count
+        self._sum += float(values.sum())
+        self.min_value = min(self.min_value, float(values.min()))
+        self.max_value = max(self.max_value, float(values.max()))
+
+        if count > self.retention:
+            timestamps = timestamps[-self.retention:]
+            values = values[-self.retention:]
+            count = self.retention
+
+        self._reserve(count)
+        end = self._end + count
+        self._times[self._end:end] = timestamps
+        self._values[self._end:end] = values
+        self._end = end
+        if end - self._start > self.retention:
+            self._start = end - self.retention
+
+    def assign(self, timestamps, values):
+        """
+        Replace the contents with a complete series (e.g. a loaded log).
+
+        float64 arrays are adopted without copying. Retention grows to fit
+        the series, so nothing is dropped; NaN values (missing samples) are
+        kept for plotting and left out of the statistics.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if timestamps.shape != values.shape or timestamps.ndim != 1:
+            raise ValueError("timestamps and values must be 1-D arrays of equal length")
+
+        self.clear()
+        count = len(values)
+        if count == 0:
+            return
+
+        self.retention = max(self.retention, count)
+        self._times = timestamps
+        self._values = values
+        self._end = count
+
+        valid = values[~np.isnan(values)]
+        self.total_count = count
+        if valid.size:
+            self._sum = float(valid.mean()) * count  # avg_value over valid samples
+            self.min_value = float(valid.min())
+            self.max_value = float(valid.max())
+
+    def set_retention(self, retention: int):
+        """Change the retention limit, dropping the oldest samples if needed."""
+        if retention < 1:
+            raise ValueError(f"Retention must be at least 1 sample, got {retention}")
+        self.retention = retention
+        if self._end - self._start > retention:
+            self._start = self._end - retention
+        if len(self._times) > 2 * retention:
+            keep = self._end - self._start
+            self._times = self._times[self._start:self._end].copy()
+            self._values = self._values[self._start:self._end].copy()
+            self._start = 0
+            self._end = keep
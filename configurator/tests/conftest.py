@@ -0,0 +1,28 @@
+"""
+Shared test fixtures
+"""
+
+import struct
+
+import pytest
+
+
+def _channel_record(channel_id, config=b"\x00" * 8, name=b"", ch_type=0x20):
+    header = struct.pack('<HBBBBHiBB', channel_id, ch_type, 1, 0, 0, 0xFFFF, 0, len(name), len(config))
+    return header + name + config
+
+
+def _binary_config(records):
+    return struct.pack('<H', len(records)) + b"".join(records)
+
+
+@pytest.fixture
+def make_record():
+    """Builder for one binary channel record ([CfgChannelHeader_t][name][config]), a timer by default."""
+    return _channel_record
+
+
+@pytest.fixture
+def make_config():
+    """Builder for a binary config ([channel_count][records]) from channel records."""
+    return _binary_config
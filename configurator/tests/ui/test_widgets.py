@@ -11,7 +11,7 @@ from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
-from PyQt6.QtWidgets import QApplication, QWidget, QTreeWidget, QTableWidget
+from PyQt6.QtWidgets import QApplication, QWidget, QTreeWidget, QTableView
 from PyQt6.QtCore import Qt
 
 
@@ -102,7 +102,7 @@ class TestOutputMonitor:
         from ui.widgets.output_monitor import OutputMonitor
         widget = OutputMonitor()
         assert hasattr(widget, 'table')
-        assert isinstance(widget.table, QTableWidget)
+        assert isinstance(widget.table, QTableView)
         widget.close()
 
     def test_default_outputs_initialized(self, qapp):
@@ -116,7 +116,7 @@ class TestOutputMonitor:
         """Test correct number of columns"""
         from ui.widgets.output_monitor import OutputMonitor
         widget = OutputMonitor()
-        assert widget.table.columnCount() >= 5  # At least basic columns
+        assert widget.model.columnCount() >= 5  # At least basic columns
         widget.close()
 
     def test_reset_peaks_button(self, qapp):
@@ -165,7 +165,7 @@ class TestAnalogMonitor:
         from ui.widgets.analog_monitor import AnalogMonitor
         widget = AnalogMonitor()
         assert hasattr(widget, 'table')
-        assert isinstance(widget.table, QTableWidget)
+        assert isinstance(widget.table, QTableView)
         widget.close()
 
 
@@ -238,6 +238,19 @@ class TestPIDTuner:
         assert hasattr(widget, 'controller_reset')
         widget.close()
 
+    def test_history_bounded(self, qapp):
+        """Test telemetry history respects the history length"""
+        from ui.widgets.pid_tuner import PIDTuner
+        widget = PIDTuner()
+        widget.current_controller_id = 'pid1'
+        widget.history_spin.setValue(10)
+        for i in range(500):
+            widget.update_telemetry('pid1', 100.0, float(i), 0.5)
+        assert len(widget.process_data) == 100
+        assert widget.error_data.values[-1] == -399.0
+        widget._update_graph()
+        widget.close()
+
 
 class TestCANMonitor:
     """Tests for CANMonitor widget"""
@@ -269,6 +282,124 @@ class TestDataLogger:
         assert isinstance(widget, QWidget)
         widget.close()
 
+    def test_samples_bounded(self, qapp):
+        """Test channel storage respects the retention limit"""
+        from ui.widgets.data_logger import DataLoggerWidget
+        widget = DataLoggerWidget()
+        widget.set_retention(100)
+        for i in range(500):
+            widget.add_sample(0x0001, i * 0.01, float(i))
+
+        channel = widget.channels[0x0001]
+        assert channel.sample_count == 100
+        assert channel.current_value == 499.0
+        assert channel.min_recorded == 0.0
+        assert channel.max_recorded == 499.0
+        assert channel.timestamps[0] == pytest.approx(4.0)
+        widget._on_update()
+        widget.close()
+
+    def test_plot_data_decimated(self, qapp):
+        """Test plotted data is reduced to the plot width"""
+        import numpy as np
+        from ui.widgets.data_logger import DataLoggerWidget, PYRAMID_MIN_SAMPLES
+        widget = DataLoggerWidget()
+        channel = widget.channels[0x0001]
+        count = PYRAMID_MIN_SAMPLES * 5
+        channel.add_samples(np.arange(count) * 0.01, np.sin(np.arange(count) * 0.01))
+
+        x, y = channel.plot_data(width=500)
+        assert len(x) <= 1002
+        assert channel._pyramid is None
+
+        # Unchanged data switches to the pyramid
+        x2, y2 = channel.plot_data(width=500)
+        assert channel._pyramid is not None
+        assert y2.max() == pytest.approx(y.max())
+
+        channel.add_sample(count * 0.01, 5.0)
+        channel.plot_data(width=500)
+        assert channel._pyramid is None
+        widget.close()
+
+    def test_export_csv(self, qapp, tmp_path):
+        """Test CSV export of recorded samples"""
+        from ui.widgets.data_logger import DataLoggerWidget
+        widget = DataLoggerWidget()
+        widget.channels[0x0001].enabled = True
+        widget.channels[0x0006].enabled = True
+        widget.add_sample(0x0001, 0.0, 12.5)
+        widget.add_sample(0x0001, 0.1, 12.6)
+        widget.add_sample(0x0006, 0.1, 3.0)
+
+        path = tmp_path / "log.csv"
+        widget.export_to_csv(str(path))
+        lines = path.read_text().splitlines()
+        assert lines[1] == "0.0000,12.5000,"
+        assert lines[2] == "0.1000,12.6000,3.0000"
+        widget.close()
+
+    def test_background_export(self, qapp, tmp_path):
+        """Test threaded columnar export reports progress and loads back"""
+        import numpy as np
+        from ui.widgets.data_logger import DataLoggerWidget
+        widget = DataLoggerWidget()
+        channel = widget.channels[0x0001]
+        channel.enabled = True
+        channel.add_samples(np.arange(50_000) * 0.01, np.arange(50_000) * 0.5)
+        progress = []
+        finished = []
+        widget.export_progress.connect(lambda done, total: progress.append(done))
+        widget.export_finished.connect(lambda name, error: finished.append(error))
+
+        path = str(tmp_path / "log.npz")
+        widget.start_export(path)
+        widget._export_thread.join(10.0)
+        qapp.processEvents()
+        assert finished == ['']
+        assert progress[-1] == 50_000
+
+        widget.load_from_columnar(path)
+        loaded = [ch for ch in widget.channels.values() if ch.sample_count]
+        assert len(loaded) == 1
+        assert loaded[0].name == channel.name
+        assert loaded[0].max_recorded == 24_999.5
+        widget.close()
+
+    def test_load_plog(self, qapp, tmp_path):
+        """Test PLOG files load without retention limit"""
+        from ui.widgets.data_logger import DataLoggerWidget
+        from datalog import DataLogChannel, DataLogType, PlogWriter
+        path = str(tmp_path / "session.plog")
+        channels = [
+            DataLogChannel(id=1, name="RPM", unit="rpm", type=DataLogType.UINT16),
+            DataLogChannel(id=2, name="TPS", unit="%", type=DataLogType.FLOAT),
+        ]
+        with PlogWriter(path, channels) as writer:
+            for i in range(500):
+                writer.write(i * 10, [i, i * 0.5])
+
+        widget = DataLoggerWidget()
+        widget.set_retention(100)
+        widget.load_from_plog(path)
+        loaded = {ch.name: ch for ch in widget.channels.values() if ch.sample_count}
+        assert loaded["RPM"].sample_count == 500
+        assert loaded["RPM"].end_time == pytest.approx(4.99)
+
+        # Plots read the file; nothing is copied into the buffers
+        x, y = loaded["RPM"].plot_data(None, None, 50)
+        assert len(x) <= 100
+        assert (x[0], y.max()) == (0.0, 499.0)
+        x, y = loaded["TPS"].plot_data(1.0, 1.5, 1000)
+        assert x[0] <= 1.0 and x[-1] >= 1.5
+        assert y[1] == pytest.approx(50.0)
+        assert len(loaded["RPM"].buffer) == 0
+
+        assert loaded["RPM"].unit == "rpm"
+        assert loaded["TPS"].max_recorded == 249.5
+        assert loaded["TPS"].timestamps[-1] == pytest.approx(4.99)
+        widget.close()
+
 
 class TestChannelGraph:
     """Tests for ChannelGraphWidget"""
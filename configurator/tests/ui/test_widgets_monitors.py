@@ -1,7 +1,7 @@
 """
 UI Tests for Monitor Widget Components
-Tests: AnalogMonitor, DigitalMonitor, OutputMonitor, CANMonitor,
-       HBridgeMonitor, PMUMonitorWidget
+Tests: AnalogMonitor, DigitalMonitor, OutputMonitor, MonitorTableModel,
+       CANMonitor, HBridgeMonitor, PMUMonitorWidget
 """
 
 import sys
@@ -188,6 +188,100 @@ class TestOutputMonitor:
         widget.close()
 
 
+# ============================================================================
+# MonitorTableModel Tests (dirty-cell updates)
+# ============================================================================
+
+def _record_changes(model):
+    """Collect (row, first_col, last_col, roles) for each dataChanged."""
+    changes = []
+    model.dataChanged.connect(
+        lambda first, last, roles: changes.append((first.row(), first.column(), last.column(), list(roles))))
+    return changes
+
+
+class TestMonitorTableModel:
+    """Tests for MonitorTableModel"""
+
+    def test_update_row_emits_changed_span(self, qapp):
+        """Only the changed cells of a row are reported"""
+        from ui.widgets.monitor_table_model import MonitorTableModel
+        model = MonitorTableModel(["A", "B", "C", "D"])
+        model.set_rows([["a", "b", "c", "d"], ["e", "f", "g", "h"]])
+        changes = _record_changes(model)
+
+        assert model.update_row(0, ["a", "B", "C", "d"]) == 2
+        assert model.update_row(1, ["e", "f", "g", "h"]) == 0
+        assert model.update_row(1, [None, "x"], 2) == 1
+
+        assert changes == [
+            (0, 1, 2, [Qt.ItemDataRole.DisplayRole]),
+            (1, 3, 3, [Qt.ItemDataRole.DisplayRole]),
+        ]
+        assert model.text(1, 3) == "x"
+        assert model.cells_changed == 3
+
+    def test_row_color(self, qapp):
+        """Row colors are reported once per change"""
+        from ui.widgets.monitor_table_model import MonitorTableModel
+        from PyQt6.QtGui import QColor
+        model = MonitorTableModel(["A", "B"])
+        model.set_rows([["a", "b"]])
+        changes = _record_changes(model)
+
+        assert model.set_row_color(0, QColor(50, 80, 50))
+        assert not model.set_row_color(0, QColor(50, 80, 50))
+        assert changes == [(0, 0, 1, [Qt.ItemDataRole.BackgroundRole])]
+        index = model.index(0, 1)
+        assert model.data(index, Qt.ItemDataRole.BackgroundRole).color() == QColor(50, 80, 50)
+
+    def test_set_rows_validates_width(self, qapp):
+        from ui.widgets.monitor_table_model import MonitorTableModel
+        model = MonitorTableModel(["A", "B"])
+        with pytest.raises(ValueError):
+            model.set_rows([["a"]])
+
+    def test_output_monitor_repaints_changed_cells(self, qapp):
+        """Repeated telemetry repaints nothing; one new current repaints Curr/Peak"""
+        from ui.widgets.output_monitor import OutputMonitor
+        widget = OutputMonitor()
+        widget.set_outputs([
+            {"name": "Fuel Pump", "pins": [0]},
+            {"name": "Fan", "pins": [1, 2]},
+        ])
+        states = [1, 1, 1] + [0] * 27
+        duties = [1000] * 30
+        currents = [500, 700, 800] + [0] * 27
+        widget.update_from_telemetry(states, duties, currents, 12.0)
+
+        model = widget.model
+        assert model.text(1, widget.COL_CURR) == "1.50A"
+        assert model.text(1, widget.COL_STATUS) == "ON"
+        assert model.row_color(1) == widget.COLOR_ACTIVE
+
+        changes = _record_changes(model)
+        widget.update_from_telemetry(states, duties, currents, 12.0)
+        assert changes == []
+
+        currents[0] = 900
+        widget.update_from_telemetry(states, duties, currents, 12.0)
+        assert changes == [(0, widget.COL_CURR, widget.COL_PEAK, [Qt.ItemDataRole.DisplayRole])]
+        widget.close()
+
+    def test_variables_inspector_unchanged_value(self, qapp):
+        """Re-sending a value does not touch the Value cell"""
+        from ui.widgets.variables_inspector import VariablesInspector
+        widget = VariablesInspector()
+        widget.set_channels([{"id": "n_speed", "channel_type": "number", "channel_id": 200}])
+        widget.update_from_telemetry({'virtual_channels': {200: 1500}})
+        assert widget.model.text(0, widget.COL_VALUE) == "1.50"
+
+        changes = _record_changes(widget.model)
+        widget.update_from_telemetry({'virtual_channels': {200: 1500}})
+        assert [c for c in changes if Qt.ItemDataRole.DisplayRole in c[3]] == []
+        widget.close()
+
+
 # ============================================================================
 # CANMonitor Tests
 # ============================================================================
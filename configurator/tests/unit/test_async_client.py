@@ -0,0 +1,320 @@
+"""
+Unit Tests: Async Device Client
+
+Tests for controllers/async_client.py - asyncio device API.
+Covers:
+- PING/PONG and capabilities requests over TCP
+- Windowed binary config upload with intermediate and final ACKs
+- Compressed upload selected from cached capabilities
+- Telemetry async iteration and end on remote close
+- Pending requests failing on disconnect
+- Reliable T-MIN delivery over a pseudo terminal (POSIX)
+"""
+
+import asyncio
+import os
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from communication.protocol import MessageType, MINFrameParser, build_min_frame
+from communication.telemetry import create_telemetry_bytes, TelemetryPacket
+from controllers.async_client import AsyncDeviceClient, CONFIG_CHUNK_SIZE, CONFIG_UPLOAD_WINDOW
+from min_protocol import MINTransport
+from config_compress import decompress
+
+
+# ============================================================================
+# Fake device
+# ============================================================================
+
+class FakeDevice:
+    """Emulator stand-in answering plain MIN frames on a TCP socket."""
+
+    def __init__(self, respond=True):
+        self.respond = respond
+        self.sw_flags = 0
+        self.received = []
+        self.writers = []
+        self.server = None
+        self.port = 0
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        for writer in self.writers:
+            writer.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def send(self, min_id, payload=b''):
+        for writer in self.writers:
+            writer.write(build_min_frame(min_id, payload))
+
+    async def _handle(self, reader, writer):
+        self.writers.append(writer)
+        parser = MINFrameParser()
+        chunks = 0
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                break
+            for min_id, payload, _, _ in parser.feed(data):
+                self.received.append((min_id, payload))
+                if not self.respond:
+                    continue
+                if min_id == MessageType.PING:
+                    self.send(MessageType.PONG)
+                elif min_id == MessageType.GET_CAPABILITIES:
+                    self.send(MessageType.CAPABILITIES,
+                              bytes([0, 1, 2, 3, 30, 20, 20, 4, 2, 0]) + struct.pack("<I", self.sw_flags))
+                elif min_id in (MessageType.LOAD_BINARY_CONFIG, MessageType.LOAD_BINARY_CONFIG_LZ):
+                    index, total = struct.unpack("<HH", payload[:4])
+                    chunks += 1
+                    if chunks == total:
+                        self.send(MessageType.BINARY_CONFIG_ACK, bytes([1, 0, 12, 0, 12, 0]))
+                    else:
+                        self.send(MessageType.BINARY_CONFIG_ACK, struct.pack("<BBH", 1, 0, index))
+                elif min_id == MessageType.SAVE_TO_FLASH:
+                    self.send(MessageType.FLASH_ACK, b'\x01')
+
+
+@pytest.fixture
+async def device():
+    dev = FakeDevice()
+    await dev.start()
+    yield dev
+    await dev.stop()
+
+
+@pytest.fixture
+async def client(device):
+    cl = AsyncDeviceClient.tcp("127.0.0.1", device.port)
+    await cl.connect()
+    yield cl
+    await cl.close()
+
+
+# ============================================================================
+# Requests
+# ============================================================================
+
+class TestRequests:
+    """Tests for request/response commands."""
+
+    @pytest.mark.asyncio
+    async def test_ping(self, client):
+        """PING resolves on PONG."""
+        assert await client.ping(timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_ping_timeout(self, device, client):
+        """Silent device: ping returns False after the timeout."""
+        device.respond = False
+        assert not await client.ping(timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pings(self, client):
+        """Several outstanding requests each get their response."""
+        results = await asyncio.gather(*(client.ping() for _ in range(5)))
+        assert results == [True] * 5
+
+    @pytest.mark.asyncio
+    async def test_capabilities(self, client):
+        """Capabilities payload is parsed."""
+        caps = await client.get_capabilities()
+        assert caps.fw_version == "1.2.3"
+        assert caps.output_count == 30
+
+    @pytest.mark.asyncio
+    async def test_upload_config(self, device, client):
+        """Config is sent in chunks; the final ACK carries the channel count."""
+        data = bytes(range(256)) * 3
+        progress = []
+        ok, channels = await client.upload_config(data, progress=lambda done, total: progress.append(done))
+
+        assert ok
+        assert channels == 12
+        chunks = [p for m, p in device.received if m == MessageType.LOAD_BINARY_CONFIG]
+        total = (len(data) + CONFIG_CHUNK_SIZE - 1) // CONFIG_CHUNK_SIZE
+        assert len(chunks) == total
+        assert b"".join(c[4:] for c in chunks) == data
+        assert progress == list(range(1, total + 1))
+
+    @pytest.mark.asyncio
+    async def test_upload_compressed(self, device, client):
+        """A device advertising CONFIG_LZ gets LOAD_BINARY_CONFIG_LZ chunks."""
+        device.sw_flags = 1 << 12  # SwCapsFlags.CONFIG_LZ
+        assert (await client.get_capabilities()).supports_config_lz
+        data = bytes(2000)
+        ok, _ = await client.upload_config(data)
+
+        assert ok
+        assert not any(m == MessageType.LOAD_BINARY_CONFIG for m, _ in device.received)
+        chunks = [p for m, p in device.received if m == MessageType.LOAD_BINARY_CONFIG_LZ]
+        assert len(chunks) == 1
+        assert decompress(chunks[0][4:]) == data
+
+    @pytest.mark.asyncio
+    async def test_upload_rejected(self, device, client):
+        """Only a window of chunks is sent ahead of ACKs; an error ACK stops the upload."""
+        device.respond = False
+        task = asyncio.ensure_future(client.upload_config(bytes(1000), timeout=1.0))
+        await asyncio.sleep(0.02)
+        device.send(MessageType.BINARY_CONFIG_ACK, bytes([0, 1, 0, 0]))
+        assert await task == (False, 0)
+        sent = [m for m, _ in device.received if m == MessageType.LOAD_BINARY_CONFIG]
+        assert len(sent) == CONFIG_UPLOAD_WINDOW
+
+    @pytest.mark.asyncio
+    async def test_save_to_flash(self, client):
+        """FLASH_ACK success byte is returned."""
+        assert await client.save_to_flash(timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_request(self, device, client):
+        """Requests waiting when the connection closes raise ConnectionError."""
+        device.respond = False
+        pending = asyncio.ensure_future(
+            client.request(MessageType.PING, b'', MessageType.PONG, timeout=5.0))
+        await asyncio.sleep(0.01)
+        await client.close()
+        with pytest.raises(ConnectionError):
+            await pending
+
+    def test_from_config(self):
+        """Connection configs map to stream types and reliability."""
+        tcp = AsyncDeviceClient.from_config({"type": "Emulator", "address": "host:1234"})
+        assert (tcp.stream.host, tcp.stream.port, tcp.reliable) == ("host", 1234, False)
+        ser = AsyncDeviceClient.from_config({"type": "USB Serial", "port": "COM3 - PMU"})
+        assert (ser.stream.port, ser.reliable) == ("COM3", True)
+        with pytest.raises(ValueError):
+            AsyncDeviceClient.from_config({"type": "CAN Bus"})
+
+
+# ============================================================================
+# Telemetry
+# ============================================================================
+
+class TestTelemetry:
+    """Tests for the telemetry iterator."""
+
+    @pytest.mark.asyncio
+    async def test_iterate_until_remote_close(self, device, client):
+        """Packets are parsed in order; iteration ends when the device disconnects."""
+        received = []
+
+        async def consume():
+            async for packet in client.telemetry(rate_hz=50):
+                received.append(packet)
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.02)
+        for ts in (100, 200, 300):
+            device.send(MessageType.TELEMETRY_DATA, create_telemetry_bytes(TelemetryPacket(timestamp_ms=ts)))
+        await asyncio.sleep(0.05)
+        await device.stop()
+        await asyncio.wait_for(task, 2.0)
+
+        assert [p.timestamp_ms for p in received] == [100, 200, 300]
+        assert (MessageType.SUBSCRIBE_TELEMETRY, struct.pack("<H", 50)) in device.received
+
+    @pytest.mark.asyncio
+    async def test_queue_drops_oldest(self, device):
+        """A slow consumer loses the oldest packets, not the newest."""
+        client = AsyncDeviceClient.tcp("127.0.0.1", device.port, telemetry_queue_size=2)
+        await client.connect()
+        await asyncio.sleep(0.02)
+        for i in range(5):
+            device.send(MessageType.TELEMETRY_DATA, bytes([i]))
+        await asyncio.sleep(0.05)
+        await client.close()
+
+        payloads = [p async for p in client.telemetry(raw=True)]
+        assert payloads[-1] == bytes([4])
+        assert client.telemetry_dropped >= 3
+
+
+# ============================================================================
+# Serial (reliable T-MIN)
+# ============================================================================
+
+class PtyDevice(MINTransport):
+    """T-MIN device on the master side of a pseudo terminal."""
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.config = bytearray()
+        super().__init__()
+
+    def _now_ms(self):
+        return int(asyncio.get_running_loop().time() * 1000)
+
+    def _serial_write(self, data):
+        os.write(self.fd, data)
+
+    def _serial_any(self):
+        return False
+
+    def _serial_read_all(self):
+        return b''
+
+    def _serial_close(self):
+        pass
+
+    def on_readable(self):
+        for frame in self.poll(os.read(self.fd, 4096)):
+            if frame.min_id == MessageType.PING:
+                self.queue_frame(MessageType.PONG, b'')
+            elif frame.min_id == MessageType.LOAD_BINARY_CONFIG:
+                # Like pmu_min_port.c: reassemble, single final ACK
+                index, total = struct.unpack("<HH", frame.payload[:4])
+                if index == 0:
+                    self.config = bytearray()
+                self.config += frame.payload[4:]
+                if index == total - 1:
+                    self.queue_frame(MessageType.BINARY_CONFIG_ACK, bytes([1, 0, 7, 0, 7, 0]))
+            self.poll(b'')
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs a pty")
+class TestSerial:
+    """Tests for the serial stream with reliable delivery."""
+
+    @pytest.fixture
+    async def pty_link(self):
+        master, slave = os.openpty()
+        loop = asyncio.get_running_loop()
+        device = PtyDevice(master)
+        loop.add_reader(master, device.on_readable)
+        client = AsyncDeviceClient.serial(os.ttyname(slave))
+        await client.connect()
+        yield device, client
+        await client.close()
+        loop.remove_reader(master)
+        os.close(slave)
+        os.close(master)
+
+    @pytest.mark.asyncio
+    async def test_ping_over_pty(self, pty_link):
+        """Transport frames are ACKed and answered over a serial line."""
+        device, client = pty_link
+        assert await client.ping(timeout=1.0)
+        await asyncio.sleep(0.1)
+        # Device ACKed our PING: nothing left to retransmit
+        assert client._min.next_timeout_ms() != 0
+        assert len(client._min._transport_fifo) == 0
+
+    @pytest.mark.asyncio
+    async def test_upload_over_pty(self, pty_link):
+        """Reliable uploads queue every chunk and wait for the single final ACK."""
+        device, client = pty_link
+        data = bytes(range(256)) * 6
+        assert await client.upload_config(data, timeout=2.0) == (True, 7)
+        assert bytes(device.config) == data
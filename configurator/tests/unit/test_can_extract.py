@@ -0,0 +1,143 @@
+"""
+Unit Tests: CAN Signal Extraction Plans
+
+Tests for utils/can_extract.py - the desktop twin of the firmware's
+precompiled CAN signal extraction.
+Covers:
+- Direct loads for byte-aligned 8/16/32-bit fields
+- Generic plans matching the bit-by-bit extraction for every layout
+- Sign extension, IEEE floats and fields cut off by the buffer end
+- Integer scaling (truncation toward zero) and the float32 path
+- CAN input dict compilation and CANMonitor decoding
+"""
+
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.can_extract import (
+    PLAN_BE, PLAN_BE16, PLAN_BE32, PLAN_BITS, PLAN_INT_SCALE, PLAN_LE, PLAN_LE16,
+    PLAN_LE32, PLAN_U8, compile_can_input, compile_plan, extract_raw_bits,
+)
+
+
+def frame(*values):
+    return bytes(values) + bytes(8 - len(values))
+
+
+class TestLayouts:
+    """Tests for raw bit extraction."""
+
+    @pytest.mark.parametrize("start_bit,bit_length,byte_order,kind,expected", [
+        (0, 8, 0, PLAN_U8, 0x34),
+        (0, 16, 0, PLAN_LE16, 0x1234),
+        (8, 16, 0, PLAN_LE16, 0x5612),
+        (15, 16, 1, PLAN_BE16, 0x1256),
+        (0, 32, 0, PLAN_LE32, 0x78561234),
+        (7, 32, 1, PLAN_BE32, 0x34125678),
+        (4, 12, 0, PLAN_LE, 0x123),
+        (7, 12, 1, PLAN_BE, 0x341),
+    ])
+    def test_kinds(self, start_bit, bit_length, byte_order, kind, expected):
+        data = frame(0x34, 0x12, 0x56, 0x78)
+        plan = compile_plan(start_bit, bit_length, byte_order, max_bytes=8)
+        assert plan.kind == kind
+        assert plan.load(data) == expected
+
+    def test_matches_bit_by_bit(self):
+        """Every start bit, length and byte order gives the reference bits."""
+        data = bytes((i * 37 + 11) & 0xFF for i in range(64))
+        for max_bytes in (8, 64):
+            for byte_order in (0, 1):
+                for start_bit in range(0, 80):
+                    for bit_length in range(1, 65):
+                        plan = compile_plan(start_bit, bit_length, byte_order, max_bytes=max_bytes)
+                        assert plan.load(data) == extract_raw_bits(
+                            data, start_bit, bit_length, byte_order, max_bytes), \
+                            (start_bit, bit_length, byte_order, max_bytes)
+
+    def test_wide_field_falls_back(self):
+        """A 64-bit field off a byte boundary spans 9 bytes."""
+        plan = compile_plan(3, 64, 0)
+        assert plan.kind == PLAN_BITS
+
+    def test_cut_off_by_buffer_end(self):
+        """Bits past the buffer are missing, not read."""
+        plan = compile_plan(56, 16, 0, max_bytes=8)
+        assert plan.load(frame(0, 0, 0, 0, 0, 0, 0, 0xAB) + b"\xFF") == 0xAB
+
+
+class TestDecode:
+    """Tests for sign extension and scaling."""
+
+    def test_signed(self):
+        plan = compile_plan(0, 8, 0, signed=True)
+        assert plan.decode(frame(0xFF)) == (-1.0, -1)
+
+    def test_float_field(self):
+        plan = compile_plan(0, 32, 0, is_float=True, divider=1.0)
+        assert plan.decode(struct.pack("<f", 1.5)) == (1.5, 1)
+
+    def test_integer_scaling_truncates_toward_zero(self):
+        plan = compile_plan(0, 16, 0, divider=10.0, offset=-40.0)
+        assert plan.flags & PLAN_INT_SCALE
+        value, channel = plan.decode(frame(5, 0))
+        assert channel == -39
+        assert value == pytest.approx(-39.5)
+        assert plan.decode(frame(0xD2, 0x04))[1] == 83
+
+    def test_float_scaling(self):
+        """Fractional factors use float32 like the firmware."""
+        plan = compile_plan(0, 16, 0, multiplier=0.1)
+        assert not plan.flags & PLAN_INT_SCALE
+        value, channel = plan.decode(frame(0xD2, 0x04))
+        assert value == float(np.float32(1234) * np.float32(0.1))
+        assert channel == 123
+
+    def test_short_frame_reads_zero(self):
+        plan = compile_plan(16, 16, 0)
+        assert plan.decode(b"\x01") == (0.0, 0)
+
+
+class TestCanInput:
+    """Tests for configurator CAN input dicts."""
+
+    def test_big_endian_format_is_byte_aligned(self):
+        plan = compile_can_input({"data_format": "16bit", "byte_order": "big_endian",
+                                  "byte_offset": 2})
+        assert plan.kind == PLAN_BE16
+        assert plan.decode(frame(0, 0, 0x12, 0x34))[1] == 0x1234
+
+    def test_custom_format(self):
+        plan = compile_can_input({"data_format": "custom", "start_bit": 4, "bit_length": 12,
+                                  "data_type": "signed", "multiplier": 2.0})
+        assert plan.decode(frame(0xF0, 0xFF))[1] == -2
+
+    def test_start_byte_fallback(self):
+        plan = compile_can_input({"data_format": "8bit", "start_byte": 3})
+        assert plan.decode(frame(0, 0, 0, 42))[1] == 42
+
+
+class TestCANMonitor:
+    """Tests for CANMonitor decoding through plans."""
+
+    def test_decodes_configured_signals(self, qapp):
+        from ui.widgets.can_monitor import CANMonitor
+
+        monitor = CANMonitor()
+        monitor.set_configuration(
+            [{"name": "engine", "base_id": 0x360}],
+            [{"id": "rpm", "message_ref": "engine", "data_format": "16bit",
+              "byte_order": "big_endian", "byte_offset": 0},
+             {"id": "clt", "message_ref": "engine", "data_format": "8bit",
+              "byte_offset": 2, "offset": -40.0}])
+        monitor.receive_message(0x360, frame(0x1B, 0x58, 130))
+        monitor.receive_message(0x361, frame(0xFF, 0xFF, 0xFF))
+
+        assert monitor.signal_values["rpm"]["value"] == 7000
+        assert monitor.signal_values["clt"]["value"] == 90
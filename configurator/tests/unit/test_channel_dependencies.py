@@ -0,0 +1,191 @@
+"""
+Unit Tests: Channel Dependency Graph
+
+Tests for models/channel_dependencies.py and its use by ConfigManager.
+Covers:
+- Reference extraction per channel type (single fields, inputs lists, CAN TX signals)
+- Dependents by name and by numeric channel_id, transitive impact
+- Incremental add/update/remove/rename and late-resolving references
+- Undefined references and cycle detection
+- ConfigManager validation, cycle detection and graph upkeep
+- ChannelGraphScene edges
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from models.channel_dependencies import ChannelDependencyGraph, extract_channel_references
+from models.config_manager import ConfigManager
+
+
+def chain(count):
+    """in -> l1 -> l2 -> ... (each logic channel reads the previous one)"""
+    channels = [{"channel_id": 50, "channel_name": "in", "channel_type": "digital_input"}]
+    for i in range(1, count + 1):
+        channels.append({"channel_id": 200 + i, "channel_name": f"l{i}", "channel_type": "logic",
+                         "channel": channels[-1]["channel_name"]})
+    return channels
+
+
+class TestExtractReferences:
+    """Tests for per-type reference fields."""
+
+    @pytest.mark.parametrize("channel,expected", [
+        ({"channel_type": "logic", "channel": "a", "channel_2": "b", "inputs": ["c", "a"]},
+         ["a", "b", "c"]),
+        ({"channel_type": "number", "inputs": [{"channel": "a"}, "b", 51]}, ["a", "b", 51]),
+        ({"channel_type": "timer", "start_channel": "a", "stop_channel": ""}, ["a"]),
+        ({"channel_type": "table_3d", "x_axis_channel": "x", "y_axis_channel": "y"}, ["x", "y"]),
+        ({"channel_type": "power_output", "source_channel": 201, "duty_channel": None}, [201]),
+        ({"channel_type": "can_tx", "signals": [{"source_channel": "a"}, {"channel": "b"}]},
+         ["a", "b"]),
+        ({"channel_type": "switch", "input_channel_up": "u", "input_channel_down": "d"},
+         ["u", "d"]),
+        ({"channel_type": "can_rx", "channel": "ignored"}, []),
+    ])
+    def test_fields(self, channel, expected):
+        assert extract_channel_references(channel) == expected
+
+
+class TestChannelDependencyGraph:
+    """Tests for the graph itself."""
+
+    def test_dependents_and_impact(self):
+        graph = ChannelDependencyGraph()
+        graph.build(chain(4))
+
+        assert graph.dependents("in") == ["l1"]
+        assert graph.dependencies("l2") == ["l1"]
+        assert graph.impact("l1") == ["l2", "l3", "l4"]
+        assert graph.impact("l4") == []
+
+    def test_reference_by_channel_id(self):
+        """Device configs reference channels by numeric ID."""
+        graph = ChannelDependencyGraph()
+        graph.set_channel("in", [], channel_id=50)
+        graph.set_channel("out", [50], channel_id=100)
+
+        assert graph.dependents("in") == ["out"]
+        assert graph.dependencies("out") == ["in"]
+
+    def test_incremental_edits(self):
+        graph = ChannelDependencyGraph()
+        graph.build(chain(3))
+
+        graph.set_channel("l3", ["in"], channel_id=203)
+        assert graph.dependents("l2") == []
+        assert graph.dependents("in") == ["l1", "l3"]
+
+        graph.remove_channel("l1")
+        assert graph.dependents("in") == ["l3"]
+        assert graph.undefined_references() == [("l2", "l1")]
+
+    def test_reference_resolves_when_added(self):
+        graph = ChannelDependencyGraph()
+        graph.set_channel("logic", ["later", 300])
+        assert graph.dependencies("logic") == []
+
+        graph.set_channel("later", [])
+        graph.set_channel("by_id", [], channel_id=300)
+
+        assert graph.dependencies("logic") == ["later", "by_id"]
+        assert graph.dependents("by_id") == ["logic"]
+
+    def test_undefined_references(self):
+        graph = ChannelDependencyGraph()
+        graph.set_channel("a", ["one", "missing", 999])
+
+        assert graph.undefined_references() == [("a", "missing")]
+
+    def test_find_cycles(self):
+        graph = ChannelDependencyGraph()
+        graph.build(chain(3))
+        assert graph.find_cycles() == []
+
+        graph.set_channel("l1", ["l3"])
+        graph.set_channel("self", ["self"])
+        cycles = graph.find_cycles()
+
+        assert sorted(sorted(c) for c in cycles) == [["l1", "l2", "l3"], ["self"]]
+
+    def test_long_chain_is_not_recursive(self):
+        """Cycle search and impact handle chains deeper than the recursion limit."""
+        graph = ChannelDependencyGraph()
+        graph.build(chain(5000))
+
+        assert graph.find_cycles() == []
+        assert len(graph.impact("in")) == 5000
+
+
+class TestConfigManagerDependencies:
+    """Tests for ConfigManager's dependency graph."""
+
+    def test_validate_uses_all_reference_fields(self):
+        manager = ConfigManager()
+        manager.config["channels"] = [
+            {"channel_id": 200, "channel_name": "l1", "channel_type": "logic",
+             "channel": "missing", "inputs": [{"channel": "one"}]},
+            {"channel_id": 201, "channel_name": "pid1", "channel_type": "pid",
+             "setpoint_channel": "l1", "process_channel": 55},
+        ]
+
+        assert manager.validate_channel_references() == [
+            "Channel 'l1' references undefined channel 'missing'"
+        ]
+
+    def test_detect_circular_dependencies(self):
+        manager = ConfigManager()
+        for ch in chain(3):
+            manager.add_channel(ch)
+        assert manager.detect_circular_dependencies() == []
+
+        manager.update_channel("l1", {"channel_id": 201, "channel_name": "l1",
+                                      "channel_type": "logic", "channel": "l3"})
+
+        assert sorted(manager.detect_circular_dependencies()[0]) == ["l1", "l2", "l3"]
+
+    def test_graph_follows_edits(self):
+        manager = ConfigManager()
+        for ch in chain(3):
+            manager.add_channel(ch)
+        graph = manager.get_dependency_graph()
+
+        manager.update_channel("l1", {"channel_id": 201, "channel_name": "first",
+                                      "channel_type": "logic", "channel": "in"})
+        assert graph.dependents("in") == ["first"]
+        assert graph.undefined_references() == [("l2", "l1")]
+
+        manager.remove_channel("l3")
+        assert "l3" not in graph
+        assert graph.impact("in") == ["first"]
+
+    def test_graph_rebuilt_for_replaced_list(self):
+        manager = ConfigManager()
+        manager.config["channels"] = chain(2)
+        assert manager.get_dependency_graph().dependents("l1") == ["l2"]
+
+        manager.load_from_dict({"channels": chain(1)})
+
+        assert "l2" not in manager.get_dependency_graph()
+
+
+class TestChannelGraphScene:
+    """Tests for the channel graph view's edges."""
+
+    def test_edges_resolve_names_and_ids(self, qapp):
+        from ui.widgets.channel_graph import ChannelGraphScene
+
+        scene = ChannelGraphScene()
+        scene.build_graph([
+            {"id": "in", "type": "digital_input", "channel_id": 50},
+            {"id": "logic", "type": "logic", "input_channels": [50, "missing"]},
+            {"id": "out", "type": "power_output", "input_channels": ["logic"]},
+        ])
+
+        assert scene.nodes["logic"].inputs == ["in"]
+        assert scene.nodes["in"].outputs == ["logic"]
+        assert len(scene.edges) == 2
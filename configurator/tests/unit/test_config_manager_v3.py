@@ -5,6 +5,7 @@ Tests the new channel-based API introduced in v3.0:
 - get_next_channel_id()
 - add_channel() / get_channel_by_name() / update_channel() / remove_channel()
 - get_all_channels() / get_channels_by_type()
+- Channel indexes (by name, numeric channel_id and type)
 - CAN message methods
 """
 
@@ -311,5 +312,99 @@ class TestConfigManagerValidation:
         assert "nonexistent" in errors[0]
 
 
+class TestConfigManagerChannelIndex:
+    """Tests for the incrementally maintained channel indexes."""
+
+    @staticmethod
+    def make_channels(count):
+        return [
+            {"channel_id": 200 + i, "channel_name": f"ch{i}",
+             "channel_type": "logic" if i % 2 else "timer"}
+            for i in range(count)
+        ]
+
+    def test_lookups_after_add_update_remove(self):
+        """Indexes follow every edit made through the manager."""
+        manager = ConfigManager()
+        for ch in self.make_channels(6):
+            assert manager.add_channel(ch)
+
+        manager.update_channel("ch1", {"channel_id": 301, "channel_name": "renamed",
+                                       "channel_type": "timer"})
+        manager.remove_channel("ch2")
+
+        assert manager.get_channel_index("ch1") == -1
+        assert manager.get_channel_index("renamed") == 1
+        assert manager.get_channel_index("ch5") == 4
+        assert manager.get_channel_by_channel_id(201) is None
+        assert manager.get_channel_by_channel_id(301)["channel_name"] == "renamed"
+        assert manager.get_channel_by_channel_id(202) is None
+        assert [ch["channel_name"] for ch in manager.get_channels_by_type(ChannelType.TIMER)] == \
+            ["ch0", "renamed", "ch4"]
+        assert manager.get_channel_names_of_type(ChannelType.LOGIC) == ["ch3", "ch5"]
+        assert manager.get_channel_count(ChannelType.LOGIC) == 2
+
+    def test_matches_linear_scan(self):
+        """Every name resolves to the position a scan of the list finds."""
+        manager = ConfigManager()
+        for ch in self.make_channels(50):
+            manager.add_channel(ch)
+        for i in range(0, 50, 3):
+            manager.remove_channel(f"ch{i}")
+
+        for index, ch in enumerate(manager.get_all_channels()):
+            assert manager.get_channel_index(ch["channel_name"]) == index
+            assert manager.get_channel_by_channel_id(ch["channel_id"]) is ch
+
+    def test_list_replaced_or_extended(self):
+        """Assigning or extending the channels list directly is picked up."""
+        manager = ConfigManager()
+        manager.config["channels"] = self.make_channels(3)
+        assert manager.channel_exists("ch2")
+
+        manager.get_config()["channels"].extend(self.make_channels(5)[3:])
+        assert manager.get_channel_index("ch4") == 4
+
+        manager.config["channels"] = []
+        assert not manager.channel_exists("ch2")
+
+    def test_load_from_dict_invalidates(self):
+        """A configuration loaded from the device replaces the indexes."""
+        manager = ConfigManager()
+        manager.add_channel({"channel_id": 200, "channel_name": "old", "channel_type": "logic"})
+
+        success, _ = manager.load_from_dict(
+            {"channels": [{"channel_id": 210, "channel_name": "new", "channel_type": "timer"}]})
+
+        assert success
+        assert manager.get_channel_by_name("old") is None
+        assert manager.get_channel_by_channel_id(210)["channel_name"] == "new"
+
+    def test_in_place_rename_detected_on_hit(self):
+        """A stale hit after an in-place rename is not returned."""
+        manager = ConfigManager()
+        manager.config["channels"] = self.make_channels(2)
+        manager.get_channel_index("ch0")
+
+        manager.config["channels"][0]["channel_name"] = "renamed"
+
+        assert manager.get_channel_index("ch0") == -1
+        assert manager.get_channel_index("renamed") == 0
+
+    def test_duplicate_names_first_wins(self):
+        """Duplicate names from loaded configs resolve like a list scan."""
+        manager = ConfigManager()
+        manager.config["channels"] = [
+            {"channel_id": 200, "channel_name": "dup", "channel_type": "logic"},
+            {"channel_id": 201, "channel_name": "other", "channel_type": "logic"},
+            {"channel_id": 202, "channel_name": "dup", "channel_type": "timer"},
+        ]
+
+        assert manager.get_channel_by_name("dup")["channel_id"] == 200
+        manager.remove_channel("dup")
+        assert manager.get_channel_by_name("dup")["channel_id"] == 202
+        assert manager.get_channel_index("dup") == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
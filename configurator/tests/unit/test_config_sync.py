@@ -0,0 +1,87 @@
+"""
+Unit Tests: Delta Config Sync
+
+Tests for controllers/config_sync.py - per-channel diff of binary configs.
+Covers:
+- Splitting a binary config into channel records
+- Changed, added and removed channel detection
+- Full upload fallback without baseline or on a large diff
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from controllers.config_sync import ConfigSyncState, split_channel_records
+
+
+@pytest.fixture
+def base(make_record):
+    return [make_record(ch_id, name=f"Timer {ch_id}".encode()) for ch_id in range(200, 210)]
+
+
+class TestSplitChannelRecords:
+    """Tests for split_channel_records()."""
+
+    def test_split(self, make_config, base):
+        records = split_channel_records(make_config(base))
+        assert list(records) == list(range(200, 210))
+        assert records[203] == base[3]
+
+    def test_truncated(self, make_config, base):
+        with pytest.raises(ValueError):
+            split_channel_records(make_config(base)[:-1])
+
+    def test_duplicate_id(self, make_config, base):
+        with pytest.raises(ValueError):
+            split_channel_records(make_config([base[0], base[0]]))
+
+
+class TestConfigSyncState:
+    """Tests for ConfigSyncState.diff()."""
+
+    def test_no_baseline(self, make_config, base):
+        sync = ConfigSyncState()
+        assert not sync.has_baseline
+        assert sync.diff(make_config(base)) is None
+
+    def test_unchanged(self, make_config, base):
+        sync = ConfigSyncState()
+        sync.commit(make_config(base))
+        delta = sync.diff(make_config(base))
+        assert delta is not None and delta.is_empty
+
+    def test_changed_added_removed(self, make_record, make_config, base):
+        sync = ConfigSyncState()
+        sync.commit(make_config(base))
+
+        edited = make_record(204, config=b"\x01" * 8, name=b"Timer 204")
+        added = make_record(300)
+        new = base[:4] + [edited] + base[5:9] + [added]
+        delta = sync.diff(make_config(new))
+
+        assert delta.changed == [204]
+        assert delta.added == [300]
+        assert delta.removed == [209]
+        assert delta.records == {204: edited, 300: added}
+        assert delta.update_count == 3
+
+    def test_large_diff_falls_back(self, make_record, make_config, base):
+        sync = ConfigSyncState()
+        sync.commit(make_config(base))
+        new = [make_record(r_id, config=b"\x02" * 8) for r_id in range(200, 210)]
+        assert sync.diff(make_config(new)) is None
+
+    def test_channel_limit_falls_back(self, make_config, base):
+        sync = ConfigSyncState(max_delta_ratio=1.0, max_delta_channels=2)
+        sync.commit(make_config(base))
+        assert sync.diff(make_config(base[:7])) is None
+
+    def test_reset(self, make_config, base):
+        sync = ConfigSyncState()
+        sync.commit(make_config(base))
+        sync.reset()
+        assert sync.diff(make_config(base)) is None
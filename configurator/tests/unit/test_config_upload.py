@@ -0,0 +1,208 @@
+"""
+Unit Tests: In-band Config Upload
+
+Tests for controllers/device_controller.py - binary config upload over T-MIN.
+Covers:
+- All chunks pipelined on the open transport, single final ACK
+- Intermediate ACKs (emulator firmware) not ending the upload early
+- Error ACK reported as failure
+- Upload path chosen from CONFIG_IN_BAND in the capabilities
+- SerialTransfer fallback for firmware that does not answer in-band
+- LZ-compressed chunks when the device advertises CONFIG_LZ
+- Delta sync sending only changed channels as SET_CHANNEL_CONFIG
+"""
+
+import struct
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from communication.protocol import MessageType
+from controllers.device_controller import DeviceCapabilities, DeviceController
+from controllers.transport import MINSerialTransport
+from min_protocol import MINFrame
+from config_compress import decompress
+from device_caps import SwCapsFlags
+
+
+# ============================================================================
+# Fake transport
+# ============================================================================
+
+class FakeMINTransport(MINSerialTransport):
+    """T-MIN transport answering LOAD_BINARY_CONFIG without a serial port."""
+
+    def __init__(self, mode="final", atomic=True, sw_flags=SwCapsFlags.CONFIG_IN_BAND):
+        super().__init__("FAKE")
+        self.mode = mode  # "final", "per_chunk", "error" or "silent"
+        self.atomic = atomic  # Answer SET_CHANNEL_CONFIG
+        self.sw_flags = sw_flags  # Advertised in CAPABILITIES, None = no answer
+        self.chunks = []
+        self.chunk_types = set()
+        self.channel_updates = []
+
+    def queue_frame(self, min_id, payload=b''):
+        if min_id == MessageType.GET_CAPABILITIES:
+            if self.sw_flags is not None:
+                caps = bytes([0, 1, 0, 0, 30, 20, 20, 4, 2, 0]) + struct.pack('<I', self.sw_flags)
+                self._reply(caps, MessageType.CAPABILITIES)
+            return True
+        if min_id == MessageType.SET_CHANNEL_CONFIG:
+            self.channel_updates.append(payload)
+            if self.atomic:
+                self._reply(payload[:2] + bytes([1, 0, 0]), MessageType.CHANNEL_CONFIG_ACK)
+            return True
+        self.chunks.append(payload)
+        self.chunk_types.add(min_id)
+        index, total = struct.unpack("<HH", payload[:4])
+        if self.mode == "per_chunk" and index < total - 1:
+            self._reply(struct.pack("<BBH", 1, 0, index))
+        elif self.mode == "error" and index == 0:
+            self._reply(bytes([0, 1, 0, 0]))
+        elif self.mode in ("final", "per_chunk") and index == total - 1:
+            self._reply(bytes([1, 0, 9, 0, 9, 0]))
+        return True
+
+    def _reply(self, payload, msg_type=MessageType.BINARY_CONFIG_ACK):
+        with self._rx_lock:
+            self._rx_queue.append(MINFrame(msg_type, payload, 0, True))
+            self._rx_event.set()
+
+
+@pytest.fixture
+def controller(qapp):
+    ctrl = DeviceController()
+    ctrl._is_connected = True
+    ctrl.fallback_calls = []
+    ctrl._upload_binary_config_serial_transfer = lambda data, timeout: ctrl.fallback_calls.append(data) or True
+    return ctrl
+
+
+CONFIG = bytes(range(256)) * 4  # 6 chunks
+
+
+@pytest.fixture
+def channels(make_record):
+    return [make_record(ch_id) for ch_id in range(200, 210)]
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestInBandUpload:
+    """Tests for the in-band upload path."""
+
+    def test_pipelined_final_ack(self, controller):
+        """All chunks are queued and the final ACK completes the upload."""
+        controller._transport = FakeMINTransport("final")
+        assert controller.upload_binary_config(CONFIG, timeout=1.0)
+        assert b"".join(c[4:] for c in controller._transport.chunks) == CONFIG
+        assert controller._binary_config_channels_loaded == 9
+        assert controller.fallback_calls == []
+
+    def test_intermediate_acks_ignored(self, controller):
+        """Per-chunk ACKs from emulator firmware do not end the upload early."""
+        controller._transport = FakeMINTransport("per_chunk")
+        assert controller.upload_binary_config(CONFIG, timeout=1.0)
+        assert controller._binary_config_channels_loaded == 9
+
+    def test_error_ack(self, controller):
+        """An error ACK fails the upload without falling back."""
+        controller._transport = FakeMINTransport("error")
+        assert not controller.upload_binary_config(CONFIG, timeout=1.0)
+        assert controller.fallback_calls == []
+
+    def test_fallback_when_silent(self, controller):
+        """Firmware advertising but not answering in-band uploads gets SerialTransfer, once probed."""
+        controller._transport = FakeMINTransport("silent")
+        assert controller.upload_binary_config(CONFIG, timeout=0.1)
+        assert controller.fallback_calls == [CONFIG]
+
+        controller._transport.chunks.clear()
+        assert controller.upload_binary_config(CONFIG, timeout=0.1)
+        assert controller._transport.chunks == []
+        assert len(controller.fallback_calls) == 2
+
+    def test_serial_transfer_when_not_advertised(self, controller):
+        """Firmware without CONFIG_IN_BAND gets SerialTransfer without an ACK wait."""
+        controller._transport = FakeMINTransport("final", sw_flags=SwCapsFlags.CONFIG_LZ)
+        assert controller.upload_binary_config(CONFIG, timeout=5.0)
+        assert controller._transport.chunks == []
+        assert controller.fallback_calls == [CONFIG]
+
+    def test_serial_transfer_without_capabilities(self, controller):
+        """Firmware not answering GET_CAPABILITIES costs the short probe, not the timeout."""
+        controller._transport = FakeMINTransport("final", sw_flags=None)
+        start = time.time()
+        assert controller.upload_binary_config(CONFIG, timeout=5.0)
+        assert time.time() - start < 1.0
+        assert controller._transport.chunks == []
+        assert controller.fallback_calls == [CONFIG]
+
+    def test_compressed_when_advertised(self, controller, make_config, channels):
+        """CONFIG_LZ in the capabilities switches to LOAD_BINARY_CONFIG_LZ."""
+        controller._transport = FakeMINTransport("final")
+        controller._device_capabilities = DeviceCapabilities(
+            sw_flags=SwCapsFlags.CONFIG_LZ | SwCapsFlags.CONFIG_IN_BAND)
+        config = make_config(channels * 4)
+        assert controller.upload_binary_config(config, timeout=1.0)
+        assert controller._transport.chunk_types == {MessageType.LOAD_BINARY_CONFIG_LZ}
+        stream = b"".join(c[4:] for c in controller._transport.chunks)
+        assert len(stream) < len(config) // 3
+        assert decompress(stream) == config
+
+    def test_capabilities_sw_flags(self):
+        """Older firmware sends 10 capability bytes; newer appends sw_flags."""
+        base = bytes([0, 1, 2, 3, 30, 20, 20, 4, 2, 0])
+        assert not DeviceCapabilities.from_payload(base).supports_config_lz
+        caps = DeviceCapabilities.from_payload(base + struct.pack('<I', SwCapsFlags.CONFIG_LZ))
+        assert caps.supports_config_lz
+
+
+class TestDeltaSync:
+    """Tests for sync_binary_config()."""
+
+    def test_first_sync_is_full_upload(self, controller, make_config, channels):
+        """Without a previous sync the whole config is uploaded."""
+        controller._transport = FakeMINTransport("final")
+        assert controller.sync_binary_config(make_config(channels), timeout=1.0)
+        assert controller._transport.chunks
+        assert controller._transport.channel_updates == []
+
+    def test_only_changed_channel_sent(self, controller, make_record, make_config, channels):
+        """After a sync, an edited channel goes out as one atomic update."""
+        controller._transport = FakeMINTransport("final")
+        assert controller.sync_binary_config(make_config(channels), timeout=1.0)
+        controller._transport.chunks.clear()
+
+        edited = channels[:3] + [make_record(203, config=b"\x05" * 8)] + channels[4:]
+        assert controller.sync_binary_config(make_config(edited), timeout=1.0)
+        assert controller._transport.chunks == []
+        assert controller._transport.channel_updates == [make_record(203, config=b"\x05" * 8)]
+
+        # Nothing changed - nothing sent
+        assert controller.sync_binary_config(make_config(edited), timeout=1.0)
+        assert len(controller._transport.channel_updates) == 1
+
+    def test_removed_channel(self, controller, make_config, channels):
+        """A removed channel is sent as a 2-byte channel ID."""
+        controller._transport = FakeMINTransport("final")
+        assert controller.sync_binary_config(make_config(channels), timeout=1.0)
+        assert controller.sync_binary_config(make_config(channels[:-1]), timeout=1.0)
+        assert controller._transport.channel_updates == [struct.pack('<H', 209)]
+
+    def test_fallback_without_atomic_support(self, controller, make_record, make_config, channels):
+        """Firmware ignoring SET_CHANNEL_CONFIG gets a full upload."""
+        controller._transport = FakeMINTransport("final", atomic=False)
+        assert controller.sync_binary_config(make_config(channels), timeout=0.2)
+        controller._transport.chunks.clear()
+
+        edited = [make_record(200, config=b"\x01" * 8)] + channels[1:]
+        assert controller.sync_binary_config(make_config(edited), timeout=0.2)
+        assert controller._transport.chunks
+        assert not controller._atomic_update_supported
@@ -0,0 +1,286 @@
+"""
+Unit Tests: Connection Manager
+
+Tests for controllers/connection_manager.py - multi-device sessions.
+Covers:
+- Session registration and pooling
+- Concurrent fan-out upload + flash with per-device progress and timing
+- Failure isolation between devices
+- Concurrency limit
+- Reconnecting sessions dropped by the remote side
+"""
+
+import asyncio
+import struct
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from communication.protocol import MessageType, MINFrameParser, build_min_frame
+from controllers.connection_manager import ConnectionManager
+
+
+# ============================================================================
+# Fake devices
+# ============================================================================
+
+class SlowDevice:
+    """TCP device answering config, flash and PING after a fixed delay."""
+
+    def __init__(self, delay=0.05, flash_ok=True, sw_flags=0):
+        self.delay = delay
+        self.flash_ok = flash_ok
+        self.sw_flags = sw_flags
+        self.upload_types = set()
+        self.connections = 0
+        self.chunks = 0
+        self.writers = []
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        for writer in self.writers:
+            writer.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def drop_connections(self):
+        for writer in self.writers:
+            writer.close()
+        self.writers = []
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self.writers.append(writer)
+        parser = MINFrameParser()
+        while True:
+            try:
+                data = await reader.read(4096)
+            except ConnectionError:
+                break
+            if not data:
+                break
+            for min_id, payload, _, _ in parser.feed(data):
+                await asyncio.sleep(self.delay)
+                if min_id == MessageType.PING:
+                    writer.write(build_min_frame(MessageType.PONG))
+                elif min_id == MessageType.GET_CAPABILITIES:
+                    caps = bytes([0, 1, 2, 3, 30, 20, 20, 4, 2, 0]) + struct.pack("<I", self.sw_flags)
+                    writer.write(build_min_frame(MessageType.CAPABILITIES, caps))
+                elif min_id in (MessageType.LOAD_BINARY_CONFIG, MessageType.LOAD_BINARY_CONFIG_LZ):
+                    index, total = struct.unpack("<HH", payload[:4])
+                    self.chunks += 1
+                    self.upload_types.add(min_id)
+                    ack = bytes([1, 0, 5, 0, 5, 0]) if index == total - 1 else struct.pack("<BBH", 1, 0, index)
+                    writer.write(build_min_frame(MessageType.BINARY_CONFIG_ACK, ack))
+                elif min_id == MessageType.SAVE_TO_FLASH:
+                    writer.write(build_min_frame(MessageType.FLASH_ACK, bytes([int(self.flash_ok)])))
+
+
+async def _start_devices(count, **kwargs):
+    devices = [SlowDevice(**kwargs) for _ in range(count)]
+    for dev in devices:
+        await dev.start()
+    return devices
+
+
+def _manager(devices, **kwargs):
+    manager = ConnectionManager(**kwargs)
+    for i, dev in enumerate(devices):
+        manager.add(f"PMU-{i}", {"type": "Emulator", "address": f"127.0.0.1:{dev.port}"})
+    return manager
+
+
+CONFIG = bytes(range(250)) * 2  # 3 chunks
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+class TestSessions:
+    """Tests for session registration."""
+
+    def test_duplicate_key_rejected(self):
+        """Each key maps to exactly one device."""
+        manager = ConnectionManager()
+        manager.add("A", {"type": "Emulator", "address": "127.0.0.1:1"})
+        with pytest.raises(ValueError):
+            manager.add("A", {"type": "Emulator", "address": "127.0.0.1:2"})
+        assert manager.keys == ["A"]
+        assert "A" in manager
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_pooled(self):
+        """Repeated operations reuse the open connection."""
+        devices = await _start_devices(2, delay=0)
+        manager = _manager(devices)
+        try:
+            for _ in range(3):
+                results = await manager.ping_all()
+                assert all(r.success for r in results.values())
+            assert [d.connections for d in devices] == [1, 1]
+            assert manager.session("PMU-0").operations == 3
+        finally:
+            await manager.close_all()
+            for dev in devices:
+                await dev.stop()
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_reported(self):
+        """An unreachable device yields a failed result, not an exception."""
+        manager = ConnectionManager()
+        manager.add("dead", {"type": "Emulator", "address": "127.0.0.1:1"})
+        results = await manager.connect_all()
+        assert not results["dead"].success
+        assert results["dead"].error
+
+    @pytest.mark.asyncio
+    async def test_reconnect_after_drop(self):
+        """A session closed by the device is reconnected by the next operation."""
+        devices = await _start_devices(1, delay=0)
+        manager = _manager(devices)
+        try:
+            assert (await manager.ping_all())["PMU-0"].success
+            devices[0].drop_connections()
+            await asyncio.sleep(0.05)
+            assert not manager.session("PMU-0").is_connected
+            assert (await manager.ping_all())["PMU-0"].success
+            assert devices[0].connections == 2
+        finally:
+            await manager.close_all()
+            await devices[0].stop()
+
+
+class TestFanOut:
+    """Tests for concurrent operations."""
+
+    @pytest.mark.asyncio
+    async def test_upload_and_flash_concurrent(self):
+        """Devices are programmed in parallel, with progress and step timing."""
+        devices = await _start_devices(6, delay=0.05)
+        manager = _manager(devices)
+        progress = []
+        try:
+            start = time.monotonic()
+            results = await manager.upload_and_flash_all(
+                CONFIG, progress=lambda key, step, frac: progress.append((key, step, frac)))
+            elapsed = time.monotonic() - start
+        finally:
+            await manager.close_all()
+            for dev in devices:
+                await dev.stop()
+
+        assert all(r.success and r.result == 5 for r in results.values())
+        # Capabilities + 3 chunks + flash at 50 ms each; serial would take 6x as long
+        assert elapsed < 6 * 5 * 0.05
+        for key, result in results.items():
+            assert set(result.steps) == {"connect", "upload", "flash"}
+            assert (key, "upload", 1.0) in progress
+            assert result.elapsed_s >= sum(result.steps.values()) - 1e-6
+
+    @pytest.mark.asyncio
+    async def test_compressed_upload_negotiated(self):
+        """Devices advertising CONFIG_LZ get compressed chunks, others raw."""
+        devices = await _start_devices(2, delay=0)
+        devices[1].sw_flags = 1 << 12  # SwCapsFlags.CONFIG_LZ
+        manager = _manager(devices)
+        try:
+            results = await manager.upload_and_flash_all(bytes(2000))
+        finally:
+            await manager.close_all()
+            for dev in devices:
+                await dev.stop()
+
+        assert all(r.success for r in results.values())
+        assert devices[0].upload_types == {MessageType.LOAD_BINARY_CONFIG}
+        assert devices[1].upload_types == {MessageType.LOAD_BINARY_CONFIG_LZ}
+        assert devices[1].chunks == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_isolated(self):
+        """One device failing flash does not affect the others."""
+        devices = await _start_devices(3, delay=0)
+        devices[1].flash_ok = False
+        manager = _manager(devices)
+        try:
+            results = await manager.upload_and_flash_all(CONFIG)
+        finally:
+            await manager.close_all()
+            for dev in devices:
+                await dev.stop()
+
+        assert [r.success for r in results.values()] == [True, False, True]
+        assert "Flash" in results["PMU-1"].error
+        assert manager.session("PMU-1").last_error == results["PMU-1"].error
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """max_concurrency bounds how many devices are worked on at once."""
+        devices = await _start_devices(4, delay=0)
+        manager = _manager(devices, max_concurrency=2)
+        active = 0
+        peak = 0
+
+        async def operation(session, report):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return await session.client.ping()
+
+        try:
+            results = await manager.run_all(operation)
+        finally:
+            await manager.close_all()
+            for dev in devices:
+                await dev.stop()
+
+        assert all(r.success for r in results.values())
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Per-device timeout marks slow devices as failed."""
+        devices = await _start_devices(1, delay=0.5)
+        manager = _manager(devices)
+        try:
+            results = await manager.ping_all(timeout=2.0)
+            slow = await manager.run_all(lambda s, r: s.client.ping(2.0), timeout=0.05)
+        finally:
+            await manager.close_all()
+            await devices[0].stop()
+
+        assert results["PMU-0"].success
+        assert not slow["PMU-0"].success
+        assert "Timed out" in slow["PMU-0"].error
+
+    @pytest.mark.asyncio
+    async def test_timeout_covers_connect(self):
+        """A connect that never returns times out and frees its slot."""
+        devices = await _start_devices(1, delay=0)
+        manager = ConnectionManager(max_concurrency=1)
+        manager.add("hung", {"type": "Emulator", "address": "127.0.0.1:1"})
+        manager.add("PMU-0", {"type": "Emulator", "address": f"127.0.0.1:{devices[0].port}"})
+
+        async def never_connects():
+            await asyncio.Event().wait()
+
+        manager.session("hung").client.connect = never_connects
+        try:
+            results = await asyncio.wait_for(
+                manager.run_all(lambda s, r: s.client.ping(1.0), timeout=0.1), 2.0)
+        finally:
+            await manager.close_all()
+            await devices[0].stop()
+
+        assert not results["hung"].success
+        assert "Timed out" in results["hung"].error
+        assert results["PMU-0"].success
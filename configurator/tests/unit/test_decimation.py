@@ -0,0 +1,103 @@
+"""
+Unit Tests: Plot Decimation
+
+Tests for utils/decimation.py - min/max level-of-detail reduction.
+Covers:
+- Pass-through of short series
+- Envelope size and spike preservation
+- Visible window selection
+- Pyramid queries matching the direct envelope
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.decimation import MinMaxPyramid, minmax_envelope, visible_range
+
+
+@pytest.fixture
+def series():
+    """100k samples at 1 kHz with a single spike."""
+    times = np.arange(100_000) * 0.001
+    values = np.sin(times)
+    values[54_321] = 50.0
+    values[76_543] = -50.0
+    return times, values
+
+
+class TestEnvelope:
+
+    def test_short_series_passthrough(self):
+        times = np.arange(100, dtype=np.float64)
+        values = times * 2
+        x, y = minmax_envelope(times, values, width=500)
+        assert np.shares_memory(x, times)
+        assert np.array_equal(y, values)
+
+    def test_empty(self):
+        x, y = minmax_envelope(np.array([]), np.array([]))
+        assert len(x) == 0
+
+    def test_size_bounded(self, series):
+        times, values = series
+        x, y = minmax_envelope(times, values, width=800)
+        assert len(x) == len(y)
+        assert len(x) <= 2 * 801
+
+    def test_spikes_preserved(self, series):
+        times, values = series
+        x, y = minmax_envelope(times, values, width=300)
+        assert y.max() == 50.0
+        assert y.min() == -50.0
+        assert np.all(np.diff(x) >= 0)
+
+    def test_window(self, series):
+        times, values = series
+        x, y = minmax_envelope(times, values, 10.0, 20.0, width=400)
+        assert x[0] <= 10.0 and x[1] >= 10.0 - 0.001
+        assert x[-1] <= 20.0 + 0.001
+        assert y.max() < 2.0  # Spikes are outside the window
+
+    def test_visible_range_edges(self):
+        times = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+        assert visible_range(times, 1.5, 2.5) == (1, 4)
+        assert visible_range(times, -5.0, 10.0) == (0, 5)
+
+
+class TestPyramid:
+
+    def test_levels(self, series):
+        times, values = series
+        pyramid = MinMaxPyramid(times, values)
+        assert len(pyramid) == len(times)
+        sizes = [len(level[0]) for level in pyramid.levels]
+        assert sizes[0] == len(times)
+        assert all(a > b for a, b in zip(sizes, sizes[1:]))
+        assert sizes[-1] <= pyramid.factor
+
+    def test_query_matches_envelope(self, series):
+        times, values = series
+        pyramid = MinMaxPyramid(times, values)
+        for t0, t1, width in [(None, None, 1000), (50.0, 60.0, 600), (54.0, 54.5, 300)]:
+            x, y = pyramid.query(t0, t1, width)
+            ex, ey = minmax_envelope(times, values, t0, t1, width)
+            assert len(x) <= 2 * (width + 1)
+            assert y.max() == pytest.approx(ey.max())
+            assert y.min() == pytest.approx(ey.min())
+
+    def test_zoomed_in_returns_raw(self, series):
+        times, values = series
+        pyramid = MinMaxPyramid(times, values)
+        x, y = pyramid.query(54.3, 54.4, 1000)
+        start, stop = visible_range(times, 54.3, 54.4)
+        assert np.array_equal(x, times[start:stop])
+        assert 50.0 in y
+
+    def test_invalid_factor(self):
+        with pytest.raises(ValueError):
+            MinMaxPyramid(np.arange(10.0), np.arange(10.0), factor=1)
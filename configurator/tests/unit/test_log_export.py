@@ -0,0 +1,138 @@
+"""
+Unit Tests: Log Export
+
+Tests for utils/log_export.py - data logger export.
+Covers:
+- Outer join of channels with different sample times
+- Chunked join matching the in-memory join
+- CSV rows with empty cells for missing samples
+- Columnar (.npz) round trip
+- Chunked progress and cancellation
+"""
+
+import csv
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.log_export import (
+    ExportColumn, ExportCancelled, export_log, iter_merged, merge_columns, read_columnar,
+    write_columnar, write_csv,
+)
+
+
+@pytest.fixture
+def columns():
+    """Battery at 100 Hz, current at 50 Hz offset by 5 ms."""
+    times_a = np.arange(1000) * 0.01
+    times_b = np.arange(500) * 0.02 + 0.005
+    return [
+        ExportColumn("Battery", "V", times_a, 12.0 + times_a),
+        ExportColumn("Current", "A", times_b, times_b * 2),
+    ]
+
+
+class TestMerge:
+
+    def test_outer_join(self, columns):
+        times, (battery, current) = merge_columns(columns)
+
+        assert len(times) == 1500
+        assert np.all(np.diff(times) > 0)
+        assert np.count_nonzero(~np.isnan(battery)) == 1000
+        assert np.count_nonzero(~np.isnan(current)) == 500
+        index = np.searchsorted(times, 0.025)
+        assert np.isnan(battery[index])
+        assert current[index] == pytest.approx(0.05)
+
+    def test_shared_timestamps(self):
+        times, merged = merge_columns([
+            ExportColumn("A", "", np.array([0.0, 0.1]), np.array([1.0, 2.0])),
+            ExportColumn("B", "", np.array([0.1]), np.array([3.0])),
+        ])
+        assert times.tolist() == [0.0, 0.1]
+        assert np.isnan(merged[1][0])
+        assert merged[1][1] == 3.0
+
+    def test_empty(self):
+        times, merged = merge_columns([])
+        assert len(times) == 0
+        assert merged == []
+        assert list(iter_merged([])) == []
+
+    @pytest.mark.parametrize("chunk_rows", [1, 7, 400, 5000])
+    def test_chunks_match_merge(self, chunk_rows):
+        """Blocks concatenate to the in-memory join, repeated timestamps included."""
+        rng = np.random.default_rng(1)
+        columns = []
+        for i, count in enumerate([1200, 300, 0, 900]):
+            times = np.sort(rng.integers(0, 2000, count)) * 0.001
+            columns.append(ExportColumn(f"C{i}", "", times, rng.random(count)))
+        expected_times, expected = merge_columns(columns)
+
+        blocks = list(iter_merged(columns, chunk_rows))
+
+        assert all(0 < len(times) <= chunk_rows for times, _ in blocks)
+        np.testing.assert_array_equal(np.concatenate([times for times, _ in blocks]), expected_times)
+        for i, values in enumerate(expected):
+            np.testing.assert_array_equal(np.concatenate([merged[i] for _, merged in blocks]), values)
+
+
+class TestCsv:
+
+    def test_rows(self, columns, tmp_path):
+        path = tmp_path / "log.csv"
+        progress = []
+        rows = write_csv(str(path), columns, progress=lambda done, total: progress.append(done),
+                         chunk_rows=400)
+
+        assert rows == 1500
+        assert progress == [400, 800, 1200, 1500]
+        with open(path, newline='') as f:
+            lines = list(csv.reader(f))
+        assert lines[0] == ["Time (s)", "Battery (V)", "Current (A)"]
+        assert lines[1] == ["0.0000", "12.0000", ""]
+        assert lines[2] == ["0.0050", "", "0.0100"]
+        assert len(lines) == 1501
+
+    def test_cancel(self, columns, tmp_path):
+        cancel = threading.Event()
+        cancel.set()
+        with pytest.raises(ExportCancelled):
+            write_csv(str(tmp_path / "log.csv"), columns, cancel=cancel)
+
+
+class TestColumnar:
+
+    def test_round_trip(self, columns, tmp_path):
+        path = str(tmp_path / "log.npz")
+        progress = []
+        assert export_log(path, columns, progress=lambda done, total: progress.append((done, total))) == 1500
+        assert progress[-1] == (1500, 1500)
+
+        names, times, values = read_columnar(path)
+        assert names == [("Battery", "V"), ("Current", "A")]
+        expected_times, expected = merge_columns(columns)
+        np.testing.assert_array_equal(times, expected_times)
+        for loaded, original in zip(values, expected):
+            np.testing.assert_array_equal(loaded, original)
+
+        # Plain NumPy archive
+        with np.load(path) as archive:
+            assert archive["c0"].dtype == np.float64
+
+    def test_smaller_than_csv(self, columns, tmp_path):
+        write_columnar(str(tmp_path / "log.npz"), columns)
+        write_csv(str(tmp_path / "log.csv"), columns)
+        assert (tmp_path / "log.npz").stat().st_size < (tmp_path / "log.csv").stat().st_size
+
+    def test_rejects_other_archives(self, tmp_path):
+        path = str(tmp_path / "other.npz")
+        np.savez(path, data=np.zeros(3))
+        with pytest.raises(ValueError):
+            read_columnar(path)
@@ -0,0 +1,156 @@
+"""
+Unit Tests: Sample Ring Buffer
+
+Tests for utils/sample_buffer.py - bounded columnar sample storage.
+Covers:
+- Append and bulk extend
+- Retention limit and bounded storage
+- Views staying valid across reallocation
+- Incremental statistics
+- Adopting a complete series (loaded logs)
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.sample_buffer import SampleRingBuffer
+
+
+class TestAppend:
+
+    def test_append(self):
+        buffer = SampleRingBuffer(retention=100)
+        for i in range(10):
+            buffer.append(i * 0.1, float(i))
+
+        assert len(buffer) == 10
+        assert buffer.values.tolist() == [float(i) for i in range(10)]
+        assert buffer.last() == (pytest.approx(0.9), 9.0)
+
+    def test_retention(self):
+        buffer = SampleRingBuffer(retention=50)
+        for i in range(1000):
+            buffer.append(float(i), float(i))
+
+        assert len(buffer) == 50
+        assert buffer.times.tolist() == [float(i) for i in range(950, 1000)]
+        assert buffer.capacity <= 100
+
+    def test_views_read_only(self):
+        buffer = SampleRingBuffer(retention=10)
+        buffer.append(0.0, 1.0)
+        with pytest.raises(ValueError):
+            buffer.values[0] = 5.0
+
+    def test_views_survive_reallocation(self):
+        buffer = SampleRingBuffer(retention=20)
+        for i in range(20):
+            buffer.append(float(i), float(i))
+        view = buffer.values
+        snapshot = view.copy()
+
+        for i in range(20, 200):
+            buffer.append(float(i), float(i))
+
+        assert np.array_equal(view, snapshot)
+
+    def test_empty_last(self):
+        with pytest.raises(IndexError):
+            SampleRingBuffer().last()
+
+    def test_invalid_retention(self):
+        with pytest.raises(ValueError):
+            SampleRingBuffer(retention=0)
+
+
+class TestExtend:
+
+    def test_matches_append(self):
+        appended = SampleRingBuffer(retention=300)
+        extended = SampleRingBuffer(retention=300)
+        times = np.arange(1000) * 0.01
+        values = np.sin(times)
+
+        for t, v in zip(times, values):
+            appended.append(t, v)
+        for start in range(0, 1000, 170):
+            extended.extend(times[start:start + 170], values[start:start + 170])
+
+        assert np.array_equal(appended.times, extended.times)
+        assert np.array_equal(appended.values, extended.values)
+        assert appended.min_value == extended.min_value
+        assert appended.max_value == extended.max_value
+        assert appended.avg_value == pytest.approx(extended.avg_value)
+
+    def test_longer_than_retention(self):
+        buffer = SampleRingBuffer(retention=10)
+        buffer.extend(range(100), range(100))
+        assert buffer.values.tolist() == [float(i) for i in range(90, 100)]
+        assert buffer.total_count == 100
+
+    def test_shape_mismatch(self):
+        with pytest.raises(ValueError):
+            SampleRingBuffer().extend([1, 2], [1])
+
+
+class TestAssign:
+
+    def test_adopts_arrays(self):
+        times = np.arange(500, dtype=np.float64)
+        values = np.arange(500, dtype=np.float64) * 2
+        buffer = SampleRingBuffer(retention=100)
+        buffer.assign(times, values)
+
+        assert len(buffer) == 500
+        assert np.shares_memory(buffer.values, values)
+        assert buffer.max_value == 998.0
+        assert buffer.avg_value == pytest.approx(499.0)
+
+        buffer.append(500.0, 1.0)
+        assert len(buffer) == 500
+        assert values[-1] == 998.0
+
+    def test_missing_values_skip_statistics(self):
+        buffer = SampleRingBuffer()
+        buffer.assign([0.0, 1.0, 2.0], [4.0, np.nan, 2.0])
+
+        assert len(buffer) == 3
+        assert buffer.min_value == 2.0
+        assert buffer.avg_value == pytest.approx(3.0)
+
+
+class TestStatistics:
+
+    def test_statistics_cover_dropped_samples(self):
+        buffer = SampleRingBuffer(retention=5)
+        for value in [10.0, -3.0, 4.0, 1.0, 2.0, 3.0, 5.0, 6.0]:
+            buffer.append(0.0, value)
+
+        assert buffer.min_value == -3.0
+        assert buffer.max_value == 10.0
+        assert buffer.avg_value == pytest.approx(28.0 / 8)
+
+    def test_clear(self):
+        buffer = SampleRingBuffer(retention=5)
+        buffer.append(0.0, 1.0)
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.total_count == 0
+        assert buffer.avg_value == 0.0
+        assert buffer.min_value == float('inf')
+
+    def test_set_retention(self):
+        buffer = SampleRingBuffer(retention=1000)
+        buffer.extend(range(1000), range(1000))
+        buffer.set_retention(10)
+
+        assert buffer.values.tolist() == [float(i) for i in range(990, 1000)]
+        assert buffer.capacity <= 20
+        buffer.append(1000.0, 1000.0)
+        assert buffer.values[-1] == 1000.0
+        assert len(buffer) == 10
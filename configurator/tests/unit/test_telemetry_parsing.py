@@ -0,0 +1,165 @@
+"""
+Unit Tests: Telemetry Parsing
+
+Tests for communication/telemetry.py - precompiled telemetry codecs.
+Covers:
+- Full PMU-30 format round trip
+- Flat array results
+- Nucleo F446RE format, including truncated packets
+- Virtual channel arrays
+"""
+
+import pytest
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from communication.telemetry import (
+    ChannelState,
+    FaultFlags,
+    TelemetryPacket,
+    create_telemetry_bytes,
+    parse_telemetry,
+)
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+def _virtuals(channels):
+    data = struct.pack("<H", len(channels))
+    for ch_id, value in channels.items():
+        data += struct.pack("<Hi", ch_id, value)
+    return data
+
+
+@pytest.fixture
+def packet():
+    """Telemetry packet with distinct values in every field."""
+    return TelemetryPacket(
+        timestamp_ms=123456,
+        input_voltage_mv=13800,
+        temperature_c=-12,
+        total_current_ma=25000,
+        adc_values=[i * 200 for i in range(20)],
+        profet_states=[ChannelState(i % 8) for i in range(30)],
+        profet_duties=[i * 30 for i in range(30)],
+        hbridge_states=[1, 2, 3, 4],
+        hbridge_positions=[100, 200, 300, 400],
+        board_temp_2=41,
+        output_5v_mv=5010,
+        output_3v3_mv=3290,
+        flash_temp=38,
+        system_status=0x55,
+        fault_flags=FaultFlags.CAN1_ERROR | FaultFlags.OVERVOLTAGE,
+        digital_inputs=[i % 3 == 0 for i in range(20)],
+    )
+
+
+def _nucleo_bytes():
+    return (
+        struct.pack("<II", 9, 5000)
+        + bytes([0, 1, 6, 9] + [0] * 26)
+        + struct.pack("<20H", *range(100, 120))
+        + bytes([0b10100101])
+        + bytes(15)
+        + struct.pack("<HHhhBB", 12600, 4200, 355, 290, 2, 0x04)
+    )
+
+
+# ============================================================================
+# Full Format
+# ============================================================================
+
+class TestFullFormat:
+
+    def test_round_trip(self, packet):
+        raw = create_telemetry_bytes(packet) + _virtuals({200: 5, 300: -7})
+        parsed = parse_telemetry(raw)
+
+        assert parsed.timestamp_ms == 123456
+        assert parsed.temperature_c == -12
+        assert parsed.adc_values == packet.adc_values
+        assert parsed.profet_states == packet.profet_states
+        assert all(isinstance(s, ChannelState) for s in parsed.profet_states)
+        assert parsed.profet_duties == packet.profet_duties
+        assert parsed.hbridge_positions == [100, 200, 300, 400]
+        assert parsed.system_status == 0x55
+        assert parsed.fault_flags == FaultFlags.CAN1_ERROR | FaultFlags.OVERVOLTAGE
+        assert parsed.digital_inputs == [int(v) for v in packet.digital_inputs]
+        assert parsed.virtual_channels == {200: 5, 300: -7}
+
+    def test_flat(self, packet):
+        raw = create_telemetry_bytes(packet) + _virtuals({200: 5})
+        parsed = parse_telemetry(raw, flat=True)
+        reference = parse_telemetry(raw)
+
+        assert isinstance(parsed.adc_values, array)
+        assert isinstance(parsed.profet_states, array)
+        assert list(parsed.adc_values) == reference.adc_values
+        assert list(parsed.profet_states) == [int(s) for s in reference.profet_states]
+        assert list(parsed.profet_duties) == reference.profet_duties
+        assert list(parsed.hbridge_states) == reference.hbridge_states
+        assert list(parsed.hbridge_positions) == reference.hbridge_positions
+        assert parsed.fault_flags == reference.fault_flags
+        assert parsed.virtual_channels == reference.virtual_channels
+
+    def test_out_of_range_state(self, packet):
+        raw = bytearray(create_telemetry_bytes(packet))
+        raw[52] = 200
+        assert parse_telemetry(bytes(raw)).profet_states[0] == ChannelState.DISABLED
+
+    def test_truncated_virtuals(self, packet):
+        raw = create_telemetry_bytes(packet) + _virtuals({200: 1, 201: 2, 202: 3})
+        parsed = parse_telemetry(raw[:-3])
+        assert parsed.virtual_channels == {200: 1, 201: 2}
+
+    def test_too_short(self):
+        with pytest.raises(ValueError):
+            parse_telemetry(bytes(40))
+
+
+# ============================================================================
+# Nucleo Format
+# ============================================================================
+
+class TestNucleoFormat:
+
+    def test_parse(self):
+        parsed = parse_telemetry(_nucleo_bytes() + _virtuals({250: 42}))
+
+        assert parsed.timestamp_ms == 5000
+        assert parsed.profet_states[:4] == [
+            ChannelState.OFF, ChannelState.ON, ChannelState.PWM_ACTIVE, ChannelState.DISABLED
+        ]
+        assert parsed.adc_values == list(range(100, 120))
+        assert parsed.digital_inputs[:8] == [1, 0, 1, 0, 0, 1, 0, 1]
+        assert parsed.input_voltage_mv == 12600
+        assert parsed.total_current_ma == 4200
+        assert parsed.temperature_c == 355
+        assert parsed.board_temp_2 == 290
+        assert parsed.fault_flags == FaultFlags.OVERTEMPERATURE
+        assert parsed.virtual_channels == {250: 42}
+
+    def test_flat(self):
+        raw = _nucleo_bytes()
+        parsed = parse_telemetry(raw, flat=True)
+        assert list(parsed.profet_states[:4]) == [0, 1, 6, 9]
+        assert list(parsed.adc_values) == list(range(100, 120))
+        assert parsed.input_voltage_mv == 12600
+
+    def test_truncated(self):
+        raw = _nucleo_bytes()
+
+        parsed = parse_telemetry(raw[:100])
+        assert parsed.input_voltage_mv == 12600
+        assert parsed.temperature_c == 0
+        assert parsed.fault_flags == FaultFlags.NONE
+
+        parsed = parse_telemetry(raw[:97])
+        assert parsed.input_voltage_mv == 0
+        assert parsed.adc_values == list(range(100, 120))
@@ -0,0 +1,194 @@
+"""
+Unit Tests: Telemetry Pipeline
+
+Tests for controllers/telemetry_pipeline.py - background decode and fan-out.
+Covers:
+- Decoding on the worker thread, not the caller's
+- Latest-wins coalescing with per-subscriber field selection
+- Change-only delivery
+- Every-frame delivery for the data logger
+- DeviceController routing TELEMETRY_DATA through the pipeline
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from communication.protocol import MessageType
+from communication.telemetry import TelemetryPacket, create_telemetry_bytes
+from controllers import telemetry_pipeline
+from controllers.device_controller import DeviceController
+from controllers.telemetry_pipeline import FIELD_RECEIVED, TelemetryPipeline
+
+
+def payload(voltage_mv=12000, timestamp_ms=0, states=None):
+    packet = TelemetryPacket(timestamp_ms=timestamp_ms, input_voltage_mv=voltage_mv)
+    if states is not None:
+        packet.profet_states = states
+    return create_telemetry_bytes(packet)
+
+
+@pytest.fixture
+def pipeline(qapp):
+    pipe = TelemetryPipeline()
+    yield pipe
+    pipe.stop()
+
+
+class TestDelivery:
+    """Tests for coalesced delivery."""
+
+    def test_decoded_on_worker(self, pipeline, monkeypatch):
+        """Parsing happens on the pipeline thread."""
+        threads = []
+        parse = telemetry_pipeline.parse_telemetry
+
+        def recording_parse(data, flat=False):
+            threads.append(threading.current_thread())
+            return parse(data, flat)
+
+        monkeypatch.setattr(telemetry_pipeline, "parse_telemetry", recording_parse)
+        received = []
+        pipeline.subscribe(received.append, ['voltage_v'])
+        pipeline.submit(payload(12500))
+        assert pipeline.wait_idle()
+        pipeline.flush()
+
+        assert threads and threading.current_thread() not in threads
+        assert received == [{'voltage_v': 12.5, FIELD_RECEIVED: received[0][FIELD_RECEIVED]}]
+
+    def test_latest_wins(self, pipeline):
+        """Frames between refreshes collapse to the newest one."""
+        latest = []
+        pipeline.subscribe(latest.append, ['voltage_v', 'uptime_ms'])
+        for i in range(50):
+            pipeline.submit(payload(10000 + i, timestamp_ms=i))
+        assert pipeline.wait_idle()
+        pipeline.flush()
+
+        assert len(latest) == 1
+        assert latest[0]['uptime_ms'] == 49
+        assert latest[0]['voltage_v'] == pytest.approx(10.049)
+        assert pipeline.frames_decoded == 50
+
+    def test_every_frame(self, pipeline):
+        """every_frame subscribers get all frames in order."""
+        frames = []
+        pipeline.subscribe(frames.append, ['uptime_ms'], every_frame=True)
+        for i in range(20):
+            pipeline.submit(payload(timestamp_ms=i))
+        assert pipeline.wait_idle()
+        pipeline.flush()
+        pipeline.flush()
+
+        assert len(frames) == 1
+        assert [f['uptime_ms'] for f in frames[0]] == list(range(20))
+
+    def test_change_only(self, pipeline):
+        """Subscribers are skipped when none of their fields changed."""
+        voltage = []
+        uptime = []
+        pipeline.subscribe(voltage.append, ['voltage_v', 'channel_states'])
+        pipeline.subscribe(uptime.append, ['uptime_ms'])
+
+        for i in range(3):
+            pipeline.submit(payload(12000, timestamp_ms=i))
+            assert pipeline.wait_idle()
+            pipeline.flush()
+
+        assert len(voltage) == 1
+        assert voltage[0]['channel_states'] == [0] * 30
+        assert len(uptime) == 3
+
+        pipeline.reset_subscribers()
+        pipeline.submit(payload(12000, timestamp_ms=2))
+        assert pipeline.wait_idle()
+        pipeline.flush()
+        assert len(voltage) == 2
+
+    def test_unsubscribe(self, pipeline):
+        received = []
+        subscription = pipeline.subscribe(received.append, ['voltage_v'])
+        pipeline.unsubscribe(subscription)
+        pipeline.submit(payload())
+        assert pipeline.wait_idle()
+        pipeline.flush()
+        assert received == []
+
+    def test_unknown_field(self, pipeline):
+        with pytest.raises(ValueError):
+            pipeline.subscribe(print, ['voltage_v', 'warp_factor'])
+
+    def test_malformed_payload(self, pipeline):
+        """Short packets are counted and skipped."""
+        received = []
+        pipeline.subscribe(received.append, ['voltage_v'])
+        pipeline.submit(b"\x00" * 10)
+        assert pipeline.wait_idle()
+        pipeline.flush()
+        assert pipeline.decode_errors == 1
+        assert received == []
+
+    def test_subscriber_error_isolated(self, pipeline):
+        """A failing subscriber does not block the others."""
+        received = []
+
+        def broken(data):
+            raise RuntimeError("widget gone")
+
+        pipeline.subscribe(broken, ['voltage_v'])
+        pipeline.subscribe(received.append, ['voltage_v'])
+        pipeline.submit(payload())
+        assert pipeline.wait_idle()
+        pipeline.flush()
+        assert len(received) == 1
+
+
+class TestDeviceController:
+    """Tests for the controller hand-off."""
+
+    def test_telemetry_routed_to_pipeline(self, qapp):
+        controller = DeviceController()
+        received = []
+        controller.telemetry_pipeline.subscribe(received.append, ['voltage_v'])
+        try:
+            controller._handle_message(MessageType.TELEMETRY_DATA, payload(13800))
+            assert controller.telemetry_pipeline.wait_idle()
+            controller.telemetry_pipeline.flush()
+        finally:
+            controller.telemetry_pipeline.stop()
+
+        assert received[0]['voltage_v'] == pytest.approx(13.8)
+
+    def test_reconnect_redelivers_identical_telemetry(self, qapp):
+        """Displays cleared on disconnect are refilled by an unchanged frame."""
+        controller = DeviceController()
+        pipeline = controller.telemetry_pipeline
+        received = []
+        pipeline.subscribe(received.append, ['voltage_v'])
+        try:
+            for reconnect in (False, False, True):
+                if reconnect:
+                    controller._do_disconnect()
+                controller._handle_message(MessageType.TELEMETRY_DATA, payload(13800))
+                assert pipeline.wait_idle()
+                pipeline.flush()
+        finally:
+            pipeline.stop()
+
+        assert len(received) == 2
+        assert received[1]['voltage_v'] == pytest.approx(13.8)
+
+    def test_legacy_signal_still_emitted(self, qapp):
+        controller = DeviceController()
+        packets = []
+        controller.telemetry_received.connect(packets.append)
+        try:
+            controller._handle_message(MessageType.TELEMETRY_DATA, payload(13800))
+        finally:
+            controller.telemetry_pipeline.stop()
+        assert packets[0].input_voltage_mv == 13800
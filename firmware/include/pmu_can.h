@@ -61,6 +61,27 @@ typedef struct {
     uint8_t enable_termination; /* Enable built-in 120Ω termination */
 } PMU_CAN_BusConfig_t;
 
+/**
+ * @brief Precompiled signal extraction plan
+ *
+ * Built once when a signal map or CAN Input is added, so decoding a frame
+ * is a fixed load, shift and mask with no per-frame format decisions.
+ * Byte-aligned 8/16/32-bit fields get a direct load. The configurator's
+ * CAN monitor (utils/can_extract.py) compiles the same plan.
+ */
+typedef struct {
+    uint64_t mask;              /* Mask applied after the shift */
+    int32_t multiplier;         /* Integer scaling (when exact): */
+    int32_t divider;            /*   value = (raw * multiplier + offset * divider) / divider */
+    int32_t offset;
+    uint8_t kind;               /* Load strategy (direct, generic LE/BE, bit-by-bit) */
+    uint8_t byte_offset;        /* First data byte (start bit for bit-by-bit) */
+    uint8_t byte_count;         /* Bytes loaded (buffer size for bit-by-bit) */
+    uint8_t shift;              /* Right shift after the load */
+    uint8_t bit_length;         /* Signal length in bits */
+    uint8_t flags;              /* Signed / IEEE float / integer scaling / Motorola */
+} PMU_CAN_ExtractPlan_t;
+
 /**
  * @brief CAN signal mapping (for DBC support)
  */
@@ -75,6 +96,7 @@ typedef struct {
     uint16_t virtual_channel;   /* Target virtual channel */
     uint32_t timeout_ms;        /* Signal timeout in ms */
     uint32_t last_update_ms;    /* Last update timestamp */
+    PMU_CAN_ExtractPlan_t plan; /* Extraction plan (built by PMU_CAN_AddSignalMap) */
 } PMU_CAN_SignalMap_t;
 
 /**
@@ -145,6 +167,7 @@ typedef struct {
     uint8_t timeout_flag;               /* Signal timeout flag */
     /* Linked message pointer (resolved at runtime) */
     PMU_CAN_MessageObject_t* message_ptr;  /* Pointer to parent message */
+    PMU_CAN_ExtractPlan_t plan;         /* Extraction plan (built by PMU_CAN_AddInput) */
 } PMU_CAN_Input_t;
 
 /* Exported constants --------------------------------------------------------*/
@@ -38,7 +38,9 @@ extern "C" {
 /* Exported constants --------------------------------------------------------*/
 
 /** Maximum virtual channels that can be processed */
+#ifndef PMU_EXEC_MAX_CHANNELS
 #define PMU_EXEC_MAX_CHANNELS       16  /* Reduced from 128 for debugging */
+#endif
 
 /* Channel types (mirrors ChannelType_t from shared library) */
 #define PMU_EXEC_TYPE_POWER_OUTPUT  0x10  /* Power output with source linking */
@@ -90,6 +92,19 @@ HAL_StatusTypeDef PMU_ChannelExec_AddOutputLink(
     uint8_t hw_index
 );
 
+/**
+ * @brief Replace a channel's config in place (same type) and restart it
+ * @param channel_id    Channel ID to update
+ * @param type          Channel type, must match the existing channel
+ * @param config        Pointer to type-specific config (copied)
+ * @retval HAL_OK on success, HAL_ERROR if not found or the type differs
+ */
+HAL_StatusTypeDef PMU_ChannelExec_UpdateChannel(
+    uint16_t channel_id,
+    uint8_t type,
+    const void* config
+);
+
 /**
  * @brief Remove a channel from the executor
  * @param channel_id    Channel ID to remove
@@ -146,8 +161,13 @@ uint16_t PMU_ChannelExec_GetChannelCount(void);
  * @brief Get execution statistics
  * @param exec_count    Output: number of executions
  * @param last_exec_us  Output: last execution time in microseconds
+ * @param max_exec_us   Output: worst-case execution time since the last
+ *                      config load/clear, in microseconds
+ *
+ * Any output pointer may be NULL.
  */
-void PMU_ChannelExec_GetStats(uint32_t* exec_count, uint32_t* last_exec_us);
+void PMU_ChannelExec_GetStats(uint32_t* exec_count, uint32_t* last_exec_us,
+                              uint32_t* max_exec_us);
 
 /**
  * @brief Get channel data for telemetry
@@ -29,6 +29,7 @@ extern "C" {
 #define MIN_CMD_CLEAR_CONFIG_ACK  0x17
 #define MIN_CMD_LOAD_BINARY       0x18
 #define MIN_CMD_BINARY_ACK        0x19
+#define MIN_CMD_LOAD_BINARY_LZ    0x1A  /* LOAD_BINARY with LZ-compressed data */
 #define MIN_CMD_START_STREAM      0x20
 #define MIN_CMD_STOP_STREAM       0x21
 #define MIN_CMD_DATA              0x22
@@ -36,6 +37,8 @@ extern "C" {
 #define MIN_CMD_OUTPUT_ACK        0x29
 #define MIN_CMD_GET_CAPABILITIES  0x30
 #define MIN_CMD_CAPABILITIES      0x31
+#define MIN_CMD_SET_CHANNEL_CONFIG 0x36  /* Atomic single channel update/remove */
+#define MIN_CMD_CHANNEL_CONFIG_ACK 0x37
 #define MIN_CMD_CAN_INJECT        0x40  /* Inject CAN message for testing */
 #define MIN_CMD_CAN_INJECT_ACK    0x41
 #define MIN_CMD_ACK               0x3E
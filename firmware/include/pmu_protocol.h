@@ -89,6 +89,7 @@ typedef enum {
     PMU_CMD_CHANNEL_CONFIG_ACK  = 0x67,  /**< Channel config update response */
     PMU_CMD_LOAD_BINARY_CONFIG  = 0x68,  /**< Load binary configuration (chunked) */
     PMU_CMD_BINARY_CONFIG_ACK   = 0x69,  /**< Binary config acknowledgment */
+    PMU_CMD_LOAD_BINARY_CONFIG_LZ = 0x6A,  /**< Load LZ-compressed binary configuration (chunked) */
 
     /* Device restart (0x70-0x7F) */
     PMU_CMD_RESET               = 0x70,  /**< Reset/restart device */
@@ -58,6 +58,7 @@ typedef enum {
     ST_CMD_CLEAR_CONFIG_ACK = 0x17,
     ST_CMD_LOAD_BINARY      = 0x18,
     ST_CMD_BINARY_ACK       = 0x19,
+    ST_CMD_LOAD_BINARY_LZ   = 0x1A,
 
     /* Telemetry */
     ST_CMD_START_STREAM     = 0x20,
@@ -29,6 +29,7 @@ extern "C" {
 #define ST_CMD_CLEAR_CONFIG_ACK  0x17
 #define ST_CMD_LOAD_BINARY       0x18
 #define ST_CMD_BINARY_ACK        0x19
+#define ST_CMD_LOAD_BINARY_LZ    0x1A  /* LOAD_BINARY with LZ-compressed data */
 #define ST_CMD_START_STREAM      0x20
 #define ST_CMD_STOP_STREAM       0x21
 #define ST_CMD_DATA              0x22
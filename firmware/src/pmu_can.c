@@ -18,6 +18,16 @@
  * - Signal timeout detection
  * - Bus statistics and monitoring
  *
+ * Each signal is compiled into an extraction plan when it is added (byte
+ * offset, shift, mask, sign extension, integer scaling where exact), with a
+ * direct load for byte-aligned 8/16/32-bit fields.
+ *
+ * Receive dispatch is indexed: legacy signal maps are kept sorted by CAN ID
+ * per bus, message objects are found through a sorted (bus, CAN ID) table,
+ * and each message's inputs form one contiguous run, so a frame costs a
+ * binary search plus the signals it actually carries. Timeouts are kept in
+ * deadline min-heaps and only the expired entries are visited each update.
+ *
  ******************************************************************************
  */
 
@@ -38,11 +48,25 @@ typedef struct {
     FDCAN_HandleTypeDef* hfdcan;        /* FDCAN handle (or NULL for classic CAN) */
     PMU_CAN_BusConfig_t config;         /* Bus configuration */
     PMU_CAN_Statistics_t stats;         /* Bus statistics */
-    PMU_CAN_SignalMap_t signal_maps[PMU_CAN_MAX_SIGNAL_MAPS];  /* Signal mappings */
+    PMU_CAN_SignalMap_t signal_maps[PMU_CAN_MAX_SIGNAL_MAPS];  /* Signal mappings, sorted by CAN ID */
     uint16_t signal_count;              /* Number of active signal mappings */
     uint8_t is_initialized;             /* Initialization flag */
+    /* Signal timeout min-heap (slots into signal_maps) */
+    uint32_t signal_deadline[PMU_CAN_MAX_SIGNAL_MAPS];
+    uint16_t signal_heap[PMU_CAN_MAX_SIGNAL_MAPS];
+    uint16_t signal_heap_count;
+    uint8_t signal_heap_valid;          /* 0 = rebuild before next timeout check */
 } PMU_CAN_BusState_t;
 
+/**
+ * @brief Receive index entry: one enabled-or-not message object
+ */
+typedef struct {
+    uint32_t can_id;                    /* Message base ID */
+    uint16_t message_slot;              /* Slot in message_objects[] */
+    uint8_t bus;                        /* CAN bus */
+} CAN_RxIndexEntry_t;
+
 /* Private define ------------------------------------------------------------*/
 
 /* Byte order constants */
@@ -57,6 +81,26 @@ static const uint8_t can_format_bit_lengths[] = {
     [PMU_CAN_DATA_FORMAT_CUSTOM] = 0,  /* Use explicit bit_length */
 };
 
+/* Extraction plan load strategies (PMU_CAN_ExtractPlan_t.kind) */
+#define CAN_PLAN_U8              0   /* One byte */
+#define CAN_PLAN_LE16            1   /* Byte-aligned 16-bit, Intel */
+#define CAN_PLAN_BE16            2   /* Byte-aligned 16-bit, Motorola */
+#define CAN_PLAN_LE32            3   /* Byte-aligned 32-bit, Intel */
+#define CAN_PLAN_BE32            4   /* Byte-aligned 32-bit, Motorola */
+#define CAN_PLAN_LE              5   /* byte_count bytes Intel, then shift and mask */
+#define CAN_PLAN_BE              6   /* byte_count bytes Motorola, then shift and mask */
+#define CAN_PLAN_BITS            7   /* Spans more than 8 bytes: CAN_ExtractRawBits() */
+
+/* Extraction plan flags (PMU_CAN_ExtractPlan_t.flags) */
+#define CAN_PLAN_SIGNED          0x01  /* Sign-extend from bit_length */
+#define CAN_PLAN_FLOAT           0x02  /* 32-bit IEEE 754 value */
+#define CAN_PLAN_INT_SCALE       0x04  /* Scaling is exact in integers */
+#define CAN_PLAN_MOTOROLA        0x08  /* Byte order (for CAN_PLAN_BITS) */
+
+/* Largest |multiplier|, |divider|, |offset| for integer scaling; keeps
+ * raw * multiplier + offset * divider well inside int64 for 32-bit fields */
+#define CAN_PLAN_INT_SCALE_MAX   65536
+
 /* Private macro -------------------------------------------------------------*/
 
 /* Bus validation macros */
@@ -87,26 +131,134 @@ static uint16_t message_object_count = 0;
 static PMU_CAN_Input_t can_inputs[PMU_CAN_MAX_INPUTS];
 static uint16_t can_input_count = 0;
 
+/* Receive index, sorted by (bus, CAN ID, slot); rebuilt lazily after any
+ * message object or input change */
+static CAN_RxIndexEntry_t rx_index[PMU_CAN_MAX_MESSAGE_OBJECTS];
+static uint16_t rx_index_bus_first[PMU_CAN_BUS_COUNT + 1];  /* Per-bus range in rx_index */
+static uint16_t rx_input_order[PMU_CAN_MAX_INPUTS];         /* Input slots grouped by message */
+static uint16_t rx_input_first[PMU_CAN_MAX_MESSAGE_OBJECTS];
+static uint16_t rx_input_count[PMU_CAN_MAX_MESSAGE_OBJECTS];
+static uint8_t rx_index_valid = 0;
+
+/* Message timeout min-heap (slots into message_objects) */
+static uint32_t message_deadline[PMU_CAN_MAX_MESSAGE_OBJECTS];
+static uint16_t message_heap[PMU_CAN_MAX_MESSAGE_OBJECTS];
+static uint16_t message_heap_count = 0;
+
 /* Private function prototypes -----------------------------------------------*/
 static HAL_StatusTypeDef CAN_InitBus(PMU_CAN_Bus_t bus);
 static void CAN_ProcessRxMessage(PMU_CAN_Bus_t bus, PMU_CAN_Message_t* msg);
 static void CAN_ParseSignals(PMU_CAN_Bus_t bus, PMU_CAN_Message_t* msg);
-static float CAN_ExtractSignal(uint8_t* data, PMU_CAN_SignalMap_t* signal);
 static void CAN_CheckTimeouts(PMU_CAN_Bus_t bus);
 static uint8_t CAN_BytesToDLC(uint8_t bytes);
 static uint8_t CAN_DLCToBytes(uint8_t dlc);
 
 /* Two-level architecture helpers */
-static float CAN_ExtractInputValue(PMU_CAN_Input_t* input, uint8_t* data);
+static void CAN_CompileInputPlan(PMU_CAN_Input_t* input);
 static PMU_CAN_MessageObject_t* CAN_FindMessageByCanId(PMU_CAN_Bus_t bus, uint32_t can_id);
+static void CAN_RebuildRxIndex(void);
+
+/* Deadline heap helpers */
+static void CAN_HeapPush(uint32_t* deadline, uint16_t* slot, uint16_t* count,
+                         uint16_t new_slot, uint32_t new_deadline);
+static void CAN_HeapSiftDown(uint32_t* deadline, uint16_t* slot, uint16_t count,
+                             uint16_t pos);
 
 /* Shared bit extraction helper */
 static uint64_t CAN_ExtractRawBits(const uint8_t* data, uint8_t start_bit,
                                     uint8_t bit_length, uint8_t byte_order,
                                     uint8_t max_bytes);
 
+/* Extraction plans */
+static void CAN_CompilePlan(PMU_CAN_ExtractPlan_t* plan, uint8_t start_bit,
+                            uint8_t bit_length, uint8_t byte_order, uint8_t flags,
+                            uint8_t max_bytes, float multiplier, float divider,
+                            float offset);
+static int32_t CAN_DecodePlan(const PMU_CAN_ExtractPlan_t* plan, const uint8_t* data,
+                              float multiplier, float divider, float offset,
+                              float* value);
+
 /* Private user code ---------------------------------------------------------*/
 
+/**
+ * @brief Deadline comparison that survives tick counter wrap-around
+ * @retval Non-zero if deadline a is before deadline b
+ */
+static inline uint8_t CAN_DeadlineBefore(uint32_t a, uint32_t b)
+{
+    return (int32_t)(a - b) < 0;
+}
+
+/**
+ * @brief First deadline for an entry last seen at tick last
+ *
+ * Already overdue entries are due now: last + timeout may be more than
+ * 2^31 ms in the past (e.g. never received, last = 0) and would then
+ * compare as a future deadline.
+ */
+static inline uint32_t CAN_SeedDeadline(uint32_t last, uint32_t timeout_ms)
+{
+    return (system_tick_ms - last > timeout_ms) ? system_tick_ms : last + timeout_ms;
+}
+
+/**
+ * @brief Push an entry onto a deadline min-heap
+ * @param deadline Heap deadlines
+ * @param slot Heap slots (parallel to deadline)
+ * @param count Heap size, incremented
+ * @param new_slot Slot to add
+ * @param new_deadline Its deadline
+ */
+static void CAN_HeapPush(uint32_t* deadline, uint16_t* slot, uint16_t* count,
+                         uint16_t new_slot, uint32_t new_deadline)
+{
+    uint16_t pos = (*count)++;
+
+    while (pos > 0) {
+        uint16_t parent = (pos - 1) / 2;
+        if (!CAN_DeadlineBefore(new_deadline, deadline[parent])) {
+            break;
+        }
+        deadline[pos] = deadline[parent];
+        slot[pos] = slot[parent];
+        pos = parent;
+    }
+    deadline[pos] = new_deadline;
+    slot[pos] = new_slot;
+}
+
+/**
+ * @brief Restore the heap order below pos after its deadline moved later
+ * @param deadline Heap deadlines
+ * @param slot Heap slots (parallel to deadline)
+ * @param count Heap size
+ * @param pos Entry whose deadline increased
+ */
+static void CAN_HeapSiftDown(uint32_t* deadline, uint16_t* slot, uint16_t count,
+                             uint16_t pos)
+{
+    uint32_t moving_deadline = deadline[pos];
+    uint16_t moving_slot = slot[pos];
+
+    for (;;) {
+        uint16_t child = 2 * pos + 1;
+        if (child >= count) {
+            break;
+        }
+        if (child + 1 < count && CAN_DeadlineBefore(deadline[child + 1], deadline[child])) {
+            child++;
+        }
+        if (!CAN_DeadlineBefore(deadline[child], moving_deadline)) {
+            break;
+        }
+        deadline[pos] = deadline[child];
+        slot[pos] = slot[child];
+        pos = child;
+    }
+    deadline[pos] = moving_deadline;
+    slot[pos] = moving_slot;
+}
+
 /**
  * @brief Extract raw bits from CAN data buffer
  * @param data CAN data bytes
@@ -127,7 +279,7 @@ static uint64_t CAN_ExtractRawBits(const uint8_t* data, uint8_t start_bit,
     if (byte_order == CAN_BYTE_ORDER_INTEL) {
         /* Intel/Little endian (LSB first) */
         uint8_t bytes_needed = (bit_length + start_bit_in_byte + 7) / 8;
-        for (uint8_t i = 0; i < bytes_needed && (start_byte + i) < max_bytes; i++) {
+        for (uint8_t i = 0; i < bytes_needed && i < 8 && (start_byte + i) < max_bytes; i++) {
             raw_value |= ((uint64_t)data[start_byte + i] << (i * 8));
         }
         raw_value >>= start_bit_in_byte;
@@ -166,6 +318,206 @@ static uint64_t CAN_ExtractRawBits(const uint8_t* data, uint8_t start_bit,
     return raw_value;
 }
 
+/**
+ * @brief Compile a signal's layout and scaling into an extraction plan
+ *
+ * Decoding with the plan gives the same raw bits as CAN_ExtractRawBits(),
+ * including signals cut off by the end of the buffer.
+ *
+ * @param plan Plan to fill
+ * @param start_bit Start bit (Intel: LSB, Motorola: MSB, DBC numbering)
+ * @param bit_length Number of bits
+ * @param byte_order 0=Intel/LSB, 1=Motorola/MSB
+ * @param flags CAN_PLAN_SIGNED and/or CAN_PLAN_FLOAT
+ * @param max_bytes Data buffer size (8 for CAN, 64 for CAN FD)
+ * @param multiplier Scale multiplier
+ * @param divider Scale divider (0 = none)
+ * @param offset Offset added after scaling
+ */
+static void CAN_CompilePlan(PMU_CAN_ExtractPlan_t* plan, uint8_t start_bit,
+                            uint8_t bit_length, uint8_t byte_order, uint8_t flags,
+                            uint8_t max_bytes, float multiplier, float divider,
+                            float offset)
+{
+    uint8_t start_byte = start_bit / 8;
+    uint8_t start_bit_in_byte = start_bit % 8;
+    uint8_t available = (start_byte < max_bytes) ? (uint8_t)(max_bytes - start_byte) : 0;
+    uint8_t needed;
+
+    memset(plan, 0, sizeof(*plan));
+    plan->bit_length = bit_length;
+    plan->byte_offset = start_byte;
+    plan->mask = CAN_CREATE_MASK(bit_length);
+
+    if (flags & CAN_PLAN_FLOAT) {
+        /* Only a 32-bit field holds an IEEE float; others decode as unsigned */
+        flags = (bit_length == 32) ? CAN_PLAN_FLOAT : 0;
+    }
+    if ((flags & CAN_PLAN_SIGNED) && (bit_length == 0 || bit_length > 64)) {
+        flags &= (uint8_t)~CAN_PLAN_SIGNED;
+    }
+
+    if (byte_order == CAN_BYTE_ORDER_INTEL) {
+        needed = (uint8_t)((bit_length + start_bit_in_byte + 7) / 8);
+        plan->kind = CAN_PLAN_LE;
+        plan->byte_count = (needed < available) ? needed : available;
+        plan->shift = start_bit_in_byte;
+
+        if (start_bit_in_byte == 0 && plan->byte_count == needed) {
+            if (bit_length == 8) plan->kind = CAN_PLAN_U8;
+            if (bit_length == 16) plan->kind = CAN_PLAN_LE16;
+            if (bit_length == 32) plan->kind = CAN_PLAN_LE32;
+        }
+    } else {
+        /* MSB at start_bit_in_byte of the first byte, continuing into the
+         * following bytes; the first byte is always read */
+        uint8_t first_bits = start_bit_in_byte + 1;
+        needed = (bit_length <= first_bits) ? 1 :
+                 (uint8_t)(1 + (bit_length - first_bits + 7) / 8);
+        if (available == 0) {
+            available = 1;
+        }
+        flags |= CAN_PLAN_MOTOROLA;
+        plan->kind = CAN_PLAN_BE;
+
+        if (needed <= available) {
+            plan->byte_count = needed;
+            plan->shift = (uint8_t)(8 * needed - 7 + start_bit_in_byte - bit_length);
+        } else {
+            /* Cut off by the end of the buffer: the bits that are there */
+            uint8_t present = (uint8_t)(first_bits + 8 * (available - 1));
+            plan->byte_count = available;
+            plan->shift = 0;
+            if (present < bit_length) {
+                plan->mask = CAN_CREATE_MASK(present);
+            }
+        }
+
+        if (start_bit_in_byte == 7 && plan->byte_count == needed) {
+            if (bit_length == 8) plan->kind = CAN_PLAN_U8;
+            if (bit_length == 16) plan->kind = CAN_PLAN_BE16;
+            if (bit_length == 32) plan->kind = CAN_PLAN_BE32;
+        }
+    }
+
+    if (needed > 8) {
+        /* Wider than one 64-bit load: keep the bit-by-bit extraction */
+        plan->kind = CAN_PLAN_BITS;
+        plan->byte_offset = start_bit;
+        plan->byte_count = max_bytes;
+        plan->shift = 0;
+    }
+
+    /* Integer scaling when multiplier, divider and offset are whole numbers */
+    float divisor = (divider != 0.0f) ? divider : 1.0f;
+    if (!(flags & CAN_PLAN_FLOAT) && bit_length <= 32 &&
+        fabsf(multiplier) <= CAN_PLAN_INT_SCALE_MAX &&
+        fabsf(divisor) <= CAN_PLAN_INT_SCALE_MAX &&
+        fabsf(offset) <= CAN_PLAN_INT_SCALE_MAX &&
+        multiplier == (float)(int32_t)multiplier &&
+        divisor == (float)(int32_t)divisor &&
+        offset == (float)(int32_t)offset) {
+        flags |= CAN_PLAN_INT_SCALE;
+        plan->multiplier = (int32_t)multiplier;
+        plan->divider = (int32_t)divisor;
+        plan->offset = (int32_t)offset;
+    }
+
+    plan->flags = flags;
+}
+
+/**
+ * @brief Load a signal's raw bits with its extraction plan
+ * @param plan Compiled plan
+ * @param data Data buffer the plan was compiled for
+ * @retval Raw value (not sign-extended or scaled)
+ */
+static inline uint64_t CAN_PlanLoad(const PMU_CAN_ExtractPlan_t* plan, const uint8_t* data)
+{
+    const uint8_t* p = &data[plan->byte_offset];
+    uint64_t raw = 0;
+
+    switch (plan->kind) {
+        case CAN_PLAN_U8:
+            return p[0];
+        case CAN_PLAN_LE16:
+            return (uint64_t)p[0] | ((uint64_t)p[1] << 8);
+        case CAN_PLAN_BE16:
+            return ((uint64_t)p[0] << 8) | (uint64_t)p[1];
+        case CAN_PLAN_LE32:
+            return (uint64_t)p[0] | ((uint64_t)p[1] << 8) |
+                   ((uint64_t)p[2] << 16) | ((uint64_t)p[3] << 24);
+        case CAN_PLAN_BE32:
+            return ((uint64_t)p[0] << 24) | ((uint64_t)p[1] << 16) |
+                   ((uint64_t)p[2] << 8) | (uint64_t)p[3];
+        case CAN_PLAN_LE:
+            for (uint8_t i = 0; i < plan->byte_count; i++) {
+                raw |= (uint64_t)p[i] << (i * 8);
+            }
+            return (raw >> plan->shift) & plan->mask;
+        case CAN_PLAN_BE:
+            for (uint8_t i = 0; i < plan->byte_count; i++) {
+                raw = (raw << 8) | p[i];
+            }
+            return (raw >> plan->shift) & plan->mask;
+        default:
+            return CAN_ExtractRawBits(data, plan->byte_offset, plan->bit_length,
+                                      (plan->flags & CAN_PLAN_MOTOROLA) ?
+                                          CAN_BYTE_ORDER_MOTOROLA : CAN_BYTE_ORDER_INTEL,
+                                      plan->byte_count);
+    }
+}
+
+/**
+ * @brief Decode a signal with its extraction plan
+ * @param plan Compiled plan
+ * @param data Data buffer the plan was compiled for
+ * @param multiplier Scale multiplier (float scaling path)
+ * @param divider Scale divider, 0 = none (float scaling path)
+ * @param offset Offset (float scaling path)
+ * @param value Scaled value
+ * @retval Virtual channel value (scaled value truncated toward zero)
+ */
+static int32_t CAN_DecodePlan(const PMU_CAN_ExtractPlan_t* plan, const uint8_t* data,
+                              float multiplier, float divider, float offset,
+                              float* value)
+{
+    uint64_t raw = CAN_PlanLoad(plan, data);
+
+    if (plan->flags & CAN_PLAN_SIGNED) {
+        uint64_t sign = 1ULL << (plan->bit_length - 1);
+        raw = (raw ^ sign) - sign;
+    }
+
+    if (plan->flags & CAN_PLAN_INT_SCALE) {
+        int64_t scaled = (int64_t)raw * plan->multiplier +
+                         (int64_t)plan->offset * plan->divider;
+        *value = (float)scaled / (float)plan->divider;
+        return (int32_t)(scaled / plan->divider);
+    }
+
+    float v;
+    if (plan->flags & CAN_PLAN_FLOAT) {
+        union { uint32_t u; float f; } conv;
+        conv.u = (uint32_t)raw;
+        v = conv.f;
+    } else if (plan->flags & CAN_PLAN_SIGNED) {
+        v = (float)((int64_t)raw);
+    } else {
+        v = (float)raw;
+    }
+
+    /* Apply scaling: value = raw * multiplier / divider + offset */
+    if (divider != 0.0f) {
+        v = v * multiplier / divider + offset;
+    } else {
+        v = v * multiplier + offset;
+    }
+
+    *value = v;
+    return (int32_t)v;
+}
+
 /**
  * @brief Initialize CAN bus driver
  * @retval HAL status
@@ -527,54 +879,36 @@ static void CAN_ProcessRxMessage(PMU_CAN_Bus_t bus, PMU_CAN_Message_t* msg)
  */
 static void CAN_ParseSignals(PMU_CAN_Bus_t bus, PMU_CAN_Message_t* msg)
 {
-    /* Iterate through signal mappings */
-    for (uint16_t i = 0; i < can_buses[bus].signal_count; i++) {
-        PMU_CAN_SignalMap_t* signal = &can_buses[bus].signal_maps[i];
-
-        /* Check if this signal is in this message */
-        if (signal->can_id == msg->id) {
-            /* Extract signal value */
-            float value = CAN_ExtractSignal(msg->data, signal);
-
-            /* Update virtual channel */
-            PMU_Logic_SetVChannel(signal->virtual_channel, (int32_t)value);
-
-            /* Update timestamp */
-            signal->last_update_ms = system_tick_ms;
+    PMU_CAN_SignalMap_t* signals = can_buses[bus].signal_maps;
+    uint16_t count = can_buses[bus].signal_count;
+
+    /* Signal maps are sorted by CAN ID: find the first one for this message */
+    uint16_t lo = 0;
+    uint16_t hi = count;
+    while (lo < hi) {
+        uint16_t mid = (uint16_t)((lo + hi) / 2);
+        if (signals[mid].can_id < msg->id) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
         }
     }
-}
 
-/**
- * @brief Extract signal value from CAN data
- * @param data CAN data bytes
- * @param signal Signal mapping
- * @retval Extracted and scaled value
- */
-static float CAN_ExtractSignal(uint8_t* data, PMU_CAN_SignalMap_t* signal)
-{
-    /* Use shared bit extraction helper */
-    uint64_t raw_value = CAN_ExtractRawBits(data, signal->start_bit,
-                                             signal->length_bits,
-                                             signal->byte_order, 8);
-
-    /* Convert to signed if needed */
-    float value;
-    if (signal->value_type == 1) {  /* Signed */
-        uint64_t mask = CAN_CREATE_MASK(signal->length_bits);
-        /* Sign extend if MSB is set */
-        if (raw_value & (1ULL << (signal->length_bits - 1))) {
-            raw_value |= ~mask;
-        }
-        value = (float)((int64_t)raw_value);
-    } else {  /* Unsigned or float */
-        value = (float)raw_value;
-    }
+    /* Decode the contiguous run of signals carried by this message */
+    for (uint16_t i = lo; i < count && signals[i].can_id == msg->id; i++) {
+        PMU_CAN_SignalMap_t* signal = &signals[i];
+
+        /* Extract signal value */
+        float value;
+        int32_t channel_value = CAN_DecodePlan(&signal->plan, msg->data, signal->scale,
+                                               0.0f, signal->offset, &value);
 
-    /* Apply scale and offset */
-    value = value * signal->scale + signal->offset;
+        /* Update virtual channel */
+        PMU_Logic_SetVChannel(signal->virtual_channel, channel_value);
 
-    return value;
+        /* Update timestamp (the timeout heap picks it up lazily) */
+        signal->last_update_ms = system_tick_ms;
+    }
 }
 
 /**
@@ -583,17 +917,41 @@ static float CAN_ExtractSignal(uint8_t* data, PMU_CAN_SignalMap_t* signal)
  */
 static void CAN_CheckTimeouts(PMU_CAN_Bus_t bus)
 {
-    for (uint16_t i = 0; i < can_buses[bus].signal_count; i++) {
-        PMU_CAN_SignalMap_t* signal = &can_buses[bus].signal_maps[i];
-
-        /* Check if timeout enabled and exceeded */
-        if (signal->timeout_ms > 0) {
-            uint32_t elapsed = system_tick_ms - signal->last_update_ms;
-            if (elapsed > signal->timeout_ms) {
-                /* TODO: Set virtual channel to fault/default value */
-                /* Or trigger fault handler */
+    PMU_CAN_BusState_t* state = &can_buses[bus];
+
+    /* Signal maps changed: rebuild the heap from their current deadlines */
+    if (!state->signal_heap_valid) {
+        state->signal_heap_count = 0;
+        for (uint16_t i = 0; i < state->signal_count; i++) {
+            PMU_CAN_SignalMap_t* signal = &state->signal_maps[i];
+            if (signal->timeout_ms > 0) {
+                CAN_HeapPush(state->signal_deadline, state->signal_heap,
+                             &state->signal_heap_count, i,
+                             CAN_SeedDeadline(signal->last_update_ms, signal->timeout_ms));
             }
         }
+        state->signal_heap_valid = 1;
+    }
+
+    /* Heap deadlines never run ahead of the real ones (reception only moves
+     * them later), so only entries at the top can have expired */
+    while (state->signal_heap_count > 0 &&
+           CAN_DeadlineBefore(state->signal_deadline[0], system_tick_ms)) {
+        PMU_CAN_SignalMap_t* signal = &state->signal_maps[state->signal_heap[0]];
+        uint32_t elapsed = system_tick_ms - signal->last_update_ms;
+
+        if (elapsed > signal->timeout_ms) {
+            /* TODO: Set virtual channel to fault/default value */
+            /* Or trigger fault handler */
+
+            /* Look again one timeout later while the signal stays silent */
+            state->signal_deadline[0] = system_tick_ms + signal->timeout_ms;
+        } else {
+            /* Received since this deadline was set */
+            state->signal_deadline[0] = signal->last_update_ms + signal->timeout_ms;
+        }
+        CAN_HeapSiftDown(state->signal_deadline, state->signal_heap,
+                         state->signal_heap_count, 0);
     }
 }
 
@@ -612,17 +970,30 @@ HAL_StatusTypeDef PMU_CAN_AddSignalMap(PMU_CAN_Bus_t bus, PMU_CAN_SignalMap_t* s
         return HAL_ERROR;  /* No space */
     }
 
+    /* Keep maps sorted by CAN ID (after existing maps with the same ID) */
+    uint16_t pos = can_buses[bus].signal_count;
+    while (pos > 0 && can_buses[bus].signal_maps[pos - 1].can_id > signal->can_id) {
+        pos--;
+    }
+    memmove(&can_buses[bus].signal_maps[pos + 1], &can_buses[bus].signal_maps[pos],
+            (can_buses[bus].signal_count - pos) * sizeof(PMU_CAN_SignalMap_t));
+
     /* Copy signal mapping */
-    memcpy(&can_buses[bus].signal_maps[can_buses[bus].signal_count],
-           signal, sizeof(PMU_CAN_SignalMap_t));
+    memcpy(&can_buses[bus].signal_maps[pos], signal, sizeof(PMU_CAN_SignalMap_t));
 
     /* Set default timeout if not specified */
     if (signal->timeout_ms == 0) {
-        can_buses[bus].signal_maps[can_buses[bus].signal_count].timeout_ms =
-            PMU_CAN_SIGNAL_TIMEOUT_MS;
+        can_buses[bus].signal_maps[pos].timeout_ms = PMU_CAN_SIGNAL_TIMEOUT_MS;
     }
 
+    /* Compile extraction (value_type 1 = signed; 2 = float decodes as unsigned, as before) */
+    CAN_CompilePlan(&can_buses[bus].signal_maps[pos].plan, signal->start_bit,
+                    signal->length_bits, signal->byte_order,
+                    (signal->value_type == 1) ? CAN_PLAN_SIGNED : 0, 8,
+                    signal->scale, 0.0f, signal->offset);
+
     can_buses[bus].signal_count++;
+    can_buses[bus].signal_heap_valid = 0;
     return HAL_OK;
 }
 
@@ -650,6 +1021,7 @@ HAL_StatusTypeDef PMU_CAN_RemoveSignalMap(PMU_CAN_Bus_t bus, uint32_t can_id, ui
             }
 
             can_buses[bus].signal_count--;
+            can_buses[bus].signal_heap_valid = 0;
             return HAL_OK;
         }
     }
@@ -666,6 +1038,7 @@ HAL_StatusTypeDef PMU_CAN_ClearSignalMaps(PMU_CAN_Bus_t bus)
 {
     CAN_VALIDATE_BUS(bus);
     can_buses[bus].signal_count = 0;
+    can_buses[bus].signal_heap_valid = 0;
     return HAL_OK;
 }
 
@@ -755,86 +1128,146 @@ static uint8_t CAN_BytesToDLC(uint8_t bytes)
  */
 static PMU_CAN_MessageObject_t* CAN_FindMessageByCanId(PMU_CAN_Bus_t bus, uint32_t can_id)
 {
-    for (uint16_t i = 0; i < message_object_count; i++) {
-        if (message_objects[i].can_bus == bus &&
-            message_objects[i].base_id == can_id &&
-            message_objects[i].enabled) {
-            return &message_objects[i];
+    if (bus >= PMU_CAN_BUS_COUNT) {
+        return NULL;
+    }
+    if (!rx_index_valid) {
+        CAN_RebuildRxIndex();
+    }
+
+    /* Lower bound of can_id within this bus's range */
+    uint16_t lo = rx_index_bus_first[bus];
+    uint16_t hi = rx_index_bus_first[bus + 1];
+    uint16_t end = hi;
+    while (lo < hi) {
+        uint16_t mid = (uint16_t)((lo + hi) / 2);
+        if (rx_index[mid].can_id < can_id) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+
+    /* Equal IDs are in slot order: the first enabled one wins, as before */
+    for (uint16_t i = lo; i < end && rx_index[i].can_id == can_id; i++) {
+        PMU_CAN_MessageObject_t* msg = &message_objects[rx_index[i].message_slot];
+        if (msg->enabled) {
+            return msg;
         }
     }
     return NULL;
 }
 
 /**
- * @brief Extract value from CAN data using input configuration
- * @param input CAN Input configuration
- * @param data Raw CAN data bytes
- * @retval Extracted and scaled value
+ * @brief Rebuild the receive index, per-message input runs and timeout heap
+ *
+ * Called lazily after message objects or inputs change, so loading a
+ * config costs one rebuild instead of one per added object.
  */
-static float CAN_ExtractInputValue(PMU_CAN_Input_t* input, uint8_t* data)
+static void CAN_RebuildRxIndex(void)
 {
-    float value = 0.0f;
+    uint16_t count = 0;
+
+    /* Insertion sort by (bus, CAN ID); stable, so equal IDs stay in slot order */
+    for (uint16_t slot = 0; slot < message_object_count; slot++) {
+        CAN_RxIndexEntry_t entry;
+        entry.can_id = message_objects[slot].base_id;
+        entry.message_slot = slot;
+        entry.bus = (uint8_t)message_objects[slot].can_bus;
+
+        uint16_t pos = count;
+        while (pos > 0 &&
+               (rx_index[pos - 1].bus > entry.bus ||
+                (rx_index[pos - 1].bus == entry.bus && rx_index[pos - 1].can_id > entry.can_id))) {
+            rx_index[pos] = rx_index[pos - 1];
+            pos--;
+        }
+        rx_index[pos] = entry;
+        count++;
+    }
+
+    /* Per-bus ranges (objects on an invalid bus fall past the last range) */
+    uint16_t i = 0;
+    for (uint8_t bus = 0; bus <= PMU_CAN_BUS_COUNT; bus++) {
+        while (i < count && rx_index[i].bus < bus) {
+            i++;
+        }
+        rx_index_bus_first[bus] = i;
+    }
+
+    /* Group linked inputs by message, keeping their relative order */
+    memset(rx_input_count, 0, sizeof(rx_input_count));
+    for (uint16_t n = 0; n < can_input_count; n++) {
+        PMU_CAN_MessageObject_t* msg = can_inputs[n].message_ptr;
+        if (msg != NULL && msg >= message_objects && msg < &message_objects[message_object_count]) {
+            rx_input_count[msg - message_objects]++;
+        }
+    }
+    uint16_t first = 0;
+    for (uint16_t slot = 0; slot < message_object_count; slot++) {
+        rx_input_first[slot] = first;
+        first += rx_input_count[slot];
+        rx_input_count[slot] = 0;
+    }
+    for (uint16_t n = 0; n < can_input_count; n++) {
+        PMU_CAN_MessageObject_t* msg = can_inputs[n].message_ptr;
+        if (msg != NULL && msg >= message_objects && msg < &message_objects[message_object_count]) {
+            uint16_t slot = (uint16_t)(msg - message_objects);
+            rx_input_order[rx_input_first[slot] + rx_input_count[slot]++] = n;
+        }
+    }
+
+    /* Timeout heap over messages that have a timeout */
+    message_heap_count = 0;
+    for (uint16_t slot = 0; slot < message_object_count; slot++) {
+        if (message_objects[slot].timeout_ms > 0) {
+            CAN_HeapPush(message_deadline, message_heap, &message_heap_count, slot,
+                         CAN_SeedDeadline(message_objects[slot].last_rx_tick,
+                                          message_objects[slot].timeout_ms));
+        }
+    }
+
+    rx_index_valid = 1;
+}
 
+/**
+ * @brief Compile a CAN Input's extraction plan from its configuration
+ * @param input CAN Input configuration
+ */
+static void CAN_CompileInputPlan(PMU_CAN_Input_t* input)
+{
     /* Determine bit position and length using lookup table */
     uint8_t start_bit;
     uint8_t bit_length;
+    uint8_t flags = 0;
 
     if (input->data_format == PMU_CAN_DATA_FORMAT_CUSTOM) {
         start_bit = input->start_bit;
         bit_length = input->bit_length;
-    } else if (input->data_format < sizeof(can_format_bit_lengths)) {
-        start_bit = input->byte_offset * 8;
-        bit_length = can_format_bit_lengths[input->data_format];
-        if (bit_length == 0) bit_length = 16;  /* Default fallback */
     } else {
-        start_bit = input->byte_offset * 8;
-        bit_length = 16;  /* Default */
-    }
-
-    /* Use shared bit extraction helper (64 bytes for CAN FD) */
-    uint64_t raw_value = CAN_ExtractRawBits(data, start_bit, bit_length,
-                                             input->byte_order, 64);
-
-    /* Convert based on data type */
-    uint64_t mask = CAN_CREATE_MASK(bit_length);
-
-    switch (input->data_type) {
-        case PMU_CAN_DATA_TYPE_UNSIGNED:
-            value = (float)raw_value;
-            break;
-
-        case PMU_CAN_DATA_TYPE_SIGNED:
-            /* Sign extend if MSB is set */
-            if (raw_value & (1ULL << (bit_length - 1))) {
-                raw_value |= ~mask;
-            }
-            value = (float)((int64_t)raw_value);
-            break;
-
-        case PMU_CAN_DATA_TYPE_FLOAT:
-            if (bit_length == 32) {
-                /* IEEE 754 float */
-                union { uint32_t u; float f; } conv;
-                conv.u = (uint32_t)raw_value;
-                value = conv.f;
-            } else {
-                value = (float)raw_value;
-            }
-            break;
+        if (input->data_format < sizeof(can_format_bit_lengths)) {
+            bit_length = can_format_bit_lengths[input->data_format];
+            if (bit_length == 0) bit_length = 16;  /* Default fallback */
+        } else {
+            bit_length = 16;  /* Default */
+        }
 
-        default:
-            value = (float)raw_value;
-            break;
+        /* Byte-aligned field: Motorola start bit is the MSB of the first byte */
+        start_bit = input->byte_offset * 8;
+        if (input->byte_order == CAN_BYTE_ORDER_MOTOROLA) {
+            start_bit += 7;
+        }
     }
 
-    /* Apply scaling: value = raw * multiplier / divider + offset */
-    if (input->divider != 0.0f) {
-        value = value * input->multiplier / input->divider + input->offset;
-    } else {
-        value = value * input->multiplier + input->offset;
+    if (input->data_type == PMU_CAN_DATA_TYPE_SIGNED) {
+        flags = CAN_PLAN_SIGNED;
+    } else if (input->data_type == PMU_CAN_DATA_TYPE_FLOAT) {
+        flags = CAN_PLAN_FLOAT;
     }
 
-    return value;
+    /* 64 bytes for CAN FD */
+    CAN_CompilePlan(&input->plan, start_bit, bit_length, input->byte_order, flags, 64,
+                    input->multiplier, input->divider, input->offset);
 }
 
 /**
@@ -863,6 +1296,7 @@ HAL_StatusTypeDef PMU_CAN_AddMessageObject(PMU_CAN_MessageObject_t* msg_obj)
     memset(message_objects[message_object_count].rx_data, 0, 64);
 
     message_object_count++;
+    rx_index_valid = 0;
     return HAL_OK;
 }
 
@@ -918,6 +1352,7 @@ HAL_StatusTypeDef PMU_CAN_ClearMessageObjects(void)
 {
     message_object_count = 0;
     memset(message_objects, 0, sizeof(message_objects));
+    rx_index_valid = 0;
 
     /* Clear input message pointers */
     for (uint16_t i = 0; i < can_input_count; i++) {
@@ -958,6 +1393,7 @@ HAL_StatusTypeDef PMU_CAN_AddInput(PMU_CAN_Input_t* input)
     can_inputs[can_input_count].current_value = input->default_value;
     can_inputs[can_input_count].timeout_flag = 0;
     can_inputs[can_input_count].message_ptr = NULL;
+    CAN_CompileInputPlan(&can_inputs[can_input_count]);
 
     /* Try to link to message */
     PMU_CAN_MessageObject_t* msg = PMU_CAN_GetMessageObject(input->message_ref);
@@ -966,6 +1402,7 @@ HAL_StatusTypeDef PMU_CAN_AddInput(PMU_CAN_Input_t* input)
     }
 
     can_input_count++;
+    rx_index_valid = 0;
     return HAL_OK;
 }
 
@@ -985,6 +1422,7 @@ HAL_StatusTypeDef PMU_CAN_RemoveInput(const char* input_id)
                 memcpy(&can_inputs[j], &can_inputs[j + 1], sizeof(PMU_CAN_Input_t));
             }
             can_input_count--;
+            rx_index_valid = 0;
             return HAL_OK;
         }
     }
@@ -1017,6 +1455,7 @@ HAL_StatusTypeDef PMU_CAN_ClearInputs(void)
 {
     can_input_count = 0;
     memset(can_inputs, 0, sizeof(can_inputs));
+    rx_index_valid = 0;
     return HAL_OK;
 }
 
@@ -1042,6 +1481,7 @@ uint16_t PMU_CAN_LinkInputsToMessages(void)
         }
     }
 
+    rx_index_valid = 0;
     return linked_count;
 }
 
@@ -1050,18 +1490,29 @@ uint16_t PMU_CAN_LinkInputsToMessages(void)
  */
 void PMU_CAN_ProcessMessageTimeouts(void)
 {
-    for (uint16_t i = 0; i < message_object_count; i++) {
-        PMU_CAN_MessageObject_t* msg = &message_objects[i];
+    if (!rx_index_valid) {
+        CAN_RebuildRxIndex();
+    }
 
-        if (!msg->enabled || msg->timeout_ms == 0) {
-            continue;
-        }
+    /* Only messages whose heap deadline has passed are looked at; reception
+     * just stamps last_rx_tick and the entry is corrected when it surfaces */
+    while (message_heap_count > 0 &&
+           CAN_DeadlineBefore(message_deadline[0], system_tick_ms)) {
+        PMU_CAN_MessageObject_t* msg = &message_objects[message_heap[0]];
 
         /* Check timeout */
         uint32_t elapsed = system_tick_ms - msg->last_rx_tick;
-        if (elapsed > msg->timeout_ms) {
+        if (msg->enabled && elapsed > msg->timeout_ms) {
             msg->timeout_flag = 1;
         }
+
+        if (!msg->enabled || elapsed > msg->timeout_ms) {
+            /* Look again one timeout later */
+            message_deadline[0] = system_tick_ms + msg->timeout_ms;
+        } else {
+            message_deadline[0] = msg->last_rx_tick + msg->timeout_ms;
+        }
+        CAN_HeapSiftDown(message_deadline, message_heap, message_heap_count, 0);
     }
 }
 
@@ -1073,6 +1524,7 @@ void PMU_CAN_ProcessInputs(void)
     for (uint16_t i = 0; i < can_input_count; i++) {
         PMU_CAN_Input_t* input = &can_inputs[i];
         PMU_CAN_MessageObject_t* msg = input->message_ptr;
+        int32_t channel_value;
 
         /* Skip if not linked to a message */
         if (msg == NULL) {
@@ -1094,6 +1546,7 @@ void PMU_CAN_ProcessInputs(void)
                     input->current_value = 0.0f;
                     break;
             }
+            channel_value = (int32_t)(input->current_value);
         } else {
             input->timeout_flag = 0;
 
@@ -1105,12 +1558,14 @@ void PMU_CAN_ProcessInputs(void)
             }
 
             /* Extract value */
-            input->current_value = CAN_ExtractInputValue(input, data);
+            channel_value = CAN_DecodePlan(&input->plan, data, input->multiplier,
+                                           input->divider, input->offset,
+                                           &input->current_value);
         }
 
         /* Update virtual channel if assigned */
         if (input->virtual_channel != 0) {
-            PMU_Logic_SetVChannel(input->virtual_channel, (int32_t)(input->current_value));
+            PMU_Logic_SetVChannel(input->virtual_channel, channel_value);
         }
     }
 }
@@ -1152,24 +1607,27 @@ void PMU_CAN_HandleRxMessage(PMU_CAN_Bus_t bus, uint32_t can_id, uint8_t* data,
         memcpy(msg->rx_data, data, (dlc > 64) ? 64 : dlc);
     }
 
-    /* Process inputs that use this message */
-    for (uint16_t i = 0; i < can_input_count; i++) {
-        if (can_inputs[i].message_ptr == msg) {
-            /* Calculate data offset for this input */
-            uint8_t* input_data = msg->rx_data;
-            if (msg->message_type == PMU_CAN_MSG_TYPE_COMPOUND) {
-                input_data = &msg->rx_data[can_inputs[i].frame_offset * msg->dlc];
-            }
+    /* Process inputs that use this message (one contiguous run in the index) */
+    uint16_t slot = (uint16_t)(msg - message_objects);
+    const uint16_t* run = &rx_input_order[rx_input_first[slot]];
+    for (uint16_t n = 0; n < rx_input_count[slot]; n++) {
+        PMU_CAN_Input_t* input = &can_inputs[run[n]];
 
-            /* Extract and update value */
-            can_inputs[i].current_value = CAN_ExtractInputValue(&can_inputs[i], input_data);
-            can_inputs[i].timeout_flag = 0;
+        /* Calculate data offset for this input */
+        uint8_t* input_data = msg->rx_data;
+        if (msg->message_type == PMU_CAN_MSG_TYPE_COMPOUND) {
+            input_data = &msg->rx_data[input->frame_offset * msg->dlc];
+        }
 
-            /* Update virtual channel if assigned */
-            if (can_inputs[i].virtual_channel != 0) {
-                PMU_Logic_SetVChannel(can_inputs[i].virtual_channel,
-                                      (int32_t)(can_inputs[i].current_value));
-            }
+        /* Extract and update value */
+        int32_t channel_value = CAN_DecodePlan(&input->plan, input_data, input->multiplier,
+                                               input->divider, input->offset,
+                                               &input->current_value);
+        input->timeout_flag = 0;
+
+        /* Update virtual channel if assigned */
+        if (input->virtual_channel != 0) {
+            PMU_Logic_SetVChannel(input->virtual_channel, channel_value);
         }
     }
 }
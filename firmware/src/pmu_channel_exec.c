@@ -44,6 +44,7 @@ typedef struct {
     uint8_t         hw_index;       /**< Hardware index (for outputs) */
     uint8_t         reserved;       /**< Padding for 4-byte alignment */
     ChannelRuntime_t runtime;       /**< Runtime state and config pointer */
+    const int32_t*  input_value;    /**< Resolved inline input (timer trigger, logic input 0), NULL = registry */
 } PMU_ExecChannel_t;
 
 /**
@@ -54,10 +55,19 @@ typedef struct {
     uint16_t        source_id;      /**< Source channel to read from */
     uint8_t         hw_index;       /**< Hardware output index (0-29) */
     uint8_t         enabled;        /**< Link active */
+    const int32_t*  source_value;   /**< Resolved source (executor channel value), NULL = registry */
 } PMU_OutputLink_t;
 
 #define PMU_MAX_OUTPUT_LINKS    32
 
+/**
+ * @brief Channel ID index entry, sorted by channel_id for binary search
+ */
+typedef struct {
+    uint16_t        channel_id;     /**< Channel ID */
+    uint16_t        slot;           /**< Index into channels[] */
+} PMU_ExecIndexEntry_t;
+
 /**
  * @brief Channel executor state (internal)
  */
@@ -67,10 +77,22 @@ typedef struct {
     uint16_t            channel_count;                  /**< Number of channels */
     PMU_OutputLink_t    output_links[PMU_MAX_OUTPUT_LINKS]; /**< Output links */
     uint16_t            output_link_count;              /**< Number of output links */
+    PMU_ExecIndexEntry_t index[PMU_EXEC_MAX_CHANNELS];  /**< channel_id -> slot, sorted */
+    uint8_t             index_valid;                    /**< Index and resolved inputs up to date */
     uint32_t            exec_count;                     /**< Execution counter */
     uint32_t            last_exec_us;                   /**< Last execution time (us) */
+    uint32_t            max_exec_us;                    /**< Worst-case execution time (us) */
 } PMU_ExecState_t;
 
+/**
+ * @brief Microsecond timestamp for execution statistics
+ * Defaults to the HAL tick (1 ms resolution); builds with a finer clock
+ * (cycle counter, host benchmark) define their own.
+ */
+#ifndef PMU_EXEC_TIME_US
+#define PMU_EXEC_TIME_US()  (HAL_GetTick() * 1000U)
+#endif
+
 /* Private variables ---------------------------------------------------------*/
 
 /** Executor state */
@@ -93,7 +115,10 @@ extern void NucleoOutput_Reset(void);
 static int32_t ExecGetValue(uint16_t channel_id, void* user_data);
 static void ExecSetValue(uint16_t channel_id, int32_t value, void* user_data);
 static PMU_ExecChannel_t* FindChannel(uint16_t channel_id);
+static void RebuildIndex(void);
+static const int32_t* ResolveInput(uint16_t channel_id);
 static void* AllocConfig(uint16_t size);
+static uint16_t ConfigSize(uint8_t type);
 static int32_t GetSourceValue(uint16_t channel_id);
 
 /* Public functions ----------------------------------------------------------*/
@@ -131,44 +156,9 @@ HAL_StatusTypeDef PMU_ChannelExec_AddChannel(
         return HAL_ERROR;
     }
 
-    /* Get config size based on type */
-    uint16_t config_size = 0;
-    switch (type) {
-        case CH_TYPE_LOGIC:
-            config_size = sizeof(CfgLogic_t);
-            break;
-        case CH_TYPE_MATH:
-            config_size = sizeof(CfgMath_t);
-            break;
-        case CH_TYPE_TIMER:
-            config_size = sizeof(CfgTimer_t);
-            break;
-        case CH_TYPE_PID:
-            config_size = sizeof(CfgPid_t);
-            break;
-        case CH_TYPE_FILTER:
-            config_size = sizeof(CfgFilter_t);
-            break;
-        case CH_TYPE_TABLE_2D:
-            config_size = sizeof(CfgTable2D_t);
-            break;
-        case CH_TYPE_SWITCH:
-            config_size = sizeof(CfgSwitch_t);
-            break;
-        case CH_TYPE_NUMBER:
-            config_size = sizeof(CfgNumber_t);
-            break;
-        case CH_TYPE_COUNTER:
-            config_size = sizeof(CfgCounter_t);
-            break;
-        case CH_TYPE_HYSTERESIS:
-            config_size = sizeof(CfgHysteresis_t);
-            break;
-        case CH_TYPE_FLIPFLOP:
-            config_size = sizeof(CfgFlipFlop_t);
-            break;
-        default:
-            return HAL_ERROR;  /* Unknown type */
+    uint16_t config_size = ConfigSize(type);
+    if (config_size == 0) {
+        return HAL_ERROR;  /* Unknown type */
     }
 
     /* Allocate and copy config */
@@ -183,6 +173,7 @@ HAL_StatusTypeDef PMU_ChannelExec_AddChannel(
     ch->channel_id = channel_id;
     ch->type = type;
     ch->enabled = 1;
+    ch->input_value = NULL;
 
     /* Initialize runtime */
     ch->runtime.id = channel_id;
@@ -196,6 +187,35 @@ HAL_StatusTypeDef PMU_ChannelExec_AddChannel(
     Exec_InitChannelState(&ch->runtime, (ChannelType_t)type);
 
     exec_state.channel_count++;
+    exec_state.index_valid = 0;
+    return HAL_OK;
+}
+
+/**
+ * @brief Replace a channel's config in place and restart it
+ *
+ * The new config is copied over the channel's existing config storage, so
+ * repeated edits do not consume storage. The channel keeps its slot.
+ */
+HAL_StatusTypeDef PMU_ChannelExec_UpdateChannel(
+    uint16_t channel_id,
+    uint8_t type,
+    const void* config
+)
+{
+    PMU_ExecChannel_t* ch = FindChannel(channel_id);
+    if (!ch || ch->type != type) {
+        return HAL_ERROR;
+    }
+
+    memcpy(ch->runtime.config, config, ConfigSize(type));
+    ch->enabled = 1;
+    ch->runtime.flags = 0;
+    ch->runtime.value = 0;
+    ch->runtime.prev_value = 0;
+    Exec_InitChannelState(&ch->runtime, (ChannelType_t)type);
+
+    exec_state.index_valid = 0;  /* Inputs may have changed */
     return HAL_OK;
 }
 
@@ -211,6 +231,7 @@ HAL_StatusTypeDef PMU_ChannelExec_RemoveChannel(uint16_t channel_id)
                 exec_state.channels[j] = exec_state.channels[j + 1];
             }
             exec_state.channel_count--;
+            exec_state.index_valid = 0;  /* Slots moved */
             return HAL_OK;
         }
     }
@@ -234,8 +255,10 @@ void PMU_ChannelExec_Clear(void)
     /* Reset counters FIRST - this prevents Update() from accessing old data */
     exec_state.channel_count = 0;
     exec_state.output_link_count = 0;
+    exec_state.index_valid = 0;
     exec_state.exec_count = 0;
     exec_state.last_exec_us = 0;
+    exec_state.max_exec_us = 0;
 
     /* Reset context timestamps to avoid large dt_ms after reload */
     exec_state.context.now_ms = 0;
@@ -275,8 +298,10 @@ HAL_StatusTypeDef PMU_ChannelExec_AddOutputLink(
     link->source_id = source_id;
     link->hw_index = hw_index;
     link->enabled = 1;
+    link->source_value = NULL;
 
     exec_state.output_link_count++;
+    exec_state.index_valid = 0;
     return HAL_OK;
 }
 
@@ -292,11 +317,17 @@ void PMU_ChannelExec_Update(void)
     }
 
     uint32_t start_tick = HAL_GetTick();
+    uint32_t start_us = PMU_EXEC_TIME_US();
 
 #ifdef NUCLEO_F446RE
     HAL_IWDG_Refresh(&hiwdg);
 #endif
 
+    /* Channels were added/removed since the last cycle: re-resolve inputs */
+    if (!exec_state.index_valid) {
+        RebuildIndex();
+    }
+
     /* Update timing */
     Exec_UpdateTime(&exec_state.context, start_tick);
 
@@ -323,7 +354,8 @@ void PMU_ChannelExec_Update(void)
             /* Simplified inline Logic evaluation for IS_TRUE */
             CfgLogic_t* logic = (CfgLogic_t*)ch->runtime.config;
             if (logic->input_count > 0 && logic->inputs[0] != 0 && logic->inputs[0] != 0xFFFF) {
-                int32_t input_val = PMU_Channel_GetValue(logic->inputs[0]);
+                int32_t input_val = ch->input_value ? *ch->input_value
+                                                    : PMU_Channel_GetValue(logic->inputs[0]);
                 if (logic->operation == 0x06) {  /* IS_TRUE */
                     result = (input_val != 0) ? 1 : 0;
                 } else if (logic->operation == 0x07) {  /* IS_FALSE */
@@ -337,8 +369,10 @@ void PMU_ChannelExec_Update(void)
 
             /* Get trigger input value */
             int32_t trigger = 0;
-            if (timer_cfg->trigger_id != 0 && timer_cfg->trigger_id != 0xFFFF) {
-                trigger = GetSourceValue(timer_cfg->trigger_id);
+            if (ch->input_value) {
+                trigger = *ch->input_value;
+            } else if (timer_cfg->trigger_id != 0 && timer_cfg->trigger_id != 0xFFFF) {
+                trigger = PMU_Channel_GetValue(timer_cfg->trigger_id);
             }
 
             uint32_t now_ms = HAL_GetTick();
@@ -404,8 +438,9 @@ void PMU_ChannelExec_Update(void)
             continue;
         }
 
-        /* Read source channel value (check executor channels first, then firmware) */
-        int32_t source_value = GetSourceValue(link->source_id);
+        /* Read source channel value (resolved executor channel, else firmware) */
+        int32_t source_value = link->source_value ? *link->source_value
+                                                  : PMU_Channel_GetValue(link->source_id);
 
         /* Convert to output state (non-zero = ON) */
         uint8_t state = (source_value != 0) ? 1 : 0;
@@ -418,7 +453,10 @@ void PMU_ChannelExec_Update(void)
     }
 
     exec_state.exec_count++;
-    exec_state.last_exec_us = (HAL_GetTick() - start_tick) * 1000;
+    exec_state.last_exec_us = PMU_EXEC_TIME_US() - start_us;
+    if (exec_state.last_exec_us > exec_state.max_exec_us) {
+        exec_state.max_exec_us = exec_state.last_exec_us;
+    }
 }
 
 /**
@@ -555,6 +593,9 @@ int PMU_ChannelExec_LoadConfig(const uint8_t* data, uint16_t size)
         offset += config_size;
     }
 
+    /* Build the channel ID index and resolve inputs once, not per read */
+    RebuildIndex();
+
     return loaded;
 }
 
@@ -569,7 +610,8 @@ uint16_t PMU_ChannelExec_GetChannelCount(void)
 /**
  * @brief Get execution statistics
  */
-void PMU_ChannelExec_GetStats(uint32_t* exec_count, uint32_t* last_exec_us)
+void PMU_ChannelExec_GetStats(uint32_t* exec_count, uint32_t* last_exec_us,
+                              uint32_t* max_exec_us)
 {
     if (exec_count) {
         *exec_count = exec_state.exec_count;
@@ -577,6 +619,9 @@ void PMU_ChannelExec_GetStats(uint32_t* exec_count, uint32_t* last_exec_us)
     if (last_exec_us) {
         *last_exec_us = exec_state.last_exec_us;
     }
+    if (max_exec_us) {
+        *max_exec_us = exec_state.max_exec_us;
+    }
 }
 
 /**
@@ -696,17 +741,113 @@ static void ExecSetValue(uint16_t channel_id, int32_t value, void* user_data)
 
 /**
  * @brief Find channel by ID
+ *
+ * Binary search over the sorted index (O(log N)). With duplicate IDs the
+ * lowest slot wins, as with a linear scan.
  */
 static PMU_ExecChannel_t* FindChannel(uint16_t channel_id)
 {
-    for (uint16_t i = 0; i < exec_state.channel_count; i++) {
-        if (exec_state.channels[i].channel_id == channel_id) {
-            return &exec_state.channels[i];
+    if (!exec_state.index_valid) {
+        RebuildIndex();
+    }
+
+    /* Lower bound: first entry with id >= channel_id */
+    uint16_t lo = 0;
+    uint16_t hi = exec_state.channel_count;
+    while (lo < hi) {
+        uint16_t mid = (uint16_t)((lo + hi) / 2);
+        if (exec_state.index[mid].channel_id < channel_id) {
+            lo = (uint16_t)(mid + 1);
+        } else {
+            hi = mid;
         }
     }
+
+    if (lo < exec_state.channel_count && exec_state.index[lo].channel_id == channel_id) {
+        return &exec_state.channels[exec_state.index[lo].slot];
+    }
     return NULL;
 }
 
+/**
+ * @brief Rebuild the channel ID index and resolve channel inputs
+ *
+ * Called after LoadConfig and lazily after channels are added or removed.
+ * The inputs Update() reads inline (timer trigger, logic input 0, output
+ * link source) are resolved to a pointer to the executor channel's runtime
+ * value; others (hardware, CAN) stay NULL and are read from the firmware
+ * channel registry. ExecGetValue() still goes through FindChannel().
+ */
+static void RebuildIndex(void)
+{
+    /* Insertion sort by channel_id (stable: equal IDs keep slot order) */
+    for (uint16_t i = 0; i < exec_state.channel_count; i++) {
+        PMU_ExecIndexEntry_t entry = { exec_state.channels[i].channel_id, i };
+        uint16_t j = i;
+        while (j > 0 && exec_state.index[j - 1].channel_id > entry.channel_id) {
+            exec_state.index[j] = exec_state.index[j - 1];
+            j--;
+        }
+        exec_state.index[j] = entry;
+    }
+    exec_state.index_valid = 1;
+
+    for (uint16_t i = 0; i < exec_state.channel_count; i++) {
+        PMU_ExecChannel_t* ch = &exec_state.channels[i];
+        ch->input_value = NULL;
+        if (ch->runtime.config == NULL) {
+            continue;
+        }
+        if (ch->runtime.type == CH_TYPE_TIMER) {
+            ch->input_value = ResolveInput(((CfgTimer_t*)ch->runtime.config)->trigger_id);
+        } else if (ch->runtime.type == CH_TYPE_LOGIC) {
+            CfgLogic_t* logic = (CfgLogic_t*)ch->runtime.config;
+            if (logic->input_count > 0) {
+                ch->input_value = ResolveInput(logic->inputs[0]);
+            }
+        }
+    }
+
+    for (uint16_t i = 0; i < exec_state.output_link_count; i++) {
+        PMU_OutputLink_t* link = &exec_state.output_links[i];
+        link->source_value = ResolveInput(link->source_id);
+    }
+}
+
+/**
+ * @brief Resolve an input reference to an executor channel value
+ * @return Pointer to the channel's runtime value, NULL if not an executor channel
+ */
+static const int32_t* ResolveInput(uint16_t channel_id)
+{
+    if (channel_id == 0 || channel_id == 0xFFFF) {
+        return NULL;
+    }
+    PMU_ExecChannel_t* ch = FindChannel(channel_id);
+    return ch ? &ch->runtime.value : NULL;
+}
+
+/**
+ * @brief Config struct size for a channel type, 0 if unknown
+ */
+static uint16_t ConfigSize(uint8_t type)
+{
+    switch (type) {
+        case CH_TYPE_LOGIC:      return sizeof(CfgLogic_t);
+        case CH_TYPE_MATH:       return sizeof(CfgMath_t);
+        case CH_TYPE_TIMER:      return sizeof(CfgTimer_t);
+        case CH_TYPE_PID:        return sizeof(CfgPid_t);
+        case CH_TYPE_FILTER:     return sizeof(CfgFilter_t);
+        case CH_TYPE_TABLE_2D:   return sizeof(CfgTable2D_t);
+        case CH_TYPE_SWITCH:     return sizeof(CfgSwitch_t);
+        case CH_TYPE_NUMBER:     return sizeof(CfgNumber_t);
+        case CH_TYPE_COUNTER:    return sizeof(CfgCounter_t);
+        case CH_TYPE_HYSTERESIS: return sizeof(CfgHysteresis_t);
+        case CH_TYPE_FLIPFLOP:   return sizeof(CfgFlipFlop_t);
+        default:                 return 0;
+    }
+}
+
 /**
  * @brief Allocate config from static storage
  */
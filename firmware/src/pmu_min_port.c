@@ -13,6 +13,8 @@
 #include "min_config.h"
 #include "min.h"
 #include "pmu_min_port.h"
+#include "config_compress.h"
+#include "device_caps.h"
 #include <string.h>
 
 #ifdef NUCLEO_F446RE
@@ -88,6 +90,12 @@ static volatile bool min_in_command_handler = false;
 static uint8_t min_config_buffer[MIN_CONFIG_BUFFER_SIZE];
 static uint16_t min_config_len = 0;
 
+/* Chunked LOAD_BINARY reassembly (chunks arrive in order over T-MIN) */
+static uint16_t min_upload_len = 0;
+static uint16_t min_upload_next_chunk = 0;
+static uint16_t min_upload_total_chunks = 0;
+static PMU_LzDecoder_t min_upload_lz;  /* Decodes LOAD_BINARY_LZ chunks into min_config_buffer */
+
 /* Stream state */
 static bool min_stream_active = false;
 static uint32_t min_stream_period_ms = 100;  /* 10 Hz default */
@@ -192,6 +200,8 @@ uint32_t min_time_ms(void)
 
 /* Channel executor */
 extern int PMU_ChannelExec_LoadConfig(const uint8_t* data, uint16_t size);
+extern HAL_StatusTypeDef PMU_ChannelExec_AddChannel(uint16_t channel_id, uint8_t type, const void* config);
+extern HAL_StatusTypeDef PMU_ChannelExec_RemoveChannel(uint16_t channel_id);
 extern void PMU_ChannelExec_Clear(void);
 extern uint16_t PMU_ChannelExec_GetChannelCount(void);
 extern bool PMU_ChannelExec_GetChannelInfo(uint16_t index, uint16_t* channel_id, int32_t* value);
@@ -366,61 +376,254 @@ static void handle_get_config(void)
     min_send_frame(&g_min_ctx, MIN_CMD_CONFIG_DATA, response, 4 + copy_len);
 }
 
-static void handle_load_binary_config(uint8_t const *payload, uint8_t len)
+static void send_binary_ack(uint8_t success, uint8_t error, uint16_t channels_loaded)
+{
+    /* Final ACK: [success][error][channels_loaded:2B LE][total_channels][reserved] */
+    uint8_t ack[6];
+    ack[0] = success;
+    ack[1] = error;
+    ack[2] = channels_loaded & 0xFF;
+    ack[3] = (channels_loaded >> 8) & 0xFF;
+    ack[4] = (uint8_t)PMU_ChannelExec_GetChannelCount();
+    ack[5] = 0;
+
+    /* Ensure TX is ready before sending ACK */
+    while (min_tx_in_progress) {
+        /* Wait for any in-progress TX */
+    }
+
+    /* Unreliable ACK - if lost, client retries the upload */
+    min_send_frame(&g_min_ctx, MIN_CMD_BINARY_ACK, ack, sizeof(ack));
+
+    /* Ensure ACK is fully transmitted before returning */
+    while (!(USART2->SR & USART_SR_TC)) {
+        /* Wait for TX complete */
+    }
+}
+
+static void handle_load_binary_config(uint8_t const *payload, uint8_t len, bool compressed)
 {
     load_binary_called_count++;
 
     if (len < 4) {
-        uint8_t nack[2] = {MIN_CMD_LOAD_BINARY, 0x02};
+        uint8_t nack[2] = {compressed ? MIN_CMD_LOAD_BINARY_LZ : MIN_CMD_LOAD_BINARY, 0x02};
         min_send_frame(&g_min_ctx, MIN_CMD_NACK, nack, 2);  /* Unreliable NACK */
         return;
     }
 
-    min_stream_active = false;
+    /* Chunk header: [chunk_idx:2B LE][total_chunks:2B LE] */
+    uint16_t chunk_idx = payload[0] | (payload[1] << 8);
+    uint16_t total_chunks = payload[2] | (payload[3] << 8);
+    uint16_t chunk_len = len - 4;
+
+    if (total_chunks == 0 || chunk_idx >= total_chunks) {
+        send_binary_ack(0, 3, 0);  /* error=3 (invalid chunk header) */
+        return;
+    }
+
+    /* First chunk - start a new upload */
+    if (chunk_idx == 0) {
+        min_stream_active = false;
+        min_upload_len = 0;
+        min_upload_next_chunk = 0;
+        min_upload_total_chunks = total_chunks;
+        min_config_len = 0;  /* Buffer is being replaced */
+        pmu_lz_decoder_init(&min_upload_lz, min_config_buffer, MIN_CONFIG_BUFFER_SIZE);
+    }
 
-    /* Skip 4-byte chunk header */
-    uint16_t config_len = len - 4;
-    const uint8_t* config_data = payload + 4;
+    if (chunk_idx != min_upload_next_chunk || total_chunks != min_upload_total_chunks) {
+        min_upload_next_chunk = 0;
+        send_binary_ack(0, 4, 0);  /* error=4 (chunk out of sequence) */
+        return;
+    }
 
-    /* Store config for persistence */
-    if (config_len <= MIN_CONFIG_BUFFER_SIZE) {
-        memcpy(min_config_buffer, config_data, config_len);
-        min_config_len = config_len;
+    if (compressed) {
+        /* Decoded straight into min_config_buffer - no staging buffer */
+        int lz = pmu_lz_decoder_feed(&min_upload_lz, payload + 4, chunk_len);
+        bool last = (chunk_idx + 1 == total_chunks);
+        if (lz < 0 || (last && lz != PMU_LZ_DONE)) {
+            min_upload_next_chunk = 0;
+            send_binary_ack(0, (lz == PMU_LZ_ERR_OVERFLOW) ? 1 : 5, 0);  /* error=5 (bad LZ data) */
+            return;
+        }
+        min_upload_len = min_upload_lz.out_len;
+    } else {
+        if (min_upload_len + chunk_len > MIN_CONFIG_BUFFER_SIZE) {
+            min_upload_next_chunk = 0;
+            send_binary_ack(0, 1, 0);  /* error=1 (overflow) */
+            return;
+        }
+        memcpy(min_config_buffer + min_upload_len, payload + 4, chunk_len);
+        min_upload_len += chunk_len;
     }
+    min_upload_next_chunk++;
+
+    /* Intermediate chunks are not ACKed: T-MIN already guarantees delivery,
+     * so the host pipelines all chunks and waits for the single final ACK. */
+    if (min_upload_next_chunk < min_upload_total_chunks) {
+        return;
+    }
+    min_upload_next_chunk = 0;
+    min_config_len = min_upload_len;
 
     /* Refresh watchdog before config loading - clear/parse may take time */
     HAL_IWDG_Refresh(&hiwdg);
 
     /* Load via channel executor */
-    int result = PMU_ChannelExec_LoadConfig(config_data, config_len);
+    int result = PMU_ChannelExec_LoadConfig(min_config_buffer, min_config_len);
 
     /* Refresh watchdog after config loading */
     HAL_IWDG_Refresh(&hiwdg);
 
     /* result is the number of loaded channels (including output links) */
     uint16_t channels_loaded = (result >= 0) ? (uint16_t)result : 0;
+    send_binary_ack((result >= 0) ? 1 : 0, (result >= 0) ? 0 : 1, channels_loaded);
+}
 
-    uint8_t ack[4];
-    ack[0] = (result >= 0) ? 1 : 0;
-    ack[1] = 0;
-    ack[2] = channels_loaded & 0xFF;
-    ack[3] = (channels_loaded >> 8) & 0xFF;
+/* Channel record layout in min_config_buffer: [CfgChannelHeader_t:14][name][config] */
+#define CFG_CHANNEL_HEADER_SIZE  14
+#define CFG_TYPE_TIMER           0x20
+#define CFG_TYPE_FLIPFLOP        0x2C
 
-    /* Refresh watchdog before sending ACK */
-    HAL_IWDG_Refresh(&hiwdg);
+static void send_channel_config_ack(uint16_t channel_id, uint8_t success, uint16_t error_code)
+{
+    /* [channel_id:2B LE][success:1B][error_code:2B LE] - same layout as pmu_protocol.c */
+    uint8_t ack[5];
+    ack[0] = channel_id & 0xFF;
+    ack[1] = (channel_id >> 8) & 0xFF;
+    ack[2] = success;
+    ack[3] = error_code & 0xFF;
+    ack[4] = (error_code >> 8) & 0xFF;
+    min_send_frame(&g_min_ctx, MIN_CMD_CHANNEL_CONFIG_ACK, ack, sizeof(ack));
+}
 
-    /* Ensure TX is ready before sending ACK */
-    while (min_tx_in_progress) {
-        /* Wait for any in-progress TX */
+/**
+ * @brief Find a channel record in min_config_buffer
+ * @param channel_id  Channel to look for
+ * @param rec_len     Receives the record length (header + name + config)
+ * @retval Record offset in the buffer, or 0 if the channel is not present
+ */
+static uint16_t config_find_record(uint16_t channel_id, uint16_t *rec_len)
+{
+    if (min_config_len < 2) {
+        return 0;
     }
 
-    /* Unreliable ACK - if lost, client retries and we reload config */
-    min_send_frame(&g_min_ctx, MIN_CMD_BINARY_ACK, ack, 4);
+    uint16_t count = min_config_buffer[0] | (min_config_buffer[1] << 8);
+    uint16_t offset = 2;
 
-    /* Ensure ACK is fully transmitted before returning */
-    while (!(USART2->SR & USART_SR_TC)) {
-        /* Wait for TX complete */
+    for (uint16_t i = 0; i < count; i++) {
+        if (offset + CFG_CHANNEL_HEADER_SIZE > min_config_len) {
+            break;
+        }
+        uint16_t id = min_config_buffer[offset] | (min_config_buffer[offset + 1] << 8);
+        uint16_t len = CFG_CHANNEL_HEADER_SIZE + min_config_buffer[offset + 12] + min_config_buffer[offset + 13];
+        if (id == channel_id) {
+            *rec_len = len;
+            return offset;
+        }
+        offset += len;
     }
+    return 0;
+}
+
+/**
+ * @brief Handle SET_CHANNEL_CONFIG - atomic single channel update
+ *
+ * Payload is one channel record exactly as stored in a LOAD_BINARY config
+ * ([CfgChannelHeader_t:14][name][config]); a 2-byte payload [channel_id]
+ * removes the channel. The record is spliced into min_config_buffer so
+ * GET_CONFIG and SAVE_CONFIG see the updated config.
+ *
+ * A virtual channel whose record keeps its size and type is replaced in
+ * place and its executor config overwritten in its existing storage slot.
+ * Any other change shifts records in the buffer, so the whole buffer is
+ * reloaded (which also resets the executor's config storage).
+ */
+static void handle_set_channel_config(uint8_t const *payload, uint8_t len)
+{
+    if (len < 2) {
+        send_channel_config_ack(0, 0, 1);  /* error=1 (payload too short) */
+        return;
+    }
+
+    uint16_t channel_id = payload[0] | (payload[1] << 8);
+    bool remove = (len == 2);
+    uint16_t new_len = 0;
+
+    if (channel_id == 0) {
+        send_channel_config_ack(0, 0, 4);  /* error=4 (invalid channel ID) */
+        return;
+    }
+
+    if (!remove) {
+        if (len < CFG_CHANNEL_HEADER_SIZE) {
+            send_channel_config_ack(channel_id, 0, 1);
+            return;
+        }
+        new_len = CFG_CHANNEL_HEADER_SIZE + payload[12] + payload[13];
+        if (len < new_len) {
+            send_channel_config_ack(channel_id, 0, 2);  /* error=2 (incomplete data) */
+            return;
+        }
+    }
+
+    /* No config loaded yet - start from an empty one */
+    if (min_config_len < 2) {
+        min_config_buffer[0] = 0;
+        min_config_buffer[1] = 0;
+        min_config_len = 2;
+    }
+
+    uint16_t old_len = 0;
+    uint16_t rec_off = config_find_record(channel_id, &old_len);
+
+    if (remove && rec_off == 0) {
+        send_channel_config_ack(channel_id, 1, 0);  /* Already absent */
+        return;
+    }
+
+    /* Same-size virtual channel: overwrite the record and the executor config in place */
+    uint8_t new_type = remove ? 0 : payload[2];
+    if (rec_off != 0 && new_len == old_len &&
+        min_config_buffer[rec_off + 2] == new_type &&
+        new_type >= CFG_TYPE_TIMER && new_type <= CFG_TYPE_FLIPFLOP) {
+        memcpy(min_config_buffer + rec_off, payload, new_len);
+        if (PMU_ChannelExec_UpdateChannel(
+                channel_id, new_type,
+                min_config_buffer + rec_off + CFG_CHANNEL_HEADER_SIZE + payload[12]) == HAL_OK) {
+            send_channel_config_ack(channel_id, 1, 0);
+            return;
+        }
+        /* Not in the executor (it failed to load before) - full reload below */
+    }
+
+    if (min_config_len - old_len + new_len > MIN_CONFIG_BUFFER_SIZE) {
+        send_channel_config_ack(channel_id, 0, 5);  /* error=5 (overflow) */
+        return;
+    }
+
+    uint16_t count = min_config_buffer[0] | (min_config_buffer[1] << 8);
+    if (rec_off == 0) {
+        rec_off = min_config_len;  /* New channel - append */
+        count++;
+    } else if (remove) {
+        count--;
+    }
+
+    memmove(min_config_buffer + rec_off + new_len,
+            min_config_buffer + rec_off + old_len,
+            min_config_len - rec_off - old_len);
+    memcpy(min_config_buffer + rec_off, payload, new_len);
+    min_config_len = min_config_len - old_len + new_len;
+    min_config_buffer[0] = count & 0xFF;
+    min_config_buffer[1] = (count >> 8) & 0xFF;
+
+    HAL_IWDG_Refresh(&hiwdg);
+    int result = PMU_ChannelExec_LoadConfig(min_config_buffer, min_config_len);
+    HAL_IWDG_Refresh(&hiwdg);
+
+    send_channel_config_ack(channel_id, (result >= 0) ? 1 : 0, (result >= 0) ? 0 : 3);
 }
 
 static void handle_save_config(void)
@@ -572,8 +775,10 @@ static void handle_get_capabilities(void)
      * [7]    hbridge_count
      * [8]    can_bus_count
      * [9]    reserved (0)
+     * [10-13] sw_flags (DeviceCapsSwFlags_t, LE) - protocol features of this port
      */
-    uint8_t caps[10] = {
+    uint32_t sw_flags = CAPS_SW_CONFIG_LZ | CAPS_SW_CONFIG_IN_BAND;
+    uint8_t caps[14] = {
         PMU_DEVICE_TYPE,
         PMU_FW_VERSION_MAJOR,
         PMU_FW_VERSION_MINOR,
@@ -583,9 +788,13 @@ static void handle_get_capabilities(void)
         PMU_DIGITAL_INPUT_COUNT,
         PMU_HBRIDGE_COUNT,
         PMU_CAN_BUS_COUNT,
-        0  /* reserved */
+        0,  /* reserved */
+        sw_flags & 0xFF,
+        (sw_flags >> 8) & 0xFF,
+        (sw_flags >> 16) & 0xFF,
+        (sw_flags >> 24) & 0xFF
     };
-    min_send_frame(&g_min_ctx, MIN_CMD_CAPABILITIES, caps, 10);
+    min_send_frame(&g_min_ctx, MIN_CMD_CAPABILITIES, caps, sizeof(caps));
 }
 
 /**
@@ -619,7 +828,13 @@ void min_application_handler(uint8_t min_id, uint8_t const *min_payload,
             handle_get_config();
             break;
         case MIN_CMD_LOAD_BINARY:
-            handle_load_binary_config(min_payload, len_payload);
+            handle_load_binary_config(min_payload, len_payload, false);
+            break;
+        case MIN_CMD_LOAD_BINARY_LZ:
+            handle_load_binary_config(min_payload, len_payload, true);
+            break;
+        case MIN_CMD_SET_CHANNEL_CONFIG:
+            handle_set_channel_config(min_payload, len_payload);
             break;
         case MIN_CMD_SAVE_CONFIG:
             handle_save_config();
@@ -23,6 +23,7 @@
 #include "pmu_channel.h"
 #include "pmu_channel_exec.h"
 #include "pmu_lua.h"
+#include "config_compress.h"
 #include "board_config.h"
 #include <string.h>
 #include <stdio.h>
@@ -132,6 +133,8 @@ static void Protocol_HandleLuaSetEnabled(const PMU_Protocol_Packet_t* packet);
 #endif
 static void Protocol_HandleSetChannelConfig(const PMU_Protocol_Packet_t* packet);
 static void Protocol_HandleLoadBinaryConfig(const PMU_Protocol_Packet_t* packet);
+static void Protocol_HandleLoadBinaryConfigLz(const PMU_Protocol_Packet_t* packet);
+static void Protocol_LoadBinaryConfigChunk(const PMU_Protocol_Packet_t* packet, bool compressed);
 static void Protocol_HandleClearConfig(const PMU_Protocol_Packet_t* packet);
 static void Protocol_HandleReset(const PMU_Protocol_Packet_t* packet);
 static void Protocol_SendChannelConfigACK(uint16_t channel_id, bool success, uint16_t error_code, const char* error_msg);
@@ -229,6 +232,7 @@ static const Protocol_CommandEntry_t command_dispatch_table[] = {
     {PMU_CMD_SAVE_CONFIG,       Protocol_HandleSaveConfig},
     {PMU_CMD_CLEAR_CONFIG,      Protocol_HandleClearConfig},
     {PMU_CMD_LOAD_BINARY_CONFIG, Protocol_HandleLoadBinaryConfig},
+    {PMU_CMD_LOAD_BINARY_CONFIG_LZ, Protocol_HandleLoadBinaryConfigLz},
     {PMU_CMD_SET_CHANNEL_CONFIG, Protocol_HandleSetChannelConfig},
     /* Logging commands */
     {PMU_CMD_START_LOGGING,     Protocol_HandleStartLogging},
@@ -1347,6 +1351,7 @@ static void Protocol_HandleClearConfig(const PMU_Protocol_Packet_t* packet)
 /* Binary config chunked upload state */
 static uint16_t binary_total_chunks = 0;
 static uint16_t binary_received_chunks = 0;
+static PMU_LzDecoder_t binary_config_lz;  /* Decodes LOAD_BINARY_CONFIG_LZ chunks into binary_config_buffer */
 
 /**
  * @brief Handle LOAD_BINARY_CONFIG command - load binary channel configuration
@@ -1363,6 +1368,22 @@ static uint16_t binary_received_chunks = 0;
  *   [config_data:N bytes]
  */
 static void Protocol_HandleLoadBinaryConfig(const PMU_Protocol_Packet_t* packet)
+{
+    Protocol_LoadBinaryConfigChunk(packet, false);
+}
+
+/**
+ * @brief Handle LOAD_BINARY_CONFIG_LZ command - LZ-compressed binary config
+ *
+ * Same chunking as LOAD_BINARY_CONFIG; the concatenated chunk data is one
+ * config_compress.h stream, decoded straight into binary_config_buffer.
+ */
+static void Protocol_HandleLoadBinaryConfigLz(const PMU_Protocol_Packet_t* packet)
+{
+    Protocol_LoadBinaryConfigChunk(packet, true);
+}
+
+static void Protocol_LoadBinaryConfigChunk(const PMU_Protocol_Packet_t* packet, bool compressed)
 {
     /* Always use chunked format: [chunk_idx:2B LE][total_chunks:2B LE][data] */
     if (packet->length < 4) {
@@ -1389,17 +1410,38 @@ static void Protocol_HandleLoadBinaryConfig(const PMU_Protocol_Packet_t* packet)
         binary_config_len = 0;
         binary_total_chunks = total_chunks;
         binary_received_chunks = 0;
+        pmu_lz_decoder_init(&binary_config_lz, binary_config_buffer, CONFIG_BUFFER_SIZE);
     }
 
-    /* Accumulate chunk data */
-    if (binary_config_len + chunk_len >= CONFIG_BUFFER_SIZE) {
-        uint8_t response[4] = {0, 1, 0, 0};  /* success=0, error=1 (overflow) */
-        Protocol_SendData(PMU_CMD_BINARY_CONFIG_ACK, packet->seq_id, response, 4);
-        return;
-    }
+    if (compressed) {
+        /* The decoder is a stream - chunks must arrive in order, once */
+        if (chunk_idx != binary_received_chunks || total_chunks != binary_total_chunks) {
+            binary_received_chunks = 0;
+            uint8_t response[4] = {0, 4, 0, 0};  /* success=0, error=4 (chunk out of sequence) */
+            Protocol_SendData(PMU_CMD_BINARY_CONFIG_ACK, packet->seq_id, response, 4);
+            return;
+        }
+
+        int lz = pmu_lz_decoder_feed(&binary_config_lz, chunk_data, chunk_len);
+        bool last = (chunk_idx + 1 == total_chunks);
+        if (lz < 0 || (last && lz != PMU_LZ_DONE)) {
+            binary_received_chunks = 0;
+            uint8_t response[4] = {0, (lz == PMU_LZ_ERR_OVERFLOW) ? 1 : 5, 0, 0};  /* error=5 (bad LZ data) */
+            Protocol_SendData(PMU_CMD_BINARY_CONFIG_ACK, packet->seq_id, response, 4);
+            return;
+        }
+        binary_config_len = binary_config_lz.out_len;
+    } else {
+        /* Accumulate chunk data */
+        if (binary_config_len + chunk_len >= CONFIG_BUFFER_SIZE) {
+            uint8_t response[4] = {0, 1, 0, 0};  /* success=0, error=1 (overflow) */
+            Protocol_SendData(PMU_CMD_BINARY_CONFIG_ACK, packet->seq_id, response, 4);
+            return;
+        }
 
-    memcpy(binary_config_buffer + binary_config_len, chunk_data, chunk_len);
-    binary_config_len += chunk_len;
+        memcpy(binary_config_buffer + binary_config_len, chunk_data, chunk_len);
+        binary_config_len += chunk_len;
+    }
     binary_received_chunks++;
 
     /* All chunks received - process binary config */
@@ -12,6 +12,8 @@
 
 #include "pmu_serial_transfer.h"
 #include "pmu_serial_transfer_port.h"
+#include "config_compress.h"
+#include "device_caps.h"
 #include <string.h>
 #include <stdbool.h>
 
@@ -316,6 +318,38 @@ static void handle_load_binary(const uint8_t* payload, uint8_t len)
     uart_send_packet(ST_CMD_BINARY_ACK, ack, 4);
 }
 
+static void handle_load_binary_lz(const uint8_t* payload, uint8_t len)
+{
+    if (len < 4) {
+        uint8_t nack[2] = {ST_CMD_LOAD_BINARY_LZ, 0x02};
+        uart_send_packet(ST_CMD_NACK, nack, 2);
+        return;
+    }
+
+    stream_active = false;
+
+    /* Single packet: [chunk_idx:2B][total_chunks:2B][LZ stream] */
+    int size = pmu_lz_decompress(payload + 4, len - 4, config_buffer, CONFIG_BUFFER_SIZE);
+    int result = -1;
+    if (size >= 0) {
+        config_len = (uint16_t)size;
+        HAL_IWDG_Refresh(&hiwdg);
+        result = PMU_ChannelExec_LoadConfig(config_buffer, config_len);
+        HAL_IWDG_Refresh(&hiwdg);
+    } else {
+        config_len = 0;
+    }
+
+    uint16_t channels = (result >= 0) ? (uint16_t)result : 0;
+    uint8_t ack[4] = {
+        (result >= 0) ? 1 : 0,
+        (size < 0) ? 5 : 0,  /* error=5 (bad LZ data) */
+        channels & 0xFF,
+        (channels >> 8) & 0xFF
+    };
+    uart_send_packet(ST_CMD_BINARY_ACK, ack, 4);
+}
+
 static void handle_save_config(void)
 {
     HAL_IWDG_Refresh(&hiwdg);
@@ -388,7 +422,8 @@ static void handle_set_output(const uint8_t* payload, uint8_t len)
 
 static void handle_get_capabilities(void)
 {
-    uint8_t caps[10] = {
+    uint32_t sw_flags = CAPS_SW_CONFIG_LZ;  /* Protocol features of this port */
+    uint8_t caps[14] = {
         0x10,  /* Device type: Nucleo-F446RE */
         1, 0, 0,  /* Version 1.0.0 */
         30,   /* outputs */
@@ -396,9 +431,13 @@ static void handle_get_capabilities(void)
         8,    /* digital inputs */
         2,    /* h-bridges */
         0,    /* can buses (none on Nucleo) */
-        0     /* reserved */
+        0,    /* reserved */
+        sw_flags & 0xFF,          /* sw_flags (DeviceCapsSwFlags_t, LE) */
+        (sw_flags >> 8) & 0xFF,
+        (sw_flags >> 16) & 0xFF,
+        (sw_flags >> 24) & 0xFF
     };
-    uart_send_packet(ST_CMD_CAPABILITIES, caps, 10);
+    uart_send_packet(ST_CMD_CAPABILITIES, caps, sizeof(caps));
 }
 
 /* ============================================================================
@@ -415,6 +454,7 @@ static void on_packet(uint8_t cmd, const uint8_t* payload, uint8_t len)
         case ST_CMD_RESET:         handle_reset(); break;
         case ST_CMD_GET_CONFIG:    handle_get_config(); break;
         case ST_CMD_LOAD_BINARY:   handle_load_binary(payload, len); break;
+        case ST_CMD_LOAD_BINARY_LZ: handle_load_binary_lz(payload, len); break;
         case ST_CMD_SAVE_CONFIG:   handle_save_config(); break;
         case ST_CMD_CLEAR_CONFIG:  handle_clear_config(); break;
         case ST_CMD_START_STREAM:  handle_start_stream(payload, len); break;
@@ -0,0 +1,310 @@
+/**
+ ******************************************************************************
+ * @file           : bench_can_rx.c
+ * @brief          : Host benchmark for indexed CAN receive dispatch
+ * @author         : R2 m-sport
+ * @date           : 2026-01-01
+ ******************************************************************************
+ * Loads 200 CAN inputs (50 message objects x 4 inputs) and 200 legacy
+ * signal maps on one bus, checks that every frame reaches exactly its own
+ * signals and that timeouts fire for silent messages only (also past
+ * 2^31 ms of uptime), then times
+ * per-frame dispatch and the per-update timeout check against the old
+ * linear scans.
+ *
+ * Not part of the Unity suite (only built with PMU_CAN_BENCH):
+ *
+ *   cd firmware
+ *   gcc -O2 -DPMU_CAN_BENCH -Itest -Iinclude test/bench_can_rx.c -o bench_can_rx
+ *   ./bench_can_rx
+ ******************************************************************************
+ */
+
+#ifdef PMU_CAN_BENCH
+
+#define _POSIX_C_SOURCE 199309L
+#include <stdint.h>
+#include <stdio.h>
+#include <time.h>
+
+/* Host build without FDCAN hardware access */
+#define UNIT_TEST
+#define PMU_HAL_H
+#include "stm32h7xx_hal.h"
+
+/* Driver under test */
+#include "../src/pmu_can.c"
+
+#define BENCH_MESSAGES      50
+#define BENCH_PER_MESSAGE   4
+#define BENCH_SIGNALS       (BENCH_MESSAGES * BENCH_PER_MESSAGE)
+#define BENCH_BASE_ID       0x100
+#define BENCH_ROUNDS        20000
+#define BENCH_VCHAN_INPUTS  1       /* Virtual channels 1..200: CAN inputs */
+#define BENCH_VCHAN_SIGNALS 301     /* Virtual channels 301..500: signal maps */
+
+/* Firmware stubs ------------------------------------------------------------*/
+
+static float vchannels[512];
+static uint32_t vchannel_writes;
+
+HAL_StatusTypeDef PMU_Logic_SetVChannel(uint16_t vchan, float value)
+{
+    vchannels[vchan % 512] = value;
+    vchannel_writes++;
+    return HAL_OK;
+}
+
+uint8_t PMU_BlinkMarine_HandleRxMessage(PMU_CAN_Bus_t bus, uint32_t can_id,
+                                        uint8_t* data, uint8_t dlc)
+{
+    (void)bus;
+    (void)can_id;
+    (void)data;
+    (void)dlc;
+    return 0;
+}
+
+static double Bench_TimeNs(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1e9 + ts.tv_nsec;
+}
+
+/* Config builder ------------------------------------------------------------*/
+
+/* IDs are added in scattered order so slot order and ID order differ */
+static uint32_t BenchCanId(uint16_t m)
+{
+    return BENCH_BASE_ID + (uint32_t)((m * 37) % BENCH_MESSAGES);
+}
+
+static void BuildConfig(void)
+{
+    PMU_CAN_Init();
+    PMU_CAN_ClearInputs();
+    PMU_CAN_ClearMessageObjects();
+
+    for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+        PMU_CAN_MessageObject_t msg;
+        memset(&msg, 0, sizeof(msg));
+        snprintf(msg.id, sizeof(msg.id), "msg%u", m);
+        msg.can_bus = PMU_CAN_BUS_1;
+        msg.base_id = BenchCanId(m);
+        msg.message_type = PMU_CAN_MSG_TYPE_NORMAL;
+        msg.frame_count = 1;
+        msg.dlc = 8;
+        msg.timeout_ms = 100;
+        msg.enabled = 1;
+        PMU_CAN_AddMessageObject(&msg);
+    }
+
+    /* Inputs are added signal-major so each message's inputs are scattered */
+    for (uint16_t s = 0; s < BENCH_PER_MESSAGE; s++) {
+        for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+            PMU_CAN_Input_t input;
+            memset(&input, 0, sizeof(input));
+            snprintf(input.id, sizeof(input.id), "in%u_%u", m, s);
+            snprintf(input.message_ref, sizeof(input.message_ref), "msg%u", m);
+            input.data_type = PMU_CAN_DATA_TYPE_UNSIGNED;
+            input.data_format = PMU_CAN_DATA_FORMAT_16BIT;
+            input.byte_offset = (uint8_t)(s * 2);
+            input.multiplier = 1.0f;
+            input.divider = 1.0f;
+            input.virtual_channel = (uint16_t)(BENCH_VCHAN_INPUTS + m * BENCH_PER_MESSAGE + s);
+            PMU_CAN_AddInput(&input);
+        }
+
+        for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+            PMU_CAN_SignalMap_t signal;
+            memset(&signal, 0, sizeof(signal));
+            signal.can_id = BenchCanId(m);
+            signal.start_bit = (uint8_t)(s * 16);
+            signal.length_bits = 16;
+            signal.byte_order = 0;
+            signal.scale = 1.0f;
+            signal.virtual_channel = (uint16_t)(BENCH_VCHAN_SIGNALS + m * BENCH_PER_MESSAGE + s);
+            signal.timeout_ms = 100;
+            PMU_CAN_AddSignalMap(PMU_CAN_BUS_1, &signal);
+        }
+    }
+}
+
+/* Frame for message m: signal s carries m * 16 + s */
+static void BuildFrame(uint16_t m, PMU_CAN_Message_t* frame)
+{
+    memset(frame, 0, sizeof(*frame));
+    frame->id = BenchCanId(m);
+    frame->dlc = 8;
+    for (uint16_t s = 0; s < BENCH_PER_MESSAGE; s++) {
+        uint16_t value = (uint16_t)(m * 16 + s);
+        frame->data[s * 2] = (uint8_t)value;
+        frame->data[s * 2 + 1] = (uint8_t)(value >> 8);
+    }
+}
+
+static void Dispatch(PMU_CAN_Message_t* frame)
+{
+    CAN_ProcessRxMessage(PMU_CAN_BUS_1, frame);
+    PMU_CAN_HandleRxMessage(PMU_CAN_BUS_1, frame->id, frame->data, frame->dlc, 0);
+}
+
+/* Old cost per frame: scan every signal map and message object, then every
+ * input for the matching message */
+static uint32_t LinearDispatchCost(uint32_t can_id)
+{
+    uint32_t hits = 0;
+    PMU_CAN_MessageObject_t* found = NULL;
+
+    for (uint16_t i = 0; i < can_buses[PMU_CAN_BUS_1].signal_count; i++) {
+        hits += (can_buses[PMU_CAN_BUS_1].signal_maps[i].can_id == can_id);
+    }
+    for (uint16_t i = 0; i < message_object_count; i++) {
+        if (message_objects[i].can_bus == PMU_CAN_BUS_1 &&
+            message_objects[i].base_id == can_id && message_objects[i].enabled) {
+            found = &message_objects[i];
+            break;
+        }
+    }
+    for (uint16_t i = 0; i < can_input_count; i++) {
+        hits += (can_inputs[i].message_ptr == found);
+    }
+    return hits;
+}
+
+/* Old cost per update: scan every signal map and message object */
+static uint32_t LinearTimeoutCost(void)
+{
+    uint32_t expired = 0;
+    for (uint16_t i = 0; i < can_buses[PMU_CAN_BUS_1].signal_count; i++) {
+        PMU_CAN_SignalMap_t* signal = &can_buses[PMU_CAN_BUS_1].signal_maps[i];
+        expired += (system_tick_ms - signal->last_update_ms > signal->timeout_ms);
+    }
+    for (uint16_t i = 0; i < message_object_count; i++) {
+        expired += (system_tick_ms - message_objects[i].last_rx_tick > message_objects[i].timeout_ms);
+    }
+    return expired;
+}
+
+static int CheckValues(void)
+{
+    for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+        for (uint16_t s = 0; s < BENCH_PER_MESSAGE; s++) {
+            float expected = (float)(m * 16 + s);
+            uint16_t k = (uint16_t)(m * BENCH_PER_MESSAGE + s);
+            if (vchannels[BENCH_VCHAN_INPUTS + k] != expected ||
+                vchannels[BENCH_VCHAN_SIGNALS + k] != expected) {
+                printf("FAIL: message %u signal %u: input %.0f, map %.0f, expected %.0f\n",
+                       m, s, vchannels[BENCH_VCHAN_INPUTS + k],
+                       vchannels[BENCH_VCHAN_SIGNALS + k], expected);
+                return 0;
+            }
+        }
+    }
+    return 1;
+}
+
+int main(void)
+{
+    PMU_CAN_Message_t frames[BENCH_MESSAGES];
+    PMU_CAN_Message_t unknown;
+    volatile uint32_t sink = 0;
+
+    BuildConfig();
+    for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+        BuildFrame(m, &frames[m]);
+    }
+    memset(&unknown, 0, sizeof(unknown));
+    unknown.id = 0x7F0;
+    unknown.dlc = 8;
+
+    /* Correctness: every frame decodes exactly its own 4 + 4 signals */
+    vchannel_writes = 0;
+    for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+        Dispatch(&frames[m]);
+    }
+    Dispatch(&unknown);
+    if (vchannel_writes != 2 * BENCH_SIGNALS || !CheckValues()) {
+        printf("FAIL: %lu channel writes, expected %u\n",
+               (unsigned long)vchannel_writes, 2 * BENCH_SIGNALS);
+        return 1;
+    }
+
+    /* Timeouts: everything but message 7 keeps arriving for 300 ms */
+    for (int tick = 0; tick < 30; tick++) {
+        for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+            if (m != 7) {
+                Dispatch(&frames[m]);
+            }
+        }
+        system_tick_ms += 10;
+        CAN_CheckTimeouts(PMU_CAN_BUS_1);
+        PMU_CAN_ProcessMessageTimeouts();
+    }
+    for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+        if (message_objects[m].timeout_flag != (m == 7)) {
+            printf("FAIL: message %u timeout_flag = %u\n", m, message_objects[m].timeout_flag);
+            return 1;
+        }
+    }
+    Dispatch(&frames[7]);
+    if (message_objects[7].timeout_flag) {
+        printf("FAIL: reception did not clear the timeout\n");
+        return 1;
+    }
+
+    /* A never-received message still times out after uptime passes 2^31 ms */
+    system_tick_ms = 0x80000000u + 1000u;
+    message_objects[7].last_rx_tick = 0;
+    rx_index_valid = 0;
+    for (int tick = 0; tick < 2; tick++) {
+        PMU_CAN_ProcessMessageTimeouts();
+        system_tick_ms += 10;
+    }
+    if (!message_objects[7].timeout_flag) {
+        printf("FAIL: stale message did not time out after tick wrap\n");
+        return 1;
+    }
+
+    /* Dispatch timing, cycling through all IDs */
+    double start = Bench_TimeNs();
+    for (int r = 0; r < BENCH_ROUNDS; r++) {
+        Dispatch(&frames[r % BENCH_MESSAGES]);
+    }
+    double dispatch_ns = (Bench_TimeNs() - start) / BENCH_ROUNDS;
+
+    start = Bench_TimeNs();
+    for (int r = 0; r < BENCH_ROUNDS; r++) {
+        sink += LinearDispatchCost(frames[r % BENCH_MESSAGES].id);
+    }
+    double linear_dispatch_ns = (Bench_TimeNs() - start) / BENCH_ROUNDS;
+
+    /* Timeout check timing with all messages live */
+    for (uint16_t m = 0; m < BENCH_MESSAGES; m++) {
+        Dispatch(&frames[m]);
+    }
+    start = Bench_TimeNs();
+    for (int r = 0; r < BENCH_ROUNDS; r++) {
+        CAN_CheckTimeouts(PMU_CAN_BUS_1);
+        PMU_CAN_ProcessMessageTimeouts();
+    }
+    double timeout_ns = (Bench_TimeNs() - start) / BENCH_ROUNDS;
+
+    start = Bench_TimeNs();
+    for (int r = 0; r < BENCH_ROUNDS; r++) {
+        sink += LinearTimeoutCost();
+    }
+    double linear_timeout_ns = (Bench_TimeNs() - start) / BENCH_ROUNDS;
+
+    printf("%u signals (%u inputs + %u signal maps) on %u message IDs\n",
+           2 * BENCH_SIGNALS, BENCH_SIGNALS, BENCH_SIGNALS, BENCH_MESSAGES);
+    printf("%-22s %12s %18s\n", "", "indexed (ns)", "linear scan (ns)");
+    printf("%-22s %12.1f %18.1f\n", "frame dispatch", dispatch_ns, linear_dispatch_ns);
+    printf("%-22s %12.1f %18.1f\n", "timeout check", timeout_ns, linear_timeout_ns);
+
+    (void)sink;
+    return 0;
+}
+
+#endif /* PMU_CAN_BENCH */
@@ -0,0 +1,234 @@
+/**
+ ******************************************************************************
+ * @file           : bench_channel_exec.c
+ * @brief          : Host benchmark for the channel executor input lookups
+ * @author         : R2 m-sport
+ * @date           : 2026-01-01
+ ******************************************************************************
+ * Measures PMU_ChannelExec_Update() for configs of increasing size, each a
+ * chain of alternating timers and logic (IS_TRUE) channels fed by the
+ * previous channel plus output links, and compares it with the cost of the
+ * old per-read linear channel scan. These are the inputs Update() evaluates
+ * inline; other engine types (math, filter, ...) are not run by this loop.
+ *
+ * Not part of the Unity suite (only built with PMU_EXEC_BENCH):
+ *
+ *   cd firmware
+ *   gcc -O2 -DPMU_EXEC_BENCH -Itest -Iinclude -I../shared \
+ *       test/bench_channel_exec.c ../shared/channel_executor.c \
+ *       ../shared/channel_config.c ../shared/engine/[a-z]*.c -o bench_channel_exec
+ *   ./bench_channel_exec
+ ******************************************************************************
+ */
+
+#ifdef PMU_EXEC_BENCH
+
+#define _POSIX_C_SOURCE 199309L
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+#define PMU_EXEC_MAX_CHANNELS   256
+
+static uint32_t Bench_TimeUs(void);
+#define PMU_EXEC_TIME_US()      Bench_TimeUs()
+
+/* Executor under test, built with the benchmark channel limit and clock */
+#include "../src/pmu_channel_exec.c"
+
+#define BENCH_CYCLES        2000
+#define BENCH_HW_INPUT_ID   1       /* Registry channel that triggers the chain */
+#define BENCH_FIRST_ID      200
+
+/* Firmware stubs ------------------------------------------------------------*/
+
+int32_t PMU_Channel_GetValue(uint16_t channel_id)
+{
+    return (channel_id == BENCH_HW_INPUT_ID) ? 1 : 0;
+}
+
+HAL_StatusTypeDef PMU_Channel_SetValue(uint16_t channel_id, int32_t value)
+{
+    (void)channel_id;
+    (void)value;
+    return HAL_OK;
+}
+
+static uint8_t output_states[32];
+
+HAL_StatusTypeDef PMU_PROFET_SetState(uint8_t channel, uint8_t state)
+{
+    output_states[channel % 32] = state;
+    return HAL_OK;
+}
+
+void NucleoOutput_Reset(void)
+{
+}
+
+static uint32_t Bench_TimeUs(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint32_t)(ts.tv_sec * 1000000ULL + ts.tv_nsec / 1000);
+}
+
+static double Bench_TimeNs(void)
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1e9 + ts.tv_nsec;
+}
+
+/* Config builder ------------------------------------------------------------*/
+
+static uint16_t PutHeader(uint8_t* p, uint16_t id, uint8_t type, uint8_t hw_index,
+                          uint16_t source_id, uint8_t config_size)
+{
+    memset(p, 0, 14);
+    p[0] = (uint8_t)id;
+    p[1] = (uint8_t)(id >> 8);
+    p[2] = type;
+    p[5] = hw_index;
+    p[6] = (uint8_t)source_id;
+    p[7] = (uint8_t)(source_id >> 8);
+    p[13] = config_size;
+    return 14;
+}
+
+/**
+ * Channels BENCH_FIRST_ID + i, alternating PULSE timers and IS_TRUE logic,
+ * each fed by the previous one (the first by a hardware input), listed in
+ * reverse so slot order and ID order differ; plus links from the last
+ * channels to all 32 outputs.
+ */
+static uint16_t BuildConfig(uint8_t* buf, uint16_t channels)
+{
+    uint16_t offset = 2;
+    uint16_t count = 0;
+
+    for (int i = channels - 1; i >= 0; i--) {
+        uint16_t input = (i == 0) ? BENCH_HW_INPUT_ID : (uint16_t)(BENCH_FIRST_ID + i - 1);
+
+        if (i % 2) {
+            CfgLogic_t logic;
+            memset(&logic, 0, sizeof(logic));
+            logic.operation = 0x06;  /* IS_TRUE */
+            logic.input_count = 1;
+            logic.inputs[0] = input;
+
+            offset += PutHeader(&buf[offset], (uint16_t)(BENCH_FIRST_ID + i), CH_TYPE_LOGIC,
+                                0, 0, sizeof(logic));
+            memcpy(&buf[offset], &logic, sizeof(logic));
+            offset += sizeof(logic);
+        } else {
+            CfgTimer_t timer;
+            memset(&timer, 0, sizeof(timer));
+            timer.mode = 2;  /* PULSE */
+            timer.trigger_id = input;
+            timer.delay_ms = 1000;
+
+            offset += PutHeader(&buf[offset], (uint16_t)(BENCH_FIRST_ID + i), CH_TYPE_TIMER,
+                                0, 0, sizeof(timer));
+            memcpy(&buf[offset], &timer, sizeof(timer));
+            offset += sizeof(timer);
+        }
+        count++;
+    }
+
+    for (uint16_t hw = 0; hw < 32; hw++) {
+        uint16_t source = (uint16_t)(BENCH_FIRST_ID + channels - 1 - (hw % channels));
+        offset += PutHeader(&buf[offset], (uint16_t)(100 + hw), CH_TYPE_POWER_OUTPUT,
+                            (uint8_t)hw, source, 0);
+        count++;
+    }
+
+    buf[0] = (uint8_t)count;
+    buf[1] = (uint8_t)(count >> 8);
+    return offset;
+}
+
+/* Input ID a chain channel reads */
+static uint16_t ChainInput(const PMU_ExecChannel_t* ch)
+{
+    return (ch->runtime.type == CH_TYPE_LOGIC)
+        ? ((CfgLogic_t*)ch->runtime.config)->inputs[0]
+        : ((CfgTimer_t*)ch->runtime.config)->trigger_id;
+}
+
+/* Old lookup cost: one linear scan per input read (chain inputs + links) */
+static int32_t LinearScanCycle(void)
+{
+    int32_t sum = 0;
+    uint16_t reads = (uint16_t)(exec_state.channel_count + exec_state.output_link_count);
+    for (uint16_t r = 0; r < reads; r++) {
+        uint16_t wanted = (r < exec_state.channel_count)
+            ? ChainInput(&exec_state.channels[r])
+            : exec_state.output_links[r - exec_state.channel_count].source_id;
+        for (uint16_t i = 0; i < exec_state.channel_count; i++) {
+            if (exec_state.channels[i].channel_id == wanted) {
+                sum += exec_state.channels[i].runtime.value;
+                break;
+            }
+        }
+    }
+    return sum;
+}
+
+static uint8_t config_buf[PMU_EXEC_MAX_CHANNELS * 48 + 32 * 16];
+
+int main(void)
+{
+    static const uint16_t sizes[] = { 16, 64, 128, 250 };
+    volatile int32_t sink = 0;
+
+    printf("%9s %14s %14s %18s\n", "channels", "update (us)", "max (us)", "linear scan (us)");
+
+    for (size_t s = 0; s < sizeof(sizes) / sizeof(sizes[0]); s++) {
+        uint16_t channels = sizes[s];
+
+        PMU_ChannelExec_Init();
+        uint16_t size = BuildConfig(config_buf, channels);
+        int loaded = PMU_ChannelExec_LoadConfig(config_buf, size);
+        if (loaded != channels + 32) {
+            printf("FAIL: loaded %d of %d channels\n", loaded, channels + 32);
+            return 1;
+        }
+
+        double start = Bench_TimeNs();
+        for (int c = 0; c < BENCH_CYCLES; c++) {
+            PMU_ChannelExec_Update();
+        }
+        double update_us = (Bench_TimeNs() - start) / BENCH_CYCLES / 1000.0;
+
+        /* By now the whole chain follows the hardware input */
+        uint16_t id = 0;
+        int32_t value;
+        for (uint16_t i = 0; i < channels; i++) {
+            if (!PMU_ChannelExec_GetChannelInfo(i, &id, &value) || value != 1) {
+                printf("FAIL: channel %u = %ld\n", id, (long)value);
+                return 1;
+            }
+        }
+        if (!output_states[0] || !output_states[31]) {
+            printf("FAIL: outputs not driven\n");
+            return 1;
+        }
+
+        start = Bench_TimeNs();
+        for (int c = 0; c < BENCH_CYCLES; c++) {
+            sink += LinearScanCycle();
+        }
+        double linear_us = (Bench_TimeNs() - start) / BENCH_CYCLES / 1000.0;
+
+        uint32_t max_us = 0;
+        PMU_ChannelExec_GetStats(NULL, NULL, &max_us);
+        printf("%9u %14.2f %14lu %18.2f\n", channels, update_us, (unsigned long)max_us, linear_us);
+    }
+
+    (void)sink;
+    return 0;
+}
+
+#endif /* PMU_EXEC_BENCH */
@@ -0,0 +1,110 @@
+/**
+ * @file config_compress.c
+ * @brief LZ decoder for compressed binary config transfer
+ */
+
+#include "config_compress.h"
+
+enum {
+    LZ_STATE_SIZE_LO = 0,
+    LZ_STATE_SIZE_HI,
+    LZ_STATE_TOKEN,
+    LZ_STATE_LITERAL,
+    LZ_STATE_DIST_LO,
+    LZ_STATE_DIST_HI,
+    LZ_STATE_END,
+};
+
+void pmu_lz_decoder_init(PMU_LzDecoder_t* dec, uint8_t* out, uint16_t out_cap)
+{
+    dec->out = out;
+    dec->out_cap = out_cap;
+    dec->out_len = 0;
+    dec->raw_size = 0;
+    dec->distance = 0;
+    dec->state = LZ_STATE_SIZE_LO;
+    dec->count = 0;
+}
+
+int pmu_lz_decoder_feed(PMU_LzDecoder_t* dec, const uint8_t* in, size_t len)
+{
+    for (size_t i = 0; i < len; i++) {
+        uint8_t byte = in[i];
+
+        switch (dec->state) {
+            case LZ_STATE_SIZE_LO:
+                dec->raw_size = byte;
+                dec->state = LZ_STATE_SIZE_HI;
+                break;
+
+            case LZ_STATE_SIZE_HI:
+                dec->raw_size |= (uint16_t)byte << 8;
+                if (dec->raw_size > dec->out_cap) {
+                    return PMU_LZ_ERR_OVERFLOW;
+                }
+                dec->state = (dec->raw_size == 0) ? LZ_STATE_END : LZ_STATE_TOKEN;
+                break;
+
+            case LZ_STATE_TOKEN:
+                if (byte & 0x80) {
+                    dec->count = (byte & 0x7F) + PMU_LZ_MIN_MATCH;
+                    dec->state = LZ_STATE_DIST_LO;
+                } else {
+                    dec->count = byte + 1;
+                    dec->state = LZ_STATE_LITERAL;
+                }
+                if (dec->out_len + dec->count > dec->raw_size) {
+                    return PMU_LZ_ERR_DATA;
+                }
+                break;
+
+            case LZ_STATE_LITERAL:
+                dec->out[dec->out_len++] = byte;
+                if (--dec->count == 0) {
+                    dec->state = (dec->out_len == dec->raw_size) ? LZ_STATE_END : LZ_STATE_TOKEN;
+                }
+                break;
+
+            case LZ_STATE_DIST_LO:
+                dec->distance = byte;
+                dec->state = LZ_STATE_DIST_HI;
+                break;
+
+            case LZ_STATE_DIST_HI: {
+                dec->distance |= (uint16_t)byte << 8;
+                if (dec->distance == 0 || dec->distance > dec->out_len) {
+                    return PMU_LZ_ERR_DISTANCE;
+                }
+                /* Byte-wise forward copy: overlapping matches repeat a run */
+                uint8_t* dst = dec->out + dec->out_len;
+                const uint8_t* src = dst - dec->distance;
+                for (uint8_t n = 0; n < dec->count; n++) {
+                    dst[n] = src[n];
+                }
+                dec->out_len += dec->count;
+                dec->state = (dec->out_len == dec->raw_size) ? LZ_STATE_END : LZ_STATE_TOKEN;
+                break;
+            }
+
+            default:  /* LZ_STATE_END */
+                return PMU_LZ_ERR_DATA;
+        }
+    }
+
+    return (dec->state == LZ_STATE_END) ? PMU_LZ_DONE : PMU_LZ_OK;
+}
+
+int pmu_lz_decompress(const uint8_t* in, size_t in_len, uint8_t* out, uint16_t out_cap)
+{
+    PMU_LzDecoder_t dec;
+    pmu_lz_decoder_init(&dec, out, out_cap);
+
+    int result = pmu_lz_decoder_feed(&dec, in, in_len);
+    if (result < 0) {
+        return result;
+    }
+    if (result != PMU_LZ_DONE) {
+        return PMU_LZ_ERR_DATA;
+    }
+    return dec.out_len;
+}
@@ -0,0 +1,85 @@
+/**
+ * @file config_compress.h
+ * @brief LZ decoder for compressed binary config transfer
+ *
+ * Small-RAM LZ77 variant used by LOAD_BINARY_CONFIG_LZ. The decoder writes
+ * straight into the config buffer and resolves back-references against
+ * what it has already written, so it needs no window or staging buffer -
+ * only the few bytes of state in PMU_LzDecoder_t. Input can be fed in
+ * arbitrary pieces (one per transport chunk).
+ *
+ * Stream format:
+ *   [raw_size:2B LE]
+ *   tokens until raw_size bytes are produced:
+ *     0x00-0x7F  literal run: (token + 1) bytes follow
+ *     0x80-0xFF  match: length (token & 0x7F) + 4, followed by
+ *                [distance:2B LE], copied from distance bytes back
+ *                (overlapping copies encode runs)
+ *
+ * Encoder: shared/python/config_compress.py
+ *
+ * @version 1.0
+ * @date October 2026
+ */
+
+#ifndef PMU_CONFIG_COMPRESS_H
+#define PMU_CONFIG_COMPRESS_H
+
+#include <stdint.h>
+#include <stddef.h>
+#include <stdbool.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#define PMU_LZ_MIN_MATCH    4
+#define PMU_LZ_MAX_LITERAL  128
+#define PMU_LZ_MAX_MATCH    (0x7F + PMU_LZ_MIN_MATCH)
+
+/** Decoder result codes */
+typedef enum {
+    PMU_LZ_OK            = 0,   /**< Input consumed, more may follow */
+    PMU_LZ_DONE          = 1,   /**< raw_size bytes produced */
+    PMU_LZ_ERR_OVERFLOW  = -1,  /**< raw_size exceeds output buffer */
+    PMU_LZ_ERR_DISTANCE  = -2,  /**< Match reaches before start of output */
+    PMU_LZ_ERR_DATA      = -3,  /**< Token overruns raw_size or data after end */
+} PMU_LzResult_t;
+
+/** Streaming decoder state */
+typedef struct {
+    uint8_t* out;        /**< Output buffer */
+    uint16_t out_cap;    /**< Output buffer size */
+    uint16_t out_len;    /**< Bytes produced so far */
+    uint16_t raw_size;   /**< Expected output size (from stream header) */
+    uint16_t distance;   /**< Match distance being read */
+    uint8_t state;       /**< Parser state (internal) */
+    uint8_t count;       /**< Literal bytes / match length pending */
+} PMU_LzDecoder_t;
+
+/**
+ * @brief Start decoding into an output buffer
+ */
+void pmu_lz_decoder_init(PMU_LzDecoder_t* dec, uint8_t* out, uint16_t out_cap);
+
+/**
+ * @brief Feed the next piece of compressed input
+ *
+ * @return PMU_LZ_OK, PMU_LZ_DONE once raw_size bytes are produced, or a
+ *         negative PMU_LzResult_t error (the decoder must be re-initialized)
+ */
+int pmu_lz_decoder_feed(PMU_LzDecoder_t* dec, const uint8_t* in, size_t len);
+
+/**
+ * @brief Decompress a complete stream in one call
+ *
+ * @return Decompressed size, or a negative PMU_LzResult_t error
+ *         (PMU_LZ_ERR_DATA if the stream is truncated)
+ */
+int pmu_lz_decompress(const uint8_t* in, size_t in_len, uint8_t* out, uint16_t out_cap);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* PMU_CONFIG_COMPRESS_H */
@@ -33,11 +33,12 @@ void Caps_Init(DeviceCaps_t* caps, DeviceType_t device_type)
                 CAPS_HAS_SDCARD | CAPS_HAS_USB |
                 CAPS_HAS_RTC | CAPS_HAS_EEPROM | CAPS_HAS_FLASH_EXT;
 
+            /* CONFIG_LZ: pmu_protocol.c decodes LOAD_BINARY_CONFIG_LZ */
             caps->sw_flags =
                 CAPS_SW_PID | CAPS_SW_TABLES_2D | CAPS_SW_TABLES_3D |
                 CAPS_SW_LOGIC | CAPS_SW_TIMERS | CAPS_SW_FILTERS | CAPS_SW_MATH |
                 CAPS_SW_LUA | CAPS_SW_DATALOG | CAPS_SW_BLINKMARINE |
-                CAPS_SW_WIPER_PARK | CAPS_SW_CAN_STREAM;
+                CAPS_SW_WIPER_PARK | CAPS_SW_CAN_STREAM | CAPS_SW_CONFIG_LZ;
 
             caps->profet_count = 30;
             caps->hbridge_count = 4;
@@ -71,9 +72,10 @@ void Caps_Init(DeviceCaps_t* caps, DeviceType_t device_type)
                 CAPS_HAS_PWM | CAPS_HAS_CAN1 |
                 CAPS_HAS_USB;
 
+            /* CONFIG_LZ: the F446 MIN / SerialTransfer ports decode LOAD_BINARY_CONFIG_LZ */
             caps->sw_flags =
                 CAPS_SW_LOGIC | CAPS_SW_TIMERS |
-                CAPS_SW_TABLES_2D;
+                CAPS_SW_TABLES_2D | CAPS_SW_CONFIG_LZ;
 
             caps->profet_count = 0;
             caps->hbridge_count = 0;
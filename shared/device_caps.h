@@ -69,6 +69,8 @@ typedef enum {
     CAPS_SW_BLINKMARINE    = (1 << 9),   /**< Supports BlinkMarine keypads */
     CAPS_SW_WIPER_PARK     = (1 << 10),  /**< Supports wiper park mode */
     CAPS_SW_CAN_STREAM     = (1 << 11),  /**< Supports CAN streaming output */
+    CAPS_SW_CONFIG_LZ      = (1 << 12),  /**< Accepts LZ-compressed config upload */
+    CAPS_SW_CONFIG_IN_BAND = (1 << 13),  /**< Accepts chunked config upload over T-MIN */
 } DeviceCapsSwFlags_t;
 
 /*============================================================================
@@ -25,7 +25,13 @@ from .channel_types import (
     ChannelFlags,
 )
 
-from .crc import crc32, crc16_ccitt
+from .crc import crc32, crc32_update, crc32_finalize, crc16_ccitt, crc16_update
+
+from .value_store import ChannelValueStore
+
+from .datalog import PlogReader, MappedPlogReader, CsvLogReader, open_log
+
+from .log_replay import LogReplay, ReplayStats, replay_file
 
 __version__ = "1.0.0"
 __all__ = [
@@ -38,4 +44,15 @@ __all__ = [
     "ChannelFlags",
     "crc32",
     "crc16_ccitt",
+    "crc32_update",
+    "crc32_finalize",
+    "crc16_update",
+    "ChannelValueStore",
+    "PlogReader",
+    "MappedPlogReader",
+    "CsvLogReader",
+    "open_log",
+    "LogReplay",
+    "ReplayStats",
+    "replay_file",
 ]
@@ -422,7 +422,7 @@ class CfgLogic:
 
 @dataclass
 class CfgMath:
-    """Math configuration (32 bytes)"""
+    """Math configuration (34 bytes)"""
     operation: int = 0
     input_count: int = 0
     inputs: List[int] = field(default_factory=lambda: [CH_REF_NONE] * CFG_MAX_INPUTS)
@@ -433,7 +433,7 @@ class CfgMath:
     scale_den: int = 1
 
     FORMAT = "<BB8Hiiihh"
-    SIZE = 32
+    SIZE = 34
 
     def pack(self) -> bytes:
         inputs = self.inputs[:CFG_MAX_INPUTS]
@@ -583,6 +583,139 @@ class CfgNumber:
         return cls(*values)
 
 
+@dataclass
+class CfgSwitchCase:
+    """Single switch case (12 bytes)"""
+    match_value: int = 0
+    max_value: int = 0
+    result: int = 0
+
+
+@dataclass
+class CfgSwitch:
+    """Switch/selector configuration (104 bytes)"""
+    selector_id: int = CH_REF_NONE
+    case_count: int = 0
+    mode: int = 0  # 0=value match, 1=range match, 2=index
+    cases: List[CfgSwitchCase] = field(
+        default_factory=lambda: [CfgSwitchCase() for _ in range(CFG_MAX_SWITCH_CASES)]
+    )
+    default_value: int = 0
+
+    FORMAT = f"<HBB{CFG_MAX_SWITCH_CASES * 3}ii"
+    SIZE = 104
+
+    def pack(self) -> bytes:
+        cases = list(self.cases[:CFG_MAX_SWITCH_CASES])
+        while len(cases) < CFG_MAX_SWITCH_CASES:
+            cases.append(CfgSwitchCase())
+        case_values = []
+        for case in cases:
+            case_values.extend((case.match_value, case.max_value, case.result))
+        return struct.pack(
+            self.FORMAT,
+            self.selector_id, self.case_count, self.mode,
+            *case_values, self.default_value
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "CfgSwitch":
+        values = struct.unpack(cls.FORMAT, data[:cls.SIZE])
+        cases = [
+            CfgSwitchCase(*values[3 + i * 3:6 + i * 3])
+            for i in range(CFG_MAX_SWITCH_CASES)
+        ]
+        return cls(
+            selector_id=values[0],
+            case_count=values[1],
+            mode=values[2],
+            cases=cases,
+            default_value=values[-1]
+        )
+
+
+@dataclass
+class CfgCounter:
+    """Counter configuration (16 bytes)"""
+    inc_trigger_id: int = CH_REF_NONE
+    dec_trigger_id: int = CH_REF_NONE
+    reset_trigger_id: int = CH_REF_NONE
+    initial_value: int = 0
+    min_value: int = 0
+    max_value: int = 100
+    step: int = 1
+    wrap: int = 0
+    edge_mode: int = 1
+
+    FORMAT = "<HHHhhhhBB"
+    SIZE = 16
+
+    def pack(self) -> bytes:
+        return struct.pack(
+            self.FORMAT,
+            self.inc_trigger_id, self.dec_trigger_id, self.reset_trigger_id,
+            self.initial_value, self.min_value, self.max_value, self.step,
+            self.wrap, self.edge_mode
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "CfgCounter":
+        values = struct.unpack(cls.FORMAT, data[:cls.SIZE])
+        return cls(*values)
+
+
+@dataclass
+class CfgFlipFlop:
+    """FlipFlop configuration (12 bytes)"""
+    ff_type: int = 0
+    reserved: int = 0
+    set_input_id: int = CH_REF_NONE
+    reset_input_id: int = CH_REF_NONE
+    clock_input_id: int = CH_REF_NONE
+    initial_state: int = 0
+    reserved2: bytes = field(default_factory=lambda: bytes(3))
+
+    FORMAT = "<BBHHHB3s"
+    SIZE = 12
+
+    def pack(self) -> bytes:
+        return struct.pack(
+            self.FORMAT,
+            self.ff_type, self.reserved, self.set_input_id, self.reset_input_id,
+            self.clock_input_id, self.initial_state, self.reserved2
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "CfgFlipFlop":
+        values = struct.unpack(cls.FORMAT, data[:cls.SIZE])
+        return cls(*values)
+
+
+@dataclass
+class CfgHysteresis:
+    """Hysteresis configuration (12 bytes)"""
+    input_id: int = CH_REF_NONE
+    hyst_type: int = 0
+    invert: int = 0
+    threshold_high: int = 100
+    threshold_low: int = 50
+
+    FORMAT = "<HBBii"
+    SIZE = 12
+
+    def pack(self) -> bytes:
+        return struct.pack(
+            self.FORMAT,
+            self.input_id, self.hyst_type, self.invert,
+            self.threshold_high, self.threshold_low
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "CfgHysteresis":
+        values = struct.unpack(cls.FORMAT, data[:cls.SIZE])
+        return cls(*values)
+
+
 # ============================================================================
 # Type Config Mapping
 # ============================================================================
@@ -600,6 +733,10 @@ CONFIG_TYPES: Dict[int, type] = {
     ChannelType.FILTER: CfgFilter,
     ChannelType.PID: CfgPid,
     ChannelType.NUMBER: CfgNumber,
+    ChannelType.SWITCH: CfgSwitch,
+    ChannelType.COUNTER: CfgCounter,
+    ChannelType.FLIPFLOP: CfgFlipFlop,
+    ChannelType.HYSTERESIS: CfgHysteresis,
 }
 
 
@@ -14,8 +14,9 @@ Version: 1.0
 Date: January 2026
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, Optional, Any
+from typing import Callable, Optional, Any, Dict, List, NamedTuple, Tuple
 
 # Import Logic Engine modules
 from .engine.logic import *
@@ -32,6 +33,8 @@ from .engine.flipflop import *
 # Import channel config types (includes ChannelType)
 from .channel_config import *
 
+from .value_store import ChannelValueStore
+
 # =============================================================================
 # Constants
 # =============================================================================
@@ -108,6 +111,110 @@ class ExecContext:
     dt_ms: int = 0
 
 
+# =============================================================================
+# Compiled Execution Plan
+# =============================================================================
+
+class PlanStep(NamedTuple):
+    """
+    Single prebound plan step.
+    """
+    runtime: ChannelRuntime
+    slot: int
+    func: Callable[[], int]
+
+
+@dataclass
+class ExecPlan:
+    """
+    Compiled execution plan.
+
+    Steps are ordered so that every channel runs after the channels it
+    reads from. Input references are resolved to slots in `values` at
+    compile time, so a cycle is a flat loop over prebound steps.
+
+    With a ChannelValueStore attached, `values` is the store's current
+    buffer and slots are channel IDs.
+    """
+    steps: List[PlanStep] = field(default_factory=list)
+    values: Any = field(default_factory=lambda: [0])
+    zero_slot: int = 0  # Always reads 0, used for CH_REF_NONE
+    store: Optional[ChannelValueStore] = None
+    slots: Dict[int, int] = field(default_factory=dict)  # channel_id -> slot
+    external: List[Tuple[int, int]] = field(default_factory=list)  # (slot, channel_id)
+    cyclic_ids: List[int] = field(default_factory=list)  # Channels in dependency loops
+
+
+_LOGIC_MULTI_OPS = {
+    LogicOp.AND: logic_and,
+    LogicOp.OR: logic_or,
+    LogicOp.XOR: logic_xor,
+    LogicOp.NAND: logic_nand,
+    LogicOp.NOR: logic_nor,
+}
+
+_LOGIC_COMPARE_OPS = {
+    LogicOp.GT: logic_gt,
+    LogicOp.GTE: logic_gte,
+    LogicOp.LT: logic_lt,
+    LogicOp.LTE: logic_lte,
+    LogicOp.EQ: logic_eq,
+    LogicOp.NEQ: logic_neq,
+}
+
+_MATH_BINARY_OPS = {
+    MathOp.ADD: math_add,
+    MathOp.SUB: math_sub,
+    MathOp.MUL: math_mul,
+    MathOp.DIV: math_div,
+    MathOp.MOD: math_mod,
+}
+
+_MATH_UNARY_OPS = {
+    MathOp.ABS: math_abs,
+    MathOp.NEG: math_neg,
+}
+
+_MATH_LIST_OPS = {
+    MathOp.MIN: math_min,
+    MathOp.MAX: math_max,
+    MathOp.AVG: math_avg,
+}
+
+
+def channel_input_ids(runtime: ChannelRuntime) -> List[int]:
+    """
+    Get the channel IDs a channel reads, in input order.
+
+    Args:
+        runtime: Channel runtime data
+
+    Returns:
+        Input channel IDs (unused references are CH_REF_NONE)
+    """
+    config = runtime.config
+    ch_type = runtime.type
+    if config is None:
+        return []
+
+    if ch_type in (ChannelType.LOGIC, ChannelType.MATH):
+        count = min(config.input_count, EXEC_MAX_INPUTS)
+        ids = list(config.inputs[:count])
+        ids.extend([CH_REF_NONE] * (count - len(ids)))
+        return ids
+    if ch_type == ChannelType.TIMER:
+        return [config.trigger_id]
+    if ch_type == ChannelType.PID:
+        return [config.setpoint_id, config.feedback_id]
+    if ch_type in (ChannelType.FILTER, ChannelType.TABLE_2D, ChannelType.HYSTERESIS):
+        return [config.input_id]
+    if ch_type == ChannelType.SWITCH:
+        return [config.selector_id]
+    if ch_type == ChannelType.COUNTER:
+        return [config.inc_trigger_id, config.dec_trigger_id, config.reset_trigger_id]
+    return []
+
+
 # =============================================================================
 # Executor Class
 # =============================================================================
@@ -124,10 +231,18 @@ class ChannelExecutor:
         executor.update_time(current_time_ms)
         for channel in channels:
             new_value = executor.process_channel(channel)
+
+    Compiled usage (dependency order resolved once):
+        executor.compile(channels)
+
+        # Each cycle:
+        executor.run_cycle(current_time_ms)
     """
 
     def __init__(self):
         self.ctx = ExecContext()
+        self.store: Optional[ChannelValueStore] = None
+        self.plan: Optional[ExecPlan] = None
 
     def init(self,
              get_value: GetValueFunc,
@@ -149,6 +264,30 @@ class ChannelExecutor:
             last_ms=0,
             dt_ms=0
         )
+        self.store = None
+        self.plan = None
+
+    def init_store(self,
+                   store: Optional[ChannelValueStore] = None,
+                   user_data: Any = None) -> ChannelValueStore:
+        """
+        Initialize executor on a dense channel value store.
+
+        The store backs get_value/set_value for process_channel() and is
+        used natively by compiled plans.
+
+        Args:
+            store: Value store (a new one is created if omitted)
+            user_data: Optional user data
+
+        Returns:
+            The attached value store
+        """
+        if store is None:
+            store = ChannelValueStore()
+        self.init(store.get, store.set, user_data)
+        self.store = store
+        return store
 
     def update_time(self, now_ms: int):
         """
@@ -374,7 +513,6 @@ class ChannelExecutor:
 
         # Build table
         table = Table2D(
-            size=config.point_count,
             x_values=list(config.x_values[:config.point_count]),
             y_values=list(config.y_values[:config.point_count])
         )
@@ -384,7 +522,11 @@ class ChannelExecutor:
     def exec_switch(self, config: CfgSwitch) -> int:
         """Execute switch channel."""
         selector = self._get_input(config.selector_id)
+        return self._select_case(config, selector)
 
+    @staticmethod
+    def _select_case(config: CfgSwitch, selector: int) -> int:
+        """Select switch output for a selector value."""
         # Mode 2: index-based selection
         if config.mode == 2:
             if 0 <= selector < config.case_count:
@@ -511,6 +653,414 @@ class ChannelExecutor:
         runtime.value = result
         return result
 
+    # =========================================================================
+    # Compiled Execution
+    # =========================================================================
+
+    def compile(self, runtimes: List[ChannelRuntime]) -> ExecPlan:
+        """
+        Compile channels into a dependency-ordered execution plan.
+
+        Channels are sorted topologically by their input references and
+        bound to type-specific steps with input slots already resolved.
+        Channels inside a dependency loop run last, in the given order,
+        and read the previous cycle's value of their loop partners.
+        Channels without an executor step (inputs, outputs, system) are
+        read through get_value once per cycle, or straight from the value
+        store when one is attached.
+
+        Configs are snapshotted - recompile after changing them.
+
+        Args:
+            runtimes: All channels of the configuration
+
+        Returns:
+            Compiled plan, also stored as the executor's active plan
+        """
+        binders = {
+            ChannelType.LOGIC: self._bind_logic,
+            ChannelType.MATH: self._bind_math,
+            ChannelType.TIMER: self._bind_timer,
+            ChannelType.PID: self._bind_pid,
+            ChannelType.FILTER: self._bind_filter,
+            ChannelType.TABLE_2D: self._bind_table2d,
+            ChannelType.SWITCH: self._bind_switch,
+            ChannelType.COUNTER: self._bind_counter,
+            ChannelType.HYSTERESIS: self._bind_hysteresis,
+            ChannelType.NUMBER: self._bind_number,
+        }
+
+        by_id: Dict[int, ChannelRuntime] = {}
+        for runtime in runtimes:
+            if runtime.config is None or runtime.type not in binders:
+                continue
+            if runtime.id in by_id:
+                raise ValueError(f"Duplicate channel id {runtime.id}")
+            by_id[runtime.id] = runtime
+
+        # Kahn's algorithm, stable with respect to the given order
+        inputs_of = {ch_id: channel_input_ids(rt) for ch_id, rt in by_id.items()}
+        dependents: Dict[int, List[int]] = {ch_id: [] for ch_id in by_id}
+        pending: Dict[int, int] = {}
+        for ch_id, input_ids in inputs_of.items():
+            deps = {i for i in input_ids if i in by_id and i != ch_id}
+            pending[ch_id] = len(deps)
+            for dep in deps:
+                dependents[dep].append(ch_id)
+
+        ready = deque(ch_id for ch_id in by_id if pending[ch_id] == 0)
+        order: List[int] = []
+        while ready:
+            ch_id = ready.popleft()
+            order.append(ch_id)
+            for dependent in dependents[ch_id]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        store = self.store
+        if store is None:
+            plan = ExecPlan()
+        else:
+            plan = ExecPlan(values=store.current, zero_slot=store.null_slot, store=store)
+
+        if len(order) < len(by_id):
+            ordered = set(order)
+            plan.cyclic_ids = [ch_id for ch_id in by_id if ch_id not in ordered]
+            order.extend(plan.cyclic_ids)
+
+        for ch_id in order:
+            if store is None:
+                plan.slots[ch_id] = len(plan.values)
+                plan.values.append(by_id[ch_id].value)
+            elif ch_id in store:
+                plan.slots[ch_id] = ch_id
+            else:
+                raise ValueError(f"Channel id {ch_id} outside value store")
+
+        for ch_id in order:
+            runtime = by_id[ch_id]
+            in_slots = [self._resolve_slot(plan, i) for i in inputs_of[ch_id]]
+            func = binders[runtime.type](runtime, plan, in_slots)
+            plan.steps.append(PlanStep(runtime, plan.slots[ch_id], func))
+
+        self.plan = plan
+        return plan
+
+    def run_cycle(self, now_ms: int) -> int:
+        """
+        Execute all channels of the compiled plan once.
+
+        External inputs are fetched through get_value at the start of the
+        cycle; every computed value is published through set_value.
+
+        With a value store attached the store is the only destination:
+        the cycle starts with begin_cycle() and results are written to it
+        directly (ChannelRuntime.value is not updated).
+
+        Args:
+            now_ms: Current time in milliseconds
+
+        Returns:
+            Number of channels executed
+        """
+        plan = self.plan
+        if plan is None:
+            raise RuntimeError("No execution plan - call compile() first")
+
+        self.update_time(now_ms)
+
+        values = plan.values
+        if plan.store is not None:
+            plan.store.begin_cycle()
+            for _, slot, func in plan.steps:
+                values[slot] = func()
+            return len(plan.steps)
+
+        get_value = self.ctx.get_value
+        if get_value is not None:
+            for slot, channel_id in plan.external:
+                values[slot] = get_value(channel_id)
+
+        set_value = self.ctx.set_value
+        for runtime, slot, func in plan.steps:
+            runtime.prev_value = runtime.value
+            result = func()
+            runtime.value = result
+            values[slot] = result
+            if set_value is not None:
+                set_value(runtime.id, result)
+
+        return len(plan.steps)
+
+    @staticmethod
+    def _resolve_slot(plan: ExecPlan, channel_id: int) -> int:
+        """Get the value slot for a channel, allocating external slots."""
+        if plan.store is not None:
+            return channel_id if channel_id in plan.store else plan.zero_slot
+        if channel_id == CH_REF_NONE:
+            return plan.zero_slot
+        slot = plan.slots.get(channel_id)
+        if slot is None:
+            slot = len(plan.values)
+            plan.values.append(0)
+            plan.slots[channel_id] = slot
+            plan.external.append((slot, channel_id))
+        return slot
+
+    # =========================================================================
+    # Plan Step Binders
+    # =========================================================================
+
+    def _bind_logic(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind logic channel step."""
+        v = plan.values
+        config = runtime.config
+        op = config.operation
+        compare = config.compare_value
+        a = s[0] if len(s) > 0 else plan.zero_slot
+        b = s[1] if len(s) > 1 else plan.zero_slot
+
+        if op in _LOGIC_MULTI_OPS:
+            fn = _LOGIC_MULTI_OPS[op]
+            evaluate = lambda: fn([v[i] for i in s])
+        elif op == LogicOp.NOT:
+            evaluate = lambda: logic_not(v[a])
+        elif op in _LOGIC_COMPARE_OPS:
+            fn = _LOGIC_COMPARE_OPS[op]
+            evaluate = lambda: fn(v[a], compare)
+        elif op == LogicOp.IN_RANGE:
+            evaluate = lambda: logic_in_range(v[a], v[b], compare)
+        else:
+            evaluate = lambda: 0
+
+        if config.invert_output:
+            return lambda: int(not evaluate())
+        return lambda: int(evaluate())
+
+    def _bind_math(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind math channel step."""
+        v = plan.values
+        config = runtime.config
+        op = config.operation
+        lo, hi = config.min_value, config.max_value
+        num, den = config.scale_num, config.scale_den
+        a = s[0] if len(s) > 0 else plan.zero_slot
+        b = s[1] if len(s) > 1 else plan.zero_slot
+        c = s[2] if len(s) > 2 else plan.zero_slot
+
+        if op in _MATH_BINARY_OPS:
+            fn = _MATH_BINARY_OPS[op]
+            compute = lambda: fn(v[a], v[b])
+        elif op in _MATH_UNARY_OPS:
+            fn = _MATH_UNARY_OPS[op]
+            compute = lambda: fn(v[a])
+        elif op in _MATH_LIST_OPS:
+            fn = _MATH_LIST_OPS[op]
+            compute = lambda: fn([v[i] for i in s])
+        elif op == MathOp.CLAMP:
+            compute = lambda: math_clamp(v[a], lo, hi)
+        elif op == MathOp.MAP:
+            compute = lambda: math_map(v[a], v[b], v[c], lo, hi)
+        elif op == MathOp.SCALE:
+            compute = lambda: math_scale(v[a], num, den)
+        else:
+            compute = lambda: v[a]
+
+        if den != 0 and den != 1:
+            return lambda: math_scale(math_clamp(compute(), lo, hi), num, den)
+        return lambda: math_clamp(compute(), lo, hi)
+
+    def _bind_timer(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind timer channel step."""
+        v = plan.values
+        config = runtime.config
+        trigger = s[0]
+        timer_cfg = TimerConfig(
+            mode=TimerMode(config.mode),
+            trigger_mode=TimerTrigger(config.trigger_mode),
+            delay_ms=config.delay_ms,
+            on_time_ms=config.on_time_ms,
+            off_time_ms=config.off_time_ms,
+            auto_reset=config.auto_reset
+        )
+
+        def step() -> int:
+            state = runtime.state
+            if state.timer is None:
+                state.timer = TimerState()
+            return timer_update(state.timer, timer_cfg, v[trigger], self.ctx.now_ms)
+        return step
+
+    def _bind_pid(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind PID channel step."""
+        v = plan.values
+        config = runtime.config
+        setpoint, feedback = s
+        pid_cfg = PIDConfig(
+            kp=config.kp,
+            ki=config.ki,
+            kd=config.kd,
+            scale=PID_DEFAULT_SCALE,
+            output_min=config.output_min,
+            output_max=config.output_max,
+            integral_min=config.integral_min,
+            integral_max=config.integral_max,
+            deadband=config.deadband,
+            d_on_measurement=config.d_on_measurement,
+            reset_integral_on_setpoint=False
+        )
+
+        def step() -> int:
+            state = runtime.state
+            if state.pid is None:
+                state.pid = PIDState()
+            return pid_update(state.pid, pid_cfg, v[setpoint], v[feedback], self.ctx.dt_ms)
+        return step
+
+    def _bind_filter(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind filter channel step."""
+        v = plan.values
+        config = runtime.config
+        inp = s[0]
+        filter_type = config.filter_type
+
+        if filter_type == FilterType.SMA:
+            sma_cfg = SMAConfig(window_size=config.window_size)
+
+            def step() -> int:
+                state = runtime.state
+                if state.sma is None:
+                    state.sma = SMAState()
+                return sma_update(state.sma, sma_cfg, v[inp])
+
+        elif filter_type == FilterType.EMA:
+            ema_cfg = EMAConfig(alpha=config.alpha)
+
+            def step() -> int:
+                state = runtime.state
+                if state.ema is None:
+                    state.ema = EMAState()
+                return ema_update(state.ema, ema_cfg, v[inp])
+
+        elif filter_type == FilterType.LOWPASS:
+            lpf_cfg = LPFConfig(time_constant_ms=config.time_constant_ms, scale=1000)
+
+            def step() -> int:
+                state = runtime.state
+                if state.lpf is None:
+                    state.lpf = LPFState()
+                return lpf_update(state.lpf, lpf_cfg, v[inp], self.ctx.dt_ms)
+
+        elif filter_type == FilterType.MEDIAN:
+            median_cfg = MedianConfig(window_size=config.window_size)
+
+            def step() -> int:
+                state = runtime.state
+                if state.median is None:
+                    state.median = MedianState()
+                return median_update(state.median, median_cfg, v[inp])
+
+        elif filter_type == FilterType.RATE_LIMIT:
+            rate_cfg = RateLimiterConfig(
+                rise_rate=config.time_constant_ms,  # Reuse field
+                fall_rate=config.time_constant_ms
+            )
+
+            def step() -> int:
+                state = runtime.state
+                if state.rate_limiter is None:
+                    state.rate_limiter = RateLimiterState()
+                return rate_limiter_update(state.rate_limiter, rate_cfg, v[inp], self.ctx.dt_ms)
+
+        elif filter_type == FilterType.DEBOUNCE:
+            debounce_cfg = DebounceConfig(
+                debounce_ms=config.time_constant_ms,
+                hysteresis=0
+            )
+
+            def step() -> int:
+                state = runtime.state
+                if state.debounce is None:
+                    state.debounce = DebounceState()
+                return debounce_update(state.debounce, debounce_cfg, v[inp], self.ctx.dt_ms)
+
+        else:
+            def step() -> int:
+                return v[inp]
+
+        return step
+
+    def _bind_table2d(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind 2D table channel step."""
+        v = plan.values
+        config = runtime.config
+        inp = s[0]
+        table = Table2D(
+            x_values=list(config.x_values[:config.point_count]),
+            y_values=list(config.y_values[:config.point_count])
+        )
+        return lambda: table2d_lookup(table, v[inp])
+
+    def _bind_switch(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind switch channel step."""
+        v = plan.values
+        config = runtime.config
+        selector = s[0]
+        select = self._select_case
+        return lambda: select(config, v[selector])
+
+    def _bind_counter(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind counter channel step."""
+        v = plan.values
+        config = runtime.config
+        inc, dec, reset = s
+        counter_cfg = CounterConfig(
+            initial_value=config.initial_value,
+            min_value=config.min_value,
+            max_value=config.max_value,
+            step=config.step,
+            wrap=config.wrap,
+            edge_mode=config.edge_mode
+        )
+
+        def step() -> int:
+            state = runtime.state
+            if state.counter is None:
+                state.counter = CounterState()
+            return counter_update(state.counter, counter_cfg, v[inc], v[dec], v[reset])
+        return step
+
+    def _bind_hysteresis(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind hysteresis channel step."""
+        v = plan.values
+        config = runtime.config
+        inp = s[0]
+        hyst_cfg = HysteresisConfig(
+            threshold_high=config.threshold_high,
+            threshold_low=config.threshold_low,
+            invert=config.invert
+        )
+
+        def step() -> int:
+            state = runtime.state
+            if state.hysteresis is None:
+                state.hysteresis = HysteresisState()
+            return hysteresis_update(state.hysteresis, hyst_cfg, v[inp])
+        return step
+
+    def _bind_number(self, runtime: ChannelRuntime, plan: ExecPlan, s: List[int]) -> Callable[[], int]:
+        """Bind number channel step."""
+        v = plan.values
+        config = runtime.config
+        if config.readonly:
+            value = config.value
+            return lambda: value
+        if plan.store is not None:
+            ch_id = runtime.id
+            return lambda: v[ch_id]
+        return lambda: runtime.value
+
     # =========================================================================
     # State Initialization
     # =========================================================================
@@ -0,0 +1,128 @@
+"""
+PMU-30 Config Compression - Python implementation
+
+Encoder (and reference decoder) for the small-RAM LZ format decoded by
+config_compress.c. Binary configs compress well: channel names repeat
+prefixes and most struct fields are zero.
+
+Stream format:
+    [raw_size:2B LE]
+    tokens until raw_size bytes are produced:
+        0x00-0x7F  literal run: (token + 1) bytes follow
+        0x80-0xFF  match: length (token & 0x7F) + 4, then [distance:2B LE]
+"""
+
+import struct
+from typing import Dict, List
+
+MIN_MATCH = 4
+MAX_LITERAL = 128
+MAX_MATCH = 0x7F + MIN_MATCH
+MAX_DISTANCE = 0xFFFF
+MAX_RAW_SIZE = 0xFFFF
+
+# Candidate positions checked per hash bucket (higher = smaller output, slower)
+MAX_CHAIN = 32
+
+
+class CompressError(ValueError):
+    """Malformed compressed stream or input too large."""
+    pass
+
+
+def _flush_literals(out: bytearray, data: bytes, start: int, end: int):
+    while start < end:
+        run = min(end - start, MAX_LITERAL)
+        out.append(run - 1)
+        out += data[start:start + run]
+        start += run
+
+
+def compress(data: bytes) -> bytes:
+    """Compress data (at most 65535 bytes).
+
+    Greedy LZ77 over hash chains of 4-byte prefixes; the whole input is the
+    window, so the decoder needs no memory beyond its output buffer.
+    """
+    data = bytes(data)
+    size = len(data)
+    if size > MAX_RAW_SIZE:
+        raise CompressError(f"Input too large: {size} bytes")
+
+    out = bytearray(struct.pack('<H', size))
+    chains: Dict[bytes, List[int]] = {}
+    literal_start = 0
+    pos = 0
+
+    while pos + MIN_MATCH <= size:
+        key = data[pos:pos + MIN_MATCH]
+        candidates = chains.get(key)
+        best_len = 0
+        best_dist = 0
+
+        if candidates:
+            limit = min(MAX_MATCH, size - pos)
+            for cand in reversed(candidates[-MAX_CHAIN:]):
+                dist = pos - cand
+                if dist > MAX_DISTANCE:
+                    break
+                length = MIN_MATCH
+                while length < limit and data[cand + length] == data[pos + length]:
+                    length += 1
+                if length > best_len:
+                    best_len, best_dist = length, dist
+                    if length == limit:
+                        break
+
+        if best_len:
+            _flush_literals(out, data, literal_start, pos)
+            out.append(0x80 | (best_len - MIN_MATCH))
+            out += struct.pack('<H', best_dist)
+            end = pos + best_len
+            while pos < end:
+                chains.setdefault(data[pos:pos + MIN_MATCH], []).append(pos)
+                pos += 1
+            literal_start = pos
+        else:
+            chains.setdefault(key, []).append(pos)
+            pos += 1
+
+    _flush_literals(out, data, literal_start, size)
+    return bytes(out)
+
+
+def decompress(stream: bytes) -> bytes:
+    """Decompress a complete stream (reference for config_compress.c)."""
+    if len(stream) < 2:
+        raise CompressError("Stream too short")
+
+    raw_size = struct.unpack_from('<H', stream, 0)[0]
+    out = bytearray()
+    pos = 2
+
+    while len(out) < raw_size:
+        if pos >= len(stream):
+            raise CompressError("Truncated stream")
+        token = stream[pos]
+        pos += 1
+        if token & 0x80:
+            length = (token & 0x7F) + MIN_MATCH
+            if pos + 2 > len(stream):
+                raise CompressError("Truncated match")
+            dist = struct.unpack_from('<H', stream, pos)[0]
+            pos += 2
+            if dist == 0 or dist > len(out) or len(out) + length > raw_size:
+                raise CompressError(f"Invalid match at offset {pos - 3}")
+            start = len(out) - dist
+            for i in range(length):
+                out.append(out[start + i])
+        else:
+            length = token + 1
+            if len(out) + length > raw_size or pos + length > len(stream):
+                raise CompressError(f"Invalid literal run at offset {pos - 1}")
+            out += stream[pos:pos + length]
+            pos += length
+
+    if pos != len(stream):
+        raise CompressError("Trailing data after end of stream")
+    return bytes(out)
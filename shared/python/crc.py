@@ -2,8 +2,22 @@
 PMU-30 CRC Functions - Python implementation
 
 Mirrors crc32.h/.c for Python compatibility.
+
+crc32() and crc16_ccitt() use the C implementations in zlib and
+binascii (same polynomials and initial values as crc32.c). The
+*_update()/finalize functions allow computing a CRC over data that
+arrives in pieces. Pure Python table-driven versions are kept as
+reference implementations.
 """
 
+import binascii
+import zlib
+
+CRC32_INIT = 0xFFFFFFFF
+CRC16_INIT = 0xFFFF
+CRC16_POLY = 0x1021
+
+
 # CRC-32 lookup table (IEEE 802.3 polynomial)
 _CRC32_TABLE = [
     0x00000000, 0x77073096, 0xEE0E612C, 0x990951BA,
@@ -73,6 +87,25 @@ _CRC32_TABLE = [
 ]
 
 
+def _make_crc16_table() -> list:
+    """Build the CRC-16-CCITT (0x1021, MSB first) lookup table."""
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ CRC16_POLY) if crc & 0x8000 else (crc << 1)
+        table.append(crc & 0xFFFF)
+    return table
+
+
+# CRC-16-CCITT lookup table (polynomial 0x1021)
+CRC16_TABLE = _make_crc16_table()
+
+
+# ============================================================================
+# CRC-32
+# ============================================================================
+
 def crc32(data: bytes) -> int:
     """
     Calculate CRC-32 checksum (IEEE 802.3).
@@ -83,12 +116,41 @@ def crc32(data: bytes) -> int:
     Returns:
         CRC-32 checksum as unsigned 32-bit integer
     """
+    return zlib.crc32(data) & 0xFFFFFFFF
+
+
+def crc32_update(crc: int, data: bytes) -> int:
+    """
+    Update CRC-32 with additional data (mirrors pmu_crc32_update).
+
+    Args:
+        crc: Current CRC register (CRC32_INIT for the first chunk)
+        data: Input bytes
+
+    Returns:
+        Updated CRC register (pass to crc32_finalize when done)
+    """
+    return zlib.crc32(data, crc ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+
+
+def crc32_finalize(crc: int) -> int:
+    """Finalize CRC-32 register to the checksum (mirrors pmu_crc32_finalize)."""
+    return crc ^ 0xFFFFFFFF
+
+
+def crc32_py(data: bytes) -> int:
+    """Table-driven pure Python CRC-32 (reference implementation)."""
     crc = 0xFFFFFFFF
+    table = _CRC32_TABLE
     for byte in data:
-        crc = _CRC32_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
     return crc ^ 0xFFFFFFFF
 
 
+# ============================================================================
+# CRC-16-CCITT
+# ============================================================================
+
 def crc16_ccitt(data: bytes) -> int:
     """
     Calculate CRC-16-CCITT checksum.
@@ -102,12 +164,29 @@ def crc16_ccitt(data: bytes) -> int:
     Returns:
         CRC-16 checksum as unsigned 16-bit integer
     """
-    crc = 0xFFFF
+    return binascii.crc_hqx(data, CRC16_INIT)
+
+
+def crc16_update(crc: int, data: bytes) -> int:
+    """
+    Update CRC-16-CCITT with additional data.
+
+    The CRC has no final XOR, so the result is both the running value
+    and the checksum.
+
+    Args:
+        crc: Current CRC (CRC16_INIT for the first chunk)
+        data: Input bytes
+
+    Returns:
+        Updated CRC
+    """
+    return binascii.crc_hqx(data, crc)
+
+
+def crc16_ccitt_py(data: bytes, crc: int = CRC16_INIT) -> int:
+    """Table-driven pure Python CRC-16-CCITT (reference implementation)."""
+    table = CRC16_TABLE
     for byte in data:
-        crc ^= byte << 8
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
-            else:
-                crc = (crc << 1) & 0xFFFF
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
     return crc
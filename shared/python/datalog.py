@@ -0,0 +1,702 @@
+"""
+PMU-30 Data Log Files - Python implementation
+
+Mirrors the PLOG file format written by pmu_datalog.c and the CSV
+format exported by the configurator's data logger.
+
+PLOG layout (little-endian):
+- PMU_DataLog_FileHeader_t (84 bytes)
+- PMU_DataLog_Channel_t x channel_count (64 bytes each)
+- Records: uint16 length + sample (uint32 timestamp_ms + one value per
+  enabled channel, packed with the channel's type size)
+
+Readers stream records in bounded memory and yield LogSample tuples.
+MappedPlogReader gives random access to large PLOG files through a
+memory map, with NumPy views per channel (requires NumPy).
+"""
+
+import csv
+import mmap
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+DATALOG_MAGIC = 0x474F4C50  # 'PLOG'
+DATALOG_VERSION = 0x0100    # 1.0
+
+DATALOG_NAME_LEN = 24
+DATALOG_UNIT_LEN = 8
+
+# Read size for streaming record parsing
+DATALOG_READ_CHUNK = 64 * 1024
+
+# Records between entries of the mapped reader's sparse timestamp index
+DATALOG_INDEX_INTERVAL = 1024
+
+_RECORD_LEN = struct.Struct("<H")
+
+
+class DataLogType(IntEnum):
+    """Channel value type - mirrors PMU_DataLog_Type_t"""
+    BOOL = 0
+    UINT8 = 1
+    INT8 = 2
+    UINT16 = 3
+    INT16 = 4
+    UINT32 = 5
+    INT32 = 6
+    FLOAT = 7
+
+
+class DataLogCategory(IntEnum):
+    """Channel category - mirrors PMU_DataLog_Category_t"""
+    SYSTEM = 0
+    OUTPUT = 1
+    INPUT = 2
+    HBRIDGE = 3
+    CAN = 4
+    LOGIC = 5
+    PID = 6
+    USER = 7
+
+
+# struct codes for sample values, by DataLogType
+DATALOG_TYPE_CODES = {
+    DataLogType.BOOL: "B",
+    DataLogType.UINT8: "B",
+    DataLogType.INT8: "b",
+    DataLogType.UINT16: "H",
+    DataLogType.INT16: "h",
+    DataLogType.UINT32: "I",
+    DataLogType.INT32: "i",
+    DataLogType.FLOAT: "f",
+}
+
+# Byte size of sample values, by DataLogType
+DATALOG_TYPE_SIZES = {t: struct.calcsize("<" + code) for t, code in DATALOG_TYPE_CODES.items()}
+
+
+# ============================================================================
+# File Structures
+# ============================================================================
+
+def _cstr(data: bytes) -> str:
+    return data.split(b"\0", 1)[0].decode("utf-8", errors="replace")
+
+
+@dataclass
+class DataLogFileHeader:
+    """PLOG file header (84 bytes) - mirrors PMU_DataLog_FileHeader_t"""
+    magic: int = DATALOG_MAGIC
+    version: int = DATALOG_VERSION
+    channel_count: int = 0
+    sample_rate_hz: int = 0
+    start_time: int = 0
+    sample_count: int = 0
+    device_name: str = ""
+    session_name: str = ""
+
+    FORMAT = "<IHHIII32s32s"
+    SIZE = 84
+
+    def pack(self) -> bytes:
+        return struct.pack(
+            self.FORMAT,
+            self.magic, self.version, self.channel_count, self.sample_rate_hz,
+            self.start_time, self.sample_count,
+            self.device_name.encode("utf-8")[:31], self.session_name.encode("utf-8")[:31]
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "DataLogFileHeader":
+        values = struct.unpack(cls.FORMAT, data[:cls.SIZE])
+        return cls(*values[:6], _cstr(values[6]), _cstr(values[7]))
+
+    def is_valid(self) -> bool:
+        return self.magic == DATALOG_MAGIC and (self.version >> 8) == (DATALOG_VERSION >> 8)
+
+
+@dataclass
+class DataLogChannel:
+    """PLOG channel definition (64 bytes) - mirrors PMU_DataLog_Channel_t"""
+    id: int = 0
+    name: str = ""
+    unit: str = ""
+    type: int = DataLogType.INT32
+    category: int = DataLogCategory.USER
+    scale: float = 1.0
+    offset: float = 0.0
+    min_value: float = 0.0
+    max_value: float = 0.0
+    decimal_places: int = 0
+    enabled: int = 1
+
+    FORMAT = "<H24s8s2xIIffffBB2x"
+    SIZE = 64
+
+    def pack(self) -> bytes:
+        return struct.pack(
+            self.FORMAT,
+            self.id,
+            self.name.encode("utf-8")[:DATALOG_NAME_LEN - 1],
+            self.unit.encode("utf-8")[:DATALOG_UNIT_LEN - 1],
+            self.type, self.category, self.scale, self.offset,
+            self.min_value, self.max_value, self.decimal_places, self.enabled
+        )
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "DataLogChannel":
+        values = struct.unpack(cls.FORMAT, data[:cls.SIZE])
+        return cls(values[0], _cstr(values[1]), _cstr(values[2]), *values[3:])
+
+    def to_raw(self, value: Union[int, float]) -> int:
+        """Convert a logged value to the channel's raw integer value."""
+        if self.type == DataLogType.FLOAT:
+            if self.scale:
+                return round((value - self.offset) / self.scale)
+            return round(value)
+        return value
+
+
+class LogSample(NamedTuple):
+    """One log sample: timestamp and one value per column (None = missing)"""
+    timestamp_ms: int
+    values: Tuple[Optional[Union[int, float]], ...]
+
+
+# ============================================================================
+# PLOG Reader / Writer
+# ============================================================================
+
+class PlogReader:
+    """
+    Streaming PLOG reader.
+
+    Records are parsed from fixed-size reads, so memory use does not
+    depend on file size. Columns are the enabled channels in file order.
+
+    Example usage:
+        with PlogReader("session.plog") as log:
+            names = [ch.name for ch in log.columns]
+            for timestamp_ms, values in log:
+                ...
+    """
+
+    def __init__(self, source: Union[str, IO[bytes]]):
+        if isinstance(source, str):
+            self._file = open(source, "rb")
+            self._owns_file = True
+        else:
+            self._file = source
+            self._owns_file = False
+
+        self.header = DataLogFileHeader.unpack(self._read_exact(DataLogFileHeader.SIZE))
+        if not self.header.is_valid():
+            self.close()
+            raise ValueError(
+                f"Invalid PLOG file: magic=0x{self.header.magic:08X}, "
+                f"version=0x{self.header.version:04X}"
+            )
+
+        self.channels = [
+            DataLogChannel.unpack(self._read_exact(DataLogChannel.SIZE))
+            for _ in range(self.header.channel_count)
+        ]
+        self.columns = [ch for ch in self.channels if ch.enabled]
+        self.data_offset = self._file.tell()
+
+        codes = [DATALOG_TYPE_CODES.get(ch.type, "") for ch in self.columns]
+        self._prefix_sizes = [4]
+        for code in codes:
+            size = struct.calcsize("<" + code) if code else 0
+            self._prefix_sizes.append(self._prefix_sizes[-1] + size)
+        self._codes = codes
+        self._structs: Dict[int, Tuple[struct.Struct, int]] = {}
+
+    @property
+    def column_names(self) -> List[str]:
+        return [ch.name for ch in self.columns]
+
+    def _read_exact(self, size: int) -> bytes:
+        data = self._file.read(size)
+        if len(data) != size:
+            raise ValueError("Truncated PLOG file")
+        return data
+
+    def _struct_for(self, length: int) -> Tuple[struct.Struct, int]:
+        """Sample struct for a record length (firmware truncates oversized samples)."""
+        cached = self._structs.get(length)
+        if cached is None:
+            count = 0
+            while count < len(self._codes) and self._prefix_sizes[count + 1] <= length:
+                count += 1
+            cached = (struct.Struct("<I" + "".join(self._codes[:count])), count)
+            self._structs[length] = cached
+        return cached
+
+    def __iter__(self) -> Iterator[LogSample]:
+        self._file.seek(self.data_offset)
+        columns = len(self.columns)
+        pending = b""
+
+        while True:
+            chunk = self._file.read(DATALOG_READ_CHUNK)
+            if not chunk:
+                break
+            data = pending + chunk if pending else chunk
+            pos = 0
+            end = len(data)
+
+            while end - pos >= 2:
+                (length,) = _RECORD_LEN.unpack_from(data, pos)
+                if end - pos - 2 < length:
+                    break
+                if length >= 4:
+                    sample, count = self._struct_for(length)
+                    values = sample.unpack_from(data, pos + 2)
+                    if count < columns:
+                        values += (None,) * (columns - count)
+                    yield LogSample(values[0], values[1:])
+                pos += 2 + length
+
+            pending = data[pos:]
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "PlogReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PlogWriter:
+    """
+    PLOG writer (same layout as the firmware).
+
+    The header sample count is updated on close.
+    """
+
+    def __init__(self,
+                 target: Union[str, IO[bytes]],
+                 channels: Sequence[DataLogChannel],
+                 sample_rate_hz: int = 0,
+                 session_name: str = ""):
+        if isinstance(target, str):
+            self._file = open(target, "wb")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+
+        self.channels = list(channels)
+        self.header = DataLogFileHeader(
+            channel_count=len(self.channels),
+            sample_rate_hz=sample_rate_hz,
+            device_name="PMU-30",
+            session_name=session_name,
+        )
+        self.sample_count = 0
+        self._start = self._file.tell()
+
+        enabled = [ch for ch in self.channels if ch.enabled]
+        self._sample = struct.Struct(
+            "<HI" + "".join(DATALOG_TYPE_CODES[DataLogType(ch.type)] for ch in enabled)
+        )
+        self._file.write(self.header.pack())
+        for ch in self.channels:
+            self._file.write(ch.pack())
+
+    def write(self, timestamp_ms: int, values: Sequence[Union[int, float]]) -> None:
+        """Write one sample (one value per enabled channel)."""
+        self._file.write(self._sample.pack(self._sample.size - 2, timestamp_ms, *values))
+        self.sample_count += 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        end = self._file.tell()
+        self.header.sample_count = self.sample_count
+        self._file.seek(self._start)
+        self._file.write(self.header.pack())
+        self._file.seek(end)
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "PlogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ============================================================================
+# Memory-mapped PLOG Reader
+# ============================================================================
+
+# NumPy dtypes for sample values, by DataLogType
+_NUMPY_TYPES = {
+    DataLogType.BOOL: "u1",
+    DataLogType.UINT8: "u1",
+    DataLogType.INT8: "i1",
+    DataLogType.UINT16: "<u2",
+    DataLogType.INT16: "<i2",
+    DataLogType.UINT32: "<u4",
+    DataLogType.INT32: "<i4",
+    DataLogType.FLOAT: "<f4",
+}
+
+
+class MappedPlogReader:
+    """
+    Random-access PLOG reader over a read-only memory map.
+
+    The header and channel table are parsed once; samples stay in the
+    file. The firmware writes every record with the same length, so the
+    records form a fixed-stride array and each channel is a strided
+    NumPy view into the map. Pages are only read when a view is used,
+    so opening a file takes the same time at any size. A sparse index
+    holding every index_interval-th timestamp limits time-range lookups
+    to one index block.
+
+    Record lengths are checked at the index points. A file whose records
+    do not share one length is scanned once and copied into a padded
+    array instead.
+
+    Example usage:
+        with MappedPlogReader("session.plog") as log:
+            start, stop = log.index_range(60_000, 120_000)
+            times = log.timestamps[start:stop]
+            rpm = log.values("RPM", start, stop)
+    """
+
+    def __init__(self, path: str, index_interval: int = DATALOG_INDEX_INTERVAL):
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for memory-mapped PLOG access")
+        if index_interval < 1:
+            raise ValueError(f"Index interval must be at least 1, got {index_interval}")
+
+        with open(path, "rb") as f:
+            if f.seek(0, 2) < DataLogFileHeader.SIZE:
+                raise ValueError("Truncated PLOG file")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.header = DataLogFileHeader.unpack(self._map[:DataLogFileHeader.SIZE])
+            if not self.header.is_valid():
+                raise ValueError(
+                    f"Invalid PLOG file: magic=0x{self.header.magic:08X}, "
+                    f"version=0x{self.header.version:04X}"
+                )
+
+            self.data_offset = DataLogFileHeader.SIZE + self.header.channel_count * DataLogChannel.SIZE
+            if self.data_offset > len(self._map):
+                raise ValueError("Truncated PLOG file")
+            self.channels = [
+                DataLogChannel.unpack(self._map[pos:pos + DataLogChannel.SIZE])
+                for pos in range(DataLogFileHeader.SIZE, self.data_offset, DataLogChannel.SIZE)
+            ]
+        except ValueError:
+            self._map.close()
+            raise
+
+        self.columns = [ch for ch in self.channels if ch.enabled]
+
+        # Column offsets within a sample (after the timestamp)
+        self._column_ends: List[int] = []
+        pos = 4
+        for ch in self.columns:
+            pos += DATALOG_TYPE_SIZES.get(ch.type, 0)
+            self._column_ends.append(pos)
+        self.sample_size = pos
+
+        self._lengths: Optional["np.ndarray"] = None  # Per-record lengths (scanned files only)
+        self._records = self._map_records(index_interval)
+        if self._records is None:
+            self._records = self._scan_records()
+
+        self.index_interval = index_interval
+        self._index = self._records["t"][::index_interval].astype(np.int64)
+
+    @property
+    def column_names(self) -> List[str]:
+        return [ch.name for ch in self.columns]
+
+    @property
+    def is_mapped(self) -> bool:
+        """True if samples are views into the file (False after a full scan)."""
+        return self._lengths is None
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _record_dtype(self, length: int) -> "np.dtype":
+        """Structured dtype for records of one length, columns that fit only."""
+        names, formats, offsets = ["t"], ["<u4"], [2]
+        for i, ch in enumerate(self.columns):
+            code = _NUMPY_TYPES.get(ch.type)
+            if code and self._column_ends[i] <= length:
+                names.append(f"c{i}")
+                formats.append(code)
+                offsets.append(2 + self._column_ends[i] - DATALOG_TYPE_SIZES[ch.type])
+        return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": 2 + length})
+
+    def _map_records(self, interval: int) -> Optional["np.ndarray"]:
+        """Fixed-stride view of the records, or None if their lengths differ."""
+        data_size = len(self._map) - self.data_offset
+        if data_size < 2:
+            return np.zeros(0, dtype=self._record_dtype(self.sample_size))
+
+        (length,) = _RECORD_LEN.unpack_from(self._map, self.data_offset)
+        if length < 4:
+            return None
+        stride = 2 + length
+        count = data_size // stride  # A partial last record (power loss) is dropped
+
+        lengths = np.ndarray((count,), dtype="<u2", buffer=self._map,
+                             offset=self.data_offset, strides=(stride,))
+        if count == 0 or not (lengths[::interval] == length).all() or lengths[-1] != length:
+            return None
+        tail = self.data_offset + count * stride
+        if len(self._map) - tail >= 2 and 2 + _RECORD_LEN.unpack_from(self._map, tail)[0] <= len(self._map) - tail:
+            return None  # Trailing bytes hold a complete shorter record
+        return np.ndarray((count,), dtype=self._record_dtype(length),
+                          buffer=self._map, offset=self.data_offset)
+
+    def _scan_records(self) -> "np.ndarray":
+        """Copy variable-length records into a padded array (one pass over the file)."""
+        size = self.sample_size
+        padding = bytes(size)
+        parts = []
+        lengths = []
+        data = self._map
+        pos = self.data_offset
+        end = len(data)
+
+        while end - pos >= 2:
+            (length,) = _RECORD_LEN.unpack_from(data, pos)
+            if end - pos - 2 < length:
+                break
+            if length >= 4:
+                take = min(length, size)
+                parts.append(data[pos:pos + 2 + take])
+                parts.append(padding[take:])
+                lengths.append(take)
+            pos += 2 + length
+
+        self._lengths = np.array(lengths, dtype=np.int32)
+        return np.frombuffer(b"".join(parts), dtype=self._record_dtype(size))
+
+    def _column_index(self, key: Union[str, int]) -> int:
+        """Column index by channel name or channel ID."""
+        for i, ch in enumerate(self.columns):
+            if (ch.name == key) if isinstance(key, str) else (ch.id == key):
+                return i
+        raise KeyError(f"Channel not in log: {key!r}")
+
+    def column(self, key: Union[str, int]) -> DataLogChannel:
+        """Channel definition by name or ID."""
+        return self.columns[self._column_index(key)]
+
+    @property
+    def timestamps(self) -> "np.ndarray":
+        """Sample timestamps in ms (uint32 view)."""
+        return self._records["t"]
+
+    def raw(self, key: Union[str, int], start: int = 0, stop: Optional[int] = None) -> "np.ndarray":
+        """
+        Stored values of one channel (view, no copy).
+
+        Values absent from short records read as 0; values() marks them NaN.
+        """
+        index = self._column_index(key)
+        records = self._records[start:stop]
+        field = f"c{index}"
+        if field not in records.dtype.names:
+            return np.zeros(len(records), dtype=_NUMPY_TYPES.get(self.columns[index].type, "<i4"))
+        return records[field]
+
+    def values(self, key: Union[str, int], start: int = 0, stop: Optional[int] = None) -> "np.ndarray":
+        """Real values of one channel as float64 (integer types scaled, NaN = missing)."""
+        index = self._column_index(key)
+        channel = self.columns[index]
+        records = self._records[start:stop]
+        field = f"c{index}"
+        if field not in records.dtype.names:
+            return np.full(len(records), np.nan)
+
+        values = self._scale(channel, records[field])
+        if self._lengths is not None:
+            values[self._lengths[start:stop] < self._column_ends[index]] = np.nan
+        return values
+
+    def to_real(self, key: Union[str, int], raw: "np.ndarray") -> "np.ndarray":
+        """Real values as float64 from stored values of one channel (e.g. a reduced raw() window)."""
+        return self._scale(self.columns[self._column_index(key)], raw)
+
+    @staticmethod
+    def _scale(channel: DataLogChannel, raw: "np.ndarray") -> "np.ndarray":
+        values = np.array(raw, dtype=np.float64)
+        if channel.type != DataLogType.FLOAT:
+            # Firmware logs raw integers; FLOAT channels are stored scaled
+            values *= channel.scale or 1.0
+            values += channel.offset
+        return values
+
+    def _search(self, timestamp_ms: int, side: str) -> int:
+        """searchsorted over the timestamps, reading a single index block."""
+        block = int(np.searchsorted(self._index, timestamp_ms, side=side))
+        lo = max(block - 1, 0) * self.index_interval
+        hi = min(block * self.index_interval, len(self._records))
+        return lo + int(np.searchsorted(self._records["t"][lo:hi], timestamp_ms, side=side))
+
+    def index_range(self, t0_ms: Optional[int] = None, t1_ms: Optional[int] = None) -> Tuple[int, int]:
+        """Sample index range [start, stop) with t0_ms <= timestamp <= t1_ms."""
+        start = 0 if t0_ms is None else self._search(t0_ms, "left")
+        stop = len(self._records) if t1_ms is None else self._search(t1_ms, "right")
+        return start, max(start, stop)
+
+    def window(self, key: Union[str, int], t0_ms: Optional[int] = None,
+               t1_ms: Optional[int] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """(timestamps, values) of one channel between t0_ms and t1_ms."""
+        start, stop = self.index_range(t0_ms, t1_ms)
+        return self._records["t"][start:stop], self.values(key, start, stop)
+
+    def close(self) -> None:
+        """Release the map. Views still held elsewhere keep it open until freed."""
+        self._records = None
+        self._index = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> "MappedPlogReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ============================================================================
+# CSV Reader / Writer
+# ============================================================================
+
+def _split_column(title: str) -> Tuple[str, str]:
+    """Split 'Name (unit)' into name and unit."""
+    if "(" in title and title.endswith(")"):
+        cut = title.rfind("(")
+        return title[:cut].strip(), title[cut + 1:-1]
+    return title.strip(), ""
+
+
+class CsvLogReader:
+    """
+    Streaming reader for data logger CSV exports.
+
+    The first column is time in seconds, the remaining columns are
+    'Name (unit)'. Empty cells read as None.
+    """
+
+    def __init__(self, source: Union[str, IO[str]]):
+        if isinstance(source, str):
+            self._file = open(source, "r", newline="")
+            self._owns_file = True
+        else:
+            self._file = source
+            self._owns_file = False
+
+        self._reader = csv.reader(self._file)
+        header = next(self._reader, None)
+        if not header:
+            self.close()
+            raise ValueError("Empty CSV log")
+        self.columns = [_split_column(title) for title in header[1:]]
+
+    @property
+    def column_names(self) -> List[str]:
+        return [name for name, _ in self.columns]
+
+    def __iter__(self) -> Iterator[LogSample]:
+        width = len(self.columns)
+        for row in self._reader:
+            if len(row) < 2:
+                continue
+            try:
+                timestamp_ms = round(float(row[0]) * 1000)
+                values = tuple(float(cell) if cell else None for cell in row[1:width + 1])
+            except ValueError:
+                continue
+            if len(values) < width:
+                values += (None,) * (width - len(values))
+            yield LogSample(timestamp_ms, values)
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "CsvLogReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class CsvLogWriter:
+    """Writer for data logger CSV files (time in seconds, one column per channel)."""
+
+    def __init__(self, target: Union[str, IO[str]], names: Sequence[str], units: Optional[Sequence[str]] = None):
+        if isinstance(target, str):
+            self._file = open(target, "w", newline="")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+
+        units = units or [""] * len(names)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(
+            ["Time (s)"] + [f"{name} ({unit})" if unit else name for name, unit in zip(names, units)]
+        )
+        self.sample_count = 0
+
+    def write(self, timestamp_ms: int, values: Sequence[Union[int, float]]) -> None:
+        """Write one row."""
+        self._writer.writerow([f"{timestamp_ms / 1000:.3f}", *values])
+        self.sample_count += 1
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "CsvLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_log(path: str) -> Union[PlogReader, CsvLogReader]:
+    """Open a log file for reading, by extension (.csv or PLOG)."""
+    if path.lower().endswith(".csv"):
+        return CsvLogReader(path)
+    return PlogReader(path)
@@ -59,6 +59,8 @@ class SwCapsFlags(IntFlag):
     BLINKMARINE = 1 << 9
     WIPER_PARK = 1 << 10
     CAN_STREAM = 1 << 11
+    CONFIG_LZ = 1 << 12
+    CONFIG_IN_BAND = 1 << 13
 
 
 class DeviceType(IntEnum):
@@ -167,6 +169,14 @@ class DeviceCaps:
     def has_datalog(self) -> bool:
         return self.has_sw(SwCapsFlags.DATALOG)
 
+    @property
+    def has_config_lz(self) -> bool:
+        return self.has_sw(SwCapsFlags.CONFIG_LZ)
+
+    @property
+    def has_config_in_band(self) -> bool:
+        return self.has_sw(SwCapsFlags.CONFIG_IN_BAND)
+
     @property
     def fw_version_str(self) -> str:
         """Firmware version as string"""
@@ -364,7 +374,8 @@ def get_pmu30_caps() -> DeviceCaps:
             SwCapsFlags.PID | SwCapsFlags.TABLES_2D | SwCapsFlags.TABLES_3D |
             SwCapsFlags.LOGIC | SwCapsFlags.TIMERS | SwCapsFlags.FILTERS |
             SwCapsFlags.MATH | SwCapsFlags.LUA | SwCapsFlags.DATALOG |
-            SwCapsFlags.BLINKMARINE | SwCapsFlags.WIPER_PARK | SwCapsFlags.CAN_STREAM
+            SwCapsFlags.BLINKMARINE | SwCapsFlags.WIPER_PARK | SwCapsFlags.CAN_STREAM |
+            SwCapsFlags.CONFIG_LZ
         ),
         profet_count=30,
         hbridge_count=4,
@@ -399,7 +410,8 @@ def get_nucleo_f446_caps() -> DeviceCaps:
             HwCapsFlags.HAS_USB
         ),
         sw_flags=(
-            SwCapsFlags.LOGIC | SwCapsFlags.TIMERS | SwCapsFlags.TABLES_2D
+            SwCapsFlags.LOGIC | SwCapsFlags.TIMERS | SwCapsFlags.TABLES_2D |
+            SwCapsFlags.CONFIG_LZ
         ),
         profet_count=0,
         hbridge_count=0,
@@ -18,6 +18,7 @@ Modules:
     filter     - Signal filters (SMA, EMA, LPF, median, etc.)
     flipflop   - Flip-flops and latches (SR, D, T, JK)
     hysteresis - Hysteresis comparator / Schmitt trigger
+    batch      - NumPy batch variants for replaying recorded data
 """
 
 from .logic import (
@@ -107,6 +108,7 @@ from .pid import (
 )
 
 from .filter import (
+    FilterType,
     SMAConfig,
     SMAState,
     EMAConfig,
@@ -166,6 +168,25 @@ from .hysteresis import (
     deadband,
 )
 
+from .batch import (
+    HAS_NUMPY,
+    logic_evaluate_batch,
+    math_evaluate_batch,
+    sma_update_batch,
+    ema_update_batch,
+    lpf_update_batch,
+    median_update_batch,
+    rate_limiter_update_batch,
+    debounce_update_batch,
+    hysteresis_update_batch,
+    sr_latch_update_batch,
+    d_flipflop_update_batch,
+    t_flipflop_update_batch,
+    toggle_update_batch,
+    timer_update_batch,
+    table2d_lookup_batch,
+)
+
 __all__ = [
     # Logic
     "LogicOp",
@@ -196,6 +217,7 @@ __all__ = [
     "PIDConfig", "PIDState",
     "pid_init", "pid_reset", "pid_update", "pid_default_config",
     # Filter
+    "FilterType",
     "SMAConfig", "SMAState", "EMAConfig", "EMAState",
     "LPFConfig", "LPFState", "MedianConfig", "MedianState",
     "RateLimiterConfig", "RateLimiterState", "DebounceConfig", "DebounceState",
@@ -215,4 +237,13 @@ __all__ = [
     "window_init", "window_update",
     "multilevel_init", "multilevel_update",
     "compare_ge", "compare_gt", "compare_in_range", "deadband",
+    # Batch
+    "HAS_NUMPY",
+    "logic_evaluate_batch", "math_evaluate_batch",
+    "sma_update_batch", "ema_update_batch", "lpf_update_batch",
+    "median_update_batch", "rate_limiter_update_batch", "debounce_update_batch",
+    "hysteresis_update_batch",
+    "sr_latch_update_batch", "d_flipflop_update_batch",
+    "t_flipflop_update_batch", "toggle_update_batch",
+    "timer_update_batch", "table2d_lookup_batch",
 ]
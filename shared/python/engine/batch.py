@@ -0,0 +1,788 @@
+"""
+Logic Engine - Batch Simulation
+
+NumPy batch variants of the scalar engine functions for replaying
+recorded data. Each function takes a whole input series (plus initial
+state for stateful blocks) and returns the output series and the final
+state, so long recordings can be processed in chunks.
+
+Results are bit-exact with the scalar functions: floor division, int32
+saturation and state transitions are reproduced as-is, and products that
+could overflow int64 are computed with Python integers.
+
+Stateless operations, moving-window filters and latch-like blocks
+(hysteresis, flip-flops) are vectorized. Recursive filters and the timer
+state machine have no exact closed form in integer math, so they run as
+a tight loop over plain lists. Inputs that the vectorized paths cannot
+reproduce exactly (unsorted tables, inconsistent ring buffers, overlapping
+hysteresis thresholds) fall back to the scalar functions.
+
+Outputs are int64 arrays.
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    np = None
+
+from .logic import LogicOp
+from .math_ops import MathOp, INT32_MAX, INT32_MIN
+from .filter import (
+    FILTER_MAX_SAMPLES,
+    FILTER_ALPHA_SCALE,
+    SMAConfig, SMAState, sma_update,
+    EMAConfig, EMAState,
+    LPFConfig, LPFState,
+    MedianConfig, MedianState, median_update,
+    RateLimiterConfig, RateLimiterState,
+    DebounceConfig, DebounceState,
+)
+from .hysteresis import HysteresisConfig, HysteresisState, hysteresis_update
+from .flipflop import FlipFlopState
+from .timer import TimerConfig, TimerState, timer_update
+from .table import Table2D, table2d_lookup
+
+
+# Largest product magnitude computed in int64
+_INT64_SAFE = 2**62
+
+Series = Union[Sequence[int], "np.ndarray", int]
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for batch simulation")
+
+
+def _series(values: Series) -> "np.ndarray":
+    """Convert input to an int64 array (scalars become 0-d arrays)."""
+    _require_numpy()
+    return np.asarray(values, dtype=np.int64)
+
+
+def _abs_max(values: "np.ndarray") -> int:
+    if values.size == 0:
+        return 0
+    return max(abs(int(values.max())), abs(int(values.min())))
+
+
+def _mul(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """Product, using Python integers if int64 could overflow."""
+    if _abs_max(a) * _abs_max(b) >= _INT64_SAFE:
+        return a.astype(object) * b.astype(object)
+    return a * b
+
+
+def _clamp_i32(values: "np.ndarray") -> "np.ndarray":
+    clamped = np.where(values > INT32_MAX, INT32_MAX, values)
+    clamped = np.where(clamped < INT32_MIN, INT32_MIN, clamped)
+    return clamped.astype(np.int64)
+
+
+def _safe_divisor(divisor: "np.ndarray") -> "np.ndarray":
+    return np.where(divisor == 0, 1, divisor)
+
+
+def _forward_fill(events: "np.ndarray", initial: int) -> "np.ndarray":
+    """Hold the last event value (events < 0 mean hold)."""
+    n = len(events)
+    positions = np.where(events >= 0, np.arange(n), -1)
+    np.maximum.accumulate(positions, out=positions)
+    return np.where(positions >= 0, events[np.maximum(positions, 0)], initial)
+
+
+def _rising_edges(signal: "np.ndarray", last: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return (high, rising) boolean series given the previous level."""
+    high = signal != 0
+    prev = np.empty_like(high)
+    prev[0] = last != 0
+    prev[1:] = high[:-1]
+    return high, high & ~prev
+
+
+def _per_sample(values: Series, n: int) -> List[int]:
+    """Expand a scalar or series argument to a list of n ints."""
+    arr = _series(values)
+    if arr.ndim == 0:
+        return [int(arr)] * n
+    return arr.tolist()
+
+
+def _ring_history(samples: List[int], index: int, count: int, window: int) -> Optional[List[int]]:
+    """
+    Chronological live samples of a ring buffer, or None if the buffer
+    is not in a state the vectorized filters can continue from.
+    """
+    if count == 0:
+        return [] if index == 0 else None
+    if len(samples) != window or not 0 <= index < window or count > window:
+        return None
+    if count < window:
+        return list(samples[:count]) if index == count else None
+    return list(samples[index:]) + list(samples[:index])
+
+
+def _ring_after(samples: List[int], index: int, window: int, new: List[int]) -> List[int]:
+    """Ring buffer contents after writing new samples."""
+    ring = list(samples) if len(samples) >= window else [0] * window
+    start = max(0, len(new) - window)
+    for i in range(start, len(new)):
+        ring[(index + i) % window] = new[i]
+    return ring
+
+
+# ============================================================================
+# Logic
+# ============================================================================
+
+def logic_evaluate_batch(op: LogicOp, inputs: Sequence[Series]) -> "np.ndarray":
+    """
+    Batch version of logic_evaluate().
+
+    Args:
+        op: Logic operation to perform
+        inputs: Input series (scalars are broadcast)
+
+    Returns:
+        Result series
+    """
+    if not inputs:
+        raise ValueError("At least one input series is required")
+    arrays = np.broadcast_arrays(*[_series(x) for x in inputs])
+    n = len(arrays)
+    shape = arrays[0].shape
+    nonzero = [a != 0 for a in arrays]
+
+    if op == LogicOp.AND:
+        result = np.logical_and.reduce(nonzero)
+    elif op == LogicOp.OR:
+        result = np.logical_or.reduce(nonzero)
+    elif op == LogicOp.XOR:
+        result = np.logical_xor.reduce(nonzero)
+    elif op == LogicOp.NAND:
+        result = ~np.logical_and.reduce(nonzero)
+    elif op == LogicOp.NOR:
+        result = ~np.logical_or.reduce(nonzero)
+    elif op == LogicOp.NOT:
+        result = ~nonzero[0]
+    elif op == LogicOp.GT and n >= 2:
+        result = arrays[0] > arrays[1]
+    elif op == LogicOp.GTE and n >= 2:
+        result = arrays[0] >= arrays[1]
+    elif op == LogicOp.LT and n >= 2:
+        result = arrays[0] < arrays[1]
+    elif op == LogicOp.LTE and n >= 2:
+        result = arrays[0] <= arrays[1]
+    elif op == LogicOp.EQ and n >= 2:
+        result = arrays[0] == arrays[1]
+    elif op == LogicOp.NEQ and n >= 2:
+        result = arrays[0] != arrays[1]
+    elif op == LogicOp.IN_RANGE and n >= 3:
+        result = (arrays[1] <= arrays[0]) & (arrays[0] <= arrays[2])
+    elif op == LogicOp.OUTSIDE_RANGE and n >= 3:
+        result = (arrays[0] < arrays[1]) | (arrays[0] > arrays[2])
+    else:
+        result = np.zeros(shape, dtype=bool)
+
+    return result.astype(np.int64)
+
+
+# ============================================================================
+# Math
+# ============================================================================
+
+def _math_div(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    by_zero = np.where(a > 0, INT32_MAX, np.where(a < 0, INT32_MIN, 0))
+    return np.where(b == 0, by_zero, a // _safe_divisor(b))
+
+
+def _math_scale(value: "np.ndarray", multiplier: "np.ndarray", divisor: "np.ndarray") -> "np.ndarray":
+    product = _mul(value, multiplier)
+    by_zero = np.where(product > 0, INT32_MAX, INT32_MIN)
+    scaled = _clamp_i32(product // _safe_divisor(divisor))
+    return np.where(divisor == 0, by_zero, scaled).astype(np.int64)
+
+
+def _math_clamp(value: "np.ndarray", low: "np.ndarray", high: "np.ndarray") -> "np.ndarray":
+    return np.where(value < low, low, np.where(value > high, high, value))
+
+
+def _math_map(value, in_min, in_max, out_min, out_max) -> "np.ndarray":
+    in_range = in_max - in_min
+    mapped = _mul(value - in_min, out_max - out_min) // _safe_divisor(in_range) + out_min
+    return np.where(in_range == 0, out_min, _clamp_i32(mapped)).astype(np.int64)
+
+
+def _math_lerp(a, b, t, t_max) -> "np.ndarray":
+    lerped = _clamp_i32(a + _mul(b - a, t) // _safe_divisor(t_max))
+    result = np.where(t >= t_max, b, lerped)
+    return np.where((t_max == 0) | (t <= 0), a, result).astype(np.int64)
+
+
+def math_evaluate_batch(op: MathOp, inputs: Sequence[Series]) -> "np.ndarray":
+    """
+    Batch version of math_evaluate().
+
+    Args:
+        op: Math operation to perform
+        inputs: Input series (scalars are broadcast)
+
+    Returns:
+        Result series
+    """
+    if not inputs:
+        raise ValueError("At least one input series is required")
+    x = np.broadcast_arrays(*[_series(v) for v in inputs])
+    n = len(x)
+
+    if op == MathOp.ADD and n >= 2:
+        result = _clamp_i32(x[0] + x[1])
+    elif op == MathOp.SUB and n >= 2:
+        result = _clamp_i32(x[0] - x[1])
+    elif op == MathOp.MUL and n >= 2:
+        result = _clamp_i32(_mul(x[0], x[1]))
+    elif op == MathOp.DIV and n >= 2:
+        result = _math_div(x[0], x[1])
+    elif op == MathOp.MOD and n >= 2:
+        result = np.where(x[1] == 0, 0, np.remainder(x[0], _safe_divisor(x[1])))
+    elif op in (MathOp.ADD, MathOp.SUB, MathOp.MUL, MathOp.DIV, MathOp.MOD):
+        result = x[0]
+    elif op in (MathOp.ABS, MathOp.NEG):
+        magnitude = np.abs(x[0]) if op == MathOp.ABS else -x[0]
+        result = np.where(x[0] == INT32_MIN, INT32_MAX, magnitude)
+    elif op == MathOp.MIN:
+        result = np.minimum.reduce(x)
+    elif op == MathOp.MAX:
+        result = np.maximum.reduce(x)
+    elif op == MathOp.AVG:
+        result = np.add.reduce(x) // n
+    elif op == MathOp.CLAMP:
+        result = _math_clamp(x[0], x[1], x[2]) if n >= 3 else x[0]
+    elif op == MathOp.MAP:
+        result = _math_map(*x[:5]) if n >= 5 else x[0]
+    elif op == MathOp.SCALE:
+        result = _math_scale(x[0], x[1], x[2]) if n >= 3 else x[0]
+    elif op == MathOp.LERP:
+        if n >= 4:
+            result = _math_lerp(x[0], x[1], x[2], x[3])
+        elif n >= 3:
+            result = _math_lerp(x[0], x[1], x[2], np.int64(1000))
+        else:
+            result = x[0]
+    else:
+        result = np.zeros(x[0].shape, dtype=np.int64)
+
+    return np.asarray(result, dtype=np.int64)
+
+
+# ============================================================================
+# Filters
+# ============================================================================
+
+def sma_update_batch(
+    config: SMAConfig,
+    inputs: Series,
+    state: Optional[SMAState] = None
+) -> Tuple["np.ndarray", SMAState]:
+    """
+    Batch version of sma_update().
+
+    Args:
+        config: SMA configuration
+        inputs: Input series
+        state: Initial state (modified; created if None)
+
+    Returns:
+        (output series, final state)
+    """
+    state = state if state is not None else SMAState()
+    x = _series(inputs)
+    n = len(x)
+    window = min(max(1, config.window_size), FILTER_MAX_SAMPLES)
+    history = _ring_history(state.samples, state.index, state.count, window)
+
+    if history is None or state.total != sum(history):
+        out = [sma_update(state, config, v) for v in x.tolist()]
+        return np.array(out, dtype=np.int64), state
+    if n == 0:
+        return np.zeros(0, dtype=np.int64), state
+
+    h = len(history)
+    ext = np.concatenate([np.asarray(history, dtype=np.int64), x])
+    csum = np.concatenate([[0], np.cumsum(ext)])
+    ends = np.arange(h + 1, h + n + 1)
+    counts = np.minimum(ends, window)
+    out = (csum[ends] - csum[ends - counts]) // counts
+
+    new = x.tolist()
+    state.samples = _ring_after(state.samples, state.index, window, new)
+    state.index = (state.index + n) % window
+    state.count = int(counts[-1])
+    state.total = int(csum[-1] - csum[-1 - state.count])
+    return np.asarray(out, dtype=np.int64), state
+
+
+def ema_update_batch(
+    config: EMAConfig,
+    inputs: Series,
+    state: Optional[EMAState] = None
+) -> Tuple["np.ndarray", EMAState]:
+    """
+    Batch version of ema_update().
+
+    Args:
+        config: EMA configuration
+        inputs: Input series
+        state: Initial state (modified; created if None)
+
+    Returns:
+        (output series, final state)
+    """
+    state = state if state is not None else EMAState()
+    xs = _series(inputs).tolist()
+    out = [0] * len(xs)
+    alpha = max(1, min(255, config.alpha))
+    keep = FILTER_ALPHA_SCALE - alpha
+    value = state.value
+    start = 0
+
+    if xs and not state.initialized:
+        value = out[0] = xs[0]
+        state.initialized = True
+        start = 1
+
+    for i in range(start, len(xs)):
+        value = (alpha * xs[i] + keep * value) // FILTER_ALPHA_SCALE
+        out[i] = value
+
+    state.value = value
+    return np.array(out, dtype=np.int64), state
+
+
+def lpf_update_batch(
+    config: LPFConfig,
+    inputs: Series,
+    dt_ms: Series,
+    state: Optional[LPFState] = None
+) -> Tuple["np.ndarray", LPFState]:
+    """
+    Batch version of lpf_update().
+
+    Args:
+        config: LPF configuration
+        inputs: Input series
+        dt_ms: Time step per sample (scalar or series)
+        state: Initial state (modified; created if None)
+
+    Returns:
+        (output series, final state)
+    """
+    state = state if state is not None else LPFState()
+    xs = _series(inputs).tolist()
+    dts = _per_sample(dt_ms, len(xs))
+    out = [0] * len(xs)
+    scale = config.scale if config.scale > 0 else 1000
+    read_scale = config.scale
+    tau = max(1, config.time_constant_ms)
+    value = state.value
+    initialized = state.initialized
+
+    for i, x in enumerate(xs):
+        dt = dts[i]
+        if dt == 0:
+            out[i] = value // read_scale if initialized else x
+        elif not initialized:
+            value = x * scale
+            initialized = True
+            out[i] = x
+        else:
+            value = (dt * x * scale + tau * value) // (tau + dt)
+            out[i] = value // scale
+
+    state.value = value
+    state.initialized = initialized
+    return np.array(out, dtype=np.int64), state
+
+
+def median_update_batch(
+    config: MedianConfig,
+    inputs: Series,
+    state: Optional[MedianState] = None
+) -> Tuple["np.ndarray", MedianState]:
+    """
+    Batch version of median_update().
+
+    Args:
+        config: Median configuration
+        inputs: Input series
+        state: Initial state (modified; created if None)
+
+    Returns:
+        (output series, final state)
+    """
+    state = state if state is not None else MedianState()
+    x = _series(inputs)
+    n = len(x)
+    window = min(max(3, config.window_size), FILTER_MAX_SAMPLES)
+    history = _ring_history(state.samples, state.index, state.count, window)
+
+    if history is None:
+        out = [median_update(state, config, v) for v in x.tolist()]
+        return np.array(out, dtype=np.int64), state
+    if n == 0:
+        return np.zeros(0, dtype=np.int64), state
+
+    ext = np.concatenate([np.asarray(history, dtype=np.int64), x])
+    h = len(history)
+    out = np.empty(n, dtype=np.int64)
+
+    # Ramp-up while the buffer is filling
+    ramp = min(n, max(0, window - h - 1))
+    for i in range(ramp):
+        live = sorted(ext[:h + i + 1].tolist())
+        count = len(live)
+        mid = count // 2
+        if count == 1:
+            out[i] = live[0]
+        elif count % 2 == 1:
+            out[i] = live[mid]
+        else:
+            out[i] = (live[mid - 1] + live[mid]) // 2
+
+    # Full windows
+    if ramp < n:
+        windows = np.lib.stride_tricks.sliding_window_view(ext, window)
+        windows = np.sort(windows[h + ramp + 1 - window:], axis=1)
+        mid = window // 2
+        if window % 2 == 1:
+            out[ramp:] = windows[:, mid]
+        else:
+            out[ramp:] = (windows[:, mid - 1] + windows[:, mid]) // 2
+
+    state.samples = _ring_after(state.samples, state.index, window, x.tolist())
+    state.index = (state.index + n) % window
+    state.count = min(state.count + n, window)
+    return out, state
+
+
+def rate_limiter_update_batch(
+    config: RateLimiterConfig,
+    inputs: Series,
+    dt_ms: Series,
+    state: Optional[RateLimiterState] = None
+) -> Tuple["np.ndarray", RateLimiterState]:
+    """
+    Batch version of rate_limiter_update().
+
+    Args:
+        config: Rate limiter configuration
+        inputs: Target series
+        dt_ms: Time step per sample (scalar or series)
+        state: Initial state (modified; created if None)
+
+    Returns:
+        (output series, final state)
+    """
+    state = state if state is not None else RateLimiterState()
+    xs = _series(inputs).tolist()
+    dts = _per_sample(dt_ms, len(xs))
+    out = [0] * len(xs)
+    value = state.value
+    initialized = state.initialized
+    rise, fall = config.rise_rate, config.fall_rate
+
+    for i, target in enumerate(xs):
+        dt = dts[i]
+        if not initialized:
+            value = target
+            initialized = True
+        elif dt != 0:
+            diff = target - value
+            if diff > 0:
+                step = max(1, (rise * dt) // 1000)
+                value = value + step if diff > step else target
+            elif diff < 0:
+                step = max(1, (fall * dt) // 1000)
+                value = value - step if -diff > step else target
+        out[i] = value
+
+    state.value = value
+    state.initialized = initialized
+    return np.array(out, dtype=np.int64), state
+
+
+def debounce_update_batch(
+    config: DebounceConfig,
+    inputs: Series,
+    dt_ms: Series,
+    state: Optional[DebounceState] = None
+) -> Tuple["np.ndarray", DebounceState]:
+    """
+    Batch version of debounce_update().
+
+    Args:
+        config: Debounce configuration
+        inputs: Input series
+        dt_ms: Time step per sample (scalar or series)
+        state: Initial state (modified; created if None)
+
+    Returns:
+        (output series, final state)
+    """
+    state = state if state is not None else DebounceState()
+    xs = _series(inputs).tolist()
+    dts = _per_sample(dt_ms, len(xs))
+    out = [0] * len(xs)
+    stable = state.stable_value
+    pending = state.pending_value
+    pending_ms = state.pending_time_ms
+    initialized = state.initialized
+    threshold = config.hysteresis
+    debounce_ms = config.debounce_ms
+
+    for i, x in enumerate(xs):
+        if not initialized:
+            stable = pending = x
+            pending_ms = 0
+            initialized = True
+        else:
+            if threshold > 0:
+                changed = abs(x - stable) > threshold
+            else:
+                changed = x != stable
+            if not changed:
+                pending = stable
+                pending_ms = 0
+            elif x == pending:
+                pending_ms += dts[i]
+                if pending_ms >= debounce_ms:
+                    stable = x
+                    pending_ms = 0
+            else:
+                pending = x
+                pending_ms = dts[i]
+        out[i] = stable
+
+    state.stable_value = stable
+    state.pending_value = pending
+    state.pending_time_ms = pending_ms
+    state.initialized = initialized
+    return np.array(out, dtype=np.int64), state
+
+
+# ============================================================================
+# Hysteresis
+# ============================================================================
+
+def hysteresis_update_batch(
+    config: HysteresisConfig,
+    inputs: Series,
+    state: Optional[HysteresisState] = None
+) -> Tuple["np.ndarray", HysteresisState]:
+    """
+    Batch version of hysteresis_update().
+
+    Args:
+        config: Comparator configuration
+        inputs: Input series
+        state: Initial state (modified; created if None)
+
+    Returns:
+        (output series, final state)
+    """
+    state = state if state is not None else HysteresisState()
+    x = _series(inputs)
+    n = len(x)
+    high, low = config.threshold_high, config.threshold_low
+
+    if low >= high:
+        # Overlapping thresholds toggle on every sample in the overlap
+        out = [hysteresis_update(state, config, v) for v in x.tolist()]
+        return np.array(out, dtype=np.int64), state
+    if n == 0:
+        return np.zeros(0, dtype=np.int64), state
+
+    events = np.full(n, -1, dtype=np.int64)
+    events[x >= high] = 1
+    events[x <= low] = 0
+    if not state.initialized:
+        mid = (high + low) // 2
+        events[0] = 1 if x[0] >= mid else 0
+
+    raw = _forward_fill(events, state.output)
+    state.output = int(raw[-1])
+    state.initialized = True
+
+    if config.invert:
+        return (1 - raw).astype(np.int64), state
+    return raw.astype(np.int64), state
+
+
+# ============================================================================
+# Flip-Flops
+# ============================================================================
+
+def sr_latch_update_batch(
+    set_inputs: Series,
+    reset_inputs: Series,
+    state: Optional[FlipFlopState] = None
+) -> Tuple["np.ndarray", FlipFlopState]:
+    """
+    Batch version of sr_latch_update() (reset wins).
+
+    Returns:
+        (Q series, final state)
+    """
+    state = state if state is not None else FlipFlopState()
+    s, r = np.broadcast_arrays(_series(set_inputs), _series(reset_inputs))
+    if len(s) == 0:
+        return np.zeros(0, dtype=np.int64), state
+
+    events = np.where(r != 0, 0, np.where(s != 0, 1, -1))
+    q = _forward_fill(events, state.q)
+    state.q = int(q[-1])
+    state.initialized = True
+    return q.astype(np.int64), state
+
+
+def d_flipflop_update_batch(
+    d_inputs: Series,
+    clk_inputs: Series,
+    state: Optional[FlipFlopState] = None
+) -> Tuple["np.ndarray", FlipFlopState]:
+    """
+    Batch version of d_flipflop_update().
+
+    Returns:
+        (Q series, final state)
+    """
+    state = state if state is not None else FlipFlopState()
+    d, clk = np.broadcast_arrays(_series(d_inputs), _series(clk_inputs))
+    if len(clk) == 0:
+        return np.zeros(0, dtype=np.int64), state
+
+    high, rising = _rising_edges(clk, state.last_clk)
+    events = np.where(rising, (d != 0).astype(np.int64), -1)
+    q = _forward_fill(events, state.q)
+    state.q = int(q[-1])
+    state.last_clk = int(high[-1])
+    state.initialized = True
+    return q.astype(np.int64), state
+
+
+def t_flipflop_update_batch(
+    t_inputs: Series,
+    clk_inputs: Series,
+    state: Optional[FlipFlopState] = None
+) -> Tuple["np.ndarray", FlipFlopState]:
+    """
+    Batch version of t_flipflop_update().
+
+    Returns:
+        (Q series, final state)
+    """
+    state = state if state is not None else FlipFlopState()
+    t, clk = np.broadcast_arrays(_series(t_inputs), _series(clk_inputs))
+    if len(clk) == 0:
+        return np.zeros(0, dtype=np.int64), state
+
+    high, rising = _rising_edges(clk, state.last_clk)
+    toggles = np.cumsum(rising & (t != 0))
+    q = (1 if state.q else 0) ^ (toggles & 1)
+    state.q = int(q[-1])
+    state.last_clk = int(high[-1])
+    state.initialized = True
+    return q.astype(np.int64), state
+
+
+def toggle_update_batch(
+    triggers: Series,
+    state: Optional[FlipFlopState] = None
+) -> Tuple["np.ndarray", FlipFlopState]:
+    """
+    Batch version of toggle_update().
+
+    Returns:
+        (Q series, final state)
+    """
+    trigger = _series(triggers)
+    return t_flipflop_update_batch(np.ones_like(trigger), trigger, state)
+
+
+# ============================================================================
+# Timer
+# ============================================================================
+
+def timer_update_batch(
+    config: TimerConfig,
+    triggers: Series,
+    now_ms: Series,
+    state: Optional[TimerState] = None
+) -> Tuple["np.ndarray", TimerState]:
+    """
+    Batch version of timer_update().
+
+    The timer state machine is evaluated sample by sample.
+
+    Args:
+        config: Timer configuration
+        triggers: Trigger series
+        now_ms: Timestamp series (ms)
+        state: Initial state (modified; created if None)
+
+    Returns:
+        (output series, final state)
+    """
+    state = state if state is not None else TimerState()
+    trig = _series(triggers).tolist()
+    times = _per_sample(now_ms, len(trig))
+    out = [timer_update(state, config, t, now) for t, now in zip(trig, times)]
+    return np.array(out, dtype=np.int64), state
+
+
+# ============================================================================
+# Tables
+# ============================================================================
+
+def table2d_lookup_batch(table: Table2D, inputs: Series) -> "np.ndarray":
+    """
+    Batch version of table2d_lookup().
+
+    Args:
+        table: 2D lookup table (x values ascending)
+        inputs: Input series
+
+    Returns:
+        Interpolated output series
+    """
+    x = _series(inputs)
+    xv = np.asarray(table.x_values, dtype=np.int64)
+    yv = np.asarray(table.y_values, dtype=np.int64)
+    n = table.size
+
+    if n == 0:
+        return np.zeros(x.shape, dtype=np.int64)
+    if n == 1:
+        return np.full(x.shape, table.y_values[0], dtype=np.int64)
+    if len(xv) != len(yv) or np.any(np.diff(xv) < 0):
+        return np.array([table2d_lookup(table, v) for v in x.ravel().tolist()],
+                        dtype=np.int64).reshape(x.shape)
+
+    upper = np.clip(np.searchsorted(xv, x, side='right'), 1, n - 1)
+    lower = upper - 1
+    x0, x1 = xv[lower], xv[upper]
+    y0, y1 = yv[lower], yv[upper]
+    dx = x1 - x0
+    interp = y0 + _mul(x - x0, y1 - y0) // _safe_divisor(dx)
+    interp = np.where(dx == 0, y0, interp)
+
+    result = np.where(x <= xv[0], yv[0], np.where(x >= xv[-1], yv[-1], interp))
+    return np.asarray(result, dtype=np.int64)
@@ -5,6 +5,7 @@ Various signal filtering algorithms with external state management.
 """
 
 from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import List, Optional
 
 
@@ -12,6 +13,17 @@ FILTER_MAX_SAMPLES = 16
 FILTER_ALPHA_SCALE = 256
 
 
+class FilterType(IntEnum):
+    """Filter types - mirrors FilterType_t"""
+    NONE = 0
+    SMA = 1
+    EMA = 2
+    LOWPASS = 3
+    MEDIAN = 4
+    RATE_LIMIT = 5
+    DEBOUNCE = 6
+
+
 # ============================================================================
 # Simple Moving Average
 # ============================================================================
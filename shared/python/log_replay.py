@@ -0,0 +1,248 @@
+"""
+PMU-30 Log Replay - Python implementation
+
+Drives the channel executor from recorded logs (CSV or PLOG) without
+hardware. Every sample writes the logged input channels into the value
+store, runs one compiled execution cycle at the sample timestamp and
+optionally writes all computed channels to an output log.
+
+Samples are streamed, so memory use does not depend on log length.
+replay_file() is a top-level function and can be mapped over a process
+pool to regression-test a configuration against many logs.
+"""
+
+import time
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .channel_config import Channel, ConfigFile
+from .channel_executor import ChannelExecutor, ChannelRuntime
+from .datalog import (
+    CsvLogReader,
+    CsvLogWriter,
+    DataLogChannel,
+    DataLogType,
+    PlogReader,
+    PlogWriter,
+    open_log,
+)
+
+INT32_MAX = 0x7FFFFFFF
+INT32_MIN = -0x80000000
+
+# Samples between progress callbacks
+REPLAY_PROGRESS_INTERVAL = 10000
+
+
+# ============================================================================
+# Statistics
+# ============================================================================
+
+@dataclass
+class ReplayStats:
+    """Replay statistics"""
+    samples: int = 0
+    first_ms: int = 0
+    last_ms: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def samples_per_sec(self) -> float:
+        return self.samples / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def log_duration_s(self) -> float:
+        return (self.last_ms - self.first_ms) / 1000
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def runtimes_from_channels(channels: Iterable[Channel]) -> List[ChannelRuntime]:
+    """Create executor runtimes with initialized state for config channels."""
+    runtimes = []
+    for ch in channels:
+        runtime = ChannelRuntime(id=ch.id, flags=ch.flags, value=ch.default_value, config=ch.config)
+        ChannelExecutor.init_channel_state(runtime, ch.type)
+        runtimes.append(runtime)
+    return runtimes
+
+
+def _raw_converter(column) -> Callable[[Union[int, float]], int]:
+    """Build logged value -> clamped int32 raw value conversion for a column."""
+    to_raw = column.to_raw if isinstance(column, DataLogChannel) else round
+
+    def convert(value: Union[int, float]) -> int:
+        raw = to_raw(value)
+        if raw > INT32_MAX:
+            return INT32_MAX
+        if raw < INT32_MIN:
+            return INT32_MIN
+        return raw
+
+    return convert
+
+
+# ============================================================================
+# Replay Engine
+# ============================================================================
+
+class LogReplay:
+    """
+    Replay recorded logs through a channel configuration.
+
+    Log columns are matched to channels by name, or explicitly through
+    channel_map (column name -> channel id). Unmatched columns are ignored.
+    Missing values (empty CSV cells) keep the channel's previous value.
+
+    Example usage:
+        replay = LogReplay(ConfigFile.load("car.pmu").channels)
+        with open_log("session.plog") as log:
+            stats = replay.run(log, output="session_out.csv")
+        print(f"{stats.samples_per_sec:.0f} samples/s")
+    """
+
+    def __init__(self,
+                 channels: List[Channel],
+                 channel_map: Optional[Dict[str, int]] = None):
+        self.channels = list(channels)
+        self.channel_map = dict(channel_map or {})
+        self.executor = ChannelExecutor()
+        self.store = self.executor.init_store()
+
+        for ch in self.channels:
+            self.store.set(ch.id, ch.default_value)
+
+        self.runtimes = runtimes_from_channels(self.channels)
+        self.plan = self.executor.compile(self.runtimes)
+
+    @property
+    def output_ids(self) -> List[int]:
+        """Computed channel IDs, in execution order."""
+        return [step.runtime.id for step in self.plan.steps]
+
+    def resolve_inputs(self, column_names: List[str]) -> List[Tuple[int, int]]:
+        """Map log columns to channel IDs. Returns (column, channel_id) pairs."""
+        by_name = {ch.name: ch.id for ch in self.channels if ch.name}
+        computed = set(self.output_ids)
+        inputs = []
+        for col, name in enumerate(column_names):
+            ch_id = self.channel_map.get(name, by_name.get(name))
+            if ch_id is None or ch_id in computed or ch_id not in self.store:
+                continue
+            inputs.append((col, ch_id))
+        return inputs
+
+    def _open_output(self, output: Union[str, object]):
+        """Create an output log writer for the computed channels."""
+        if not isinstance(output, str):
+            return output
+        names = {ch.id: ch.name or f"Channel {ch.id}" for ch in self.channels}
+        if output.lower().endswith(".csv"):
+            return CsvLogWriter(output, [names[ch_id] for ch_id in self.output_ids])
+        log_channels = [
+            DataLogChannel(id=ch_id, name=names[ch_id], type=DataLogType.INT32)
+            for ch_id in self.output_ids
+        ]
+        return PlogWriter(output, log_channels)
+
+    def run(self,
+            log: Union[PlogReader, CsvLogReader],
+            output: Union[str, CsvLogWriter, PlogWriter, None] = None,
+            realtime: bool = False,
+            speed: float = 1.0,
+            max_samples: Optional[int] = None,
+            progress: Optional[Callable[[ReplayStats], None]] = None) -> ReplayStats:
+        """
+        Replay a log.
+
+        Args:
+            log: Open log reader
+            output: Output log path (.csv or PLOG) or writer
+            realtime: Pace samples to their timestamps
+            speed: Pacing speed factor (2.0 = twice real time)
+            max_samples: Stop after this many samples
+            progress: Called with the running stats every
+                REPLAY_PROGRESS_INTERVAL samples
+
+        Returns:
+            Replay statistics
+        """
+        columns = log.columns
+        inputs = [
+            (col, ch_id, _raw_converter(columns[col]))
+            for col, ch_id in self.resolve_inputs(log.column_names)
+        ]
+        out_ids = self.output_ids
+        if len(out_ids) == 1:
+            single = out_ids[0]
+            collect = lambda values: (values[single],)
+        elif out_ids:
+            collect = itemgetter(*out_ids)
+        else:
+            collect = lambda values: ()
+
+        writer = self._open_output(output) if output is not None else None
+        owns_writer = isinstance(output, str)
+
+        stats = ReplayStats()
+        store_values = self.store.current
+        set_value = self.store.set
+        run_cycle = self.executor.run_cycle
+        clock = time.perf_counter
+        start = clock()
+        wall_base = log_base = None
+
+        try:
+            for timestamp_ms, values in log:
+                for col, ch_id, convert in inputs:
+                    value = values[col]
+                    if value is not None:
+                        set_value(ch_id, convert(value))
+
+                if realtime:
+                    if log_base is None:
+                        wall_base, log_base = clock(), timestamp_ms
+                    delay = wall_base + (timestamp_ms - log_base) / (1000 * speed) - clock()
+                    if delay > 0:
+                        time.sleep(delay)
+
+                run_cycle(timestamp_ms)
+
+                if writer is not None:
+                    writer.write(timestamp_ms, collect(store_values))
+
+                if stats.samples == 0:
+                    stats.first_ms = timestamp_ms
+                stats.last_ms = timestamp_ms
+                stats.samples += 1
+
+                if progress is not None and stats.samples % REPLAY_PROGRESS_INTERVAL == 0:
+                    stats.elapsed_s = clock() - start
+                    progress(stats)
+                if max_samples is not None and stats.samples >= max_samples:
+                    break
+        finally:
+            if writer is not None and owns_writer:
+                writer.close()
+
+        stats.elapsed_s = clock() - start
+        return stats
+
+
+def replay_file(config_path: str,
+                log_path: str,
+                output_path: Optional[str] = None,
+                channel_map: Optional[Dict[str, int]] = None,
+                realtime: bool = False) -> ReplayStats:
+    """
+    Replay one log file through a binary configuration file.
+
+    Suitable for multiprocessing.Pool.starmap over many logs.
+    """
+    replay = LogReplay(ConfigFile.load(config_path).channels, channel_map)
+    with open_log(log_path) as log:
+        return replay.run(log, output=output_path, realtime=realtime)
+
@@ -6,12 +6,14 @@ Author: Ken Tindell
 Copyright (c) 2014-2017 JK Energy Ltd.
 Licensed under MIT License.
 """
+import os
 from random import SystemRandom
+from select import select
 from struct import pack
 from binascii import crc32
 from threading import Lock
 from time import time
-from logging import getLogger, ERROR
+from logging import getLogger, DEBUG, ERROR
 from typing import Dict, Optional, List
 
 from serial import Serial, SerialException
@@ -23,6 +25,14 @@ randomizer = SystemRandom()
 min_logger = getLogger("min")
 
 
+# Fixed pyserial read timeout; wait_for_data() never reconfigures the port
+SERIAL_READ_TIMEOUT = 0.1
+
+
+# Single-byte objects for running CRC updates
+_BYTE = [bytes((i,)) for i in range(256)]
+
+
 def int32_to_bytes(value: int) -> bytes:
     return pack(">I", value)
 
@@ -80,6 +90,7 @@ class MINTransport:
     HEADER_BYTE = 0xAA
     STUFF_BYTE = 0x55
     EOF_BYTE = 0x55
+    _HEADER_PAIR = bytes([HEADER_BYTE, HEADER_BYTE])
 
     SEARCHING_FOR_SOF = 0
     RECEIVING_ID_CONTROL = 1
@@ -101,6 +112,7 @@ class MINTransport:
         ack_retransmit_timeout_ms=25,
         frame_retransmit_timeout_ms=50,
         loglevel=ERROR,
+        crc_self_test=False,
     ):
         """
         :param window_size: Number of outstanding unacknowledged frames
@@ -113,6 +125,8 @@ class MINTransport:
         :param ack_retransmit_timeout_ms: Time before ACK frames are resent
         :param frame_retransmit_timeout_ms: Time before frames are resent
         :param loglevel: set the logging desired
+        :param crc_self_test: cross-check every received CRC against the bitwise
+                              reference implementation (debug only, slow)
         """
         self.transport_fifo_size = transport_fifo_size
         self.ack_retransmit_timeout_ms = ack_retransmit_timeout_ms
@@ -120,6 +134,7 @@ class MINTransport:
         self.idle_timeout_ms = idle_timeout_ms
         self.frame_retransmit_timeout_ms = frame_retransmit_timeout_ms
         self.rx_window_size = rx_window_size
+        self.crc_self_test = crc_self_test
 
         min_logger.setLevel(level=loglevel)
 
@@ -142,9 +157,10 @@ class MINTransport:
 
         # State for receiving a MIN frame
         self._rx_frame_buf = bytearray()
-        self._rx_header_bytes_seen = 0
+        self._rx_raw = bytearray()  # Unscanned bytes (partial 0xAA 0xAA pair)
         self._rx_frame_state = self.SEARCHING_FOR_SOF
         self._rx_frame_checksum = 0
+        self._rx_crc = 0
         self._rx_payload_bytes = bytearray()
         self._rx_frame_id_control = 0
         self._rx_frame_seq = 0
@@ -483,80 +499,116 @@ class MINTransport:
     def _rx_bytes(self, data: bytes):
         """
         Called by handler to pass over a sequence of bytes
+
+        The buffer is scanned for 0xAA 0xAA pairs with bytes.find(); the byte
+        after a pair is a start of frame (0xAA), a stuff byte (0x55, dropped)
+        or an error. Everything in between is plain frame data and is handed
+        to _rx_data() in slices. A trailing partial pair is kept for the
+        next call.
         :param data:
         """
-        min_logger.debug("Received bytes: %s", bytes_to_hexstr(data))
-        for byte in data:
-            if self._rx_header_bytes_seen == 2:
-                self._rx_header_bytes_seen = 0
+        if min_logger.isEnabledFor(DEBUG):
+            min_logger.debug("Received bytes: %s", bytes_to_hexstr(data))
+
+        buf = self._rx_raw
+        buf += data
+        end = len(buf)
+        pos = 0
+        view = memoryview(buf)
+        try:
+            while pos < end:
+                pair = buf.find(self._HEADER_PAIR, pos)
+                if pair < 0:
+                    # A trailing 0xAA may be the first half of a pair
+                    stop = end - 1 if buf[end - 1] == self.HEADER_BYTE else end
+                    self._rx_data(view[pos:stop])
+                    pos = stop
+                    break
+                if pair + 2 >= end:
+                    self._rx_data(view[pos:pair])
+                    pos = pair
+                    break
+
+                # The pair itself is frame data
+                self._rx_data(view[pos:pair + 2])
+                byte = buf[pair + 2]
+                pos = pair + 3
                 if byte == self.HEADER_BYTE:
                     self._rx_frame_state = self.RECEIVING_ID_CONTROL
-                    continue
-                if byte == self.STUFF_BYTE:
-                    # Discard this byte; carry on receiving the next character
-                    continue
-                # By here something must have gone wrong, give up on this frame and
-                # look for new header
-                self._rx_frame_state = self.SEARCHING_FOR_SOF
+                elif byte != self.STUFF_BYTE:
+                    # By here something must have gone wrong, give up on this frame and
+                    # look for new header
+                    self._rx_frame_state = self.SEARCHING_FOR_SOF
+                # else: discard stuff byte; carry on receiving
+        finally:
+            view.release()
+
+        del buf[:pos]
+
+    def _rx_data(self, data: memoryview):
+        """
+        Run unstuffed frame data through the receive state machine.
+
+        Payload bytes are copied in one slice; only the short header,
+        checksum and EOF fields are handled byte by byte.
+        """
+        i = 0
+        n = len(data)
+        while i < n:
+            state = self._rx_frame_state
+
+            if state == self.SEARCHING_FOR_SOF:
+                return
+
+            if state == self.RECEIVING_PAYLOAD:
+                take = min(self._rx_frame_length, n - i)
+                self._rx_frame_buf += data[i:i + take]
+                self._rx_frame_length -= take
+                i += take
+                if self._rx_frame_length == 0:
+                    self._rx_crc = crc32(self._rx_frame_buf, self._rx_crc)
+                    self._rx_frame_state = self.RECEIVING_CHECKSUM_3
                 continue
 
-            if byte == self.HEADER_BYTE:
-                self._rx_header_bytes_seen += 1
-            else:
-                self._rx_header_bytes_seen = 0
+            byte = data[i]
+            i += 1
 
-            if self._rx_frame_state == self.SEARCHING_FOR_SOF:
-                pass
-            elif self._rx_frame_state == self.RECEIVING_ID_CONTROL:
+            if state == self.RECEIVING_ID_CONTROL:
                 self._rx_frame_id_control = byte
+                self._rx_crc = crc32(_BYTE[byte])
                 self._rx_payload_bytes = 0
                 if self._rx_frame_id_control & 0x80:
                     self._rx_frame_state = self.RECEIVING_SEQ
                 else:
                     self._rx_frame_state = self.RECEIVING_LENGTH
-            elif self._rx_frame_state == self.RECEIVING_SEQ:
+            elif state == self.RECEIVING_SEQ:
                 self._rx_frame_seq = byte
+                self._rx_crc = crc32(_BYTE[byte], self._rx_crc)
                 self._rx_frame_state = self.RECEIVING_LENGTH
-            elif self._rx_frame_state == self.RECEIVING_LENGTH:
+            elif state == self.RECEIVING_LENGTH:
                 self._rx_frame_length = byte
                 self._rx_control = byte
+                self._rx_crc = crc32(_BYTE[byte], self._rx_crc)
                 self._rx_frame_buf = bytearray()
                 if self._rx_frame_length > 0:
                     self._rx_frame_state = self.RECEIVING_PAYLOAD
                 else:
                     self._rx_frame_state = self.RECEIVING_CHECKSUM_3
-            elif self._rx_frame_state == self.RECEIVING_PAYLOAD:
-                self._rx_frame_buf.append(byte)
-                self._rx_frame_length -= 1
-                if self._rx_frame_length == 0:
-                    self._rx_frame_state = self.RECEIVING_CHECKSUM_3
-            elif self._rx_frame_state == self.RECEIVING_CHECKSUM_3:
+            elif state == self.RECEIVING_CHECKSUM_3:
                 self._rx_frame_checksum = byte << 24
                 self._rx_frame_state = self.RECEIVING_CHECKSUM_2
-            elif self._rx_frame_state == self.RECEIVING_CHECKSUM_2:
+            elif state == self.RECEIVING_CHECKSUM_2:
                 self._rx_frame_checksum |= byte << 16
                 self._rx_frame_state = self.RECEIVING_CHECKSUM_1
-            elif self._rx_frame_state == self.RECEIVING_CHECKSUM_1:
+            elif state == self.RECEIVING_CHECKSUM_1:
                 self._rx_frame_checksum |= byte << 8
                 self._rx_frame_state = self.RECEIVING_CHECKSUM_0
-            elif self._rx_frame_state == self.RECEIVING_CHECKSUM_0:
+            elif state == self.RECEIVING_CHECKSUM_0:
                 self._rx_frame_checksum |= byte
-                if self._rx_frame_id_control & 0x80:
-                    computed_checksum = self._crc32(
-                        bytearray(
-                            [
-                                self._rx_frame_id_control,
-                                self._rx_frame_seq,
-                                self._rx_control,
-                            ]
-                        )
-                        + self._rx_frame_buf
-                    )
-                else:
-                    computed_checksum = self._crc32(
-                        bytearray([self._rx_frame_id_control, self._rx_control])
-                        + self._rx_frame_buf
-                    )
+                # Running CRC over id/control, [seq], length and payload
+                computed_checksum = self._rx_crc
+                if self.crc_self_test:
+                    self._check_rx_crc(computed_checksum)
 
                 if self._rx_frame_checksum != computed_checksum:
                     min_logger.warning(
@@ -569,7 +621,7 @@ class MINTransport:
                 else:
                     # Checksum passes, wait for EOF
                     self._rx_frame_state = self.RECEIVING_EOF
-            elif self._rx_frame_state == self.RECEIVING_EOF:
+            elif state == self.RECEIVING_EOF:
                 if byte == self.EOF_BYTE:
                     # Frame received OK, pass up frame for handling")
                     self._min_frame_received(
@@ -623,10 +675,11 @@ class MINTransport:
         return bytes(stuffed)
 
     @staticmethod
-    def _crc32(checksummed_data: bytearray, start=0xFFFFFFFF):
+    def _crc32(checksummed_data: bytes, start=0xFFFFFFFF):
         """
         The 'manual' implementation is left here as a guide to implementing this on
-        microcontrollers. It's cross-checked with the standard Python library version.
+        microcontrollers. The receive path uses binascii.crc32; this version is only
+        run when crc_self_test is enabled.
         """
         crc = start
         for byte in checksummed_data:
@@ -634,12 +687,21 @@ class MINTransport:
             for j in range(8):
                 mask = -(crc & 1)
                 crc = (crc >> 1) ^ (0xEDB88320 & mask)
-        checksum = ~crc % (1 << 32)
+        return ~crc % (1 << 32)
 
-        if checksum != crc32(checksummed_data, 0):
-            raise AssertionError("CRC algorithm mismatch")
+    def _check_rx_crc(self, computed_checksum: int):
+        """
+        Cross-check the running receive CRC against the manual implementation
+        """
+        if self._rx_frame_id_control & 0x80:
+            header = bytes(
+                [self._rx_frame_id_control, self._rx_frame_seq, self._rx_control]
+            )
+        else:
+            header = bytes([self._rx_frame_id_control, self._rx_control])
 
-        return checksum
+        if computed_checksum != self._crc32(header + self._rx_frame_buf):
+            raise AssertionError("CRC algorithm mismatch")
 
     def transport_stats(self):
         """
@@ -672,12 +734,43 @@ class MINTransport:
 
         return oldest_frame
 
-    def poll(self):
+    def next_timeout_ms(self) -> Optional[int]:
+        """
+        Time until poll() has timed work to do (frame send, retransmit or
+        periodic ACK).
+
+        :return: milliseconds (0 = poll now), or None if nothing is due
+            until more data is received or a frame is queued
+        """
+        now = self._now_ms()
+        window_size = (self._sn_max - self._sn_min) & 0xFF
+        if (
+            window_size < self.max_window_size
+            and len(self._transport_fifo) > window_size
+        ):
+            return 0
+
+        deadlines = []
+        if window_size > 0 and (now - self._last_received_anything_ms) < self.idle_timeout_ms:
+            oldest_sent = min(
+                self._transport_fifo[i].last_sent_time for i in range(window_size)
+            )
+            deadlines.append(oldest_sent + self.frame_retransmit_timeout_ms + 1)
+        if (now - self._last_received_frame_ms) < self.idle_timeout_ms:
+            deadlines.append(self._last_sent_ack_time_ms + self.ack_retransmit_timeout_ms + 1)
+
+        if not deadlines:
+            return None
+        return max(min(deadlines) - now, 0)
+
+    def poll(self, data: Optional[bytes] = None):
         """
         Polls the serial line.
 
         Runs through MIN, sends ACKs, handles retransmits where ACK has gone missing.
 
+        :param data: bytes already read from the line by the caller (see
+            MINTransportSerial.wait_for_data()); None reads the serial line
         :return: array of accepted MIN frames
         """
         remote_connected = (
@@ -689,7 +782,8 @@ class MINTransport:
 
         self._rx_list = []
 
-        data = self._serial_read_all()
+        if data is None:
+            data = self._serial_read_all()
         if data:
             self._rx_bytes(data=data)
 
@@ -792,21 +886,92 @@ class MINTransportSerial(MINTransport):
 
     def _serial_close(self):
         self._serial.close()
+        if self._wake_r is not None:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
+
+    def wait_for_data(self, timeout: Optional[float]) -> bytes:
+        """
+        Block until bytes arrive on the line, then return everything buffered.
+
+        Does not touch MIN state, so a reader thread can wait here without
+        holding the lock that guards poll()/queue_frame(), then pass the
+        result to poll(data).
 
-    def __init__(self, port, baudrate=9600, loglevel=ERROR):
+        :param timeout: seconds to wait at most (None = no limit)
+        :return: received bytes (empty on timeout or cancel_wait())
+        """
+        if self._fd is None:
+            data = self._wait_polled(timeout)
+        else:
+            readable, _, _ = select([self._fd, self._wake_r], [], [], timeout)
+            if self._wake_r in readable:
+                os.read(self._wake_r, 64)
+                return b""
+            if not readable:
+                return b""
+            # A readable port with nothing waiting is a hang-up: read() raises
+            data = self._serial.read(self._serial.in_waiting or 1)
+        if data and self.fake_errors:
+            data = self._corrupted_data(data)
+        return data
+
+    def _wait_polled(self, timeout: Optional[float]) -> bytes:
+        """wait_for_data() for ports without a selectable fd (Windows)."""
+        deadline = None if timeout is None else time() + timeout
+        self._wait_cancelled = False
+        while not self._wait_cancelled:
+            data = self._serial.read(1)
+            if data:
+                waiting = self._serial.in_waiting
+                if waiting:
+                    data += self._serial.read(waiting)
+                return data
+            if deadline is not None and time() >= deadline:
+                break
+        return b""
+
+    def cancel_wait(self):
+        """Wake a thread blocked in wait_for_data()."""
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\x00")
+            except BlockingIOError:
+                pass  # A wake-up is already pending
+            return
+        self._wait_cancelled = True
+        try:
+            self._serial.cancel_read()
+        except (AttributeError, NotImplementedError):
+            pass
+
+    def __init__(self, port, baudrate=9600, loglevel=ERROR, crc_self_test=False):
         """
         Open MIN connection on a given port.
         :param port: serial port
         :param debug:
+        :param crc_self_test: cross-check received CRCs (debug only)
         """
         self.fake_errors = False
         try:
-            self._serial = Serial(port=port, baudrate=baudrate, timeout=0.1, write_timeout=1.0)
+            self._serial = Serial(port=port, baudrate=baudrate, timeout=SERIAL_READ_TIMEOUT,
+                                  write_timeout=1.0)
             self._serial.reset_input_buffer()
             self._serial.reset_output_buffer()
         except SerialException:
             raise MINConnectionError(f"Transport MIN cannot open port '{port}'")
-        super().__init__(loglevel=loglevel)
+        # wait_for_data() selects on the port fd plus a pipe cancel_wait() writes to
+        self._wait_cancelled = False
+        self._wake_r = self._wake_w = None
+        try:
+            self._fd = self._serial.fileno()
+        except AttributeError:  # Windows: no fd, poll with the fixed read timeout
+            self._fd = None
+        else:
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_w, False)
+        super().__init__(loglevel=loglevel, crc_self_test=crc_self_test)
 
 
 class ThreadsafeTransportMINSerialHandler(MINTransportSerial):
@@ -819,8 +984,8 @@ class ThreadsafeTransportMINSerialHandler(MINTransportSerial):
     The application can send directly and pick up incoming frames from the queue.
     """
 
-    def __init__(self, port, loglevel=ERROR):
-        super().__init__(port=port, loglevel=loglevel)
+    def __init__(self, port, loglevel=ERROR, crc_self_test=False):
+        super().__init__(port=port, loglevel=loglevel, crc_self_test=crc_self_test)
         self._thread_lock = Lock()
 
     def close(self):
@@ -861,10 +1026,10 @@ class ThreadsafeTransportMINSerialHandler(MINTransportSerial):
             raise e
         self._thread_lock.release()
 
-    def poll(self):
+    def poll(self, data: Optional[bytes] = None):
         self._thread_lock.acquire()
         try:
-            result = super().poll()
+            result = super().poll(data)
         except Exception as e:
             self._thread_lock.release()
             raise e
@@ -17,6 +17,11 @@ from typing import Optional, List, Tuple
 from enum import IntEnum
 from dataclasses import dataclass
 
+try:
+    from .config_compress import compress as compress_config
+except ImportError:  # Loaded as a top-level module (shared/python on sys.path)
+    from config_compress import compress as compress_config
+
 
 class Command(IntEnum):
     """Protocol Command IDs (Packet ID in SerialTransfer terms)"""
@@ -34,6 +39,7 @@ class Command(IntEnum):
     CLEAR_CONFIG_ACK = 0x17
     LOAD_BINARY = 0x18
     BINARY_ACK = 0x19
+    LOAD_BINARY_LZ = 0x1A
 
     # Telemetry
     START_STREAM = 0x20
@@ -455,20 +461,27 @@ class PMUSerialTransfer:
                 return p.payload[0] == 1
         return False
 
-    def upload_config(self, binary_data: bytes) -> Tuple[bool, int]:
+    def upload_config(self, binary_data: bytes, compressed: bool = False) -> Tuple[bool, int]:
         """
         Upload binary configuration.
 
         Args:
             binary_data: Binary config data
+            compressed: Send LZ-compressed (LOAD_BINARY_LZ); only for devices
+                reporting SwCapsFlags.CONFIG_LZ in get_capabilities()
 
         Returns:
             (success, channels_loaded)
         """
+        cmd = Command.LOAD_BINARY
+        if compressed:
+            binary_data = compress_config(binary_data)
+            cmd = Command.LOAD_BINARY_LZ
+
         # Add chunk header (single chunk)
         payload = struct.pack('<HH', 0, 1) + binary_data
 
-        packets = self.transact(Command.LOAD_BINARY, payload, timeout=5.0,
+        packets = self.transact(cmd, payload, timeout=5.0,
                                 expected=Command.BINARY_ACK)
 
         for p in packets:
@@ -531,7 +544,8 @@ class PMUSerialTransfer:
                     'analog_inputs': caps[5],
                     'digital_inputs': caps[6],
                     'hbridges': caps[7],
-                    'can_buses': caps[8]
+                    'can_buses': caps[8],
+                    'sw_flags': struct.unpack('<I', caps[10:14])[0] if len(caps) >= 14 else 0,
                 }
 
         return None
@@ -3,12 +3,19 @@ PMU-30 Telemetry Codec - Python implementation
 
 Mirrors telemetry_codec.h/.c for Python compatibility.
 Provides parse_telemetry() function for configurator use.
+
+Section layouts are compiled to struct.Struct objects once per section
+flag combination and cached, so parsing a packet costs one unpack call
+for the fixed sections and one iter_unpack pass over the virtual
+channel array.
 """
 
 import struct
+import sys
+from array import array
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 # Section flags
@@ -135,108 +142,198 @@ def _get_min_size(flags: int) -> int:
     return size
 
 
-def parse_telemetry(data: bytes) -> tuple[TelemetryResult, TelemetryPacket]:
+# ============================================================================
+# Section Codecs
+# ============================================================================
+
+_HEADER_FIELDS = [
+    ("stream_counter", "I", 0),
+    ("timestamp_ms", "I", 0),
+    ("input_voltage_mv", "H", 0),
+    ("mcu_temp_c10", "h", 0),
+    ("board_temp_c10", "h", 0),
+    ("total_current_ma", "I", 0),
+    ("flags", "H", 0),
+]
+
+# Fields per section, in wire order: (attribute, struct code, count).
+# count 0 = scalar, attribute None = padding.
+_SECTION_FIELDS = {
+    TELEM_HAS_ADC: [("adc_values", "H", TELEM_ADC_COUNT)],
+    TELEM_HAS_OUTPUTS: [("output_states", "B", TELEM_OUTPUT_COUNT)],
+    TELEM_HAS_HBRIDGE: [
+        ("hbridge_positions", "h", TELEM_HBRIDGE_COUNT),
+        ("hbridge_currents", "H", TELEM_HBRIDGE_COUNT),
+    ],
+    TELEM_HAS_DIN: [("din_bitmask", "I", 0)],
+    TELEM_HAS_FAULTS: [("fault_status", "B", 0), ("fault_flags", "B", 0), (None, "x", 2)],
+    TELEM_HAS_CURRENTS: [("output_currents", "H", TELEM_OUTPUT_COUNT)],
+}
+
+# Sections before / after the variable-length virtual channel array
+_HEAD_SECTIONS = (TELEM_HAS_ADC, TELEM_HAS_OUTPUTS, TELEM_HAS_HBRIDGE, TELEM_HAS_DIN)
+_TAIL_SECTIONS = (TELEM_HAS_FAULTS, TELEM_HAS_CURRENTS)
+_SECTION_MASK = 0x7F
+
+_FLAGS = struct.Struct("<H")
+_VIRTUAL_COUNT = struct.Struct("<H")
+_VIRTUAL_ENTRY = struct.Struct("<Hi")
+
+# array.array holds native byte order
+_BYTESWAP = sys.byteorder != "little"
+
+
+class _SectionCodec:
+    """
+    Compiled codec for a run of consecutive fixed-size sections.
+
+    full unpacks every value in one call. For flat results, scalars
+    unpacks only the scalar fields and array sections are copied
+    straight from the buffer into array.array objects.
+    """
+
+    def __init__(self, fields: List[Tuple[Optional[str], str, int]]):
+        full = ["<"]
+        scalars = ["<"]
+        self.fields: List[Tuple[str, int, int]] = []
+        self.scalar_names: List[str] = []
+        self.arrays: List[Tuple[str, str, int, int]] = []
+        index = 0
+        offset = 0
+
+        for attr, code, count in fields:
+            size = struct.calcsize("<" + code) * max(count, 1)
+            if attr is None:
+                full.append(f"{count}x")
+                scalars.append(f"{count}x")
+                size = count
+            elif count:
+                full.append(f"{count}{code}")
+                scalars.append(f"{size}x")
+                self.fields.append((attr, index, count))
+                self.arrays.append((attr, code, offset, size))
+                index += count
+            else:
+                full.append(code)
+                scalars.append(code)
+                self.fields.append((attr, index, 0))
+                self.scalar_names.append(attr)
+                index += 1
+            offset += size
+
+        self.full = struct.Struct("".join(full))
+        self.scalars = struct.Struct("".join(scalars))
+        self.size = self.full.size
+
+    def decode(self, packet: "TelemetryPacket", data, offset: int) -> None:
+        values = self.full.unpack_from(data, offset)
+        for attr, index, count in self.fields:
+            setattr(packet, attr, list(values[index:index + count]) if count else values[index])
+
+    def decode_flat(self, packet: "TelemetryPacket", data, offset: int) -> None:
+        for attr, value in zip(self.scalar_names, self.scalars.unpack_from(data, offset)):
+            setattr(packet, attr, value)
+        for attr, code, start, size in self.arrays:
+            values = array(code)
+            values.frombytes(data[offset + start:offset + start + size])
+            if _BYTESWAP:
+                values.byteswap()
+            setattr(packet, attr, values)
+
+
+class _PacketLayout:
+    """Compiled codecs for one section flag combination"""
+
+    def __init__(self, flags: int):
+        head = list(_HEADER_FIELDS)
+        for flag in _HEAD_SECTIONS:
+            if flags & flag:
+                head += _SECTION_FIELDS[flag]
+        tail = []
+        for flag in _TAIL_SECTIONS:
+            if flags & flag:
+                tail += _SECTION_FIELDS[flag]
+
+        self.head = _SectionCodec(head)
+        self.tail = _SectionCodec(tail)
+        self.virtuals = bool(flags & TELEM_HAS_VIRTUALS)
+        self.faults = bool(flags & TELEM_HAS_FAULTS)
+        self.min_size = _get_min_size(flags)
+
+
+_HEADER_CODEC = _SectionCodec(_HEADER_FIELDS)
+_LAYOUTS: Dict[int, _PacketLayout] = {}
+
+
+def _get_layout(flags: int) -> _PacketLayout:
+    """Get (and cache) the compiled layout for a section flag combination"""
+    key = flags & _SECTION_MASK
+    layout = _LAYOUTS.get(key)
+    if layout is None:
+        layout = _LAYOUTS[key] = _PacketLayout(key)
+    return layout
+
+
+def parse_telemetry(data: bytes, flat: bool = False) -> tuple[TelemetryResult, TelemetryPacket]:
     """
     Parse telemetry packet from raw bytes.
 
     Args:
         data: Raw packet data (after protocol framing removed)
+        flat: Return array sections as array.array copied straight from
+            the packet instead of lists (cheaper for high-rate streams)
 
     Returns:
         Tuple of (result_code, parsed_packet)
     """
     packet = TelemetryPacket()
+    size = len(data)
 
-    if len(data) < HEADER_SIZE:
+    if size < HEADER_SIZE:
         return TelemetryResult.ERR_TOO_SHORT, packet
 
-    # Parse header
-    idx = 0
-    (
-        packet.stream_counter,
-        packet.timestamp_ms,
-        packet.input_voltage_mv,
-        packet.mcu_temp_c10,
-        packet.board_temp_c10,
-        packet.total_current_ma,
-        packet.flags,
-    ) = struct.unpack_from("<IIHhhIH", data, idx)
-    idx += HEADER_SIZE
-
-    flags = packet.flags
+    (flags,) = _FLAGS.unpack_from(data, HEADER_SIZE - 2)
+    layout = _get_layout(flags)
 
     # Check minimum size
-    if len(data) < _get_min_size(flags):
+    if size < layout.min_size:
+        _HEADER_CODEC.decode(packet, data, 0)
         return TelemetryResult.ERR_TOO_SHORT, packet
 
-    # Parse ADC section
-    if flags & TELEM_HAS_ADC:
-        if idx + TELEM_ADC_COUNT * 2 > len(data):
-            return TelemetryResult.ERR_TRUNCATED, packet
-        packet.adc_values = list(struct.unpack_from(f"<{TELEM_ADC_COUNT}H", data, idx))
-        idx += TELEM_ADC_COUNT * 2
-
-    # Parse Outputs section
-    if flags & TELEM_HAS_OUTPUTS:
-        if idx + TELEM_OUTPUT_COUNT > len(data):
-            return TelemetryResult.ERR_TRUNCATED, packet
-        packet.output_states = list(data[idx : idx + TELEM_OUTPUT_COUNT])
-        idx += TELEM_OUTPUT_COUNT
-
-    # Parse H-Bridge section
-    if flags & TELEM_HAS_HBRIDGE:
-        if idx + TELEM_HBRIDGE_COUNT * 4 > len(data):
-            return TelemetryResult.ERR_TRUNCATED, packet
-        packet.hbridge_positions = list(
-            struct.unpack_from(f"<{TELEM_HBRIDGE_COUNT}h", data, idx)
-        )
-        idx += TELEM_HBRIDGE_COUNT * 2
-        packet.hbridge_currents = list(
-            struct.unpack_from(f"<{TELEM_HBRIDGE_COUNT}H", data, idx)
-        )
-        idx += TELEM_HBRIDGE_COUNT * 2
-
-    # Parse Digital Inputs section
-    if flags & TELEM_HAS_DIN:
-        if idx + 4 > len(data):
-            return TelemetryResult.ERR_TRUNCATED, packet
-        (packet.din_bitmask,) = struct.unpack_from("<I", data, idx)
-        idx += 4
+    # Header and fixed sections before the virtual channels
+    if flat:
+        layout.head.decode_flat(packet, data, 0)
+    else:
+        layout.head.decode(packet, data, 0)
+    idx = layout.head.size
 
     # Parse Virtual Channels section
-    if flags & TELEM_HAS_VIRTUALS:
-        if idx + 2 > len(data):
-            return TelemetryResult.ERR_TRUNCATED, packet
-        (count,) = struct.unpack_from("<H", data, idx)
+    if layout.virtuals:
+        (count,) = _VIRTUAL_COUNT.unpack_from(data, idx)
         idx += 2
 
         if count > TELEM_VIRTUAL_MAX:
             count = TELEM_VIRTUAL_MAX
 
-        packet.virtual_channels = {}
-        for _ in range(count):
-            if idx + 6 > len(data):
-                return TelemetryResult.ERR_TRUNCATED, packet
-            channel_id, value = struct.unpack_from("<Hi", data, idx)
-            packet.virtual_channels[channel_id] = value
-            idx += 6
-
-    # Parse Faults section
-    if flags & TELEM_HAS_FAULTS:
-        if idx + 4 > len(data):
+        available = min(count, (size - idx) // _VIRTUAL_ENTRY.size)
+        end = idx + available * _VIRTUAL_ENTRY.size
+        with memoryview(data) as view:
+            packet.virtual_channels = dict(_VIRTUAL_ENTRY.iter_unpack(view[idx:end]))
+        if available < count:
             return TelemetryResult.ERR_TRUNCATED, packet
-        packet.fault_status = data[idx]
-        packet.fault_flags = data[idx + 1]
-        idx += 4
-
-    # Parse Currents section
-    if flags & TELEM_HAS_CURRENTS:
-        if idx + TELEM_OUTPUT_COUNT * 2 > len(data):
+        idx = end
+
+    # Faults and Currents sections
+    if layout.tail.size:
+        if idx + layout.tail.size > size:
+            if layout.faults and idx + 4 <= size:
+                packet.fault_status = data[idx]
+                packet.fault_flags = data[idx + 1]
             return TelemetryResult.ERR_TRUNCATED, packet
-        packet.output_currents = list(
-            struct.unpack_from(f"<{TELEM_OUTPUT_COUNT}H", data, idx)
-        )
-        idx += TELEM_OUTPUT_COUNT * 2
+        if flat:
+            layout.tail.decode_flat(packet, data, idx)
+        else:
+            layout.tail.decode(packet, data, idx)
 
     return TelemetryResult.OK, packet
 
@@ -1 +1,21 @@
 # Tests package
+
+import importlib.util
+import os
+import sys
+
+SHARED_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_shared_package():
+    """Load shared/python as the pmu_shared package so relative imports resolve."""
+    if "pmu_shared" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "pmu_shared",
+            os.path.join(SHARED_DIR, "__init__.py"),
+            submodule_search_locations=[SHARED_DIR],
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules["pmu_shared"] = package
+        spec.loader.exec_module(package)
+    return sys.modules["pmu_shared"]
@@ -0,0 +1,110 @@
+"""
+Config Compression Tests
+
+Round-trips the LZ encoder through the Python reference decoder and the
+streaming C decoder in config_compress.c.
+"""
+
+import sys
+import os
+import ctypes
+import random
+import shutil
+import struct
+import subprocess
+import tempfile
+import unittest
+
+# Add shared/python to path for imports
+_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _parent_dir not in sys.path:
+    sys.path.insert(0, _parent_dir)
+
+from config_compress import CompressError, compress, decompress
+
+
+def _config_like(channels: int = 40) -> bytes:
+    """Binary config shaped like serialize_ui_channels_for_executor output."""
+    records = []
+    for i in range(channels):
+        name = f"Timer Fan Delay {i}".encode()
+        config = struct.pack('<HBBIII', 50, 1, 0, 1000, 0, 0) + bytes(12)
+        header = struct.pack('<HBBBBHiBB', 200 + i, 0x20, 1, 0, 0, 0xFFFF, 0, len(name), len(config))
+        records.append(header + name + config)
+    return struct.pack('<H', channels) + b"".join(records)
+
+
+def _samples():
+    rng = random.Random(7)
+    yield b""
+    yield b"a"
+    yield b"abcd"
+    yield bytes(1000)
+    yield b"ab" * 300
+    yield bytes(rng.getrandbits(8) for _ in range(500))
+    yield _config_like()
+
+
+class TestConfigCompress(unittest.TestCase):
+    """Test the Python encoder and reference decoder."""
+
+    def test_roundtrip(self):
+        for data in _samples():
+            self.assertEqual(decompress(compress(data)), data)
+
+    def test_config_ratio(self):
+        """Configs shrink at least 3x."""
+        data = _config_like()
+        self.assertGreater(len(data) / len(compress(data)), 3.0)
+
+    def test_incompressible_overhead(self):
+        """Random data grows by one byte per 128-byte literal run."""
+        data = bytes(random.Random(1).getrandbits(8) for _ in range(1024))
+        self.assertLessEqual(len(compress(data)), 2 + len(data) + len(data) // 128 + 1)
+
+    def test_invalid_streams(self):
+        stream = compress(b"abcdabcdabcd")
+        with self.assertRaises(CompressError):
+            decompress(stream[:-1])
+        with self.assertRaises(CompressError):
+            decompress(stream + b"\x00")
+        with self.assertRaises(CompressError):
+            decompress(struct.pack('<H', 8) + bytes([0x84, 0x01, 0x00]))  # Distance before start
+        with self.assertRaises(CompressError):
+            compress(bytes(0x10000))
+
+    @unittest.skipUnless(shutil.which("cc"), "C compiler not available")
+    def test_matches_c_decoder(self):
+        """config_compress.c decodes the same output, whole or chunk by chunk."""
+        src = os.path.join(os.path.dirname(_parent_dir), "config_compress.c")
+        with tempfile.TemporaryDirectory() as tmp:
+            lib_path = os.path.join(tmp, "liblz.so")
+            subprocess.run(["cc", "-shared", "-fPIC", "-O2", src, "-o", lib_path], check=True)
+            lib = ctypes.CDLL(lib_path)
+            lib.pmu_lz_decompress.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_uint16]
+            lib.pmu_lz_decoder_feed.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t]
+
+            for data in _samples():
+                stream = compress(data)
+                out = ctypes.create_string_buffer(4096)
+                self.assertEqual(lib.pmu_lz_decompress(stream, len(stream), out, 4096), len(data))
+                self.assertEqual(out.raw[:len(data)], data)
+
+                # Fed in 7-byte pieces, as transport chunks would arrive
+                dec = ctypes.create_string_buffer(32)
+                out = ctypes.create_string_buffer(4096)
+                lib.pmu_lz_decoder_init(dec, out, ctypes.c_uint16(4096))
+                results = [lib.pmu_lz_decoder_feed(dec, stream[i:i + 7], len(stream[i:i + 7]))
+                           for i in range(0, len(stream), 7)]
+                self.assertEqual(results[-1], 1)  # PMU_LZ_DONE
+                self.assertTrue(all(r == 0 for r in results[:-1]))
+                self.assertEqual(out.raw[:len(data)], data)
+
+            stream = compress(bytes(64))
+            out = ctypes.create_string_buffer(64)
+            self.assertEqual(lib.pmu_lz_decompress(stream, len(stream), out, 16), -1)  # Overflow
+            self.assertEqual(lib.pmu_lz_decompress(stream, len(stream) - 1, out, 64), -3)  # Truncated
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+CRC and Frame Parser Tests
+
+Verifies the fast CRC functions against bitwise references and crc32.c,
+and the protocol frame parser.
+"""
+
+import os
+import ctypes
+import random
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from . import SHARED_DIR, load_shared_package
+
+load_shared_package()
+
+from pmu_shared.crc import (
+    CRC16_INIT, CRC32_INIT,
+    crc32, crc32_update, crc32_finalize, crc32_py,
+    crc16_ccitt, crc16_update, crc16_ccitt_py,
+)
+from pmu_shared.protocol import ParseState, ProtocolParser, build_frame, calc_crc16
+
+
+def _crc16_bitwise(data: bytes) -> int:
+    """Bit-by-bit CRC-16-CCITT (matches pmu_crc16_ccitt)."""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+    return crc
+
+
+def _crc32_bitwise(data: bytes) -> int:
+    """Bit-by-bit reflected CRC-32 (polynomial 0xEDB88320)."""
+    crc = 0xFFFFFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+    return crc ^ 0xFFFFFFFF
+
+
+def _samples():
+    rng = random.Random(42)
+    yield b""
+    yield b"123456789"
+    yield bytes(range(256))
+    for size in (1, 3, 17, 200, 1024):
+        yield bytes(rng.getrandbits(8) for _ in range(size))
+
+
+class TestCrc(unittest.TestCase):
+    """Test CRC-16 and CRC-32."""
+
+    def test_check_values(self):
+        """Standard check values for '123456789'."""
+        self.assertEqual(crc32(b"123456789"), 0xCBF43926)
+        self.assertEqual(crc16_ccitt(b"123456789"), 0x29B1)
+        self.assertEqual(crc16_ccitt(b""), 0xFFFF)
+
+    def test_matches_bitwise(self):
+        """Fast and table-driven versions match the bitwise references."""
+        for data in _samples():
+            self.assertEqual(crc16_ccitt(data), _crc16_bitwise(data))
+            self.assertEqual(crc16_ccitt_py(data), _crc16_bitwise(data))
+            self.assertEqual(crc32(data), _crc32_bitwise(data))
+            self.assertEqual(crc32_py(data), _crc32_bitwise(data))
+
+    def test_streaming(self):
+        """Chunked updates give the same result as one call."""
+        for data in _samples():
+            for cut in (0, len(data) // 3, len(data)):
+                crc = crc16_update(crc16_update(CRC16_INIT, data[:cut]), data[cut:])
+                self.assertEqual(crc, crc16_ccitt(data))
+                crc = crc32_update(crc32_update(CRC32_INIT, data[:cut]), data[cut:])
+                self.assertEqual(crc32_finalize(crc), crc32(data))
+
+    def test_buffer_types(self):
+        """bytearray and memoryview inputs are accepted."""
+        data = bytes(range(50))
+        self.assertEqual(crc16_ccitt(memoryview(data)[10:]), crc16_ccitt(data[10:]))
+        self.assertEqual(crc32(bytearray(data)), crc32(data))
+
+    @unittest.skipUnless(shutil.which("cc"), "C compiler not available")
+    def test_matches_c_implementation(self):
+        """Results match shared/crc32.c."""
+        src = os.path.join(os.path.dirname(SHARED_DIR), "crc32.c")
+        with tempfile.TemporaryDirectory() as tmp:
+            lib_path = os.path.join(tmp, "libcrc.so")
+            subprocess.run(["cc", "-shared", "-fPIC", "-O2", src, "-o", lib_path], check=True)
+            lib = ctypes.CDLL(lib_path)
+            lib.pmu_crc32.restype = ctypes.c_uint32
+            lib.pmu_crc16_ccitt.restype = ctypes.c_uint16
+            lib.pmu_crc32_update.restype = ctypes.c_uint32
+            lib.pmu_crc32_update.argtypes = [ctypes.c_uint32, ctypes.c_char_p, ctypes.c_size_t]
+
+            for data in _samples():
+                self.assertEqual(crc32(data), lib.pmu_crc32(data, ctypes.c_size_t(len(data))))
+                self.assertEqual(crc16_ccitt(data), lib.pmu_crc16_ccitt(data, ctypes.c_size_t(len(data))))
+                self.assertEqual(crc32_update(CRC32_INIT, data),
+                                 lib.pmu_crc32_update(CRC32_INIT, data, len(data)))
+
+
+class TestProtocolCrc(unittest.TestCase):
+    """Test protocol frame CRC."""
+
+    def test_frame_roundtrip(self):
+        """Built frames parse back and carry the CRC over length+cmd+payload."""
+        payload = bytes(range(100))
+        frame = build_frame(0x20, payload)
+        self.assertEqual(int.from_bytes(frame[-2:], "little"), calc_crc16(frame[1:-2]))
+        self.assertEqual(calc_crc16(frame[1:-2]), _crc16_bitwise(frame[1:-2]))
+
+        frames = ProtocolParser().parse_bytes(frame + build_frame(0x01))
+        self.assertEqual([(f.cmd, f.payload) for f in frames], [(0x20, payload), (0x01, b"")])
+
+    def test_bad_crc_rejected(self):
+        """Corrupted frames are dropped."""
+        frame = bytearray(build_frame(0x20, b"abc"))
+        frame[5] ^= 0xFF
+        self.assertEqual(ProtocolParser().parse_bytes(bytes(frame)), [])
+
+
+class TestProtocolParser(unittest.TestCase):
+    """Test the buffer-scanning frame parser."""
+
+    def _stream(self):
+        rng = random.Random(11)
+        stream = bytearray()
+        expected = []
+        for i in range(50):
+            payload = bytes(rng.choice((0xAA, rng.getrandbits(8))) for _ in range(rng.randint(0, 300)))
+            if i % 5 == 0:
+                stream += bytes([0x00, 0xAA, 0xFF, 0xFF, 0x01])  # garbage with bad length
+            stream += build_frame(i, payload)
+            expected.append((i, payload))
+        return bytes(stream), expected
+
+    def test_chunking_invariant(self):
+        """Any read chunking yields the same frames."""
+        stream, expected = self._stream()
+        self.assertEqual([(f.cmd, f.payload) for f in ProtocolParser().parse_bytes(stream)], expected)
+
+        rng = random.Random(5)
+        parser = ProtocolParser()
+        frames = []
+        pos = 0
+        while pos < len(stream):
+            step = rng.randint(1, 64)
+            frames += parser.parse_bytes(stream[pos:pos + step])
+            pos += step
+        self.assertEqual([(f.cmd, f.payload) for f in frames], expected)
+
+    def test_parse_byte(self):
+        """Byte-at-a-time parsing still works."""
+        stream, expected = self._stream()
+        parser = ProtocolParser()
+        frames = [f for f in (parser.parse_byte(b) for b in stream) if f]
+        self.assertEqual([(f.cmd, f.payload) for f in frames], expected)
+
+    def test_resync_inside_rejected_frame(self):
+        """A frame hidden behind a false start marker is found."""
+        frame = build_frame(0x10, b"data")
+        parser = ProtocolParser()
+        frames = parser.parse_bytes(bytes([0xAA, 0x05, 0x00, 0x01]) + frame)
+        self.assertEqual([(f.cmd, f.payload) for f in frames], [(0x10, b"data")])
+
+    def test_state(self):
+        """Parser state reflects the buffered partial frame."""
+        frame = build_frame(0x10, b"ab")
+        parser = ProtocolParser()
+        states = []
+        for b in frame:
+            parser.parse_byte(b)
+            states.append(parser.state)
+        self.assertEqual(states, [
+            ParseState.LEN_L, ParseState.LEN_H, ParseState.CMD, ParseState.PAYLOAD,
+            ParseState.PAYLOAD, ParseState.CRC_L, ParseState.CRC_H, ParseState.SYNC,
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
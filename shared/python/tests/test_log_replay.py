@@ -0,0 +1,267 @@
+"""
+Log Replay Tests
+
+Tests PLOG/CSV log files and replaying them through the executor.
+"""
+
+import os
+import io
+import math
+import tempfile
+import unittest
+
+from . import load_shared_package
+
+load_shared_package()
+
+from pmu_shared.channel_config import (
+    Channel, ConfigFile, ChannelType, CfgLogic, CfgMath, CfgFilter,
+)
+from pmu_shared.datalog import (
+    DataLogChannel, DataLogType, DataLogFileHeader, PlogReader, PlogWriter,
+    MappedPlogReader, CsvLogReader, CsvLogWriter, HAS_NUMPY,
+)
+from pmu_shared.log_replay import LogReplay, replay_file
+from pmu_shared.engine import LogicOp, MathOp, FilterType
+
+
+def _config_channels():
+    """RPM input -> scaled RPM (math) -> over-rev flag (logic)."""
+    return [
+        Channel(id=10, type=ChannelType.ANALOG_INPUT, name="RPM"),
+        Channel(id=11, type=ChannelType.ANALOG_INPUT, name="TPS"),
+        Channel(id=201, type=ChannelType.LOGIC, name="Over Rev", config=CfgLogic(
+            operation=LogicOp.GT, input_count=1, inputs=[200], compare_value=700)),
+        Channel(id=200, type=ChannelType.MATH, name="RPM x10", config=CfgMath(
+            operation=MathOp.ADD, input_count=2, inputs=[10, 11])),
+    ]
+
+
+def _log_channels():
+    return [
+        DataLogChannel(id=1, name="RPM", type=DataLogType.UINT16),
+        DataLogChannel(id=2, name="Unused", type=DataLogType.INT8, enabled=0),
+        DataLogChannel(id=3, name="TPS", unit="%", type=DataLogType.FLOAT, scale=0.5),
+    ]
+
+
+class TestDataLog(unittest.TestCase):
+    """Test PLOG and CSV files."""
+
+    def test_struct_sizes(self):
+        """Structures match the firmware layout."""
+        self.assertEqual(DataLogFileHeader.SIZE, 84)
+        self.assertEqual(len(DataLogFileHeader().pack()), 84)
+        self.assertEqual(DataLogChannel.SIZE, 64)
+        self.assertEqual(len(DataLogChannel().pack()), 64)
+
+    def test_plog_roundtrip(self):
+        """Written samples read back through the streaming reader."""
+        buf = io.BytesIO()
+        writer = PlogWriter(buf, _log_channels(), sample_rate_hz=50)
+        for i in range(5000):
+            writer.write(i * 20, [i, i * 0.5])
+        writer.close()
+
+        buf.seek(0)
+        reader = PlogReader(buf)
+        self.assertEqual(reader.header.sample_count, 5000)
+        self.assertEqual(reader.column_names, ["RPM", "TPS"])
+        samples = list(reader)
+        self.assertEqual(len(samples), 5000)
+        self.assertEqual(samples[4999].timestamp_ms, 4999 * 20)
+        self.assertEqual(samples[4999].values, (4999, 2499.5))
+        self.assertEqual(reader.columns[1].to_raw(2499.5), 4999)
+
+    def test_plog_truncated_sample(self):
+        """Short records fill missing channels with None."""
+        buf = io.BytesIO()
+        PlogWriter(buf, _log_channels()).close()
+        buf.write(bytes([6, 0]) + (100).to_bytes(4, "little") + (7).to_bytes(2, "little"))
+        buf.seek(0)
+        self.assertEqual(list(PlogReader(buf)), [(100, (7, None))])
+
+    def test_plog_invalid(self):
+        """Bad magic is rejected."""
+        with self.assertRaises(ValueError):
+            PlogReader(io.BytesIO(bytes(200)))
+
+    def test_csv_roundtrip(self):
+        """CSV writer output reads back with units split off."""
+        buf = io.StringIO()
+        writer = CsvLogWriter(buf, ["RPM", "TPS"], ["rpm", "%"])
+        writer.write(20, [650, 12])
+        writer.write(40, [660, ""])
+        buf.seek(0)
+        reader = CsvLogReader(buf)
+        self.assertEqual(reader.columns, [("RPM", "rpm"), ("TPS", "%")])
+        self.assertEqual(list(reader), [(20, (650.0, 12.0)), (40, (660.0, None))])
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy not installed")
+class TestMappedPlog(unittest.TestCase):
+    """Test random access through the memory-mapped reader."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.tmp.name, "session.plog")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, count, extra=b""):
+        channels = _log_channels()
+        channels[0].scale = 10.0
+        with PlogWriter(self.file, channels, sample_rate_hz=100) as writer:
+            for i in range(count):
+                writer.write(i * 10, [i, i * 0.5])
+        with open(self.file, "ab") as f:
+            f.write(extra)
+        return self.file
+
+    def test_matches_streaming_reader(self):
+        """Columns are views into the file with the streaming reader's values."""
+        path = self._write(3000)
+        with PlogReader(path) as stream:
+            samples = list(stream)
+
+        with MappedPlogReader(path) as log:
+            self.assertTrue(log.is_mapped)
+            self.assertEqual(len(log), 3000)
+            self.assertEqual(log.column_names, ["RPM", "TPS"])
+            self.assertFalse(log.timestamps.flags.owndata)
+            self.assertFalse(log.raw("RPM").flags.writeable)
+            self.assertEqual(log.timestamps.tolist(), [s.timestamp_ms for s in samples])
+            self.assertEqual(log.raw(1).tolist(), [s.values[0] for s in samples])
+            self.assertEqual(log.values("TPS").tolist(), [s.values[1] for s in samples])
+            # Integer channels are scaled to real values, FLOAT is stored scaled
+            self.assertEqual(log.values("RPM", 10, 12).tolist(), [100.0, 110.0])
+            self.assertEqual(log.to_real("RPM", log.raw("RPM", 10, 12)).tolist(), [100.0, 110.0])
+            self.assertEqual(log.column(3).unit, "%")
+            with self.assertRaises(KeyError):
+                log.raw("Unused")
+
+    def test_time_range(self):
+        """Time ranges resolve through the sparse index."""
+        with MappedPlogReader(self._write(1000), index_interval=7) as log:
+            times = log.timestamps.tolist()
+            for t0, t1 in [(0, 0), (5, 95), (100, 100), (3333, 6004), (9990, 20000), (-5, 5)]:
+                expected = [i for i, t in enumerate(times) if t0 <= t <= t1]
+                start, stop = log.index_range(t0, t1)
+                self.assertEqual(list(range(start, stop)), expected, (t0, t1))
+            self.assertEqual(log.index_range(), (0, 1000))
+            self.assertEqual(log.index_range(500, 400), (50, 50))
+
+            times, tps = log.window("TPS", 1000, 1030)
+            self.assertEqual(times.tolist(), [1000, 1010, 1020, 1030])
+            self.assertEqual(tps.tolist(), [50.0, 50.5, 51.0, 51.5])
+
+    def test_partial_last_record(self):
+        """A record cut short by power loss is dropped."""
+        with MappedPlogReader(self._write(10, extra=bytes([10, 0, 1, 2]))) as log:
+            self.assertTrue(log.is_mapped)
+            self.assertEqual(len(log), 10)
+
+    def test_mixed_record_lengths(self):
+        """Records of differing lengths are scanned; missing values are NaN."""
+        short = bytes([6, 0]) + (100).to_bytes(4, "little") + (7).to_bytes(2, "little")
+        with MappedPlogReader(self._write(3, extra=short)) as log:
+            self.assertFalse(log.is_mapped)
+            self.assertEqual(log.timestamps.tolist(), [0, 10, 20, 100])
+            self.assertEqual(log.raw("RPM").tolist(), [0, 1, 2, 7])
+            tps = log.values("TPS")
+            self.assertEqual(tps[:3].tolist(), [0.0, 0.5, 1.0])
+            self.assertTrue(math.isnan(tps[3]))
+
+    def test_empty_and_invalid(self):
+        """Header-only files have no samples; bad magic is rejected."""
+        with MappedPlogReader(self._write(0)) as log:
+            self.assertEqual(len(log), 0)
+            self.assertEqual(log.index_range(0, 100), (0, 0))
+
+        with open(self.file, "wb") as f:
+            f.write(bytes(200))
+        with self.assertRaises(ValueError):
+            MappedPlogReader(self.file)
+
+
+class TestLogReplay(unittest.TestCase):
+    """Test replaying logs through the executor."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def _write_plog(self, name="session.plog", count=100):
+        path = self.path(name)
+        with PlogWriter(path, _log_channels()) as writer:
+            for i in range(count):
+                writer.write(i * 10, [600 + i, i * 0.5])
+        return path
+
+    def test_replay_plog(self):
+        """Computed channels follow the logged inputs."""
+        replay = LogReplay(_config_channels())
+        self.assertEqual(replay.output_ids, [200, 201])
+
+        output = self.path("out.csv")
+        with PlogReader(self._write_plog()) as log:
+            stats = replay.run(log, output=output)
+
+        self.assertEqual(stats.samples, 100)
+        self.assertEqual(stats.log_duration_s, 0.99)
+        self.assertGreater(stats.samples_per_sec, 0)
+
+        with CsvLogReader(output) as out:
+            self.assertEqual(out.column_names, ["RPM x10", "Over Rev"])
+            rows = list(out)
+        self.assertEqual(len(rows), 100)
+        # RPM + TPS raw (TPS float / 0.5 scale = i)
+        for i, (_, (total, over)) in enumerate(rows):
+            self.assertEqual(total, 600 + 2 * i)
+            self.assertEqual(over, 1.0 if 600 + 2 * i > 700 else 0.0)
+
+    def test_replay_csv_holds_missing(self):
+        """Empty CSV cells keep the previous input value."""
+        log_path = self.path("session.csv")
+        with CsvLogWriter(log_path, ["Engine", "TPS"]) as writer:
+            writer.write(0, [100, 1])
+            writer.write(10, [200, ""])
+
+        replay = LogReplay(_config_channels(), channel_map={"Engine": 10})
+        out = io.StringIO()
+        with CsvLogReader(log_path) as log:
+            stats = replay.run(log, output=CsvLogWriter(out, ["RPM x10", "Over Rev"]))
+
+        self.assertEqual(stats.samples, 2)
+        self.assertEqual(out.getvalue().splitlines()[1:], ["0.000,101,0", "0.010,201,0"])
+
+    def test_replay_file_plog_output(self):
+        """replay_file loads a config file and writes a PLOG output."""
+        config_path = self.path("config.bin")
+        ConfigFile(channels=_config_channels()).save(config_path)
+        output = self.path("out.plog")
+
+        stats = replay_file(config_path, self._write_plog(count=10), output)
+
+        self.assertEqual(stats.samples, 10)
+        with PlogReader(output) as out:
+            self.assertEqual(out.header.sample_count, 10)
+            self.assertEqual([ch.id for ch in out.columns], [200, 201])
+            self.assertEqual(list(out)[-1].values, (618, 0))
+
+    def test_max_samples(self):
+        """Replay stops at max_samples."""
+        replay = LogReplay(_config_channels())
+        with PlogReader(self._write_plog()) as log:
+            stats = replay.run(log, max_samples=25)
+        self.assertEqual(stats.samples, 25)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
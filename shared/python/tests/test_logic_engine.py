@@ -25,9 +25,21 @@ from engine.table import *
 from engine.switch import *
 from engine.hysteresis import *
 from engine.flipflop import *
+from engine.batch import (
+    HAS_NUMPY,
+    logic_evaluate_batch, math_evaluate_batch,
+    sma_update_batch, ema_update_batch, lpf_update_batch, median_update_batch,
+    rate_limiter_update_batch, debounce_update_batch, hysteresis_update_batch,
+    sr_latch_update_batch, d_flipflop_update_batch, t_flipflop_update_batch,
+    toggle_update_batch, timer_update_batch, table2d_lookup_batch,
+)
+
+from value_store import ChannelValueStore, STORE_SIZE
 
 # Import Channel Config enums and dataclasses
-from channel_config import ChannelType, CfgLogic, CfgMath, CfgTimer, CfgFilter
+from channel_config import (
+    ChannelType, CfgLogic, CfgMath, CfgTimer, CfgFilter, CfgHysteresis, CfgNumber,
+)
 
 # Import Channel Executor - need to handle relative import issue
 # by temporarily modifying channel_executor.py imports
@@ -44,6 +56,7 @@ import types
 _ce_source = open(os.path.join(_parent_dir, "channel_executor.py")).read()
 _ce_source = _ce_source.replace("from .engine.", "from engine.")
 _ce_source = _ce_source.replace("from .channel_config", "from channel_config")
+_ce_source = _ce_source.replace("from .value_store", "from value_store")
 
 _ce_module = types.ModuleType("channel_executor_test")
 exec(_ce_source, _ce_module.__dict__)
@@ -53,6 +66,7 @@ ChannelRuntime = _ce_module.ChannelRuntime
 ChannelState = _ce_module.ChannelState
 EXEC_MAX_INPUTS = _ce_module.EXEC_MAX_INPUTS
 CH_REF_NONE = _ce_module.CH_REF_NONE
+channel_input_ids = _ce_module.channel_input_ids
 
 
 class TestLogicFunctions(unittest.TestCase):
@@ -522,6 +536,321 @@ class TestChannelExecutor(unittest.TestCase):
         self.assertEqual(result, 60)
 
 
+class TestExecutionPlan(unittest.TestCase):
+    """Test compiled, dependency-ordered execution."""
+
+    def setUp(self):
+        self.channel_values: Dict[int, int] = {}
+        self.published: Dict[int, int] = {}
+
+        def get_value(channel_id: int) -> int:
+            return self.channel_values.get(channel_id, 0)
+
+        def set_value(channel_id: int, value: int) -> None:
+            self.published[channel_id] = value
+
+        self.executor = ChannelExecutor()
+        self.executor.init(get_value, set_value)
+
+    def _make_chain(self):
+        """Channels given in reverse dependency order: 202 <- 201 <- 200 <- input 1."""
+        return [
+            ChannelRuntime(id=202, type=ChannelType.LOGIC, config=CfgLogic(
+                operation=LogicOp.NOT, input_count=1, inputs=[201])),
+            ChannelRuntime(id=201, type=ChannelType.MATH, config=CfgMath(
+                operation=MathOp.ADD, input_count=2, inputs=[200, 300])),
+            ChannelRuntime(id=200, type=ChannelType.HYSTERESIS, config=CfgHysteresis(
+                input_id=1, threshold_high=70, threshold_low=30)),
+            ChannelRuntime(id=300, type=ChannelType.NUMBER, config=CfgNumber(
+                value=5, readonly=1)),
+        ]
+
+    def test_topological_order(self):
+        """Channels run after the channels they read from."""
+        plan = self.executor.compile(self._make_chain())
+        order = [step.runtime.id for step in plan.steps]
+        self.assertLess(order.index(200), order.index(201))
+        self.assertLess(order.index(300), order.index(201))
+        self.assertLess(order.index(201), order.index(202))
+        self.assertEqual(plan.cyclic_ids, [])
+        self.assertEqual([ch_id for _, ch_id in plan.external], [1])
+
+    def test_single_pass_propagation(self):
+        """A change at the input reaches the end of the chain in one cycle."""
+        channels = self._make_chain()
+        self.executor.compile(channels)
+
+        self.channel_values[1] = 80
+        self.assertEqual(self.executor.run_cycle(10), 4)
+        self.assertEqual(self.published[200], 1)
+        self.assertEqual(self.published[201], 6)
+        self.assertEqual(self.published[202], 0)
+        self.assertEqual(channels[1].value, 6)
+
+    def test_matches_process_channel(self):
+        """Compiled execution is identical to per-channel execution in order."""
+        plan_channels = self._make_chain()
+        ref_channels = self._make_chain()
+        self.executor.compile(plan_channels)
+
+        ref_values: Dict[int, int] = {}
+        ref = ChannelExecutor()
+        ref.init(lambda ch: ref_values.get(ch, self.channel_values.get(ch, 0)),
+                 lambda ch, val: None)
+        ref_order = sorted(ref_channels, key=lambda rt: [200, 300, 201, 202].index(rt.id))
+
+        for cycle, level in enumerate([0, 50, 75, 60, 20, 90, 10]):
+            self.channel_values[1] = level
+            now_ms = (cycle + 1) * 10
+            self.executor.run_cycle(now_ms)
+            ref.update_time(now_ms)
+            for runtime in ref_order:
+                ref_values[runtime.id] = ref.process_channel(runtime)
+            for runtime in plan_channels:
+                self.assertEqual(runtime.value, ref_values[runtime.id])
+
+    def test_dependency_loop(self):
+        """Channels in a loop still run and read the previous cycle's value."""
+        channels = [
+            ChannelRuntime(id=10, type=ChannelType.LOGIC, config=CfgLogic(
+                operation=LogicOp.NOT, input_count=1, inputs=[11])),
+            ChannelRuntime(id=11, type=ChannelType.LOGIC, config=CfgLogic(
+                operation=LogicOp.OR, input_count=1, inputs=[10])),
+        ]
+        plan = self.executor.compile(channels)
+        self.assertEqual(plan.cyclic_ids, [10, 11])
+
+        self.executor.run_cycle(10)
+        self.assertEqual((channels[0].value, channels[1].value), (1, 1))
+        self.executor.run_cycle(20)
+        self.assertEqual((channels[0].value, channels[1].value), (0, 0))
+
+    def test_input_ids(self):
+        """Input references are reported per channel type."""
+        runtime = ChannelRuntime(id=1, type=ChannelType.MATH, config=CfgMath(
+            input_count=3, inputs=[5, 6]))
+        self.assertEqual(channel_input_ids(runtime), [5, 6, CH_REF_NONE])
+        runtime = ChannelRuntime(id=2, type=ChannelType.TIMER, config=CfgTimer(trigger_id=7))
+        self.assertEqual(channel_input_ids(runtime), [7])
+
+    def test_duplicate_id_rejected(self):
+        """Duplicate channel IDs are a configuration error."""
+        channels = [
+            ChannelRuntime(id=5, type=ChannelType.NUMBER, config=CfgNumber()),
+            ChannelRuntime(id=5, type=ChannelType.NUMBER, config=CfgNumber()),
+        ]
+        with self.assertRaises(ValueError):
+            self.executor.compile(channels)
+
+    def test_run_without_plan(self):
+        """Running before compile() is an error."""
+        with self.assertRaises(RuntimeError):
+            self.executor.run_cycle(0)
+
+
+class TestValueStore(unittest.TestCase):
+    """Test dense channel value store and store-backed execution."""
+
+    def setUp(self):
+        self.executor = ChannelExecutor()
+        self.store = self.executor.init_store()
+
+    def test_get_set(self):
+        """Values are indexed by channel ID; unknown IDs read 0."""
+        self.store.set(1010, 1234)
+        self.assertEqual(self.store.get(1010), 1234)
+        self.assertEqual(self.store.get(CH_REF_NONE), 0)
+        self.store.set(CH_REF_NONE, 5)  # Ignored
+        self.assertEqual(self.store.get(CH_REF_NONE), 0)
+        self.assertEqual(len(self.store), STORE_SIZE)
+
+    def test_snapshots_are_views(self):
+        """Snapshots reflect later writes without copying."""
+        frame = self.store.snapshot()
+        self.store.set(7, 42)
+        self.assertEqual(frame[7], 42)
+        self.assertEqual(len(frame), STORE_SIZE)
+        self.assertTrue(frame.readonly)
+
+        self.store.begin_cycle()
+        self.store.set(7, 43)
+        self.assertEqual(self.store.previous_snapshot()[7], 42)
+        self.assertEqual(list(self.store.changed()), [(7, 43)])
+
+    def test_process_channel_uses_store(self):
+        """Per-channel execution reads inputs from the store."""
+        self.store.set(1, 1)
+        self.store.set(2, 1)
+        runtime = ChannelRuntime(id=400, type=ChannelType.LOGIC, config=CfgLogic(
+            operation=LogicOp.AND, input_count=2, inputs=[1, 2]))
+        self.assertEqual(self.executor.process_channel(runtime), 1)
+
+    def test_compiled_plan_on_store(self):
+        """Compiled plans read and write the store directly."""
+        channels = [
+            ChannelRuntime(id=401, type=ChannelType.LOGIC, config=CfgLogic(
+                operation=LogicOp.NOT, input_count=1, inputs=[400])),
+            ChannelRuntime(id=400, type=ChannelType.LOGIC, config=CfgLogic(
+                operation=LogicOp.GT, input_count=1, inputs=[5], compare_value=100)),
+            ChannelRuntime(id=500, type=ChannelType.NUMBER, config=CfgNumber(value=9)),
+        ]
+        plan = self.executor.compile(channels)
+        self.assertEqual(plan.external, [])
+
+        self.store.set(5, 150)
+        self.store.set(500, 9)  # User-adjustable number keeps its stored value
+        self.executor.run_cycle(10)
+        self.assertEqual((self.store.get(400), self.store.get(401)), (1, 0))
+        self.assertEqual(self.store.get(500), 9)
+
+        self.store.set(5, 50)
+        self.executor.run_cycle(20)
+        self.assertEqual((self.store.get(400), self.store.get(401)), (0, 1))
+        self.assertEqual(self.store.get_previous(400), 1)
+
+    def test_missing_inputs_read_zero(self):
+        """Unused input references read 0, not channel 0."""
+        self.store.set(0, 77)
+        runtime = ChannelRuntime(id=600, type=ChannelType.MATH, config=CfgMath(
+            operation=MathOp.ADD, input_count=2, inputs=[CH_REF_NONE, CH_REF_NONE]))
+        self.executor.compile([runtime])
+        self.executor.run_cycle(10)
+        self.assertEqual(self.store.get(600), 0)
+
+    def test_channel_outside_store_rejected(self):
+        """Computed channels must fit in the store."""
+        runtime = ChannelRuntime(id=STORE_SIZE, type=ChannelType.NUMBER, config=CfgNumber())
+        with self.assertRaises(ValueError):
+            self.executor.compile([runtime])
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy not installed")
+class TestBatch(unittest.TestCase):
+    """Test batch variants against the scalar functions."""
+
+    def setUp(self):
+        import random
+        self.rng = random.Random(1234)
+
+    def series(self, n=200, low=-5000, high=5000):
+        return [self.rng.randint(low, high) for _ in range(n)]
+
+    def assertSeries(self, batch, expected):
+        self.assertEqual(batch.tolist(), list(expected))
+
+    def test_logic(self):
+        """Logic ops match logic_evaluate."""
+        a, b, c = self.series(), self.series(), self.series()
+        a[:20] = [0] * 20
+        for op in LogicOp:
+            expected = [logic_evaluate(op, [x, y, z]) for x, y, z in zip(a, b, c)]
+            self.assertSeries(logic_evaluate_batch(op, [a, b, c]), expected)
+
+    def test_math(self):
+        """Math ops match math_evaluate, including div by zero and saturation."""
+        big = self.series(low=-0x80000000, high=0x7FFFFFFF)
+        small = self.series(low=-3, high=3)
+        t = self.series(low=-100, high=1100)
+        for op in MathOp:
+            for inputs in ([big, small], [big, small, t], [big, big, small, t, big]):
+                expected = [math_evaluate(op, list(v)) for v in zip(*inputs)]
+                self.assertSeries(math_evaluate_batch(op, inputs), expected)
+
+    def test_math_broadcast(self):
+        """Scalar inputs are broadcast over the series."""
+        a = self.series()
+        expected = [math_scale(x, 3, 7) for x in a]
+        self.assertSeries(math_evaluate_batch(MathOp.SCALE, [a, 3, 7]), expected)
+
+    def test_filters(self):
+        """Filters match the scalar updates across chunk boundaries."""
+        x = self.series(n=300)
+        cases = [
+            (sma_update_batch, sma_update, SMAConfig(window_size=5), SMAState),
+            (sma_update_batch, sma_update, SMAConfig(window_size=1), SMAState),
+            (ema_update_batch, ema_update, EMAConfig(alpha=37), EMAState),
+            (median_update_batch, median_update, MedianConfig(window_size=4), MedianState),
+            (median_update_batch, median_update, MedianConfig(window_size=7), MedianState),
+        ]
+        for batch, scalar, config, state_type in cases:
+            state = state_type()
+            expected = [scalar(state, config, v) for v in x]
+            batch_state = state_type()
+            first, batch_state = batch(config, x[:2], batch_state)
+            rest, batch_state = batch(config, x[2:], batch_state)
+            self.assertEqual(first.tolist() + rest.tolist(), expected)
+            self.assertEqual(batch_state, state)
+
+    def test_timed_filters(self):
+        """Time-stepped filters match the scalar updates."""
+        x = self.series(n=300, low=0, high=3)
+        dt = self.series(n=300, low=0, high=20)
+        cases = [
+            (lpf_update_batch, lpf_update, LPFConfig(time_constant_ms=50), LPFState),
+            (rate_limiter_update_batch, rate_limiter_update,
+             RateLimiterConfig(rise_rate=100, fall_rate=50), RateLimiterState),
+            (debounce_update_batch, debounce_update, DebounceConfig(debounce_ms=30), DebounceState),
+        ]
+        for batch, scalar, config, state_type in cases:
+            state = state_type()
+            expected = [scalar(state, config, v, d) for v, d in zip(x, dt)]
+            out, batch_state = batch(config, x, dt)
+            self.assertSeries(out, expected)
+            self.assertEqual(batch_state, state)
+
+    def test_hysteresis(self):
+        """Hysteresis matches for normal, inverted and overlapping thresholds."""
+        x = self.series(low=0, high=100)
+        for config in (HysteresisConfig(threshold_high=60, threshold_low=40),
+                       HysteresisConfig(threshold_high=60, threshold_low=40, invert=True),
+                       HysteresisConfig(threshold_high=40, threshold_low=60)):
+            state = HysteresisState()
+            expected = [hysteresis_update(state, config, v) for v in x]
+            out, batch_state = hysteresis_update_batch(config, x[:1])
+            rest, batch_state = hysteresis_update_batch(config, x[1:], batch_state)
+            self.assertEqual(out.tolist() + rest.tolist(), expected)
+            self.assertEqual(batch_state, state)
+
+    def test_flipflops(self):
+        """Flip-flops match the scalar updates."""
+        a = self.series(low=0, high=1)
+        b = self.series(low=0, high=1)
+
+        state = FlipFlopState()
+        expected = [sr_latch_update(state, s, r) for s, r in zip(a, b)]
+        self.assertSeries(sr_latch_update_batch(a, b)[0], expected)
+
+        for batch, scalar in ((d_flipflop_update_batch, d_flipflop_update),
+                              (t_flipflop_update_batch, t_flipflop_update)):
+            state = FlipFlopState(q=1, last_clk=1)
+            expected = [scalar(state, d, clk) for d, clk in zip(a, b)]
+            out, batch_state = batch(a, b, FlipFlopState(q=1, last_clk=1))
+            self.assertSeries(out, expected)
+            self.assertEqual(batch_state, state)
+
+        state = FlipFlopState()
+        expected = [toggle_update(state, v) for v in a]
+        self.assertSeries(toggle_update_batch(a)[0], expected)
+
+    def test_timer(self):
+        """Timer batch matches timer_update."""
+        config = TimerConfig(mode=TimerMode.DELAY_ON, delay_ms=30)
+        trig = self.series(low=0, high=1)
+        times = list(range(0, 2000, 10))
+        state = TimerState()
+        expected = [timer_update(state, config, t, now) for t, now in zip(trig, times)]
+        self.assertSeries(timer_update_batch(config, trig, times)[0], expected)
+
+    def test_table2d(self):
+        """Table lookup matches, including clamping and unsorted tables."""
+        x = self.series(low=-100, high=1100)
+        for table in (Table2D(x_values=[0, 100, 100, 500, 1000], y_values=[5, -50, 70, 900, 20]),
+                      Table2D(x_values=[0, 500, 200], y_values=[1, 2, 3]),
+                      Table2D(x_values=[7], y_values=[3])):
+            expected = [table2d_lookup(table, v) for v in x]
+            self.assertSeries(table2d_lookup_batch(table, x), expected)
+
+
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and error handling."""
 
@@ -0,0 +1,220 @@
+"""
+MIN Transport Tests
+
+Tests T-MIN frame encoding and the receive path without a serial port.
+"""
+
+import sys
+import os
+import random
+import threading
+import time
+import unittest
+from binascii import crc32
+
+# Add shared/python to path for imports
+_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _parent_dir not in sys.path:
+    sys.path.insert(0, _parent_dir)
+
+try:
+    from min_protocol import MINTransport, MINFrame
+    HAS_SERIAL = True
+except ImportError:  # pyserial not installed
+    HAS_SERIAL = False
+
+
+if HAS_SERIAL:
+    class LoopbackTransport(MINTransport):
+        """MIN transport writing to a byte buffer."""
+
+        def __init__(self, **kwargs):
+            self.now = 1
+            self.written = bytearray()
+            super().__init__(**kwargs)
+
+        def _now_ms(self):
+            return self.now
+
+        def _serial_write(self, data):
+            self.written += data
+
+        def _serial_any(self):
+            return False
+
+        def _serial_read_all(self):
+            return b""
+
+        def _serial_close(self):
+            pass
+
+
+@unittest.skipUnless(HAS_SERIAL, "pyserial not installed")
+class TestMINReceive(unittest.TestCase):
+    """Test the MIN receive path."""
+
+    def _wire(self, min_id, payload, transport=False, seq=0):
+        sender = LoopbackTransport()
+        return sender._on_wire_bytes(MINFrame(min_id, payload, seq, transport))
+
+    def _receive(self, data, **kwargs):
+        receiver = LoopbackTransport(**kwargs)
+        receiver._rx_bytes(data)
+        return receiver
+
+    def test_crc_reference_matches_binascii(self):
+        """Manual CRC implementation matches binascii.crc32."""
+        rng = random.Random(7)
+        for size in (0, 1, 5, 255):
+            data = bytes(rng.getrandbits(8) for _ in range(size))
+            self.assertEqual(MINTransport._crc32(data), crc32(data))
+
+    def test_receive_frames(self):
+        """Frames with and without stuffing are received in production and self-test mode."""
+        payloads = [b"", b"hello", bytes([0xAA, 0xAA, 0xAA, 0x55]) * 10, bytes(range(255))]
+        data = b"".join(self._wire(0x11, p) for p in payloads)
+        for self_test in (False, True):
+            receiver = self._receive(data, crc_self_test=self_test)
+            self.assertEqual([f.payload for f in receiver._rx_list], payloads)
+
+    def test_receive_transport_frame(self):
+        """Transport frames include the sequence number in the CRC."""
+        receiver = self._receive(self._wire(0x05, b"payload", transport=True), crc_self_test=True)
+        self.assertEqual([(f.min_id, f.payload) for f in receiver._rx_list], [(0x05, b"payload")])
+
+    def test_split_delivery(self):
+        """A frame delivered one byte at a time is received."""
+        receiver = LoopbackTransport()
+        for byte in self._wire(0x11, b"split frame"):
+            receiver._rx_bytes(bytes([byte]))
+        self.assertEqual([f.payload for f in receiver._rx_list], [b"split frame"])
+
+    def test_corrupted_frame_dropped(self):
+        """A frame with a bad CRC is dropped and the next one still received."""
+        bad = bytearray(self._wire(0x11, b"abcdef"))
+        bad[6] ^= 0x01
+        receiver = self._receive(bytes(bad) + self._wire(0x12, b"ok"))
+        self.assertEqual([(f.min_id, f.payload) for f in receiver._rx_list], [(0x12, b"ok")])
+
+    def test_chunking_invariant(self):
+        """Frames mixed with line noise decode the same for any read chunking."""
+        rng = random.Random(3)
+        stream = bytearray()
+        expected = []
+        for i in range(60):
+            payload = bytes(rng.choice((0xAA, 0x55, rng.getrandbits(8)))
+                            for _ in range(rng.randint(0, 80)))
+            stream += self._wire(i & 0x3F, payload)
+            expected.append((i & 0x3F, payload))
+            if i % 7 == 0:
+                stream += bytes(rng.choice((0xAA, 0x55, 0x00)) for _ in range(5)) + b"\x55"
+
+        whole = self._receive(bytes(stream))
+        self.assertEqual([(f.min_id, f.payload) for f in whole._rx_list], expected)
+
+        for _ in range(5):
+            receiver = LoopbackTransport()
+            pos = 0
+            while pos < len(stream):
+                step = rng.randint(1, 40)
+                receiver._rx_bytes(bytes(stream[pos:pos + step]))
+                pos += step
+            self.assertEqual([(f.min_id, f.payload) for f in receiver._rx_list], expected)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
+
+
+@unittest.skipUnless(HAS_SERIAL, "pyserial not installed")
+class TestMINScheduling(unittest.TestCase):
+    """Test deadline reporting for event-driven readers."""
+
+    def setUp(self):
+        self.transport = LoopbackTransport()
+        self.transport.now = 100000
+
+    def test_idle_has_no_deadline(self):
+        """Nothing queued and remote idle: no timed work."""
+        self.assertIsNone(self.transport.next_timeout_ms())
+
+    def test_queued_frame_due_now(self):
+        """A frame that fits in the window is due immediately."""
+        self.transport.queue_frame(0x10, b"x")
+        self.assertEqual(self.transport.next_timeout_ms(), 0)
+        self.transport.poll(b"")
+        self.assertTrue(self.transport.written)
+
+    def test_retransmit_deadline(self):
+        """Unacknowledged frames are due after the retransmit timeout."""
+        t = self.transport
+        t._last_received_anything_ms = t.now
+        t.queue_frame(0x10, b"x")
+        t.poll(b"")
+        sent = len(t.written)
+        self.assertEqual(t.next_timeout_ms(), t.frame_retransmit_timeout_ms + 1)
+
+        t.now += t.frame_retransmit_timeout_ms
+        t.poll(b"")
+        self.assertEqual(len(t.written), sent)
+
+        t.now += t.next_timeout_ms()
+        t.poll(b"")
+        self.assertGreater(len(t.written), sent)
+
+    def test_ack_deadline(self):
+        """An active remote needs periodic ACKs."""
+        t = self.transport
+        t._last_received_frame_ms = t.now
+        t._last_sent_ack_time_ms = t.now - 10
+        self.assertEqual(t.next_timeout_ms(), t.ack_retransmit_timeout_ms - 10 + 1)
+
+    def test_poll_uses_passed_data(self):
+        """poll(data) processes the given bytes instead of reading the line."""
+        wire = LoopbackTransport()._on_wire_bytes(MINFrame(0x11, b"abc", 0, False))
+        frames = self.transport.poll(wire)
+        self.assertEqual([f.payload for f in frames], [b"abc"])
+
+
+@unittest.skipUnless(HAS_SERIAL and hasattr(os, "openpty"), "needs pyserial and a pty")
+class TestMINSerialWait(unittest.TestCase):
+    """Test blocking reads on a pseudo terminal."""
+
+    def setUp(self):
+        from min_protocol import MINTransportSerial
+        self.master, slave = os.openpty()
+        self.transport = MINTransportSerial(os.ttyname(slave))
+        os.close(slave)
+
+    def tearDown(self):
+        self.transport.close()
+        os.close(self.master)
+
+    def test_wait_returns_data(self):
+        """Bytes written by the peer wake the reader."""
+        os.write(self.master, b"\x01\x02\x03")
+        self.assertEqual(self.transport.wait_for_data(1.0), b"\x01\x02\x03")
+
+    def test_wait_times_out(self):
+        """No data: the wait ends after the timeout with no bytes."""
+        self.assertEqual(self.transport.wait_for_data(0.01), b"")
+
+    def test_wait_keeps_port_timeout(self):
+        """Varying waits do not reconfigure the serial port."""
+        from min_protocol import SERIAL_READ_TIMEOUT
+        for timeout in (0.01, 0.02, 0.005):
+            self.assertEqual(self.transport.wait_for_data(timeout), b"")
+        self.assertEqual(self.transport._serial.timeout, SERIAL_READ_TIMEOUT)
+
+    def test_cancel_wakes_reader(self):
+        """cancel_wait() ends a blocked wait early."""
+        result = []
+        reader = threading.Thread(target=lambda: result.append(self.transport.wait_for_data(5.0)))
+        start = time.monotonic()
+        reader.start()
+        time.sleep(0.05)
+        self.transport.cancel_wait()
+        reader.join(2.0)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(result, [b""])
+        self.assertLess(time.monotonic() - start, 2.0)
@@ -0,0 +1,131 @@
+"""
+Telemetry Codec Tests
+
+Tests parse_telemetry() against packets built field by field for every
+section flag combination.
+"""
+
+import sys
+import os
+import struct
+import unittest
+from array import array
+
+# Add shared/python to path for imports
+_parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _parent_dir not in sys.path:
+    sys.path.insert(0, _parent_dir)
+
+from telemetry import (
+    TelemetryResult, parse_telemetry,
+    TELEM_HAS_ADC, TELEM_HAS_OUTPUTS, TELEM_HAS_HBRIDGE, TELEM_HAS_DIN,
+    TELEM_HAS_VIRTUALS, TELEM_HAS_FAULTS, TELEM_HAS_CURRENTS,
+)
+
+ADC = [i * 100 for i in range(20)]
+OUTPUTS = [i % 4 for i in range(30)]
+HB_POS = [-500, 0, 250, 1000]
+HB_CUR = [10, 20, 30, 40]
+CURRENTS = [i * 250 for i in range(30)]
+VIRTUALS = {200: 1, 201: -42, 350: 123456}
+
+
+def build_packet(flags: int, virtuals=VIRTUALS) -> bytes:
+    """Build a packet section by section (telemetry_codec.c layout)."""
+    data = struct.pack("<IIHhhIH", 7, 123456, 13800, 451, 382, 15250, flags)
+    if flags & TELEM_HAS_ADC:
+        data += struct.pack("<20H", *ADC)
+    if flags & TELEM_HAS_OUTPUTS:
+        data += bytes(OUTPUTS)
+    if flags & TELEM_HAS_HBRIDGE:
+        data += struct.pack("<4h", *HB_POS) + struct.pack("<4H", *HB_CUR)
+    if flags & TELEM_HAS_DIN:
+        data += struct.pack("<I", 0x00080005)
+    if flags & TELEM_HAS_VIRTUALS:
+        data += struct.pack("<H", len(virtuals))
+        for ch_id, value in virtuals.items():
+            data += struct.pack("<Hi", ch_id, value)
+    if flags & TELEM_HAS_FAULTS:
+        data += bytes([3, 0x81, 0, 0])
+    if flags & TELEM_HAS_CURRENTS:
+        data += struct.pack("<30H", *CURRENTS)
+    return data
+
+
+class TestParseTelemetry(unittest.TestCase):
+
+    def check_packet(self, packet, flags):
+        self.assertEqual(packet.stream_counter, 7)
+        self.assertEqual(packet.timestamp_ms, 123456)
+        self.assertEqual(packet.mcu_temp_c10, 451)
+        self.assertEqual(packet.flags, flags)
+        if flags & TELEM_HAS_ADC:
+            self.assertEqual(list(packet.adc_values), ADC)
+        if flags & TELEM_HAS_OUTPUTS:
+            self.assertEqual(list(packet.output_states), OUTPUTS)
+        if flags & TELEM_HAS_HBRIDGE:
+            self.assertEqual(list(packet.hbridge_positions), HB_POS)
+            self.assertEqual(list(packet.hbridge_currents), HB_CUR)
+        if flags & TELEM_HAS_DIN:
+            self.assertTrue(packet.get_din(0))
+            self.assertFalse(packet.get_din(1))
+            self.assertTrue(packet.get_din(19))
+        if flags & TELEM_HAS_VIRTUALS:
+            self.assertEqual(packet.virtual_channels, VIRTUALS)
+        if flags & TELEM_HAS_FAULTS:
+            self.assertEqual((packet.fault_status, packet.fault_flags), (3, 0x81))
+        if flags & TELEM_HAS_CURRENTS:
+            self.assertEqual(list(packet.output_currents), CURRENTS)
+
+    def test_all_flag_combinations(self):
+        for flags in range(0x80):
+            with self.subTest(flags=flags):
+                data = build_packet(flags)
+                result, packet = parse_telemetry(data)
+                self.assertEqual(result, TelemetryResult.OK)
+                self.check_packet(packet, flags)
+                if flags & TELEM_HAS_ADC:
+                    self.assertIsInstance(packet.adc_values, list)
+
+    def test_flat(self):
+        for flags in range(0x80):
+            with self.subTest(flags=flags):
+                result, packet = parse_telemetry(build_packet(flags), flat=True)
+                self.assertEqual(result, TelemetryResult.OK)
+                self.check_packet(packet, flags)
+                if flags & TELEM_HAS_CURRENTS:
+                    self.assertIsInstance(packet.output_currents, array)
+
+    def test_too_short(self):
+        result, packet = parse_telemetry(b"\x00" * 10)
+        self.assertEqual(result, TelemetryResult.ERR_TOO_SHORT)
+
+        data = build_packet(TELEM_HAS_ADC | TELEM_HAS_CURRENTS)
+        result, packet = parse_telemetry(data[:-1])
+        self.assertEqual(result, TelemetryResult.ERR_TOO_SHORT)
+        self.assertEqual(packet.timestamp_ms, 123456)
+
+    def test_truncated_virtuals(self):
+        flags = TELEM_HAS_VIRTUALS | TELEM_HAS_FAULTS
+        data = build_packet(flags)
+        # Drop the faults section and half of the last virtual entry
+        result, packet = parse_telemetry(data[:-7])
+        self.assertEqual(result, TelemetryResult.ERR_TRUNCATED)
+        self.assertEqual(packet.virtual_channels, {200: 1, 201: -42})
+
+    def test_truncated_tail(self):
+        flags = TELEM_HAS_VIRTUALS | TELEM_HAS_FAULTS | TELEM_HAS_CURRENTS
+        data = build_packet(flags)
+        result, packet = parse_telemetry(data[:-2])
+        self.assertEqual(result, TelemetryResult.ERR_TRUNCATED)
+        self.assertEqual(packet.fault_flags, 0x81)
+
+    def test_virtual_count_clamped(self):
+        virtuals = {200 + i: i for i in range(40)}
+        result, packet = parse_telemetry(build_packet(TELEM_HAS_VIRTUALS, virtuals))
+        self.assertEqual(result, TelemetryResult.OK)
+        self.assertEqual(len(packet.virtual_channels), 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+PMU-30 Channel Value Store - Python implementation
+
+Dense, preallocated int32 value table indexed by channel ID.
+Holds the current and previous cycle so consumers can read a whole
+frame through memoryviews without per-channel lookups or copies.
+
+Channel ID ranges (from pmu_channel.h):
+- 0-99: Physical inputs
+- 100-199: Physical outputs
+- 200-999: Virtual channels
+- 1000-1279: System channels (incl. per-output status/current/duty blocks)
+"""
+
+from array import array
+from typing import Iterator, Tuple
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+STORE_SYSTEM_ID_START = 1000
+STORE_SYSTEM_ID_END = 1279
+STORE_SIZE = STORE_SYSTEM_ID_END + 1
+
+
+# ============================================================================
+# Value Store
+# ============================================================================
+
+class ChannelValueStore:
+    """
+    Channel values indexed directly by channel ID.
+
+    Both buffers carry one extra trailing element that always reads 0.
+    Compiled plans use it as the slot for CH_REF_NONE references.
+
+    Example usage:
+        store = ChannelValueStore()
+        store.set(50, 1)                 # Hardware layer writes inputs
+
+        store.begin_cycle()              # current -> previous
+        ...                              # Executor writes results
+        frame = store.snapshot()         # Zero-copy view of all values
+    """
+
+    def __init__(self, size: int = STORE_SIZE):
+        self.size = size
+        self.null_slot = size
+        self.current = array('i', bytes(4 * (size + 1)))
+        self.previous = array('i', bytes(4 * (size + 1)))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, channel_id: int) -> bool:
+        return 0 <= channel_id < self.size
+
+    def get(self, channel_id: int) -> int:
+        """Get current value (0 for unknown channels and CH_REF_NONE)."""
+        if 0 <= channel_id < self.size:
+            return self.current[channel_id]
+        return 0
+
+    def get_previous(self, channel_id: int) -> int:
+        """Get value from the previous cycle."""
+        if 0 <= channel_id < self.size:
+            return self.previous[channel_id]
+        return 0
+
+    def set(self, channel_id: int, value: int) -> None:
+        """Set current value. Writes outside the store are ignored."""
+        if 0 <= channel_id < self.size:
+            self.current[channel_id] = value
+
+    def begin_cycle(self) -> None:
+        """Start a new cycle: current values become the previous frame."""
+        self.previous[:] = self.current
+
+    def clear(self) -> None:
+        """Reset all values to 0."""
+        zero = array('i', bytes(4 * (self.size + 1)))
+        self.current[:] = zero
+        self.previous[:] = zero
+
+    def snapshot(self) -> memoryview:
+        """Read-only view of current values, indexed by channel ID."""
+        return memoryview(self.current)[:self.size].toreadonly()
+
+    def previous_snapshot(self) -> memoryview:
+        """Read-only view of previous cycle values, indexed by channel ID."""
+        return memoryview(self.previous)[:self.size].toreadonly()
+
+    def changed(self) -> Iterator[Tuple[int, int]]:
+        """Yield (channel_id, value) for channels changed since begin_cycle()."""
+        for channel_id, value, prev in zip(range(self.size), self.current, self.previous):
+            if value != prev:
+                yield channel_id, value